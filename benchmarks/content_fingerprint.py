@@ -0,0 +1,89 @@
+"""Compare the LLM extraction change fingerprint with the old BeautifulSoup text hash.
+
+Run with ``python benchmarks/content_fingerprint.py``. A synthetic JS-heavy
+blog index is mutated in ways that do not change its post list (noise) and in
+ways that do (real). A method should change its hash for every real variant
+and for none of the noise variants.
+"""
+
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+from intelstream.adapters.strategies.llm_extraction import (
+    content_fingerprint,
+    legacy_content_hash,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+POSTS = 60
+SCRIPT_BYTES = 400_000
+RUNS = 30
+
+
+def make_page(
+    posts: list[int],
+    script_token: str = "a1",
+    updated: str = "5 minutes ago",
+    views: int = 1200,
+    nav_item: str = "About",
+    ad: str = "Buy now",
+) -> str:
+    cards = "".join(
+        f'<article class="card"><h2><a href="/posts/{i}">Post {i}</a></h2>'
+        f'<p class="excerpt">Excerpt for post {i}.</p>'
+        f'<span class="views">{views + i} views</span></article>'
+        for i in posts
+    )
+    return (
+        "<html><head>"
+        f'<meta name="csrf-token" content="{script_token}">'
+        f"<script>window.__STATE__={{'token':'{script_token}','blob':'{'x' * SCRIPT_BYTES}'}}"
+        "</script><style>.card{margin:0}</style></head><body>"
+        f'<header><a href="/">Home</a></header><nav><a href="/{nav_item.lower()}">{nav_item}</a>'
+        f"</nav><main><h1>Blog</h1><p>Updated {updated}</p>{cards}</main>"
+        f'<aside><a href="/ads/{ad}">{ad}</a></aside><footer>(c) Example</footer></body></html>'
+    )
+
+
+def main() -> None:
+    posts = list(range(POSTS, 0, -1))
+    base = make_page(posts)
+    noise = {
+        "script token": make_page(posts, script_token="b2"),
+        "relative timestamp": make_page(posts, updated="6 minutes ago"),
+        "view counters": make_page(posts, views=1300),
+        "nav link": make_page(posts, nav_item="Team"),
+        "rotating ad": make_page(posts, ad="Sale"),
+    }
+    real = {
+        "new post": make_page([POSTS + 1, *posts]),
+        "removed post": make_page(posts[1:]),
+        "reordered posts": make_page([posts[1], posts[0], *posts[2:]]),
+    }
+    methods: dict[str, Callable[[str], str]] = {
+        "legacy soup text": legacy_content_hash,
+        "fingerprint": content_fingerprint,
+    }
+
+    print(f"page size {len(base) / 1024:.0f} KiB, {POSTS} posts")
+    for name, method in methods.items():
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            method(base)
+            timings.append(time.perf_counter() - start)
+        baseline = method(base)
+        false_changes = [label for label, html in noise.items() if method(html) != baseline]
+        missed = [label for label, html in real.items() if method(html) == baseline]
+        print(
+            f"{name:>16}: median={statistics.median(timings) * 1000:.2f}ms "
+            f"false changes={len(false_changes)}/{len(noise)} {false_changes} "
+            f"missed={len(missed)}/{len(real)} {missed}"
+        )
+
+
+if __name__ == "__main__":
+    main()
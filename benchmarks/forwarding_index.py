@@ -0,0 +1,85 @@
+"""Measure forwarding-rule index rebuild, incremental update and lookup cost.
+
+Run with ``python benchmarks/forwarding_index.py``. Rules are spread over
+``SOURCE_CHANNELS`` channels; "replace" is what a /forward command pays to
+publish one channel's rules, "lookup" is what ``on_message`` pays per message.
+"""
+
+import random
+import statistics
+import time
+import uuid
+
+from intelstream.database.models import ForwardingRule
+from intelstream.services.forwarding_index import ForwardingRuleIndex
+
+RULES = 10_000
+SOURCE_CHANNELS = 2_000
+REBUILDS = 20
+REPLACES = 500
+LOOKUPS = 100_000
+
+
+def make_rules() -> list[ForwardingRule]:
+    return [
+        ForwardingRule(
+            id=str(uuid.uuid4()),
+            guild_id="1",
+            source_channel_id=str(i % SOURCE_CHANNELS),
+            source_type="channel",
+            destination_channel_id=str(1_000_000 + i),
+            destination_type="channel",
+            is_active=True,
+            coalesce_window_seconds=0,
+        )
+        for i in range(RULES)
+    ]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+
+def main() -> None:
+    rules = make_rules()
+    by_channel: dict[str, list[ForwardingRule]] = {}
+    for rule in rules:
+        by_channel.setdefault(rule.source_channel_id, []).append(rule)
+    index = ForwardingRuleIndex()
+
+    rebuilds: list[float] = []
+    for _ in range(REBUILDS):
+        start = time.perf_counter()
+        index.rebuild(rules)
+        rebuilds.append(time.perf_counter() - start)
+
+    channels = list(by_channel)
+    replaces: list[float] = []
+    for _ in range(REPLACES):
+        channel_id = random.choice(channels)
+        start = time.perf_counter()
+        index.replace_channel(channel_id, by_channel[channel_id])
+        replaces.append(time.perf_counter() - start)
+
+    # Half of the lookups miss, as most channels in a guild have no rules.
+    keys = [random.choice(channels) if i % 2 else f"miss-{i}" for i in range(LOOKUPS)]
+    start = time.perf_counter()
+    for key in keys:
+        index.rules_for(key)
+    lookup_ns = (time.perf_counter() - start) / LOOKUPS * 1e9
+
+    print(f"{index.rule_count} rules over {len(index)} source channels")
+    print(
+        f" rebuild: p50={statistics.median(rebuilds) * 1000:.2f}ms "
+        f"p99={percentile(rebuilds, 0.99) * 1000:.2f}ms"
+    )
+    print(
+        f" replace: p50={statistics.median(replaces) * 1e6:.1f}us "
+        f"p99={percentile(replaces, 0.99) * 1e6:.1f}us"
+    )
+    print(f"  lookup: mean={lookup_ns:.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
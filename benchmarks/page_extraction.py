@@ -0,0 +1,102 @@
+"""Compare Page source extraction through compiled selectors with BeautifulSoup.
+
+Run with ``python benchmarks/page_extraction.py [DIR]``. Without DIR a
+synthetic listing page is used. DIR may hold saved pages as ``<name>.html``
+next to the profile that extracts them as ``<name>.profile.json``. Both paths
+must return the same posts; dateless posts are stamped with the current time,
+so dates are left out of the comparison.
+"""
+
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from intelstream.adapters.base import ContentData
+from intelstream.adapters.page import PageAdapter
+from intelstream.services.page_analyzer import ExtractionProfile
+
+POSTS = 100
+RUNS = 30
+
+SYNTHETIC_PROFILE = ExtractionProfile(
+    site_name="Synthetic Blog",
+    post_selector="div.listing article.post-card",
+    title_selector="h2.post-title > a",
+    url_selector="h2.post-title > a",
+    url_attribute="href",
+    date_selector="time.published",
+    date_attribute="datetime",
+    author_selector="span.byline a[rel=author]",
+    base_url="https://example.com",
+)
+
+
+def make_page() -> str:
+    cards = "".join(
+        f'<article class="post-card featured-{i % 3}"><div class="thumb"><img src="/img/{i}.jpg">'
+        f'</div><h2 class="post-title"><a href="/posts/{i}">Post <em>number</em> {i}</a></h2>'
+        f'<time class="published" datetime="2024-01-{i % 28 + 1:02d}T12:00:00Z">Jan</time>'
+        f'<span class="byline">by <a rel="author" href="/authors/{i % 7}">Author {i % 7}</a></span>'
+        f"<p>{'Excerpt text. ' * 40}</p>"
+        '<ul class="tags"><li><a href="/t/a">a</a></li><li><a href="/t/b">b</a></li></ul>'
+        "</article>"
+        for i in range(POSTS)
+    )
+    nav = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(50))
+    return (
+        f"<html><head><title>Blog</title></head><body><nav><ul>{nav}</ul></nav>"
+        f'<main><div class="listing">{cards}</div></main><footer>(c) Example</footer></body></html>'
+    )
+
+
+def load_pages(directory: Path | None) -> dict[str, tuple[ExtractionProfile, str]]:
+    if directory is None:
+        return {"synthetic": (SYNTHETIC_PROFILE, make_page())}
+    pages = {}
+    for html_path in sorted(directory.glob("*.html")):
+        profile_path = html_path.with_suffix(".profile.json")
+        if profile_path.exists():
+            profile = ExtractionProfile.from_dict(json.loads(profile_path.read_text()))
+            pages[html_path.stem] = (profile, html_path.read_text(errors="replace"))
+    return pages
+
+
+def measure(adapter: PageAdapter, html: str) -> tuple[float, list[ContentData]]:
+    timings = []
+    items: list[ContentData] = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        items = adapter._extract_posts(html, "https://example.com/")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), items
+
+
+def comparable(items: list[ContentData]) -> list[tuple[str, str, str | None]]:
+    return [(item.title, item.original_url, item.author) for item in items]
+
+
+def main() -> None:
+    directory = Path(sys.argv[1]) if len(sys.argv) > 1 else None
+    pages = load_pages(directory)
+    if not pages:
+        print(f"no <name>.html with <name>.profile.json found in {directory}")
+        return
+
+    for name, (profile, html) in pages.items():
+        adapter = PageAdapter(extraction_profile=profile)
+        compiled_time, compiled = measure(adapter, html)
+        with patch("intelstream.adapters.page.compile_profile", return_value=None):
+            soup_time, souped = measure(adapter, html)
+        same = comparable(compiled) == comparable(souped)
+        print(
+            f"{name}: {len(html) / 1024:.0f} KiB, {len(souped)} posts, "
+            f"soup={soup_time * 1000:.2f}ms compiled={compiled_time * 1000:.2f}ms "
+            f"speedup={soup_time / compiled_time:.1f}x same posts={same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare whole-document sitemap parsing with the streaming watermark parser.
+
+Run with ``python benchmarks/sitemap_parse.py``. A synthetic gzipped sitemap
+of mostly old URLs is parsed once by building the full tree (the previous
+approach) and once by feeding the streaming target in network-sized chunks
+with a watermark, which keeps only the few entries newer than it.
+"""
+
+import gzip
+import statistics
+import time
+import tracemalloc
+import zlib
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from defusedxml import ElementTree
+from defusedxml.ElementTree import DefusedXMLParser
+
+from intelstream.adapters.strategies.sitemap_discovery import (
+    INFLATE_CHUNK_SIZE,
+    _SitemapTarget,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+URLS = 50_000
+NEW_URLS = 20
+CHUNK = 64 * 1024
+RUNS = 5
+START = datetime(2015, 1, 1, tzinfo=UTC)
+
+
+def make_sitemap() -> bytes:
+    entries = "".join(
+        f"<url><loc>https://example.com/{'blog' if i % 2 else 'docs'}/post-{i}</loc>"
+        f"<lastmod>{(START + timedelta(hours=i)).strftime('%Y-%m-%dT%H:%M:%SZ')}</lastmod></url>"
+        for i in range(URLS)
+    )
+    xml = (
+        '<?xml version="1.0"?>'
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'
+    )
+    return gzip.compress(xml.encode())
+
+
+def whole_tree(body: bytes) -> int:
+    root = ElementTree.fromstring(gzip.decompress(body))
+    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+    urls = [
+        {"url": loc.text, "lastmod": url.findtext("sm:lastmod", namespaces=ns)}
+        for url in root.findall("sm:url", ns)
+        if (loc := url.find("sm:loc", ns)) is not None
+    ]
+    return len([u for u in urls if "/blog/" in (u["url"] or "")])
+
+
+def streaming(body: bytes) -> int:
+    since = START + timedelta(hours=URLS - NEW_URLS)
+    target = _SitemapTarget("/blog/", since)
+    parser = DefusedXMLParser(target=target)
+    inflater = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    for offset in range(0, len(body), CHUNK):
+        chunk = body[offset : offset + CHUNK]
+        while chunk:
+            parser.feed(inflater.decompress(chunk, INFLATE_CHUNK_SIZE))
+            chunk = inflater.unconsumed_tail
+    parser.feed(inflater.flush())
+    parser.close()
+    return len(target.entries)
+
+
+def main() -> None:
+    body = make_sitemap()
+    methods: dict[str, Callable[[bytes], int]] = {
+        "whole tree": whole_tree,
+        "streaming": streaming,
+    }
+
+    print(f"{URLS} URLs, {len(body) / 1024:.0f} KiB gzipped")
+    for name, method in methods.items():
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            kept = method(body)
+            timings.append(time.perf_counter() - start)
+        tracemalloc.start()
+        method(body)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:>10}: median={statistics.median(timings) * 1000:.0f}ms "
+            f"peak={peak / 1024 / 1024:.1f}MiB kept={kept}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compare SQLite commit latency and reader/writer concurrency across pragma profiles.
+
+Run with ``python benchmarks/sqlite_profile.py``. The "default" profile matches
+SQLite's stock settings (rollback journal, synchronous=FULL); "tuned" is the
+SQLitePragmas default used by the bot.
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from intelstream.database.models import SourceType
+from intelstream.database.repository import Repository, SQLitePragmas
+
+COMMITS = 300
+READERS = 4
+READS_PER_READER = 200
+
+PROFILES: dict[str, SQLitePragmas] = {
+    "default": SQLitePragmas(
+        journal_mode="DELETE",
+        synchronous="FULL",
+        mmap_size_bytes=0,
+        cache_size_kib=2000,
+        busy_timeout_ms=5000,
+        temp_store="DEFAULT",
+    ),
+    "tuned": SQLitePragmas(),
+}
+
+
+async def bench_commits(repo: Repository, source_id: str) -> list[float]:
+    latencies: list[float] = []
+    for i in range(COMMITS):
+        start = time.perf_counter()
+        await repo.add_content_item(
+            source_id=source_id,
+            external_id=f"commit-{i}",
+            title=f"Item {i}",
+            original_url=f"https://example.com/{i}",
+            author="Bench",
+            published_at=datetime.now(UTC),
+            raw_content="x" * 2000,
+        )
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def bench_mixed(repo: Repository, source_id: str) -> tuple[float, list[float]]:
+    read_latencies: list[float] = []
+
+    async def writer() -> None:
+        for i in range(COMMITS):
+            item = await repo.add_content_item(
+                source_id=source_id,
+                external_id=f"mixed-{i}",
+                title=f"Item {i}",
+                original_url=f"https://example.com/mixed/{i}",
+                author="Bench",
+                published_at=datetime.now(UTC),
+            )
+            await repo.update_content_item_summary(item.id, "summary")
+
+    async def reader() -> None:
+        for _ in range(READS_PER_READER):
+            start = time.perf_counter()
+            await repo.get_content_stats()
+            read_latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(writer(), *(reader() for _ in range(READERS)))
+    return time.perf_counter() - start, read_latencies
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+
+async def run_profile(name: str, pragmas: SQLitePragmas, directory: Path) -> None:
+    repo = Repository(f"sqlite+aiosqlite:///{directory / f'{name}.db'}", pragmas=pragmas)
+    await repo.initialize()
+    source = await repo.add_source(source_type=SourceType.RSS, name=name, identifier=name)
+
+    commits = await bench_commits(repo, source.id)
+    mixed_elapsed, reads = await bench_mixed(repo, source.id)
+    await repo.close()
+
+    print(
+        f"{name:>8}: commit p50={statistics.median(commits) * 1000:.2f}ms "
+        f"p95={percentile(commits, 0.95) * 1000:.2f}ms | "
+        f"mixed total={mixed_elapsed:.2f}s "
+        f"read p50={statistics.median(reads) * 1000:.2f}ms "
+        f"p95={percentile(reads, 0.95) * 1000:.2f}ms"
+    )
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, pragmas in PROFILES.items():
+            await run_profile(name, pragmas, Path(tmp))
+
+
+if __name__ == "__main__":
+    import structlog
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(30))
+    asyncio.run(main())
@@ -6,7 +6,8 @@ import structlog
 from bs4 import BeautifulSoup, Tag
 
 from intelstream.adapters.base import BaseAdapter, ContentData
-from intelstream.utils.feed_utils import parse_feed_date
+from intelstream.utils.feed_utils import parse_feed, parse_feed_date
+from intelstream.utils.parse_pool import run_parse
 
 logger = structlog.get_logger()
 
@@ -54,7 +55,7 @@ class ArxivAdapter(BaseAdapter):
                     response.raise_for_status()
                     content = response.text
 
-            feed = feedparser.parse(content)
+            feed = await run_parse(parse_feed, content)
 
             if feed.bozo and not feed.entries:
                 logger.warning(
@@ -183,7 +184,7 @@ class ArxivAdapter(BaseAdapter):
 
             response.raise_for_status()
 
-            content = self._extract_paper_content(response.text)
+            content = await run_parse(extract_paper_content, response.text)
             if content:
                 logger.info(
                     "Extracted HTML content",
@@ -244,3 +245,8 @@ class ArxivAdapter(BaseAdapter):
         content = re.sub(r"\n\s*\n", "\n\n", content)
 
         return content.strip() if content.strip() else None
+
+
+def extract_paper_content(html: str) -> str | None:
+    """Parse-pool job for ``ArxivAdapter._extract_paper_content``."""
+    return ArxivAdapter()._extract_paper_content(html)
@@ -1,17 +1,91 @@
 import contextlib
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
 from urllib.parse import urljoin
 
 import httpx
+import lxml.html
 import structlog
 from bs4 import BeautifulSoup, Tag
+from cssselect import HTMLTranslator, SelectorError
+from lxml import etree
 
 from intelstream.adapters.base import BaseAdapter, ContentData
 from intelstream.services.page_analyzer import ExtractionProfile
+from intelstream.utils.parse_pool import run_parse
 
 logger = structlog.get_logger()
 
+_translator = HTMLTranslator()
+
+# Text nodes BeautifulSoup's get_text() returns: comments are not text nodes,
+# and it leaves out script, style and template contents.
+_visible_text = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    """An ExtractionProfile's CSS selectors compiled to lxml XPath objects."""
+
+    post: etree.XPath
+    title: etree.XPath
+    url: etree.XPath
+    date: etree.XPath | None
+    author: etree.XPath | None
+
+
+def compile_profile(profile: ExtractionProfile) -> CompiledProfile | None:
+    """Return the profile's compiled selectors, or None if lxml cannot express one.
+
+    Compiled selectors are cached per process, so a profile is compiled once
+    per worker; an edited profile has different selectors and compiles anew.
+    """
+    return _compile_selectors(
+        profile.post_selector,
+        profile.title_selector,
+        profile.url_selector,
+        profile.date_selector,
+        profile.author_selector,
+    )
+
+
+def _compile(selector: str) -> etree.XPath:
+    # Like soupsieve, match descendants only, never the context element itself.
+    return etree.XPath(_translator.css_to_xpath(selector, prefix="descendant::"))
+
+
+@lru_cache(maxsize=256)
+def _compile_selectors(
+    post: str, title: str, url: str, date: str | None, author: str | None
+) -> CompiledProfile | None:
+    try:
+        return CompiledProfile(
+            post=_compile(post),
+            title=_compile(title),
+            url=_compile(url),
+            date=_compile(date) if date else None,
+            author=_compile(author) if author else None,
+        )
+    except (SelectorError, etree.XPathError) as e:
+        logger.info("Selector not supported by lxml, using BeautifulSoup", error=str(e))
+        return None
+
+
+def _first(selector: etree.XPath, element: lxml.html.HtmlElement) -> lxml.html.HtmlElement | None:
+    matches = selector(element)
+    return matches[0] if matches else None
+
+
+def _text(element: lxml.html.HtmlElement) -> str:
+    # Same result as BeautifulSoup's get_text(strip=True).
+    return "".join(text.strip() for text in _visible_text(element))
+
 
 class PageAdapter(BaseAdapter):
     def __init__(
@@ -45,7 +119,7 @@ class PageAdapter(BaseAdapter):
 
         try:
             html = await self._fetch_html(url)
-            items = self._extract_posts(html, url)
+            items = await run_parse(extract_posts, self._profile, html, url)
 
             logger.info(
                 "Fetched page content",
@@ -82,15 +156,34 @@ class PageAdapter(BaseAdapter):
         return response.text
 
     def _extract_posts(self, html: str, page_url: str) -> list[ContentData]:
+        base_url = self._profile.base_url or page_url
+
+        compiled = compile_profile(self._profile)
+        if compiled is not None:
+            try:
+                root = lxml.html.document_fromstring(html)
+            except (ValueError, etree.ParserError):
+                # Empty documents and strings with an XML encoding declaration.
+                pass
+            else:
+                return self._collect_posts(
+                    compiled.post(root),
+                    lambda post: self._parse_compiled_post(post, base_url, compiled),
+                )
+
         soup = BeautifulSoup(html, "lxml")
-        posts = soup.select(self._profile.post_selector)
+        return self._collect_posts(
+            soup.select(self._profile.post_selector),
+            lambda post: self._parse_post(post, base_url),
+        )
 
+    def _collect_posts(
+        self, posts: list[Any], parse: Callable[[Any], ContentData | None]
+    ) -> list[ContentData]:
         items: list[ContentData] = []
-        base_url = self._profile.base_url or page_url
-
         for post in posts:
             try:
-                item = self._parse_post(post, base_url)
+                item = parse(post)
                 if item:
                     items.append(item)
             except Exception as e:
@@ -120,15 +213,68 @@ class PageAdapter(BaseAdapter):
         if not url_value:
             return None
 
-        original_url = str(url_value)
+        return self._build_item(
+            title,
+            str(url_value),
+            base_url,
+            published_at=self._extract_date(post),
+            author=self._extract_author(post),
+        )
+
+    def _parse_compiled_post(
+        self, post: lxml.html.HtmlElement, base_url: str, compiled: CompiledProfile
+    ) -> ContentData | None:
+        title_elem = _first(compiled.title, post)
+        if title_elem is None:
+            return None
+
+        title = _text(title_elem)
+        if not title:
+            return None
+
+        url_elem = _first(compiled.url, post)
+        if url_elem is None:
+            return None
+
+        url_value = url_elem.get(self._profile.url_attribute)
+        if not url_value:
+            return None
+
+        date_str: str | None = None
+        date_elem = _first(compiled.date, post) if compiled.date is not None else None
+        if date_elem is not None:
+            if self._profile.date_attribute:
+                date_str = date_elem.get(self._profile.date_attribute)
+            else:
+                date_str = _text(date_elem)
+
+        author: str | None = None
+        author_elem = _first(compiled.author, post) if compiled.author is not None else None
+        if author_elem is not None:
+            author = _text(author_elem) or None
+
+        return self._build_item(
+            title,
+            url_value,
+            base_url,
+            published_at=self._parse_date_string(date_str) if date_str else datetime.now(UTC),
+            author=author,
+        )
+
+    def _build_item(
+        self,
+        title: str,
+        url_value: str,
+        base_url: str,
+        published_at: datetime,
+        author: str | None,
+    ) -> ContentData:
+        original_url = url_value
         if not original_url.startswith(("http://", "https://")):
             original_url = urljoin(base_url, original_url)
 
         external_id = original_url
 
-        published_at = self._extract_date(post)
-        author = self._extract_author(post)
-
         return ContentData(
             external_id=external_id,
             title=title,
@@ -200,3 +346,8 @@ class PageAdapter(BaseAdapter):
             return None
 
         return author_elem.get_text(strip=True) or None
+
+
+def extract_posts(profile: ExtractionProfile, html: str, page_url: str) -> list[ContentData]:
+    """Parse-pool job for ``PageAdapter._extract_posts``."""
+    return PageAdapter(profile)._extract_posts(html, page_url)
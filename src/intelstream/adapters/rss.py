@@ -5,7 +5,8 @@ import httpx
 import structlog
 
 from intelstream.adapters.base import BaseAdapter, ContentData
-from intelstream.utils.feed_utils import parse_feed_date
+from intelstream.utils.feed_utils import ParsedFeed, parse_feed, parse_feed_date
+from intelstream.utils.parse_pool import run_parse
 
 logger = structlog.get_logger()
 
@@ -42,7 +43,7 @@ class RSSAdapter(BaseAdapter):
                     response.raise_for_status()
                     content = response.text
 
-            feed = feedparser.parse(content)
+            feed = await run_parse(parse_feed, content)
 
             if feed.bozo and not feed.entries:
                 logger.warning(
@@ -80,9 +81,7 @@ class RSSAdapter(BaseAdapter):
             logger.error("Request error fetching RSS feed", identifier=identifier, error=str(e))
             raise
 
-    def _parse_entry(
-        self, entry: feedparser.FeedParserDict, feed: feedparser.FeedParserDict
-    ) -> ContentData:
+    def _parse_entry(self, entry: feedparser.FeedParserDict, feed: ParsedFeed) -> ContentData:
         external_id: str = str(entry.get("id") or entry.get("link") or "")
         title: str = str(entry.get("title", "Untitled"))
         original_url: str = str(entry.get("link", ""))
@@ -101,9 +100,7 @@ class RSSAdapter(BaseAdapter):
             thumbnail_url=thumbnail_url,
         )
 
-    def _extract_author(
-        self, entry: feedparser.FeedParserDict, feed: feedparser.FeedParserDict
-    ) -> str:
+    def _extract_author(self, entry: feedparser.FeedParserDict, feed: ParsedFeed) -> str:
         if entry.get("author"):
             return str(entry.author)
 
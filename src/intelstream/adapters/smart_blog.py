@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
@@ -22,6 +24,11 @@ from intelstream.services.content_extractor import ContentExtractor
 logger = structlog.get_logger()
 UNKNOWN_DATE = datetime(1970, 1, 1, tzinfo=UTC)
 
+# Strategies that cost an API call. During analysis they start only once the
+# cheaper strategies have failed, or after a delay if those are still running.
+SPECULATIVE_STRATEGIES = frozenset({"llm"})
+SPECULATIVE_START_DELAY_SECONDS = 5.0
+
 
 @dataclass
 class AnalysisResult:
@@ -47,7 +54,7 @@ class SmartBlogAdapter(BaseAdapter):
         self._content_extractor = ContentExtractor(http_client=http_client)
         self._strategies: list[DiscoveryStrategy] = [
             RSSDiscoveryStrategy(http_client=http_client),
-            SitemapDiscoveryStrategy(http_client=http_client),
+            SitemapDiscoveryStrategy(http_client=http_client, repository=repository),
             LLMExtractionStrategy(
                 anthropic_client=anthropic_client,
                 repository=repository,
@@ -65,19 +72,44 @@ class SmartBlogAdapter(BaseAdapter):
     async def analyze_site(self, url: str) -> AnalysisResult:
         logger.info("Analyzing site for blog content", url=url)
 
-        for strategy in self._strategies:
+        found = await self._race_strategies(url)
+        if found is not None:
+            strategy, result = found
+            sample_urls = [p.url for p in result.posts[:5]]
+            return AnalysisResult(
+                success=True,
+                strategy=strategy.name,
+                post_count=len(result.posts),
+                sample_posts=sample_urls,
+                feed_url=result.feed_url,
+                url_pattern=result.url_pattern,
+            )
+
+        return AnalysisResult(
+            success=False,
+            error="Unable to find blog posts on this page. "
+            "The page may not contain a recognizable blog/article listing.",
+        )
+
+    async def _race_strategies(self, url: str) -> tuple[DiscoveryStrategy, DiscoveryResult] | None:
+        """Run the strategies concurrently and return the most preferred one that found posts.
+
+        The cheap strategies start at once. A speculative strategy (LLM
+        extraction) starts when every cheap one has failed, or after
+        ``SPECULATIVE_START_DELAY_SECONDS`` if they are still running. Results
+        are taken in ``self._strategies`` order, so a strategy only wins once
+        every strategy before it has failed; the rest are then cancelled.
+        """
+        cheap_failed = asyncio.Event()
+
+        async def run(strategy: DiscoveryStrategy) -> DiscoveryResult | None:
+            if strategy.name in SPECULATIVE_STRATEGIES:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        cheap_failed.wait(), timeout=SPECULATIVE_START_DELAY_SECONDS
+                    )
             try:
                 result = await strategy.discover(url)
-                if result and result.posts:
-                    sample_urls = [p.url for p in result.posts[:5]]
-                    return AnalysisResult(
-                        success=True,
-                        strategy=strategy.name,
-                        post_count=len(result.posts),
-                        sample_posts=sample_urls,
-                        feed_url=result.feed_url,
-                        url_pattern=result.url_pattern,
-                    )
             except Exception as e:
                 logger.warning(
                     "Strategy failed during analysis",
@@ -85,13 +117,25 @@ class SmartBlogAdapter(BaseAdapter):
                     url=url,
                     error=str(e),
                 )
-                continue
+                return None
+            return result if result and result.posts else None
 
-        return AnalysisResult(
-            success=False,
-            error="Unable to find blog posts on this page. "
-            "The page may not contain a recognizable blog/article listing.",
-        )
+        tasks = [asyncio.create_task(run(strategy)) for strategy in self._strategies]
+        remaining_cheap = sum(1 for s in self._strategies if s.name not in SPECULATIVE_STRATEGIES)
+        try:
+            for strategy, task in zip(self._strategies, tasks, strict=True):
+                result = await task
+                if result is not None:
+                    return strategy, result
+                if strategy.name not in SPECULATIVE_STRATEGIES:
+                    remaining_cheap -= 1
+                    if remaining_cheap == 0:
+                        cheap_failed.set()
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def fetch_latest(
         self,
@@ -109,13 +153,13 @@ class SmartBlogAdapter(BaseAdapter):
 
         if strategy_name == "rss" and source.feed_url:
             items = await self._fetch_via_rss(source)
-            if items:
-                await self._repository.reset_failure_count(source.id)
+            if items and await self._repository.reset_failure_count(source.id):
+                logger.info("Blog source recovered", identifier=identifier)
             return items
 
         result = await self._discover_with_fallback(identifier, strategy_name, url_pattern, source)
 
-        if not result or not result.posts:
+        if not result or not result.found:
             failures = await self._repository.increment_failure_count(source.id)
             if failures >= get_settings().max_consecutive_failures:
                 logger.info(
@@ -134,7 +178,8 @@ class SmartBlogAdapter(BaseAdapter):
                     await self._repository.reset_failure_count(source.id)
             return []
 
-        await self._repository.reset_failure_count(source.id)
+        if await self._repository.reset_failure_count(source.id):
+            logger.info("Blog source recovered", identifier=identifier)
 
         new_posts: list[DiscoveredPost] = []
         for post in result.posts:
@@ -143,9 +188,11 @@ class SmartBlogAdapter(BaseAdapter):
 
         if not new_posts:
             logger.debug("No new posts found", identifier=identifier)
+            await self._advance_sitemap_watermark(source, result, failed=[])
             return []
 
         content_items: list[ContentData] = []
+        failed: list[DiscoveredPost] = []
         for post in new_posts:
             try:
                 extracted = await self._content_extractor.extract(post.url)
@@ -166,8 +213,11 @@ class SmartBlogAdapter(BaseAdapter):
                     url=post.url,
                     error=str(e),
                 )
+                failed.append(post)
                 continue
 
+        await self._advance_sitemap_watermark(source, result, failed)
+
         logger.info(
             "Fetched blog content",
             identifier=identifier,
@@ -175,6 +225,25 @@ class SmartBlogAdapter(BaseAdapter):
         )
         return content_items
 
+    async def _advance_sitemap_watermark(
+        self, source: Source, result: DiscoveryResult, failed: list[DiscoveredPost]
+    ) -> None:
+        """Remember the newest sitemap lastmod handled so the next poll skips older entries."""
+        if result.watermark is None:
+            return
+
+        # Stop at the oldest failed post so it is offered again, and never pass
+        # the current time in case a site publishes lastmods in the future.
+        candidates = [result.watermark, datetime.now(UTC)]
+        candidates.extend(post.published_at for post in failed if post.published_at is not None)
+        watermark = min(candidates)
+
+        current = source.sitemap_lastmod_watermark
+        if current is not None and current.tzinfo is None:
+            current = current.replace(tzinfo=UTC)
+        if current is None or watermark > current:
+            await self._repository.update_source_sitemap_watermark(source.id, watermark)
+
     async def _fetch_via_rss(self, source: Source) -> list[ContentData]:
         from intelstream.adapters.rss import RSSAdapter
 
@@ -195,8 +264,10 @@ class SmartBlogAdapter(BaseAdapter):
             strategy = self._get_strategy_by_name(cached_strategy)
             if strategy:
                 try:
-                    result = await strategy.discover(url, url_pattern=url_pattern)
-                    if result and result.posts:
+                    result = await strategy.discover(
+                        url, url_pattern=url_pattern, since=source.sitemap_lastmod_watermark
+                    )
+                    if result and result.found:
                         return result
                 except Exception as e:
                     logger.warning(
@@ -211,8 +282,10 @@ class SmartBlogAdapter(BaseAdapter):
                 continue
 
             try:
-                result = await strategy.discover(url, url_pattern=url_pattern)
-                if result and result.posts:
+                result = await strategy.discover(
+                    url, url_pattern=url_pattern, since=source.sitemap_lastmod_watermark
+                )
+                if result and result.found:
                     if strategy.name != cached_strategy:
                         logger.info(
                             "Fallback strategy succeeded, updating source",
@@ -15,6 +15,13 @@ class DiscoveryResult:
     posts: list[DiscoveredPost]
     feed_url: str | None = None
     url_pattern: str | None = None
+    # Newest lastmod seen among matching entries, for strategies that report one.
+    watermark: datetime | None = None
+
+    @property
+    def found(self) -> bool:
+        """Whether the strategy worked, even if nothing was newer than ``since``."""
+        return bool(self.posts) or self.watermark is not None
 
 
 class DiscoveryStrategy(ABC):
@@ -28,6 +35,7 @@ class DiscoveryStrategy(ABC):
         self,
         url: str,
         url_pattern: str | None = None,
+        since: datetime | None = None,
     ) -> DiscoveryResult | None:
         """
         Attempt to discover posts from the given URL.
@@ -35,6 +43,8 @@ class DiscoveryStrategy(ABC):
         Args:
             url: The page URL to discover posts from.
             url_pattern: Optional URL pattern to filter posts (used by sitemap strategy).
+            since: Optional watermark; posts last modified before it may be left out
+                (used by sitemap strategy).
 
         Returns:
             DiscoveryResult with posts if strategy works, None if not applicable.
@@ -2,12 +2,14 @@ import asyncio
 import hashlib
 import json
 import re
+from datetime import datetime
 from urllib.parse import urljoin, urlparse
 
 import anthropic
 import httpx
 import structlog
 from bs4 import BeautifulSoup
+from lxml import etree
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -22,6 +24,7 @@ from intelstream.adapters.strategies.base import (
 )
 from intelstream.config import get_settings
 from intelstream.database.repository import Repository
+from intelstream.utils.parse_pool import run_parse
 from intelstream.utils.url_validation import SSRFError, validate_url_for_ssrf
 
 logger = structlog.get_logger()
@@ -45,6 +48,122 @@ HTML:
 {html}"""
 
 
+_FINGERPRINT_SKIPPED_TAGS = frozenset(
+    {"script", "style", "nav", "header", "footer", "aside", "noscript", "template"}
+)
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+
+class _FingerprintTarget:
+    """lxml parser target that records links and headings without building a tree."""
+
+    def __init__(self) -> None:
+        self.links: list[str] = []
+        self.headings: list[str] = []
+        self.text: list[str] = []
+        self._skip_depth = 0
+        self._heading_depth = 0
+        self._heading_text: list[str] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if tag in _FINGERPRINT_SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif self._skip_depth:
+            return
+        elif tag == "a":
+            href = (attrib.get("href") or "").strip()
+            if href and not href.startswith(("#", "javascript:")):
+                self.links.append(href)
+        elif tag in _HEADING_TAGS:
+            self._heading_depth += 1
+
+    def end(self, tag: str) -> None:
+        if tag in _FINGERPRINT_SKIPPED_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif not self._skip_depth and tag in _HEADING_TAGS and self._heading_depth:
+            self._heading_depth -= 1
+            if not self._heading_depth:
+                self.headings.append(" ".join("".join(self._heading_text).split()))
+                self._heading_text.clear()
+
+    def data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._heading_depth:
+            self._heading_text.append(data)
+        self.text.append(data)
+
+    def close(self) -> None:
+        return None
+
+
+def content_fingerprint(html: str) -> str:
+    """Hash the ordered in-page links and headings of an HTML page.
+
+    One streaming lxml pass, with navigation, header, footer and script
+    content skipped. A new or removed post changes the links, while rotating
+    inline scripts, timestamps and tracking markup do not. Pages without any
+    links or headings fall back to their visible text.
+    """
+    target = _FingerprintTarget()
+    parser = etree.HTMLParser(target=target, no_network=True)
+    parser.feed(html)
+    parser.close()
+
+    if target.links or target.headings:
+        payload = "\n".join(target.links) + "\x00" + "\n".join(target.headings)
+    else:
+        payload = " ".join("".join(target.text).split())
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def legacy_content_hash(html: str) -> str:
+    """Hash the visible main text of an HTML page, as extraction caches did before fingerprints.
+
+    Only used to carry over cache rows written by older releases; those rows
+    expire after ``EXTRACTION_CACHE_MAX_AGE_DAYS``.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup.find_all(["script", "style", "nav", "header", "footer", "aside", "noscript"]):
+        tag.decompose()
+    main = soup.find("main") or soup.find("article") or soup.find(id="content") or soup.body
+    if main:
+        text = " ".join(main.get_text().split())
+        return hashlib.sha256(text.encode()).hexdigest()
+    return hashlib.sha256(html.encode()).hexdigest()
+
+
+def clean_html(html: str, max_html_length: int) -> str:
+    """Strip scripts and noisy attributes and truncate for the prompt; a parse-pool job."""
+    soup = BeautifulSoup(html, "lxml")
+
+    for tag in soup.find_all(["script", "style", "noscript", "svg", "path", "iframe"]):
+        tag.decompose()
+
+    for tag in soup.find_all(True):
+        attrs_to_remove = []
+        for attr in tag.attrs:
+            if attr not in ["class", "id", "href", "data-href", "rel"]:
+                attrs_to_remove.append(attr)
+        for attr in attrs_to_remove:
+            del tag[attr]
+
+    cleaned = str(soup)
+
+    if len(cleaned) > max_html_length:
+        truncated = cleaned[:max_html_length]
+        last_close = truncated.rfind(">")
+        if last_close > max_html_length - 1000:
+            truncated = truncated[: last_close + 1]
+        else:
+            last_open = truncated.rfind("<")
+            if last_open > 0:
+                truncated = truncated[:last_open]
+        cleaned = truncated
+
+    return cleaned
+
+
 class LLMExtractionStrategy(DiscoveryStrategy):
     def __init__(
         self,
@@ -66,6 +185,7 @@ class LLMExtractionStrategy(DiscoveryStrategy):
         self,
         url: str,
         url_pattern: str | None = None,  # noqa: ARG002
+        since: datetime | None = None,  # noqa: ARG002
     ) -> DiscoveryResult | None:
         html = await self._fetch_html(url)
         if not html:
@@ -74,7 +194,18 @@ class LLMExtractionStrategy(DiscoveryStrategy):
         content_hash = self._get_content_hash(html)
 
         cached = await self._repository.get_extraction_cache(url)
-        if cached and cached.content_hash == content_hash:
+        hash_matches = cached is not None and cached.content_hash == content_hash
+        if (
+            cached is not None
+            and not hash_matches
+            and cached.content_hash == await run_parse(legacy_content_hash, html)
+        ):
+            # Written before fingerprints and the page is unchanged: keep the
+            # posts under the new fingerprint instead of extracting again.
+            logger.debug("Carrying over extraction cached under the legacy hash", url=url)
+            await self._repository.set_extraction_cache(url, content_hash, cached.posts_json)
+            hash_matches = True
+        if cached is not None and hash_matches:
             try:
                 posts_data = json.loads(cached.posts_json)
                 if isinstance(posts_data, list):
@@ -118,20 +249,7 @@ class LLMExtractionStrategy(DiscoveryStrategy):
         return DiscoveryResult(posts=posts)
 
     def _get_content_hash(self, html: str) -> str:
-        soup = BeautifulSoup(html, "lxml")
-
-        for tag in soup.find_all(
-            ["script", "style", "nav", "header", "footer", "aside", "noscript"]
-        ):
-            tag.decompose()
-
-        main = soup.find("main") or soup.find("article") or soup.find(id="content") or soup.body
-
-        if main:
-            text = " ".join(main.get_text().split())
-            return hashlib.sha256(text.encode()).hexdigest()
-
-        return hashlib.sha256(html.encode()).hexdigest()
+        return content_fingerprint(html)
 
     async def _fetch_html(self, url: str) -> str | None:
         headers = {
@@ -149,36 +267,6 @@ class LLMExtractionStrategy(DiscoveryStrategy):
             logger.debug("Failed to fetch HTML", url=url, error=str(e))
             return None
 
-    def _clean_html(self, html: str) -> str:
-        soup = BeautifulSoup(html, "lxml")
-
-        for tag in soup.find_all(["script", "style", "noscript", "svg", "path", "iframe"]):
-            tag.decompose()
-
-        for tag in soup.find_all(True):
-            attrs_to_remove = []
-            for attr in tag.attrs:
-                if attr not in ["class", "id", "href", "data-href", "rel"]:
-                    attrs_to_remove.append(attr)
-            for attr in attrs_to_remove:
-                del tag[attr]
-
-        cleaned = str(soup)
-
-        max_html_length = get_settings().max_html_length
-        if len(cleaned) > max_html_length:
-            truncated = cleaned[:max_html_length]
-            last_close = truncated.rfind(">")
-            if last_close > max_html_length - 1000:
-                truncated = truncated[: last_close + 1]
-            else:
-                last_open = truncated.rfind("<")
-                if last_open > 0:
-                    truncated = truncated[:last_open]
-            cleaned = truncated
-
-        return cleaned
-
     @retry(
         retry=retry_if_exception_type(anthropic.RateLimitError),
         wait=wait_exponential(multiplier=1, min=4, max=60),
@@ -188,7 +276,7 @@ class LLMExtractionStrategy(DiscoveryStrategy):
         parsed = urlparse(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
 
-        cleaned_html = self._clean_html(html)
+        cleaned_html = await run_parse(clean_html, html, get_settings().max_html_length)
 
         prompt = EXTRACTION_PROMPT.format(base_url=base_url, html=cleaned_html)
 
@@ -1,7 +1,7 @@
 import re
+from datetime import datetime
 from urllib.parse import urljoin, urlparse
 
-import feedparser
 import httpx
 import structlog
 from bs4 import BeautifulSoup
@@ -12,7 +12,9 @@ from intelstream.adapters.strategies.base import (
     DiscoveryStrategy,
 )
 from intelstream.config import get_settings
-from intelstream.utils.feed_utils import parse_feed_date
+from intelstream.utils.feed_utils import parse_feed, parse_feed_date
+from intelstream.utils.parse_pool import run_parse
+from intelstream.utils.ttl_cache import TTLCache
 from intelstream.utils.url_validation import SSRFError, validate_url_for_ssrf
 
 logger = structlog.get_logger()
@@ -30,10 +32,49 @@ RSS_PATHS = [
     "/feeds/posts/default",
 ]
 
+FOUND_FEED_TTL_SECONDS = 6 * 3600
+DEAD_PATH_TTL_SECONDS = 24 * 3600
+MAX_PROBED_SITES = 1024
+DEAD_PATH_STATUSES = frozenset({404, 410})
+
+
+class FeedProbeCache:
+    """Outcomes of probing ``RSS_PATHS``, keyed by site root.
+
+    A feed found by probing is reused until it expires or stops parsing. A
+    path that answered 404 or 410, or answered 200 with something that is not
+    a feed, is not probed again until it expires. Network errors and other
+    statuses are not cached, since they may be transient.
+    """
+
+    def __init__(
+        self,
+        found_ttl_seconds: float = FOUND_FEED_TTL_SECONDS,
+        dead_ttl_seconds: float = DEAD_PATH_TTL_SECONDS,
+        max_sites: int = MAX_PROBED_SITES,
+    ) -> None:
+        self.found: TTLCache[str, str] = TTLCache(found_ttl_seconds, max_entries=max_sites)
+        self.dead: TTLCache[tuple[str, str], bool] = TTLCache(
+            dead_ttl_seconds, max_entries=max_sites * len(RSS_PATHS)
+        )
+
+    def clear(self) -> None:
+        self.found.clear()
+        self.dead.clear()
+
+
+# Shared so /source add, polling fallbacks and re-analysis all reuse one another's probes.
+shared_probe_cache = FeedProbeCache()
+
 
 class RSSDiscoveryStrategy(DiscoveryStrategy):
-    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        probe_cache: FeedProbeCache | None = None,
+    ) -> None:
         self._client = http_client
+        self._probe_cache = probe_cache if probe_cache is not None else shared_probe_cache
 
     @property
     def name(self) -> str:
@@ -43,6 +84,7 @@ class RSSDiscoveryStrategy(DiscoveryStrategy):
         self,
         url: str,
         url_pattern: str | None = None,  # noqa: ARG002
+        since: datetime | None = None,  # noqa: ARG002
     ) -> DiscoveryResult | None:
         parsed = urlparse(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
@@ -52,9 +94,11 @@ class RSSDiscoveryStrategy(DiscoveryStrategy):
             return None
 
         rss_url = self._find_rss_in_html(html, base_url)
+        probed = False
 
         if not rss_url:
             rss_url = await self._probe_rss_paths(base_url)
+            probed = True
 
         if not rss_url:
             logger.debug("No RSS feed found", url=url)
@@ -62,6 +106,8 @@ class RSSDiscoveryStrategy(DiscoveryStrategy):
 
         posts = await self._parse_feed(rss_url)
         if not posts:
+            if probed:
+                self._probe_cache.found.invalidate(base_url)
             return None
 
         logger.info("RSS feed discovered", url=url, rss_url=rss_url, post_count=len(posts))
@@ -113,6 +159,11 @@ class RSSDiscoveryStrategy(DiscoveryStrategy):
         return None
 
     async def _probe_rss_paths(self, base_url: str) -> str | None:
+        cached = self._probe_cache.found.get(base_url)
+        if cached is not None:
+            logger.debug("Using cached RSS probe result", base_url=base_url, rss_url=cached)
+            return cached
+
         headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
@@ -138,38 +189,48 @@ class RSSDiscoveryStrategy(DiscoveryStrategy):
                         t in content_type for t in ["xml", "rss", "atom", "text/plain"]
                     ) or await self._is_valid_feed(probe_url):
                         return probe_url
+                    self._probe_cache.dead.set((base_url, path), True)
+                elif response.status_code in DEAD_PATH_STATUSES:
+                    self._probe_cache.dead.set((base_url, path), True)
             except httpx.HTTPError:
                 pass
             return None
 
+        skipped = 0
         for path in RSS_PATHS:
+            if self._probe_cache.dead.get((base_url, path)):
+                skipped += 1
+                continue
             result = await check_path(path)
             if result:
+                self._probe_cache.found.set(base_url, result)
                 return result
 
+        if skipped:
+            logger.debug("Skipped known dead RSS paths", base_url=base_url, skipped=skipped)
         return None
 
     async def _is_valid_feed(self, url: str) -> bool:
-        try:
-            if self._client:
-                response = await self._client.get(url, follow_redirects=True)
-            else:
-                async with httpx.AsyncClient(timeout=get_settings().http_timeout_seconds) as client:
-                    response = await client.get(url, follow_redirects=True)
-
-            if response.status_code != 200:
-                return False
-
-            content_type = response.headers.get("content-type", "").lower()
-            if not any(t in content_type for t in ["xml", "rss", "atom", "text/plain", "text/xml"]):
-                return False
-
-            feed = feedparser.parse(response.text)
-            return len(feed.entries) > 0
-
-        except httpx.HTTPError:
+        """Fetch ``url`` and report whether it is a feed with entries.
+
+        Network errors and error statuses raise ``httpx.HTTPError`` rather than
+        returning False, so the caller does not mistake a transient failure
+        for a path that serves something other than a feed.
+        """
+        if self._client:
+            response = await self._client.get(url, follow_redirects=True)
+        else:
+            async with httpx.AsyncClient(timeout=get_settings().http_timeout_seconds) as client:
+                response = await client.get(url, follow_redirects=True)
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "").lower()
+        if not any(t in content_type for t in ["xml", "rss", "atom", "text/plain", "text/xml"]):
             return False
 
+        feed = await run_parse(parse_feed, response.text)
+        return len(feed.entries) > 0
+
     async def _parse_feed(self, rss_url: str) -> list[DiscoveredPost] | None:
         try:
             if self._client:
@@ -179,7 +240,7 @@ class RSSDiscoveryStrategy(DiscoveryStrategy):
                     response = await client.get(rss_url, follow_redirects=True)
 
             response.raise_for_status()
-            feed = feedparser.parse(response.text)
+            feed = await run_parse(parse_feed, response.text)
 
             if feed.bozo and not feed.entries:
                 return None
@@ -1,12 +1,19 @@
-import gzip
+import asyncio
+import contextlib
+import json
 import re
-from datetime import UTC, datetime
+import zlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from urllib.parse import urljoin, urlparse
-from xml.etree.ElementTree import Element, ParseError
+from xml.etree.ElementTree import ParseError
 
 import httpx
 import structlog
-from defusedxml import ElementTree
+from defusedxml import DefusedXmlException
+from defusedxml.ElementTree import DefusedXMLParser
 
 from intelstream.adapters.strategies.base import (
     DiscoveredPost,
@@ -14,6 +21,8 @@ from intelstream.adapters.strategies.base import (
     DiscoveryStrategy,
 )
 from intelstream.config import get_settings
+from intelstream.database.models import SitemapLocation
+from intelstream.database.repository import Repository
 from intelstream.utils.url_validation import SSRFError, validate_url_for_ssrf
 
 logger = structlog.get_logger()
@@ -22,6 +31,14 @@ MAX_SITEMAP_URLS = 10000
 MAX_SUB_SITEMAPS = 10
 MAX_COMPRESSED_SIZE = 10 * 1024 * 1024  # 10MB compressed
 MAX_DECOMPRESSED_SIZE = 50 * 1024 * 1024  # 50MB decompressed
+INFLATE_CHUNK_SIZE = 256 * 1024
+MAX_CONCURRENT_FETCHES_PER_HOST = 4
+# Nesting levels of sitemap indexes followed below the root sitemap.
+MAX_SITEMAP_DEPTH = 3
+# Sub-sitemaps of a single index parsed at the same time.
+MAX_CONCURRENT_SUB_SITEMAPS = 4
+# How long a stored sitemap location is trusted before robots.txt is read again.
+LOCATION_RECHECK_INTERVAL = timedelta(days=7)
 
 SITEMAP_PATHS = [
     "/sitemap.xml",
@@ -41,14 +58,149 @@ BLOG_PATH_PATTERNS = [
     "announcements",
 ]
 
-SITEMAP_NS = {
-    "sm": "http://www.sitemaps.org/schemas/sitemap/0.9",
-}
+LASTMOD_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d",
+]
+
+
+class SitemapTooLargeError(Exception):
+    def __init__(self, message: str, size: int, limit: int) -> None:
+        super().__init__(message)
+        self.size = size
+        self.limit = limit
+
+
+@dataclass(frozen=True, slots=True)
+class SitemapEntry:
+    url: str
+    lastmod: datetime | None
+
+
+def _parse_lastmod(lastmod: str | None) -> datetime | None:
+    if not lastmod:
+        return None
+
+    lastmod = lastmod.replace("Z", "+00:00")
+
+    # fromisoformat covers the W3C datetime forms sitemaps use, much faster than strptime.
+    with contextlib.suppress(ValueError):
+        dt = datetime.fromisoformat(lastmod)
+        return dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)
+
+    for fmt in LASTMOD_FORMATS:
+        try:
+            dt = datetime.strptime(lastmod, fmt)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=UTC)
+            return dt
+        except ValueError:
+            continue
+
+    return None
+
+
+class _SitemapTarget:
+    """Parser target that keeps only the sitemap entries a poll can use.
+
+    ``<url>`` entries are kept when their location contains ``url_pattern``
+    and their lastmod is not older than ``since``; entries without a lastmod
+    are always kept. ``<sitemap>`` entries of an index are collected as
+    sub-sitemaps. No element tree is built, so memory does not grow with the
+    size of the document.
+
+    When an index is followed, the sub-sitemap results are merged into a
+    target of the same shape: ``listed`` then holds every sub-sitemap the
+    indexes named that was handled, ``skipped_unchanged`` counts those not fetched, and
+    ``failed`` is set when any sub-sitemap could not be fetched or parsed.
+    """
+
+    def __init__(self, url_pattern: str | None, since: datetime | None) -> None:
+        self._url_pattern = url_pattern
+        self._since = since
+        self._fields: dict[str, str] = {}
+        self._field: str | None = None
+        self._text: list[str] = []
+        self.is_index = False
+        self.entries: list[SitemapEntry] = []
+        self.sub_sitemaps: list[SitemapEntry] = []
+        self.skipped_older = 0
+        self.skipped_unchanged = 0
+        self.newest: datetime | None = None
+        self.listed: dict[str, datetime | None] = {}
+        self.fetched = False
+        self.failed = False
+
+    @property
+    def full(self) -> bool:
+        return len(self.entries) >= MAX_SITEMAP_URLS or len(self.sub_sitemaps) >= MAX_SUB_SITEMAPS
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:  # noqa: ARG002
+        name = tag.rpartition("}")[2]
+        if name == "sitemapindex":
+            self.is_index = True
+        elif name in ("url", "sitemap"):
+            self._fields = {}
+        elif name in ("loc", "lastmod"):
+            self._field = name
+            self._text = []
+
+    def data(self, text: str) -> None:
+        if self._field is not None:
+            self._text.append(text)
+
+    def end(self, tag: str) -> None:
+        name = tag.rpartition("}")[2]
+        if name == self._field:
+            self._fields[name] = "".join(self._text).strip()
+            self._field = None
+        elif name == "url":
+            self._add_url(self._fields.get("loc"), self._fields.get("lastmod"))
+        elif name == "sitemap":
+            loc = self._fields.get("loc")
+            if loc and len(self.sub_sitemaps) < MAX_SUB_SITEMAPS:
+                lastmod = _parse_lastmod(self._fields.get("lastmod"))
+                self.sub_sitemaps.append(SitemapEntry(url=loc, lastmod=lastmod))
+
+    def close(self) -> None:
+        pass
+
+    def _add_url(self, loc: str | None, lastmod_text: str | None) -> None:
+        if not loc or len(self.entries) >= MAX_SITEMAP_URLS:
+            return
+        if self._url_pattern and self._url_pattern not in loc:
+            return
+        lastmod = _parse_lastmod(lastmod_text)
+        if lastmod is not None:
+            if self.newest is None or lastmod > self.newest:
+                self.newest = lastmod
+            # Equal lastmods are kept: date-only values cannot order posts within a day.
+            if self._since is not None and lastmod < self._since:
+                self.skipped_older += 1
+                return
+        self.entries.append(SitemapEntry(url=loc, lastmod=lastmod))
+
+    def merge(self, child: "_SitemapTarget") -> None:
+        self.entries.extend(child.entries[: MAX_SITEMAP_URLS - len(self.entries)])
+        self.skipped_older += child.skipped_older
+        self.skipped_unchanged += child.skipped_unchanged
+        self.listed.update(child.listed)
+        self.failed = self.failed or child.failed or not child.fetched
+        if child.newest is not None and (self.newest is None or child.newest > self.newest):
+            self.newest = child.newest
 
 
 class SitemapDiscoveryStrategy(DiscoveryStrategy):
-    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        repository: Repository | None = None,
+    ) -> None:
         self._client = http_client
+        self._repository = repository
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
 
     @property
     def name(self) -> str:
@@ -58,38 +210,62 @@ class SitemapDiscoveryStrategy(DiscoveryStrategy):
         self,
         url: str,
         url_pattern: str | None = None,
+        since: datetime | None = None,
     ) -> DiscoveryResult | None:
         parsed = urlparse(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
 
-        sitemap_url = await self._find_sitemap(base_url)
-        if not sitemap_url:
-            logger.debug("No sitemap found", url=url)
-            return None
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        # Without a pattern every URL is needed to infer one, so nothing is skipped.
+        if not url_pattern:
+            since = None
+
+        location = await self._get_location(url)
+        known = self._known_sub_sitemaps(location) if since is not None else {}
+        checked_at: datetime | None = None
+
+        sitemap_url: str | None = None
+        sitemap: _SitemapTarget | None = None
+        if location is not None and self._is_fresh(location):
+            sitemap_url = location.sitemap_url
+            if not sitemap_url:
+                logger.debug("No sitemap found at last check", url=url)
+                return None
+            sitemap = await self._parse_sitemap(sitemap_url, url_pattern, since, known)
 
-        all_urls = await self._parse_sitemap(sitemap_url)
-        if not all_urls:
-            return None
+        if sitemap is None or not sitemap.fetched:
+            # No usable stored location, or it stopped working: look it up again.
+            checked_at = datetime.now(UTC)
+            sitemap_url = await self._find_sitemap(base_url)
+            sitemap = (
+                await self._parse_sitemap(sitemap_url, url_pattern, since, known)
+                if sitemap_url
+                else None
+            )
 
-        if not url_pattern:
-            url_pattern = self._infer_pattern(url, all_urls)
+        await self._save_location(url, location, sitemap_url, sitemap, checked_at)
 
-        if not url_pattern:
-            logger.debug("Could not infer URL pattern from sitemap", url=url)
+        if not sitemap_url or sitemap is None:
+            logger.debug("No sitemap found", url=url)
             return None
 
-        post_urls = [u for u in all_urls if isinstance(u["url"], str) and url_pattern in u["url"]]
-        if not post_urls:
+        if not url_pattern:
+            if not sitemap.entries:
+                return None
+            url_pattern = self._infer_pattern(url, sitemap.entries)
+            if not url_pattern:
+                logger.debug("Could not infer URL pattern from sitemap", url=url)
+                return None
+            entries = [e for e in sitemap.entries if url_pattern in e.url]
+        else:
+            entries = sitemap.entries
+
+        if not entries and not sitemap.skipped_older and not sitemap.skipped_unchanged:
             logger.debug("No URLs match pattern in sitemap", url=url, pattern=url_pattern)
             return None
 
-        posts = []
-        for u in post_urls:
-            url_str = u["url"]
-            lastmod = u.get("lastmod")
-            if isinstance(url_str, str):
-                published = lastmod if isinstance(lastmod, datetime) else None
-                posts.append(DiscoveredPost(url=url_str, title="", published_at=published))
+        posts = [DiscoveredPost(url=e.url, title="", published_at=e.lastmod) for e in entries]
 
         logger.info(
             "Sitemap discovery successful",
@@ -97,9 +273,72 @@ class SitemapDiscoveryStrategy(DiscoveryStrategy):
             sitemap_url=sitemap_url,
             pattern=url_pattern,
             post_count=len(posts),
+            skipped_older=sitemap.skipped_older,
+            skipped_sub_sitemaps=sitemap.skipped_unchanged,
         )
 
-        return DiscoveryResult(posts=posts, url_pattern=url_pattern)
+        # When every sub-sitemap was skipped nothing newer was seen, so the
+        # current watermark still stands. It also stands when a sub-sitemap
+        # failed, so that sub-sitemap's older entries are offered next poll.
+        watermark = sitemap.newest if sitemap.newest is not None else since
+        if sitemap.failed:
+            logger.debug("Keeping sitemap watermark after a failed sub-sitemap", url=url)
+            watermark = since
+        return DiscoveryResult(posts=posts, url_pattern=url_pattern, watermark=watermark)
+
+    def _is_fresh(self, location: SitemapLocation) -> bool:
+        checked_at = location.checked_at
+        if checked_at.tzinfo is None:
+            checked_at = checked_at.replace(tzinfo=UTC)
+        return datetime.now(UTC) - checked_at < LOCATION_RECHECK_INTERVAL
+
+    def _known_sub_sitemaps(self, location: SitemapLocation | None) -> dict[str, datetime | None]:
+        if location is None:
+            return {}
+        try:
+            stored = json.loads(location.sub_sitemaps_json)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(stored, dict):
+            return {}
+        return {
+            sub_url: _parse_lastmod(lastmod) if isinstance(lastmod, str) else None
+            for sub_url, lastmod in stored.items()
+        }
+
+    async def _get_location(self, page_url: str) -> SitemapLocation | None:
+        if self._repository is None:
+            return None
+        return await self._repository.get_sitemap_location(page_url)
+
+    async def _save_location(
+        self,
+        page_url: str,
+        location: SitemapLocation | None,
+        sitemap_url: str | None,
+        sitemap: _SitemapTarget | None,
+        checked_at: datetime | None,
+    ) -> None:
+        if self._repository is None:
+            return
+        listed = sitemap.listed if sitemap is not None else {}
+        sub_sitemaps_json = json.dumps(
+            {
+                sub_url: lastmod.isoformat() if lastmod else None
+                for sub_url, lastmod in listed.items()
+            },
+            sort_keys=True,
+        )
+        if (
+            checked_at is None
+            and location is not None
+            and (location.sitemap_url, location.sub_sitemaps_json)
+            == (sitemap_url, sub_sitemaps_json)
+        ):
+            return
+        await self._repository.set_sitemap_location(
+            page_url, sitemap_url, sub_sitemaps_json, checked_at=checked_at
+        )
 
     async def _find_sitemap(self, base_url: str) -> str | None:
         robots_sitemap = await self._check_robots_txt(base_url)
@@ -146,164 +385,180 @@ class SitemapDiscoveryStrategy(DiscoveryStrategy):
 
     async def _is_valid_sitemap(self, url: str) -> bool:
         try:
-            if self._client:
-                response = await self._client.get(url, follow_redirects=True)
-            else:
-                async with httpx.AsyncClient(timeout=get_settings().http_timeout_seconds) as client:
-                    response = await client.get(url, follow_redirects=True)
-
-            if response.status_code != 200:
-                return False
-
-            content = response.text[:500]
+            async with self._stream(url) as response:
+                if response.status_code != 200:
+                    return False
+
+                # Only the opening tags are needed, not the whole document.
+                head = b""
+                async for chunk in response.aiter_bytes():
+                    head += chunk
+                    if len(head) >= 500:
+                        break
+
+            content = head[:500].decode("utf-8", errors="replace")
             return "<urlset" in content or "<sitemapindex" in content
 
         except httpx.HTTPError:
             return False
 
-    async def _parse_sitemap(self, sitemap_url: str) -> list[dict[str, str | datetime | None]]:
+    async def _parse_sitemap(
+        self,
+        sitemap_url: str,
+        url_pattern: str | None = None,
+        since: datetime | None = None,
+        known: dict[str, datetime | None] | None = None,
+        visited: set[str] | None = None,
+        depth: int = 0,
+    ) -> _SitemapTarget:
+        """Stream a sitemap through the parser, following an index into its sub-sitemaps.
+
+        Sub-sitemaps are fetched concurrently, at most
+        ``MAX_CONCURRENT_SUB_SITEMAPS`` per index and
+        ``MAX_CONCURRENT_FETCHES_PER_HOST`` per host. One whose index lastmod
+        matches ``known`` and is older than ``since`` was fully handled by an
+        earlier poll and is not fetched again. ``visited`` holds every sitemap
+        already fetched in this walk so an index that lists itself or an
+        ancestor is not followed again, and nothing below ``MAX_SITEMAP_DEPTH``
+        nested indexes is followed.
+        """
+        if visited is None:
+            visited = {sitemap_url}
+        target = _SitemapTarget(url_pattern, since)
         try:
-            if self._client:
-                response = await self._client.get(sitemap_url, follow_redirects=True)
-            else:
-                async with httpx.AsyncClient(timeout=get_settings().http_timeout_seconds) as client:
-                    response = await client.get(sitemap_url, follow_redirects=True)
-
-            response.raise_for_status()
-
-            content = response.content
-
-            if sitemap_url.endswith(".gz") or content[:2] == b"\x1f\x8b":
-                if len(content) > MAX_COMPRESSED_SIZE:
-                    logger.warning(
-                        "Compressed sitemap too large",
-                        url=sitemap_url,
-                        size=len(content),
-                        limit=MAX_COMPRESSED_SIZE,
-                    )
-                    return []
-                content = gzip.decompress(content)
-                if len(content) > MAX_DECOMPRESSED_SIZE:
-                    logger.warning(
-                        "Decompressed sitemap too large",
-                        url=sitemap_url,
-                        size=len(content),
-                        limit=MAX_DECOMPRESSED_SIZE,
-                    )
-                    return []
-                xml_text = content.decode("utf-8")
-            else:
-                if len(content) > MAX_DECOMPRESSED_SIZE:
-                    logger.warning(
-                        "Sitemap too large",
-                        url=sitemap_url,
-                        size=len(content),
-                        limit=MAX_DECOMPRESSED_SIZE,
-                    )
-                    return []
-                xml_text = response.text
-
-            root = ElementTree.fromstring(xml_text)
-
-            if root.tag.endswith("sitemapindex"):
-                return await self._parse_sitemap_index(root)
-
-            return self._parse_urlset(root)
-
-        except (httpx.HTTPError, ParseError, gzip.BadGzipFile) as e:
+            async with self._host_limit(sitemap_url):
+                await self._feed_sitemap(sitemap_url, target)
+        except SitemapTooLargeError as e:
+            logger.warning(str(e), url=sitemap_url, size=e.size, limit=e.limit)
+            return _SitemapTarget(url_pattern, since)
+        except (httpx.HTTPError, ParseError, DefusedXmlException, zlib.error) as e:
             logger.debug("Failed to parse sitemap", url=sitemap_url, error=str(e))
-            return []
-
-    async def _parse_sitemap_index(self, root: Element) -> list[dict[str, str | datetime | None]]:
-        all_urls: list[dict[str, str | datetime | None]] = []
-        sitemap_count = 0
-
-        for sitemap in root.findall("sm:sitemap", SITEMAP_NS):
-            if sitemap_count >= MAX_SUB_SITEMAPS:
-                break
-            loc = sitemap.find("sm:loc", SITEMAP_NS)
-            if loc is not None and loc.text:
-                try:
-                    validate_url_for_ssrf(loc.text)
-                except SSRFError:
-                    logger.warning("Skipping sub-sitemap blocked by SSRF protection", url=loc.text)
-                    continue
-                child_urls = await self._parse_sitemap(loc.text)
-                all_urls.extend(child_urls)
-                sitemap_count += 1
-                if len(all_urls) >= MAX_SITEMAP_URLS:
-                    break
-
-        for sitemap in root.findall("sitemap"):
-            if sitemap_count >= MAX_SUB_SITEMAPS:
-                break
-            loc = sitemap.find("loc")
-            if loc is not None and loc.text:
-                try:
-                    validate_url_for_ssrf(loc.text)
-                except SSRFError:
-                    logger.warning("Skipping sub-sitemap blocked by SSRF protection", url=loc.text)
-                    continue
-                child_urls = await self._parse_sitemap(loc.text)
-                all_urls.extend(child_urls)
-                sitemap_count += 1
-                if len(all_urls) >= MAX_SITEMAP_URLS:
-                    break
-
-        return all_urls[:MAX_SITEMAP_URLS]
-
-    def _parse_urlset(self, root: Element) -> list[dict[str, str | datetime | None]]:
-        urls: list[dict[str, str | datetime | None]] = []
-
-        for url_elem in root.findall("sm:url", SITEMAP_NS):
-            loc = url_elem.find("sm:loc", SITEMAP_NS)
-            lastmod_elem = url_elem.find("sm:lastmod", SITEMAP_NS)
-
-            if loc is not None and loc.text:
-                lastmod = self._parse_lastmod(
-                    lastmod_elem.text if lastmod_elem is not None else None
-                )
-                urls.append({"url": loc.text, "lastmod": lastmod})
+            return _SitemapTarget(url_pattern, since)
 
-        for url_elem in root.findall("url"):
-            loc = url_elem.find("loc")
-            lastmod_elem = url_elem.find("lastmod")
+        target.fetched = True
+        if not target.is_index:
+            return target
 
-            if loc is not None and loc.text:
-                lastmod = self._parse_lastmod(
-                    lastmod_elem.text if lastmod_elem is not None else None
+        known = known or {}
+        merged = _SitemapTarget(url_pattern, since)
+        merged.fetched = True
+        to_fetch: list[SitemapEntry] = []
+        for sub_sitemap in target.sub_sitemaps:
+            try:
+                validate_url_for_ssrf(sub_sitemap.url)
+            except SSRFError:
+                logger.warning(
+                    "Skipping sub-sitemap blocked by SSRF protection", url=sub_sitemap.url
                 )
-                urls.append({"url": loc.text, "lastmod": lastmod})
-
-        return urls
+                continue
+            if sub_sitemap.url in visited:
+                logger.debug("Skipping already visited sub-sitemap", url=sub_sitemap.url)
+                continue
+            if depth >= MAX_SITEMAP_DEPTH:
+                logger.debug(
+                    "Skipping sub-sitemap beyond maximum depth",
+                    url=sub_sitemap.url,
+                    depth=depth + 1,
+                )
+                continue
+            visited.add(sub_sitemap.url)
+            if (
+                since is not None
+                and sub_sitemap.lastmod is not None
+                and sub_sitemap.lastmod < since
+                and sub_sitemap.url in known
+                and known[sub_sitemap.url] == sub_sitemap.lastmod
+            ):
+                merged.listed[sub_sitemap.url] = sub_sitemap.lastmod
+                merged.skipped_unchanged += 1
+                continue
+            to_fetch.append(sub_sitemap)
 
-    def _parse_lastmod(self, lastmod: str | None) -> datetime | None:
-        if not lastmod:
-            return None
+        limit = asyncio.Semaphore(MAX_CONCURRENT_SUB_SITEMAPS)
 
-        formats = [
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d",
-        ]
+        async def parse_child(sub_url: str) -> _SitemapTarget:
+            async with limit:
+                return await self._parse_sitemap(
+                    sub_url, url_pattern, since, known, visited, depth + 1
+                )
 
-        lastmod = lastmod.replace("Z", "+00:00")
+        children = await asyncio.gather(*(parse_child(sub.url) for sub in to_fetch))
+        for sub_sitemap, child in zip(to_fetch, children, strict=True):
+            # Only a fully handled sub-sitemap is remembered, so a failed one
+            # is fetched again on the next poll even if its lastmod is unchanged.
+            if child.fetched and not child.failed:
+                merged.listed[sub_sitemap.url] = sub_sitemap.lastmod
+            merged.merge(child)
+        return merged
+
+    @contextlib.asynccontextmanager
+    async def _host_limit(self, url: str) -> AsyncIterator[None]:
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_limits.setdefault(
+            host, asyncio.Semaphore(MAX_CONCURRENT_FETCHES_PER_HOST)
+        )
+        async with semaphore:
+            yield
 
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(lastmod, fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=UTC)
-                return dt
-            except ValueError:
-                continue
+    async def _feed_sitemap(self, sitemap_url: str, target: _SitemapTarget) -> None:
+        """Feed the sitemap body to ``target`` chunk by chunk, inflating gzip on the fly.
 
-        return None
+        Raises SitemapTooLargeError once the body passes the size limits.
+        """
+        parser = DefusedXMLParser(target=target)
+        inflater: Any = None
+        received = 0
+        inflated = 0
 
-    def _infer_pattern(
-        self, page_url: str, all_urls: list[dict[str, str | datetime | None]]
-    ) -> str | None:
+        async with self._stream(sitemap_url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                if received == 0 and chunk[:2] == b"\x1f\x8b":
+                    inflater = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+                received += len(chunk)
+
+                if inflater is None:
+                    if received > MAX_DECOMPRESSED_SIZE:
+                        raise SitemapTooLargeError(
+                            "Sitemap too large", received, MAX_DECOMPRESSED_SIZE
+                        )
+                    parser.feed(chunk)
+                else:
+                    if received > MAX_COMPRESSED_SIZE:
+                        raise SitemapTooLargeError(
+                            "Compressed sitemap too large", received, MAX_COMPRESSED_SIZE
+                        )
+                    # Inflate in bounded steps so a gzip bomb cannot expand all at once.
+                    while chunk:
+                        data = inflater.decompress(chunk, INFLATE_CHUNK_SIZE)
+                        inflated += len(data)
+                        if inflated > MAX_DECOMPRESSED_SIZE:
+                            raise SitemapTooLargeError(
+                                "Decompressed sitemap too large", inflated, MAX_DECOMPRESSED_SIZE
+                            )
+                        parser.feed(data)
+                        chunk = inflater.unconsumed_tail
+
+                if target.full:
+                    return
+
+        if inflater is not None:
+            parser.feed(inflater.flush())
+        parser.close()
+
+    @contextlib.asynccontextmanager
+    async def _stream(self, url: str) -> AsyncIterator[httpx.Response]:
+        if self._client:
+            async with self._client.stream("GET", url, follow_redirects=True) as response:
+                yield response
+        else:
+            async with (
+                httpx.AsyncClient(timeout=get_settings().http_timeout_seconds) as client,
+                client.stream("GET", url, follow_redirects=True) as response,
+            ):
+                yield response
+
+    def _infer_pattern(self, page_url: str, entries: list[SitemapEntry]) -> str | None:
         parsed = urlparse(page_url)
         path_parts = parsed.path.strip("/").split("/")
 
@@ -311,7 +566,7 @@ class SitemapDiscoveryStrategy(DiscoveryStrategy):
             if part.lower() in BLOG_PATH_PATTERNS:
                 return f"/{part}/"
 
-        url_strings = [u["url"] for u in all_urls if isinstance(u["url"], str)]
+        url_strings = [e.url for e in entries]
         for pattern in BLOG_PATH_PATTERNS:
             pattern_urls = [u for u in url_strings if f"/{pattern}/" in u.lower()]
             if len(pattern_urls) >= 2:
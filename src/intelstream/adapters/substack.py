@@ -5,7 +5,8 @@ import httpx
 import structlog
 
 from intelstream.adapters.base import BaseAdapter, ContentData
-from intelstream.utils.feed_utils import parse_feed_date
+from intelstream.utils.feed_utils import ParsedFeed, parse_feed, parse_feed_date
+from intelstream.utils.parse_pool import run_parse
 
 logger = structlog.get_logger()
 
@@ -47,7 +48,7 @@ class SubstackAdapter(BaseAdapter):
                     response.raise_for_status()
                     content = response.text
 
-            feed = feedparser.parse(content)
+            feed = await run_parse(parse_feed, content)
 
             if feed.bozo and not feed.entries:
                 logger.warning(
@@ -89,9 +90,7 @@ class SubstackAdapter(BaseAdapter):
             )
             raise
 
-    def _parse_entry(
-        self, entry: feedparser.FeedParserDict, feed: feedparser.FeedParserDict
-    ) -> ContentData:
+    def _parse_entry(self, entry: feedparser.FeedParserDict, feed: ParsedFeed) -> ContentData:
         external_id: str = str(entry.get("id") or entry.get("link") or "")
         title: str = str(entry.get("title", "Untitled"))
         original_url: str = str(entry.get("link", ""))
@@ -8,7 +8,10 @@ from discord import app_commands
 from discord.ext import commands
 
 from intelstream.config import Settings, get_database_directory
-from intelstream.database.repository import Repository
+from intelstream.database.repository import Repository, SQLitePragmas
+from intelstream.services.counter_aggregator import CounterAggregator
+from intelstream.services.webhook_pool import WebhookPool
+from intelstream.utils.parse_pool import ParsePool, set_parse_pool
 
 if TYPE_CHECKING:
     from intelstream.database.models import Source
@@ -109,6 +112,11 @@ class IntelStreamBot(commands.Bot):
 
         self.settings = settings
         self.repository = repository
+        self.counters = CounterAggregator(
+            repository, flush_interval_seconds=settings.counter_flush_interval_seconds
+        )
+        self.webhooks = WebhookPool(self) if settings.webhook_delivery_enabled else None
+        self.parse_pool: ParsePool | None = None
         self.start_time: datetime | None = None
         self._owner: discord.User | None = None
 
@@ -118,6 +126,18 @@ class IntelStreamBot(commands.Bot):
             db_dir.mkdir(parents=True, exist_ok=True)
 
         await self.repository.initialize()
+        self.counters.start()
+
+        if self.settings.parse_pool_enabled:
+            self.parse_pool = ParsePool(self.settings.parse_pool_workers or None)
+            self.parse_pool.start()
+            set_parse_pool(self.parse_pool)
+
+        if self.settings.seen_index_enabled:
+            await self.repository.load_seen_index(
+                capacity=self.settings.seen_index_capacity,
+                recent_size=self.settings.seen_index_recent_size,
+            )
 
         if self.settings.discord_channel_id is not None:
             migrated = await self.repository.migrate_sources_to_channel(
@@ -142,6 +162,7 @@ class IntelStreamBot(commands.Bot):
         )
         from intelstream.discord.cogs.github import GitHubCommands
         from intelstream.discord.cogs.github_polling import GitHubPolling
+        from intelstream.discord.cogs.maintenance import DatabaseMaintenance
         from intelstream.discord.cogs.message_forwarding import MessageForwarding
 
         await self.add_cog(SourceManagement(self))
@@ -152,6 +173,7 @@ class IntelStreamBot(commands.Bot):
         await self.add_cog(SuckBoobs(self))
         await self.add_cog(GitHubCommands(self))
         await self.add_cog(GitHubPolling(self))
+        await self.add_cog(DatabaseMaintenance(self))
 
         guild = discord.Object(id=self.settings.discord_guild_id)
         self.tree.copy_global_to(guild=guild)
@@ -220,6 +242,19 @@ class IntelStreamBot(commands.Bot):
         except TimeoutError:
             logger.error("Total cog unload exceeded 30s timeout")
 
+        try:
+            await asyncio.wait_for(self.counters.close(), timeout=5.0)
+        except TimeoutError:
+            logger.error("Counter flush timed out")
+        except Exception as e:
+            logger.error("Error flushing counters", error=str(e))
+
+        if self.parse_pool is not None:
+            try:
+                await asyncio.wait_for(self.parse_pool.close(), timeout=5.0)
+            except TimeoutError:
+                logger.error("Parse pool shutdown timed out")
+
         try:
             await asyncio.wait_for(self.repository.close(), timeout=5.0)
         except TimeoutError:
@@ -260,6 +295,25 @@ class CoreCommands(commands.Cog):
             days = total_seconds // 86400
             return f"{days}d ago"
 
+    def _format_drain_estimate(self, minutes: int | None) -> str:
+        if minutes is None:
+            return " (drain time unknown)"
+        if minutes == 0:
+            return ""
+        if minutes < 60:
+            return f" (~{minutes}m to drain)"
+        hours, mins = divmod(minutes, 60)
+        return f" (~{hours}h {mins}m to drain)"
+
+    def _format_cache_hit_rates(self) -> str:
+        stats = self.bot.repository.get_cache_stats()
+        labels = {
+            "sources_by_id": "sources",
+            "discord_configs": "configs",
+            "extraction_cache": "extraction",
+        }
+        return ", ".join(f"{label} {stats[name].hit_rate:.0%}" for name, label in labels.items())
+
     def _get_source_status_icon(self, source: "Source") -> str:
         from intelstream.database.models import PauseReason
 
@@ -300,6 +354,13 @@ class CoreCommands(commands.Cog):
         if guild_id:
             default_config = await self.bot.repository.get_discord_config(guild_id)
 
+        from intelstream.discord.cogs.content_posting import ContentPosting
+
+        backlog = None
+        posting_cog = self.bot.get_cog("ContentPosting")
+        if isinstance(posting_cog, ContentPosting):
+            backlog = await posting_cog.get_backlog_status()
+
         embed = discord.Embed(
             title="IntelStream Status",
             color=discord.Color.green() if not failing_sources else discord.Color.orange(),
@@ -310,6 +371,7 @@ class CoreCommands(commands.Cog):
             f"**Uptime:** {self._format_uptime()}",
             f"**Latency:** {round(self.bot.latency * 1000)}ms",
             f"**Poll Interval:** {self.bot.settings.content_poll_interval_minutes}m",
+            f"**Cache Hits:** {self._format_cache_hit_rates()}",
         ]
         embed.add_field(name="System", value="\n".join(status_lines), inline=True)
 
@@ -325,6 +387,15 @@ class CoreCommands(commands.Cog):
             content_lines.append("**Last Post:** Never")
         embed.add_field(name="Content", value="\n".join(content_lines), inline=True)
 
+        if backlog is not None:
+            backlog_lines = [
+                f"**Awaiting Summary:** {backlog.pending_summary}"
+                f"{self._format_drain_estimate(backlog.summary_drain_minutes)}",
+                f"**Awaiting Post:** {backlog.pending_posting}"
+                f"{self._format_drain_estimate(backlog.posting_drain_minutes)}",
+            ]
+            embed.add_field(name="Backlog", value="\n".join(backlog_lines), inline=True)
+
         source_summary = f"**Active:** {len(active_sources)} / {len(sources)}"
         if failing_sources:
             source_summary += f"\n**With Errors:** {len(failing_sources)}"
@@ -394,7 +465,20 @@ class CoreCommands(commands.Cog):
 
 
 async def create_bot(settings: Settings) -> IntelStreamBot:
-    repository = Repository(settings.database_url)
+    repository = Repository(
+        settings.database_url,
+        pragmas=SQLitePragmas(
+            journal_mode=settings.sqlite_journal_mode,
+            synchronous=settings.sqlite_synchronous,
+            mmap_size_bytes=settings.sqlite_mmap_size_bytes,
+            cache_size_kib=settings.sqlite_cache_size_kib,
+            busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+            temp_store=settings.sqlite_temp_store,
+        ),
+        cache_ttl_seconds=settings.repository_cache_ttl_seconds,
+        extraction_cache_entries=settings.extraction_memory_cache_entries,
+        extraction_cache_ttl_seconds=settings.extraction_cache_max_age_days * 86400,
+    )
     bot = IntelStreamBot(settings, repository)
     return bot
 
@@ -53,6 +53,122 @@ class Settings(BaseSettings):
         description="Database connection URL",
     )
 
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = Field(
+        default="WAL",
+        description="SQLite journal mode; WAL lets readers run alongside the writer",
+    )
+
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        description="SQLite synchronous level; NORMAL avoids an fsync per commit in WAL mode",
+    )
+
+    sqlite_mmap_size_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        le=4 * 1024 * 1024 * 1024,
+        description="Bytes of the SQLite database file to memory-map (0 disables mmap)",
+    )
+
+    sqlite_cache_size_kib: int = Field(
+        default=64 * 1024,
+        ge=2 * 1024,
+        le=1024 * 1024,
+        description="SQLite page cache size per connection in KiB",
+    )
+
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        le=60000,
+        description="How long SQLite waits on a locked database before failing",
+    )
+
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = Field(
+        default="MEMORY",
+        description="Where SQLite keeps temporary tables and sort spills",
+    )
+
+    repository_cache_ttl_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        le=86400.0,
+        description="How long sources and Discord configs are cached in memory (0 disables)",
+    )
+
+    seen_index_enabled: bool = Field(
+        default=True,
+        description="Keep an in-memory index of stored external IDs to skip dedup queries",
+    )
+
+    seen_index_capacity: int = Field(
+        default=1_000_000,
+        ge=1000,
+        le=50_000_000,
+        description="Minimum number of external IDs the seen-ID Bloom filter is sized for",
+    )
+
+    seen_index_recent_size: int = Field(
+        default=50_000,
+        ge=0,
+        le=5_000_000,
+        description="Exact external IDs kept in memory for recently seen items",
+    )
+
+    counter_flush_interval_seconds: float = Field(
+        default=5.0,
+        ge=0.5,
+        le=300.0,
+        description="How often aggregated forwarding and usage counters are written",
+    )
+
+    maintenance_enabled: bool = Field(
+        default=True,
+        description="Run periodic database maintenance (retention, pruning, vacuum, ANALYZE)",
+    )
+
+    maintenance_interval_hours: int = Field(
+        default=24,
+        ge=1,
+        le=168,
+        description="Hours between database maintenance runs",
+    )
+
+    extraction_cache_max_age_days: int = Field(
+        default=7,
+        ge=1,
+        le=90,
+        description="Age after which cached LLM extraction results are deleted",
+    )
+
+    extraction_memory_cache_entries: int = Field(
+        default=512,
+        ge=1,
+        le=100_000,
+        description="LLM extraction results kept in memory in front of the database cache",
+    )
+
+    raw_content_retention_days: int = Field(
+        default=30,
+        ge=1,
+        le=3650,
+        description="Age after which raw bodies of summarized items are dropped",
+    )
+
+    maintenance_vacuum_max_pages: int = Field(
+        default=0,
+        ge=0,
+        description="Free pages released per incremental vacuum (0 releases all)",
+    )
+
+    maintenance_convert_auto_vacuum: bool = Field(
+        default=False,
+        description=(
+            "Run one full VACUUM to switch older databases to incremental auto_vacuum; "
+            "the database is locked while it runs"
+        ),
+    )
+
     default_poll_interval_minutes: int = Field(
         default=5,
         ge=1,
@@ -117,6 +233,18 @@ class Settings(BaseSettings):
         description="Maximum HTML length for LLM processing",
     )
 
+    parse_pool_enabled: bool = Field(
+        default=True,
+        description="Parse fetched HTML and feeds in worker processes instead of the event loop",
+    )
+
+    parse_pool_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Parse worker processes (0 uses one per CPU core)",
+    )
+
     summarization_delay_seconds: float = Field(
         default=0.5,
         ge=0.1,
@@ -124,6 +252,39 @@ class Settings(BaseSettings):
         description="Delay between summarization requests to avoid rate limiting",
     )
 
+    backlog_drain_enabled: bool = Field(
+        default=True,
+        description="Keep pulling pages of pending items each cycle while budgets allow",
+    )
+
+    backlog_max_page_size: int = Field(
+        default=100,
+        ge=10,
+        le=500,
+        description="Largest page of pending items fetched at once while draining a backlog",
+    )
+
+    backlog_cycle_deadline_seconds: float = Field(
+        default=120.0,
+        ge=10.0,
+        le=1800.0,
+        description="Time budget for each drain phase (summarization, posting) per cycle",
+    )
+
+    summarization_max_items_per_cycle: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum items summarized per cycle when draining a backlog",
+    )
+
+    posting_max_items_per_cycle: int = Field(
+        default=200,
+        ge=1,
+        le=2000,
+        description="Maximum items posted to Discord per cycle when draining a backlog",
+    )
+
     max_consecutive_failures: int = Field(
         default=3,
         ge=1,
@@ -152,6 +313,32 @@ class Settings(BaseSettings):
         description="Maximum concurrent message forwards",
     )
 
+    forward_spool_threshold_kib: int = Field(
+        default=1024,
+        ge=0,
+        le=25600,
+        description="Attachment size in KiB above which forwarded files are spooled to disk",
+    )
+
+    forward_memory_budget_mib: int = Field(
+        default=64,
+        ge=1,
+        le=1024,
+        description="Attachment bytes in MiB that all forwards may hold in memory at once",
+    )
+
+    webhook_delivery_enabled: bool = Field(
+        default=False,
+        description="Send forwards and content posts through per-channel webhooks",
+    )
+
+    forward_coalesce_max_messages: int = Field(
+        default=50,
+        ge=2,
+        le=500,
+        description="Messages after which a coalesced burst is forwarded before its window ends",
+    )
+
     substack_poll_interval_minutes: int | None = Field(
         default=None,
         ge=1,
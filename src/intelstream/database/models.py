@@ -1,8 +1,21 @@
 import enum
+import zlib
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -28,6 +41,7 @@ class PauseReason(enum.Enum):
 
 class Source(Base):
     __tablename__ = "sources"
+    __table_args__ = (Index("ix_sources_active_last_polled", "is_active", "last_polled_at"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     type: Mapped[SourceType] = mapped_column(Enum(SourceType), nullable=False)
@@ -40,6 +54,8 @@ class Source(Base):
     discovery_strategy: Mapped[str | None] = mapped_column(String(50), nullable=True)
     url_pattern: Mapped[str | None] = mapped_column(String(255), nullable=True)
     last_content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Newest sitemap lastmod already handled; older sitemap entries are skipped.
+    sitemap_lastmod_watermark: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     consecutive_failures: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     poll_interval_minutes: Mapped[int] = mapped_column(Integer, default=5)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -63,6 +79,24 @@ class Source(Base):
 
 class ContentItem(Base):
     __tablename__ = "content_items"
+    __table_args__ = (
+        # Latest item per source, and per-source lookups such as known URLs.
+        Index("ix_content_items_source_published", "source_id", "published_at"),
+        # Has a source ever posted, and per-source posted counts.
+        Index("ix_content_items_source_posted", "source_id", "posted_to_discord"),
+        # Summarization queue, oldest first. Partial so it only holds pending rows.
+        Index(
+            "ix_content_items_unsummarized",
+            "created_at",
+            sqlite_where=text("summary IS NULL"),
+        ),
+        # Posting queue, oldest first. Partial so it only holds pending rows.
+        Index(
+            "ix_content_items_unposted",
+            "published_at",
+            sqlite_where=text("posted_to_discord = 0 AND summary IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     source_id: Mapped[str] = mapped_column(String(36), ForeignKey("sources.id"), nullable=False)
@@ -71,7 +105,6 @@ class ContentItem(Base):
     original_url: Mapped[str] = mapped_column(String(1024), nullable=False)
     author: Mapped[str] = mapped_column(String(255), nullable=False)
     published_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    raw_content: Mapped[str | None] = mapped_column(Text, nullable=True)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     thumbnail_url: Mapped[str | None] = mapped_column(String(1024), nullable=True)
     posted_to_discord: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -79,11 +112,59 @@ class ContentItem(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
 
     source: Mapped["Source"] = relationship("Source", back_populates="content_items")
+    # The body lives in content_blobs and is only loaded when asked for
+    # explicitly (selectinload), so queue and status queries never read it.
+    blob: Mapped["ContentBlob | None"] = relationship(
+        "ContentBlob",
+        uselist=False,
+        lazy="raise_on_sql",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    @property
+    def raw_content(self) -> str | None:
+        return self.blob.decode() if self.blob is not None else None
+
+    @raw_content.setter
+    def raw_content(self, value: str | None) -> None:
+        self.blob = ContentBlob.from_text(value) if value is not None else None
 
     def __repr__(self) -> str:
         return f"<ContentItem(title={self.title!r}, source_id={self.source_id!r})>"
 
 
+class ContentBlob(Base):
+    __tablename__ = "content_blobs"
+
+    CODEC_ZLIB = "zlib"
+    COMPRESSION_LEVEL = 6
+
+    content_item_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("content_items.id", ondelete="CASCADE"), primary_key=True
+    )
+    codec: Mapped[str] = mapped_column(String(16), nullable=False, default=CODEC_ZLIB)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    original_size: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    @classmethod
+    def from_text(cls, text: str) -> "ContentBlob":
+        raw = text.encode("utf-8")
+        return cls(
+            codec=cls.CODEC_ZLIB,
+            data=zlib.compress(raw, cls.COMPRESSION_LEVEL),
+            original_size=len(raw),
+        )
+
+    def decode(self) -> str:
+        if self.codec != self.CODEC_ZLIB:
+            raise ValueError(f"Unsupported content blob codec: {self.codec}")
+        return zlib.decompress(self.data).decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"<ContentBlob(content_item_id={self.content_item_id!r}, size={len(self.data)})>"
+
+
 class DiscordConfig(Base):
     __tablename__ = "discord_config"
 
@@ -113,6 +194,23 @@ class ExtractionCache(Base):
         return f"<ExtractionCache(url={self.url!r}, cached_at={self.cached_at!r})>"
 
 
+class SitemapLocation(Base):
+    """Where a blog's sitemap was found, and the sub-sitemaps its index listed."""
+
+    __tablename__ = "sitemap_locations"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    page_url: Mapped[str] = mapped_column(String(1024), nullable=False, unique=True, index=True)
+    # None when no sitemap was found at the last check.
+    sitemap_url: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    # JSON object of sub-sitemap URL to its index lastmod (ISO 8601 or null).
+    sub_sitemaps_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    checked_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
+
+    def __repr__(self) -> str:
+        return f"<SitemapLocation(page_url={self.page_url!r}, sitemap_url={self.sitemap_url!r})>"
+
+
 class ForwardingRule(Base):
     __tablename__ = "forwarding_rules"
 
@@ -124,6 +222,7 @@ class ForwardingRule(Base):
     destination_type: Mapped[str] = mapped_column(String(20), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     messages_forwarded: Mapped[int] = mapped_column(Integer, default=0)
+    coalesce_window_seconds: Mapped[int] = mapped_column(Integer, default=0)
     last_forwarded_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
 
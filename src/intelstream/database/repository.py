@@ -1,7 +1,13 @@
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
 
 import structlog
-from sqlalchemy import exists, func, select, text
+from sqlalchemy import and_, delete, event, exists, func, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
@@ -9,6 +15,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import aliased, selectinload
 
 from intelstream.database.exceptions import (
     DatabaseConnectionError,
@@ -18,16 +25,20 @@ from intelstream.database.exceptions import (
 )
 from intelstream.database.models import (
     Base,
+    ContentBlob,
     ContentItem,
     DiscordConfig,
     ExtractionCache,
     ForwardingRule,
     GitHubRepo,
     PauseReason,
+    SitemapLocation,
     Source,
     SourceType,
     SuckBoobsStats,
 )
+from intelstream.database.seen_index import SeenIdIndex
+from intelstream.utils.ttl_cache import CacheStats, TTLCache
 
 logger = structlog.get_logger()
 
@@ -40,52 +51,288 @@ SOURCES_MIGRATIONS: list[tuple[str, str]] = [
     ("channel_id", "VARCHAR(36)"),
     ("pause_reason", "VARCHAR(32) DEFAULT 'none'"),
     ("skip_summary", "BOOLEAN DEFAULT 0"),
+    ("sitemap_lastmod_watermark", "DATETIME"),
 ]
 
+FORWARDING_RULES_MIGRATIONS: list[tuple[str, str]] = [
+    ("coalesce_window_seconds", "INTEGER DEFAULT 0"),
+]
+
+RAW_CONTENT_MIGRATION_BATCH_SIZE = 200
+
+# Value PRAGMA auto_vacuum reports for INCREMENTAL mode.
+AUTO_VACUUM_INCREMENTAL = 2
+
 MIN_POLL_INTERVAL_MINUTES = 1
 MAX_POLL_INTERVAL_MINUTES = 60
 
 
+@dataclass(frozen=True)
+class SQLitePragmas:
+    """Connection-level SQLite tuning applied to every new connection.
+
+    WAL lets readers such as /status proceed while the pipeline writes, and
+    synchronous=NORMAL is durable in WAL mode apart from the last commits
+    before a power loss, while skipping the fsync on every commit.
+    """
+
+    auto_vacuum: str = "INCREMENTAL"
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size_bytes: int = 256 * 1024 * 1024
+    cache_size_kib: int = 64 * 1024
+    busy_timeout_ms: int = 5000
+    temp_store: str = "MEMORY"
+
+    def statements(self) -> list[str]:
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA mmap_size={self.mmap_size_bytes}",
+            # Negative cache_size is interpreted by SQLite as KiB rather than pages.
+            f"PRAGMA cache_size=-{self.cache_size_kib}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            f"PRAGMA temp_store={self.temp_store}",
+        ]
+
+
+@dataclass(frozen=True)
+class DatabaseFileStats:
+    page_size: int
+    page_count: int
+    freelist_count: int
+    auto_vacuum: int
+
+    @property
+    def size_bytes(self) -> int:
+        return self.page_size * self.page_count
+
+    @property
+    def free_bytes(self) -> int:
+        return self.page_size * self.freelist_count
+
+    @property
+    def incremental_vacuum_enabled(self) -> bool:
+        return self.auto_vacuum == AUTO_VACUUM_INCREMENTAL
+
+
+@dataclass
+class ForwardingCountDelta:
+    count: int
+    last_forwarded_at: datetime
+
+
+@dataclass
+class UsageCountDelta:
+    times_used: int = 0
+    times_pinged: int = 0
+
+
 class Repository:
-    def __init__(self, database_url: str) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        pragmas: SQLitePragmas | None = None,
+        cache_ttl_seconds: float = 300.0,
+        extraction_cache_entries: int = 512,
+        extraction_cache_ttl_seconds: float = 7 * 86400,
+    ) -> None:
         if not database_url.startswith("sqlite"):
             db_type = database_url.split("://")[0] if "://" in database_url else database_url
             raise ValueError(f"Only SQLite databases are supported. Got: {db_type}")
         self._engine = create_async_engine(database_url, echo=False)
+        self._pragmas = pragmas if pragmas is not None else SQLitePragmas()
+        event.listen(self._engine.sync_engine, "connect", self._apply_pragmas)
         self._session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             self._engine, class_=AsyncSession, expire_on_commit=False
         )
+        self._seen_index: SeenIdIndex | None = None
+        # Read-through caches for rarely changing rows. Every mutator below that
+        # touches a Source or DiscordConfig invalidates the affected entries.
+        self._sources_by_id: TTLCache[str, Source] = TTLCache(cache_ttl_seconds)
+        self._sources_by_identifier: TTLCache[str, Source] = TTLCache(cache_ttl_seconds)
+        self._discord_configs: TTLCache[str, DiscordConfig] = TTLCache(cache_ttl_seconds)
+        # Memory tier in front of extraction_cache, keyed by URL. Entries carry
+        # their content hash; every write to the table goes through here.
+        self._extraction_cache: TTLCache[str, ExtractionCache] = TTLCache(
+            extraction_cache_ttl_seconds, max_entries=extraction_cache_entries
+        )
+
+    def _apply_pragmas(self, dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            # auto_vacuum can only be chosen before the database file is first
+            # written (switching WAL on writes it); existing files need a VACUUM.
+            cursor.execute("PRAGMA page_count")
+            if cursor.fetchone()[0] == 0:
+                cursor.execute(f"PRAGMA auto_vacuum={self._pragmas.auto_vacuum}")
+            for statement in self._pragmas.statements():
+                cursor.execute(statement)
+        finally:
+            cursor.close()
 
     async def initialize(self) -> None:
         logger.info("Initializing database")
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
             await self._migrate_sources_table(conn)
+            await self._migrate_forwarding_rules_table(conn)
+            await self._migrate_raw_content_to_blobs(conn)
+            await conn.run_sync(self._create_missing_indexes)
         logger.info("Database initialization complete")
 
     async def _migrate_sources_table(self, conn: AsyncConnection) -> None:
-        result = await conn.execute(text("PRAGMA table_info(sources)"))
+        await self._add_missing_columns(conn, "sources", SOURCES_MIGRATIONS)
+
+    async def _migrate_forwarding_rules_table(self, conn: AsyncConnection) -> None:
+        await self._add_missing_columns(conn, "forwarding_rules", FORWARDING_RULES_MIGRATIONS)
+
+    async def _add_missing_columns(
+        self, conn: AsyncConnection, table: str, migrations: list[tuple[str, str]]
+    ) -> None:
+        result = await conn.execute(text(f"PRAGMA table_info({table})"))
         existing_columns = {row[1] for row in result.fetchall()}
 
-        for column_name, column_type in SOURCES_MIGRATIONS:
+        for column_name, column_type in migrations:
             if column_name not in existing_columns:
-                logger.info("Applying migration", column=column_name)
+                logger.info("Applying migration", table=table, column=column_name)
                 await conn.execute(
-                    text(f"ALTER TABLE sources ADD COLUMN {column_name} {column_type}")
+                    text(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}")
                 )
 
-    async def migrate_sources_to_channel(self, guild_id: str, channel_id: str) -> int:
-        """Assign existing sources without a channel to the specified guild and channel."""
+    async def _migrate_raw_content_to_blobs(self, conn: AsyncConnection) -> None:
+        """Move inline content_items.raw_content from older databases into content_blobs."""
+        result = await conn.execute(text("PRAGMA table_info(content_items)"))
+        if "raw_content" not in {row[1] for row in result.fetchall()}:
+            return
+
+        migrated = 0
+        while True:
+            result = await conn.execute(
+                text(
+                    "SELECT id, raw_content FROM content_items "
+                    "WHERE raw_content IS NOT NULL LIMIT :limit"
+                ),
+                {"limit": RAW_CONTENT_MIGRATION_BATCH_SIZE},
+            )
+            rows = result.fetchall()
+            if not rows:
+                break
+
+            blobs = []
+            for item_id, raw_content in rows:
+                blob = ContentBlob.from_text(raw_content)
+                blobs.append(
+                    {
+                        "content_item_id": item_id,
+                        "codec": blob.codec,
+                        "data": blob.data,
+                        "original_size": blob.original_size,
+                    }
+                )
+            await conn.execute(
+                ContentBlob.__table__.insert().prefix_with("OR IGNORE"),  # type: ignore[attr-defined]
+                blobs,
+            )
+            await conn.execute(
+                text("UPDATE content_items SET raw_content = NULL WHERE id = :id"),
+                [{"id": row[0]} for row in rows],
+            )
+            migrated += len(rows)
+
+        if migrated:
+            logger.info("Migrated inline raw_content to content_blobs", count=migrated)
+
+    @staticmethod
+    def _create_missing_indexes(sync_conn: Connection) -> None:
+        # create_all skips indexes on tables that already exist, so databases
+        # created before an index was added need it created here.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
+
+    async def load_seen_index(self, capacity: int, recent_size: int) -> SeenIdIndex:
+        """Build the in-memory external ID index used by content_item_exists.
+
+        The Bloom filter is sized for at least twice the current row count so
+        its error rate holds while the table grows.
+        """
         async with self.session() as session:
-            result = await session.execute(select(Source).where(Source.channel_id.is_(None)))
-            sources = list(result.scalars().all())
+            row_count = (
+                await session.execute(select(func.count()).select_from(ContentItem))
+            ).scalar_one()
+            index = SeenIdIndex(capacity=max(capacity, row_count * 2), recent_size=recent_size)
+            external_ids = await session.stream_scalars(
+                select(ContentItem.external_id).execution_options(yield_per=5000)
+            )
+            async for external_id in external_ids:
+                index.load(external_id)
+
+        self._seen_index = index
+        stats = index.get_stats()
+        logger.info(
+            "Seen-ID index loaded",
+            ids=stats.ids_loaded,
+            capacity=stats.bloom_capacity,
+            memory_bytes=stats.memory_bytes,
+        )
+        return index
+
+    @property
+    def seen_index(self) -> SeenIdIndex | None:
+        return self._seen_index
+
+    def _index_stored_id(self, external_id: str) -> None:
+        index = self._seen_index
+        if index is None:
+            return
+        was_over_capacity = index.over_capacity
+        index.add(external_id)
+        if index.over_capacity and not was_over_capacity:
+            stats = index.get_stats()
+            logger.warning(
+                "Seen-ID index is over capacity, more lookups will reach the database "
+                "until it is rebuilt at the next startup",
+                ids=stats.ids_loaded,
+                capacity=stats.bloom_capacity,
+            )
 
-            for source in sources:
-                source.guild_id = guild_id
-                source.channel_id = channel_id
+    def _cache_source(self, source: Source) -> None:
+        self._sources_by_id.set(source.id, source)
+        self._sources_by_identifier.set(source.identifier, source)
 
+    def _invalidate_source(
+        self, source_id: str | None = None, identifier: str | None = None
+    ) -> None:
+        if source_id is not None:
+            self._sources_by_id.invalidate(source_id)
+            self._sources_by_identifier.invalidate_where(lambda source: source.id == source_id)
+        if identifier is not None:
+            self._sources_by_identifier.invalidate(identifier)
+            self._sources_by_id.invalidate_where(lambda source: source.identifier == identifier)
+
+    def get_cache_stats(self) -> dict[str, CacheStats]:
+        return {
+            "sources_by_id": self._sources_by_id.get_stats(),
+            "sources_by_identifier": self._sources_by_identifier.get_stats(),
+            "discord_configs": self._discord_configs.get_stats(),
+            "extraction_cache": self._extraction_cache.get_stats(),
+        }
+
+    async def migrate_sources_to_channel(self, guild_id: str, channel_id: str) -> int:
+        """Assign existing sources without a channel to the specified guild and channel."""
+        async with self.session() as session:
+            result = await session.execute(
+                update(Source)
+                .where(Source.channel_id.is_(None))
+                .values(guild_id=guild_id, channel_id=channel_id)
+                .returning(Source.id)
+            )
+            migrated_ids = list(result.scalars())
             await session.commit()
-            return len(sources)
+        for source_id in migrated_ids:
+            self._invalidate_source(source_id=source_id)
+        return len(migrated_ids)
 
     async def close(self) -> None:
         await self._engine.dispose()
@@ -145,22 +392,26 @@ class Repository:
             return source
 
     async def get_source_by_identifier(self, identifier: str) -> Source | None:
+        cached = self._sources_by_identifier.get(identifier)
+        if cached is not None:
+            return cached
         async with self.session() as session:
             result = await session.execute(select(Source).where(Source.identifier == identifier))
-            return result.scalar_one_or_none()
+            source = result.scalar_one_or_none()
+        if source is not None:
+            self._cache_source(source)
+        return source
 
     async def get_source_by_id(self, source_id: str) -> Source | None:
+        cached = self._sources_by_id.get(source_id)
+        if cached is not None:
+            return cached
         async with self.session() as session:
             result = await session.execute(select(Source).where(Source.id == source_id))
-            return result.scalar_one_or_none()
-
-    async def get_sources_by_ids(self, source_ids: set[str]) -> dict[str, Source]:
-        if not source_ids:
-            return {}
-        async with self.session() as session:
-            result = await session.execute(select(Source).where(Source.id.in_(source_ids)))
-            sources = result.scalars().all()
-            return {source.id: source for source in sources}
+            source = result.scalar_one_or_none()
+        if source is not None:
+            self._cache_source(source)
+        return source
 
     async def get_source_by_name(self, name: str) -> Source | None:
         async with self.session() as session:
@@ -180,14 +431,24 @@ class Repository:
             return list(result.scalars().all())
 
     async def update_source_last_polled(self, source_id: str) -> bool:
+        polled_at = datetime.now(UTC)
         async with self.session() as session:
-            result = await session.execute(select(Source).where(Source.id == source_id))
-            source = result.scalar_one_or_none()
-            if source:
-                source.last_polled_at = datetime.now(UTC)
-                await session.commit()
-                return True
-            return False
+            result = await session.execute(
+                update(Source)
+                .where(Source.id == source_id)
+                .values(last_polled_at=polled_at)
+                .returning(Source.id)
+            )
+            updated = result.first() is not None
+            await session.commit()
+        if updated:
+            # Runs after every poll, so the cached row is patched rather than dropped.
+            cached = self._sources_by_id.peek(source_id)
+            if cached is not None:
+                cached.last_polled_at = polled_at
+            else:
+                self._sources_by_identifier.invalidate_where(lambda source: source.id == source_id)
+        return updated
 
     async def set_source_active(
         self,
@@ -195,32 +456,38 @@ class Repository:
         is_active: bool,
         pause_reason: PauseReason | None = None,
     ) -> Source:
+        values: dict[str, Any] = {"is_active": is_active}
+        if pause_reason is not None:
+            values["pause_reason"] = pause_reason.value
+        elif is_active:
+            values["pause_reason"] = PauseReason.NONE.value
         async with self.session() as session:
-            result = await session.execute(select(Source).where(Source.identifier == identifier))
-            source = result.scalar_one_or_none()
-            if not source:
-                logger.warning("Source not found for active state change", identifier=identifier)
-                raise SourceNotFoundError(identifier)
-            source.is_active = is_active
-            if pause_reason is not None:
-                source.pause_reason = pause_reason.value
-            elif is_active:
-                source.pause_reason = PauseReason.NONE.value
             try:
+                result = await session.execute(
+                    update(Source)
+                    .where(Source.identifier == identifier)
+                    .values(**values)
+                    .returning(Source),
+                    execution_options={"synchronize_session": False},
+                )
+                source = result.scalar_one_or_none()
                 await session.commit()
             except OperationalError as e:
                 await session.rollback()
                 logger.error("Database error updating source", identifier=identifier, error=str(e))
                 raise DatabaseConnectionError(f"Failed to update source: {e}") from e
-            await session.refresh(source)
-            logger.info(
-                "Source active state changed",
-                source_id=source.id,
-                identifier=identifier,
-                is_active=is_active,
-                pause_reason=source.pause_reason,
-            )
-            return source
+        if source is None:
+            logger.warning("Source not found for active state change", identifier=identifier)
+            raise SourceNotFoundError(identifier)
+        self._invalidate_source(source_id=source.id, identifier=identifier)
+        logger.info(
+            "Source active state changed",
+            source_id=source.id,
+            identifier=identifier,
+            is_active=is_active,
+            pause_reason=source.pause_reason,
+        )
+        return source
 
     async def get_content_count_for_source(self, source_id: str) -> int:
         async with self.session() as session:
@@ -239,6 +506,29 @@ class Repository:
                 logger.warning("Source not found for deletion", identifier=identifier)
                 raise SourceNotFoundError(identifier)
             source_id = source.id
+            deleted_external_ids: list[str] = []
+            if self._seen_index is not None:
+                deleted_external_ids = list(
+                    (
+                        await session.execute(
+                            select(ContentItem.external_id).where(
+                                ContentItem.source_id == source_id
+                            )
+                        )
+                    ).scalars()
+                )
+            # Blobs are deleted passively by the ORM, and SQLite does not
+            # enforce ON DELETE CASCADE unless foreign_keys is enabled.
+            await session.execute(
+                delete(ContentBlob).where(
+                    ContentBlob.content_item_id.in_(
+                        select(ContentItem.id).where(ContentItem.source_id == source_id)
+                    )
+                )
+            )
+            await session.execute(
+                delete(SitemapLocation).where(SitemapLocation.page_url == identifier)
+            )
             await session.delete(source)
             try:
                 await session.commit()
@@ -246,6 +536,10 @@ class Repository:
                 await session.rollback()
                 logger.error("Database error deleting source", identifier=identifier, error=str(e))
                 raise DatabaseConnectionError(f"Failed to delete source: {e}") from e
+            self._invalidate_source(source_id=source_id, identifier=identifier)
+            if self._seen_index is not None:
+                for external_id in deleted_external_ids:
+                    self._seen_index.forget(external_id)
             logger.info("Source deleted", source_id=source_id, identifier=identifier)
             return True
 
@@ -277,7 +571,9 @@ class Repository:
             except IntegrityError as e:
                 await session.rollback()
                 logger.debug("Duplicate content item", external_id=external_id)
+                self._index_stored_id(external_id)
                 raise DuplicateContentError(external_id) from e
+            self._index_stored_id(external_id)
             await session.refresh(content_item)
             logger.debug(
                 "Content item added",
@@ -296,22 +592,83 @@ class Repository:
             return result.scalar_one_or_none()
 
     async def content_item_exists(self, external_id: str) -> bool:
+        if self._seen_index is not None:
+            known = self._seen_index.lookup(external_id)
+            if known is not None:
+                return known
+
         async with self.session() as session:
             result = await session.execute(
                 select(exists().where(ContentItem.external_id == external_id))
             )
-            return result.scalar_one()
+            found: bool = result.scalar_one()
 
-    async def get_unposted_content_items(self, limit: int = 10) -> list[ContentItem]:
+        if found and self._seen_index is not None:
+            self._seen_index.remember(external_id)
+        return found
+
+    async def get_unposted_items_with_destinations(
+        self, limit: int = 10, exclude_ids: Collection[str] = ()
+    ) -> list[tuple[ContentItem, Source, str | None]]:
+        """Fetch unposted items together with their source and guild default channel.
+
+        The guild default channel comes from the active DiscordConfig for the
+        source's guild and is None when the source has no guild or the guild has
+        no active config. ``exclude_ids`` skips items already attempted this cycle.
+        """
         async with self.session() as session:
+            query = (
+                select(ContentItem, Source, DiscordConfig.channel_id)
+                .join(Source, ContentItem.source_id == Source.id)
+                .outerjoin(
+                    DiscordConfig,
+                    and_(
+                        DiscordConfig.guild_id == Source.guild_id,
+                        DiscordConfig.is_active == True,  # noqa: E712
+                    ),
+                )
+                .where(ContentItem.posted_to_discord == False)  # noqa: E712
+                .where(ContentItem.summary.isnot(None))
+            )
+            if exclude_ids:
+                query = query.where(ContentItem.id.not_in(exclude_ids))
             result = await session.execute(
-                select(ContentItem)
+                query.order_by(ContentItem.published_at.asc()).limit(limit)
+            )
+            return [(item, source, channel_id) for item, source, channel_id in result.all()]
+
+    async def count_unposted_content_items(self) -> int:
+        async with self.session() as session:
+            result = await session.execute(
+                select(func.count())
+                .select_from(ContentItem)
                 .where(ContentItem.posted_to_discord == False)  # noqa: E712
                 .where(ContentItem.summary.isnot(None))
-                .order_by(ContentItem.published_at.asc())
-                .limit(limit)
             )
-            return list(result.scalars().all())
+            return result.scalar_one()
+
+    async def get_discord_configs_for_guilds(
+        self, guild_ids: list[str]
+    ) -> dict[str, DiscordConfig]:
+        if not guild_ids:
+            return {}
+        configs: dict[str, DiscordConfig] = {}
+        missing: list[str] = []
+        for guild_id in guild_ids:
+            cached = self._discord_configs.get(guild_id)
+            if cached is not None:
+                configs[guild_id] = cached
+            else:
+                missing.append(guild_id)
+        if missing:
+            async with self.session() as session:
+                result = await session.execute(
+                    select(DiscordConfig).where(DiscordConfig.guild_id.in_(missing))
+                )
+                for config in result.scalars().all():
+                    self._discord_configs.set(config.guild_id, config)
+                    configs[config.guild_id] = config
+        return configs
 
     async def get_sources_for_guild(self, guild_id: str) -> list[Source]:
         async with self.session() as session:
@@ -320,25 +677,32 @@ class Repository:
             )
             return list(result.scalars().all())
 
-    async def get_unsummarized_content_items(self, limit: int = 10) -> list[ContentItem]:
+    async def get_unsummarized_content_items(
+        self, limit: int = 10, exclude_ids: Collection[str] = ()
+    ) -> list[ContentItem]:
         async with self.session() as session:
-            result = await session.execute(
+            query = (
                 select(ContentItem)
+                .options(selectinload(ContentItem.blob))
                 .where(ContentItem.summary.is_(None))
-                .order_by(ContentItem.created_at.asc())
-                .limit(limit)
+                .where(ContentItem.posted_to_discord == False)  # noqa: E712
+            )
+            if exclude_ids:
+                query = query.where(ContentItem.id.not_in(exclude_ids))
+            result = await session.execute(
+                query.order_by(ContentItem.created_at.asc()).limit(limit)
             )
             return list(result.scalars().all())
 
-    async def has_source_posted_content(self, source_id: str) -> bool:
+    async def count_unsummarized_content_items(self) -> int:
         async with self.session() as session:
             result = await session.execute(
-                select(ContentItem.id)
-                .where(ContentItem.source_id == source_id)
-                .where(ContentItem.posted_to_discord == True)  # noqa: E712
-                .limit(1)
+                select(func.count())
+                .select_from(ContentItem)
+                .where(ContentItem.summary.is_(None))
+                .where(ContentItem.posted_to_discord == False)  # noqa: E712
             )
-            return result.scalar_one_or_none() is not None
+            return result.scalar_one()
 
     async def get_most_recent_item_for_source(self, source_id: str) -> ContentItem | None:
         async with self.session() as session:
@@ -355,7 +719,7 @@ class Repository:
     ) -> int:
         async with self.session() as session:
             query = (
-                select(ContentItem)
+                update(ContentItem)
                 .where(ContentItem.source_id == source_id)
                 .where(ContentItem.posted_to_discord == False)  # noqa: E712
                 .where(ContentItem.summary.is_(None))
@@ -363,44 +727,110 @@ class Repository:
             if exclude_item_id:
                 query = query.where(ContentItem.id != exclude_item_id)
 
-            result = await session.execute(query)
-            items = list(result.scalars().all())
-
-            for item in items:
-                item.posted_to_discord = True
-                item.discord_message_id = "backfilled"
-
+            result = await session.execute(
+                query.values(posted_to_discord=True, discord_message_id="backfilled"),
+                execution_options={"synchronize_session": False},
+            )
+            await session.commit()
+            backfilled: int = result.rowcount  # type: ignore[attr-defined]
+            return backfilled
+
+    async def backfill_first_posting_items(
+        self, source_ids: Collection[str]
+    ) -> list[tuple[str, str]]:
+        """Backfill pending items of sources that have never posted, in one statement.
+
+        For each of ``source_ids`` with no posted item, every unsummarized,
+        unposted item except the source's most recent one is marked as
+        backfilled. Returns the ``(item_id, source_id)`` pairs that were marked.
+        """
+        if not source_ids:
+            return []
+
+        posted = aliased(ContentItem)
+        latest = aliased(ContentItem)
+        latest_item_id = (
+            select(latest.id)
+            .where(latest.source_id == ContentItem.source_id)
+            .order_by(latest.published_at.desc(), latest.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        statement = (
+            update(ContentItem)
+            .where(ContentItem.source_id.in_(source_ids))
+            .where(ContentItem.posted_to_discord == False)  # noqa: E712
+            .where(ContentItem.summary.is_(None))
+            .where(
+                ~exists().where(
+                    posted.source_id == ContentItem.source_id,
+                    posted.posted_to_discord == True,  # noqa: E712
+                )
+            )
+            .where(ContentItem.id != latest_item_id)
+            .values(posted_to_discord=True, discord_message_id="backfilled")
+            .returning(ContentItem.id, ContentItem.source_id)
+        )
+        async with self.session() as session:
+            result = await session.execute(
+                statement, execution_options={"synchronize_session": False}
+            )
+            rows = [(row[0], row[1]) for row in result.all()]
             await session.commit()
-            return len(items)
+            return rows
 
     async def update_content_item_summary(self, content_id: str, summary: str) -> bool:
         async with self.session() as session:
-            result = await session.execute(select(ContentItem).where(ContentItem.id == content_id))
-            content_item = result.scalar_one_or_none()
-            if content_item:
-                content_item.summary = summary
-                await session.commit()
-                logger.debug("Content item summary updated", content_id=content_id)
-                return True
+            result = await session.execute(
+                update(ContentItem)
+                .where(ContentItem.id == content_id)
+                .values(summary=summary)
+                .returning(ContentItem.id)
+            )
+            updated = result.first() is not None
+            await session.commit()
+        if updated:
+            logger.debug("Content item summary updated", content_id=content_id)
+        else:
             logger.warning("Content item not found for summary update", content_id=content_id)
-            return False
+        return updated
 
-    async def mark_content_item_posted(self, content_id: str, discord_message_id: str) -> bool:
+    async def update_content_item_summaries(self, summaries: list[tuple[str, str]]) -> int:
+        """Set summaries for a batch of (content_id, summary) pairs in one transaction."""
+        if not summaries:
+            return 0
         async with self.session() as session:
-            result = await session.execute(select(ContentItem).where(ContentItem.id == content_id))
-            content_item = result.scalar_one_or_none()
-            if content_item:
-                content_item.posted_to_discord = True
-                content_item.discord_message_id = discord_message_id
-                await session.commit()
-                logger.debug(
-                    "Content item marked as posted",
-                    content_id=content_id,
-                    discord_message_id=discord_message_id,
-                )
-                return True
-            logger.warning("Content item not found for posting", content_id=content_id)
-            return False
+            await session.execute(
+                update(ContentItem),
+                [{"id": content_id, "summary": summary} for content_id, summary in summaries],
+            )
+            await session.commit()
+        logger.debug("Content item summaries updated", count=len(summaries))
+        return len(summaries)
+
+    async def mark_content_items_posted(self, posted: list[tuple[str, str]]) -> int:
+        """Mark a batch of content items as posted in a single transaction.
+
+        Takes (content_id, discord_message_id) pairs as produced by the poster's
+        channel workers.
+        """
+        if not posted:
+            return 0
+        async with self.session() as session:
+            await session.execute(
+                update(ContentItem),
+                [
+                    {
+                        "id": content_id,
+                        "posted_to_discord": True,
+                        "discord_message_id": discord_message_id,
+                    }
+                    for content_id, discord_message_id in posted
+                ],
+            )
+            await session.commit()
+            logger.debug("Content items marked as posted", count=len(posted))
+            return len(posted)
 
     async def get_latest_content_for_source(self, source_id: str) -> ContentItem | None:
         async with self.session() as session:
@@ -422,6 +852,7 @@ class Repository:
                 if config:
                     config.channel_id = channel_id
                     await session.commit()
+                    self._discord_configs.invalidate(guild_id)
                     await session.refresh(config)
                     return config
 
@@ -429,6 +860,7 @@ class Repository:
                 session.add(config)
                 try:
                     await session.commit()
+                    self._discord_configs.invalidate(guild_id)
                     await session.refresh(config)
                     return config
                 except IntegrityError:
@@ -437,11 +869,17 @@ class Repository:
         raise RuntimeError(f"Failed to get or create discord config for guild {guild_id}")
 
     async def get_discord_config(self, guild_id: str) -> DiscordConfig | None:
+        cached = self._discord_configs.get(guild_id)
+        if cached is not None:
+            return cached
         async with self.session() as session:
             result = await session.execute(
                 select(DiscordConfig).where(DiscordConfig.guild_id == guild_id)
             )
-            return result.scalar_one_or_none()
+            config = result.scalar_one_or_none()
+        if config is not None:
+            self._discord_configs.set(guild_id, config)
+        return config
 
     async def update_source_discovery_strategy(
         self,
@@ -450,44 +888,85 @@ class Repository:
         feed_url: str | None = None,
         url_pattern: str | None = None,
     ) -> bool:
+        # A new strategy or pattern starts from a full scan of the sitemap.
+        values: dict[str, Any] = {
+            "discovery_strategy": discovery_strategy,
+            "sitemap_lastmod_watermark": None,
+        }
+        if feed_url is not None:
+            values["feed_url"] = feed_url
+        if url_pattern is not None:
+            values["url_pattern"] = url_pattern
         async with self.session() as session:
-            result = await session.execute(select(Source).where(Source.id == source_id))
-            source = result.scalar_one_or_none()
-            if source:
-                source.discovery_strategy = discovery_strategy
-                if feed_url is not None:
-                    source.feed_url = feed_url
-                if url_pattern is not None:
-                    source.url_pattern = url_pattern
-                await session.commit()
-                return True
-            return False
+            result = await session.execute(
+                update(Source).where(Source.id == source_id).values(**values).returning(Source.id)
+            )
+            updated = result.first() is not None
+            await session.commit()
+        if updated:
+            self._invalidate_source(source_id=source_id)
+        return updated
+
+    async def update_source_sitemap_watermark(self, source_id: str, watermark: datetime) -> bool:
+        async with self.session() as session:
+            result = await session.execute(
+                update(Source)
+                .where(Source.id == source_id)
+                .values(sitemap_lastmod_watermark=watermark)
+                .returning(Source.id)
+            )
+            updated = result.first() is not None
+            await session.commit()
+        if updated:
+            self._invalidate_source(source_id=source_id)
+        return updated
 
     async def update_source_content_hash(self, source_id: str, content_hash: str) -> bool:
         async with self.session() as session:
-            result = await session.execute(select(Source).where(Source.id == source_id))
-            source = result.scalar_one_or_none()
-            if source:
-                source.last_content_hash = content_hash
-                await session.commit()
-                return True
-            return False
+            result = await session.execute(
+                update(Source)
+                .where(Source.id == source_id)
+                .values(last_content_hash=content_hash)
+                .returning(Source.id)
+            )
+            updated = result.first() is not None
+            await session.commit()
+        if updated:
+            self._invalidate_source(source_id=source_id)
+        return updated
 
     async def get_extraction_cache(self, url: str) -> ExtractionCache | None:
+        cached = self._extraction_cache.get(url)
+        if cached is not None:
+            return cached
         async with self.session() as session:
             result = await session.execute(
                 select(ExtractionCache).where(ExtractionCache.url == url)
             )
-            return result.scalar_one_or_none()
+            cache = result.scalar_one_or_none()
+        if cache is not None:
+            self._extraction_cache.set(url, cache)
+        return cache
 
     async def set_extraction_cache(
         self, url: str, content_hash: str, posts_json: str
     ) -> ExtractionCache:
+        """Store an extraction result; a result identical to the stored one is not rewritten."""
+        cache = self._extraction_cache.get(url)
+        if cache is not None and (cache.content_hash, cache.posts_json) == (
+            content_hash,
+            posts_json,
+        ):
+            return cache
+
         async with self.session() as session:
             result = await session.execute(
                 select(ExtractionCache).where(ExtractionCache.url == url)
             )
             cache = result.scalar_one_or_none()
+            if cache and (cache.content_hash, cache.posts_json) == (content_hash, posts_json):
+                self._extraction_cache.set(url, cache)
+                return cache
             if cache:
                 cache.content_hash = content_hash
                 cache.posts_json = posts_json
@@ -501,55 +980,151 @@ class Repository:
                 session.add(cache)
             await session.commit()
             await session.refresh(cache)
-            return cache
+        self._extraction_cache.set(url, cache)
+        return cache
+
+    async def get_sitemap_location(self, page_url: str) -> SitemapLocation | None:
+        async with self.session() as session:
+            result = await session.execute(
+                select(SitemapLocation).where(SitemapLocation.page_url == page_url)
+            )
+            return result.scalar_one_or_none()
+
+    async def set_sitemap_location(
+        self,
+        page_url: str,
+        sitemap_url: str | None,
+        sub_sitemaps_json: str,
+        checked_at: datetime | None = None,
+    ) -> None:
+        """Store a page's sitemap location; ``checked_at`` None keeps the last check time."""
+        values: dict[str, Any] = {
+            "sitemap_url": sitemap_url,
+            "sub_sitemaps_json": sub_sitemaps_json,
+        }
+        if checked_at is not None:
+            values["checked_at"] = checked_at
+        new_row = {"id": str(uuid4()), "page_url": page_url, "checked_at": datetime.now(UTC)}
+        async with self.session() as session:
+            await session.execute(
+                sqlite_insert(SitemapLocation)
+                .values({**new_row, **values})
+                .on_conflict_do_update(index_elements=[SitemapLocation.page_url], set_=values)
+            )
+            await session.commit()
 
     async def cleanup_extraction_cache(self, max_age_days: int = 7) -> int:
         cutoff = datetime.now(UTC) - timedelta(days=max_age_days)
         async with self.session() as session:
             result = await session.execute(
-                select(ExtractionCache).where(ExtractionCache.cached_at < cutoff)
+                delete(ExtractionCache)
+                .where(ExtractionCache.cached_at < cutoff)
+                .returning(ExtractionCache.url)
             )
-            entries = list(result.scalars().all())
-            for entry in entries:
-                await session.delete(entry)
+            removed_urls = list(result.scalars().all())
             await session.commit()
-            if entries:
-                logger.info("Cleaned up extraction cache", removed=len(entries))
-            return len(entries)
-
-    async def get_known_urls_for_source(self, source_id: str) -> set[str]:
+        for url in removed_urls:
+            self._extraction_cache.invalidate(url)
+        if removed_urls:
+            logger.info("Cleaned up extraction cache", removed=len(removed_urls))
+        return len(removed_urls)
+
+    async def prune_raw_content(self, max_age_days: int) -> int:
+        """Drop stored bodies of summarized items created more than max_age_days ago."""
+        cutoff = datetime.now(UTC) - timedelta(days=max_age_days)
         async with self.session() as session:
             result = await session.execute(
-                select(ContentItem.original_url).where(ContentItem.source_id == source_id)
+                delete(ContentBlob).where(
+                    ContentBlob.content_item_id.in_(
+                        select(ContentItem.id)
+                        .where(ContentItem.summary.is_not(None))
+                        .where(ContentItem.created_at < cutoff)
+                    )
+                )
             )
-            return {row[0] for row in result.all()}
+            await session.commit()
+            removed: int = result.rowcount  # type: ignore[attr-defined]
+            if removed:
+                logger.info("Pruned raw content", removed=removed, max_age_days=max_age_days)
+            return removed
+
+    async def get_database_file_stats(self) -> DatabaseFileStats:
+        async with self._engine.connect() as conn:
+            values = {}
+            for name in ("page_size", "page_count", "freelist_count", "auto_vacuum"):
+                result = await conn.exec_driver_sql(f"PRAGMA {name}")
+                values[name] = result.scalar_one()
+        return DatabaseFileStats(**values)
+
+    async def incremental_vacuum(self, max_pages: int = 0) -> None:
+        """Release free pages back to the filesystem; max_pages=0 releases all."""
+        async with self._engine.begin() as conn:
+            # The pragma frees pages as its result rows are stepped through.
+            result = await conn.exec_driver_sql(f"PRAGMA incremental_vacuum({max_pages})")
+            if result.returns_rows:
+                result.fetchall()
+
+    async def vacuum(self) -> None:
+        """Rebuild the database file, which also applies a changed auto_vacuum mode."""
+        async with self._engine.connect() as conn:
+            autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await autocommit.exec_driver_sql(f"PRAGMA auto_vacuum={self._pragmas.auto_vacuum}")
+            await autocommit.exec_driver_sql("VACUUM")
+
+    async def analyze(self) -> None:
+        async with self._engine.begin() as conn:
+            await conn.exec_driver_sql("ANALYZE")
 
     async def increment_failure_count(self, source_id: str) -> int:
         async with self.session() as session:
-            result = await session.execute(select(Source).where(Source.id == source_id))
-            source = result.scalar_one_or_none()
-            if source:
-                source.consecutive_failures = (source.consecutive_failures or 0) + 1
-                await session.commit()
-                logger.debug(
-                    "Source failure count incremented",
-                    source_id=source_id,
-                    consecutive_failures=source.consecutive_failures,
-                )
-                return source.consecutive_failures
+            result = await session.execute(
+                update(Source)
+                .where(Source.id == source_id)
+                .values(consecutive_failures=func.coalesce(Source.consecutive_failures, 0) + 1)
+                .returning(Source.consecutive_failures)
+            )
+            failures = result.scalar_one_or_none()
+            await session.commit()
+        if failures is None:
             logger.warning("Source not found for failure count increment", source_id=source_id)
             return 0
+        self._invalidate_source(source_id=source_id)
+        logger.debug(
+            "Source failure count incremented",
+            source_id=source_id,
+            consecutive_failures=failures,
+        )
+        return int(failures)
 
     async def reset_failure_count(self, source_id: str) -> bool:
+        """Zero the source's failure counter.
+
+        Returns True only when the source had failures to clear; a missing
+        source and one already at zero both return False.
+        """
+        return await self.reset_failure_counts([source_id]) > 0
+
+    async def reset_failure_counts(self, source_ids: Collection[str]) -> int:
+        """Zero the failure counter of every listed source that has failures.
+
+        Sources already at zero are left untouched so a successful poll does
+        not rewrite the row.
+        """
+        if not source_ids:
+            return 0
         async with self.session() as session:
-            result = await session.execute(select(Source).where(Source.id == source_id))
-            source = result.scalar_one_or_none()
-            if source:
-                if (source.consecutive_failures or 0) > 0:
-                    source.consecutive_failures = 0
-                    await session.commit()
-                return True
-            return False
+            result = await session.execute(
+                update(Source)
+                .where(Source.id.in_(source_ids))
+                .where(Source.consecutive_failures > 0)
+                .values(consecutive_failures=0)
+                .returning(Source.id)
+            )
+            reset_ids = list(result.scalars())
+            await session.commit()
+        for source_id in reset_ids:
+            self._invalidate_source(source_id=source_id)
+        return len(reset_ids)
 
     async def add_forwarding_rule(
         self,
@@ -558,6 +1133,7 @@ class Repository:
         source_type: str,
         destination_channel_id: str,
         destination_type: str,
+        coalesce_window_seconds: int = 0,
     ) -> ForwardingRule:
         async with self.session() as session:
             rule = ForwardingRule(
@@ -566,6 +1142,7 @@ class Repository:
                 source_type=source_type,
                 destination_channel_id=destination_channel_id,
                 destination_type=destination_type,
+                coalesce_window_seconds=coalesce_window_seconds,
             )
             session.add(rule)
             await session.commit()
@@ -597,18 +1174,54 @@ class Repository:
             )
             return list(result.scalars().all())
 
-    async def increment_forwarding_count(self, rule_id: str) -> bool:
+    async def apply_counter_deltas(
+        self,
+        forwarding: Mapping[str, ForwardingCountDelta] | None = None,
+        usage: Mapping[tuple[str, str], UsageCountDelta] | None = None,
+    ) -> int:
+        """Apply aggregated forwarding and usage counter deltas in one transaction.
+
+        ``usage`` is keyed by ``(guild_id, user_id)``. Returns the number of
+        forwarding rules that were found and updated.
+        """
+        if not forwarding and not usage:
+            return 0
+        updated = 0
         async with self.session() as session:
-            result = await session.execute(
-                select(ForwardingRule).where(ForwardingRule.id == rule_id)
-            )
-            rule = result.scalar_one_or_none()
-            if rule:
-                rule.messages_forwarded = (rule.messages_forwarded or 0) + 1
-                rule.last_forwarded_at = datetime.now(UTC)
-                await session.commit()
-                return True
-            return False
+            for rule_id, forward_delta in (forwarding or {}).items():
+                result = await session.execute(
+                    update(ForwardingRule)
+                    .where(ForwardingRule.id == rule_id)
+                    .values(
+                        messages_forwarded=func.coalesce(ForwardingRule.messages_forwarded, 0)
+                        + forward_delta.count,
+                        last_forwarded_at=forward_delta.last_forwarded_at,
+                    )
+                    .returning(ForwardingRule.id)
+                )
+                if result.first() is not None:
+                    updated += 1
+            for (guild_id, user_id), usage_delta in (usage or {}).items():
+                insert_statement = sqlite_insert(SuckBoobsStats).values(
+                    id=str(uuid4()),
+                    guild_id=guild_id,
+                    user_id=user_id,
+                    times_used=usage_delta.times_used,
+                    times_pinged=usage_delta.times_pinged,
+                )
+                await session.execute(
+                    insert_statement.on_conflict_do_update(
+                        index_elements=[SuckBoobsStats.guild_id, SuckBoobsStats.user_id],
+                        set_={
+                            "times_used": SuckBoobsStats.times_used
+                            + insert_statement.excluded.times_used,
+                            "times_pinged": SuckBoobsStats.times_pinged
+                            + insert_statement.excluded.times_pinged,
+                        },
+                    )
+                )
+            await session.commit()
+        return updated
 
     async def delete_forwarding_rule(
         self, guild_id: str, source_channel_id: str, destination_channel_id: str
@@ -658,37 +1271,25 @@ class Repository:
                 return True
             return False
 
-    async def record_suck_boobs_usage(
-        self, guild_id: str, user_id: str, pinged_user_id: str
-    ) -> None:
+    async def set_forwarding_rule_coalesce_window(
+        self,
+        guild_id: str,
+        source_channel_id: str,
+        destination_channel_id: str,
+        window_seconds: int,
+    ) -> bool:
         async with self.session() as session:
-            user_result = await session.execute(
-                select(SuckBoobsStats)
-                .where(SuckBoobsStats.guild_id == guild_id)
-                .where(SuckBoobsStats.user_id == user_id)
-            )
-            user_stat = user_result.scalar_one_or_none()
-            if user_stat:
-                user_stat.times_used += 1
-            else:
-                user_stat = SuckBoobsStats(guild_id=guild_id, user_id=user_id, times_used=1)
-                session.add(user_stat)
-
-            pinged_result = await session.execute(
-                select(SuckBoobsStats)
-                .where(SuckBoobsStats.guild_id == guild_id)
-                .where(SuckBoobsStats.user_id == pinged_user_id)
+            result = await session.execute(
+                update(ForwardingRule)
+                .where(ForwardingRule.guild_id == guild_id)
+                .where(ForwardingRule.source_channel_id == source_channel_id)
+                .where(ForwardingRule.destination_channel_id == destination_channel_id)
+                .values(coalesce_window_seconds=window_seconds)
+                .returning(ForwardingRule.id)
             )
-            pinged_stat = pinged_result.scalar_one_or_none()
-            if pinged_stat:
-                pinged_stat.times_pinged += 1
-            else:
-                pinged_stat = SuckBoobsStats(
-                    guild_id=guild_id, user_id=pinged_user_id, times_pinged=1
-                )
-                session.add(pinged_stat)
-
+            updated = result.first() is not None
             await session.commit()
+            return updated
 
     async def get_suck_boobs_leaderboard(
         self, guild_id: str, limit: int = 10
@@ -845,48 +1446,58 @@ class Repository:
         last_pr_number: int | None = None,
         last_issue_number: int | None = None,
     ) -> bool:
+        values: dict[str, Any] = {"last_polled_at": datetime.now(UTC)}
+        if last_commit_sha is not None:
+            values["last_commit_sha"] = last_commit_sha
+        if last_pr_number is not None:
+            values["last_pr_number"] = last_pr_number
+        if last_issue_number is not None:
+            values["last_issue_number"] = last_issue_number
         async with self.session() as session:
-            result = await session.execute(select(GitHubRepo).where(GitHubRepo.id == repo_id))
-            github_repo = result.scalar_one_or_none()
-            if github_repo:
-                if last_commit_sha is not None:
-                    github_repo.last_commit_sha = last_commit_sha
-                if last_pr_number is not None:
-                    github_repo.last_pr_number = last_pr_number
-                if last_issue_number is not None:
-                    github_repo.last_issue_number = last_issue_number
-                github_repo.last_polled_at = datetime.now(UTC)
-                await session.commit()
-                return True
-            return False
+            result = await session.execute(
+                update(GitHubRepo)
+                .where(GitHubRepo.id == repo_id)
+                .values(**values)
+                .returning(GitHubRepo.id)
+            )
+            updated = result.first() is not None
+            await session.commit()
+            return updated
 
     async def increment_github_failure(self, repo_id: str) -> int:
         async with self.session() as session:
-            result = await session.execute(select(GitHubRepo).where(GitHubRepo.id == repo_id))
-            github_repo = result.scalar_one_or_none()
-            if github_repo:
-                github_repo.consecutive_failures = (github_repo.consecutive_failures or 0) + 1
-                await session.commit()
-                return github_repo.consecutive_failures
-            return 0
+            result = await session.execute(
+                update(GitHubRepo)
+                .where(GitHubRepo.id == repo_id)
+                .values(consecutive_failures=func.coalesce(GitHubRepo.consecutive_failures, 0) + 1)
+                .returning(GitHubRepo.consecutive_failures)
+            )
+            failures = result.scalar_one_or_none()
+            await session.commit()
+            return int(failures) if failures is not None else 0
 
     async def reset_github_failure(self, repo_id: str) -> bool:
+        """Zero the repo's failure counter; returns True if it had failures."""
         async with self.session() as session:
-            result = await session.execute(select(GitHubRepo).where(GitHubRepo.id == repo_id))
-            github_repo = result.scalar_one_or_none()
-            if github_repo:
-                if (github_repo.consecutive_failures or 0) > 0:
-                    github_repo.consecutive_failures = 0
-                    await session.commit()
-                return True
-            return False
+            result = await session.execute(
+                update(GitHubRepo)
+                .where(GitHubRepo.id == repo_id)
+                .where(GitHubRepo.consecutive_failures > 0)
+                .values(consecutive_failures=0)
+                .returning(GitHubRepo.id)
+            )
+            updated = result.first() is not None
+            await session.commit()
+            return updated
 
     async def set_github_repo_active(self, repo_id: str, is_active: bool) -> bool:
         async with self.session() as session:
-            result = await session.execute(select(GitHubRepo).where(GitHubRepo.id == repo_id))
-            github_repo = result.scalar_one_or_none()
-            if github_repo:
-                github_repo.is_active = is_active
-                await session.commit()
-                return True
-            return False
+            result = await session.execute(
+                update(GitHubRepo)
+                .where(GitHubRepo.id == repo_id)
+                .values(is_active=is_active)
+                .returning(GitHubRepo.id)
+            )
+            updated = result.first() is not None
+            await session.commit()
+            return updated
@@ -0,0 +1,144 @@
+import hashlib
+import math
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+
+DEFAULT_ERROR_RATE = 0.01
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing of one blake2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_ERROR_RATE) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str) -> list[int]:
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value)
+        )
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+
+@dataclass
+class SeenIndexStats:
+    ids_loaded: int
+    bloom_capacity: int
+    bloom_memory_bytes: int
+    recent_ids: int
+    recent_memory_bytes: int
+    bloom_negatives: int
+    recent_hits: int
+    db_checks: int
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.bloom_memory_bytes + self.recent_memory_bytes
+
+
+class SeenIdIndex:
+    """Process-wide index of content external IDs answering "have we stored this?".
+
+    A Bloom filter holds every known ID, so a miss proves an ID is new without
+    touching the database. A bounded LRU of exact IDs, fed by inserts and
+    confirmed lookups, answers the common case of a feed re-listing items it
+    listed last poll. Anything else falls through to an exact database check.
+    Memory is the Bloom filter (about 1.2 MB per million IDs at a 1% error
+    rate) plus at most ``recent_size`` strings.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        recent_size: int = 50_000,
+        error_rate: float = DEFAULT_ERROR_RATE,
+    ) -> None:
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self._recent_size = recent_size
+        self._recent_bytes = 0
+        self.bloom_negatives = 0
+        self.recent_hits = 0
+        self.db_checks = 0
+
+    def add(self, external_id: str) -> None:
+        """Record an ID that is now stored."""
+        if external_id not in self._bloom:
+            self._bloom.add(external_id)
+        self.remember(external_id)
+
+    def load(self, external_id: str) -> None:
+        """Add an ID at startup; only the Bloom filter is populated."""
+        self._bloom.add(external_id)
+
+    def remember(self, external_id: str) -> None:
+        if external_id in self._recent:
+            self._recent.move_to_end(external_id)
+            return
+        self._recent[external_id] = None
+        self._recent_bytes += sys.getsizeof(external_id)
+        while len(self._recent) > self._recent_size:
+            evicted, _ = self._recent.popitem(last=False)
+            self._recent_bytes -= sys.getsizeof(evicted)
+
+    def forget(self, external_id: str) -> None:
+        """Drop an ID whose row was deleted; the Bloom filter keeps it as a maybe."""
+        if external_id in self._recent:
+            del self._recent[external_id]
+            self._recent_bytes -= sys.getsizeof(external_id)
+
+    def lookup(self, external_id: str) -> bool | None:
+        """Return False if definitely new, True if known, None if the DB must decide."""
+        if external_id not in self._bloom:
+            self.bloom_negatives += 1
+            return False
+        if external_id in self._recent:
+            self._recent.move_to_end(external_id)
+            self.recent_hits += 1
+            return True
+        self.db_checks += 1
+        return None
+
+    @property
+    def over_capacity(self) -> bool:
+        """True once more IDs were added than the filter was sized for.
+
+        Lookups stay correct, but the false-positive rate rises, so more of them
+        fall through to the database until the index is rebuilt at startup.
+        """
+        return self._bloom.count > self._bloom.capacity
+
+    def get_stats(self) -> SeenIndexStats:
+        return SeenIndexStats(
+            ids_loaded=self._bloom.count,
+            bloom_capacity=self._bloom.capacity,
+            bloom_memory_bytes=self._bloom.memory_bytes,
+            recent_ids=len(self._recent),
+            recent_memory_bytes=self._recent_bytes,
+            bloom_negatives=self.bloom_negatives,
+            recent_hits=self.recent_hits,
+            db_checks=self.db_checks,
+        )
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 import structlog
 from discord.ext import commands, tasks
 
+from intelstream.services.backlog import BacklogStatus, DrainBudget, estimate_drain_minutes
 from intelstream.services.content_poster import ContentPoster
 from intelstream.services.pipeline import ContentPipeline
 from intelstream.services.summarizer import SummarizationService
@@ -27,6 +28,8 @@ class ContentPosting(commands.Cog):
         self._initialized = False
         self._consecutive_failures = 0
         self._base_interval: int = 5
+        self._last_cycle_summarized = 0
+        self._last_cycle_posted = 0
 
     async def cog_load(self) -> None:
         summarizer = SummarizationService(
@@ -46,6 +49,7 @@ class ContentPosting(commands.Cog):
         self._poster = ContentPoster(
             self.bot,
             max_message_length=self.bot.settings.discord_max_message_length,
+            webhooks=self.bot.webhooks,
         )
         self._initialized = True
 
@@ -72,6 +76,14 @@ class ContentPosting(commands.Cog):
                     with contextlib.suppress(asyncio.CancelledError):
                         await t
 
+        try:
+            if self._poster:
+                await asyncio.wait_for(self._poster.close(), timeout=5.0)
+        except TimeoutError:
+            logger.error("Poster close timed out during cog unload")
+        except Exception as e:
+            logger.error("Error closing poster during cog unload", error=str(e))
+
         try:
             if self._pipeline:
                 await asyncio.wait_for(self._pipeline.close(), timeout=5.0)
@@ -106,16 +118,16 @@ class ContentPosting(commands.Cog):
             new_items, summarized = await self._pipeline.run_cycle()
 
             total_posted = 0
-            for guild in self.bot.guilds:
-                try:
-                    posted = await self._poster.post_unposted_items(guild.id)
-                    total_posted += posted
-                except Exception as e:
-                    logger.error(
-                        "Error posting to guild",
-                        guild_id=guild.id,
-                        error=str(e),
-                    )
+            try:
+                total_posted = await self._poster.post_unposted_items(
+                    [guild.id for guild in self.bot.guilds],
+                    budget=self._create_posting_budget(),
+                )
+            except Exception as e:
+                logger.error("Error posting unposted items", error=str(e))
+
+            self._last_cycle_summarized = summarized
+            self._last_cycle_posted = total_posted
 
             cycle_elapsed = round(time.monotonic() - cycle_start, 2)
             logger.info(
@@ -141,6 +153,31 @@ class ContentPosting(commands.Cog):
 
             self._apply_backoff()
 
+    def _create_posting_budget(self) -> DrainBudget | None:
+        settings = self.bot.settings
+        if not settings.backlog_drain_enabled:
+            return None
+        return DrainBudget(
+            max_items=settings.posting_max_items_per_cycle,
+            deadline_seconds=settings.backlog_cycle_deadline_seconds,
+            max_page_size=settings.backlog_max_page_size,
+        )
+
+    async def get_backlog_status(self) -> BacklogStatus:
+        pending_summary = await self.bot.repository.count_unsummarized_content_items()
+        pending_posting = await self.bot.repository.count_unposted_content_items()
+        interval = self._base_interval
+        return BacklogStatus(
+            pending_summary=pending_summary,
+            pending_posting=pending_posting,
+            summary_drain_minutes=estimate_drain_minutes(
+                pending_summary, self._last_cycle_summarized, interval
+            ),
+            posting_drain_minutes=estimate_drain_minutes(
+                pending_summary + pending_posting, self._last_cycle_posted, interval
+            ),
+        )
+
     @content_loop.before_loop
     async def before_content_loop(self) -> None:
         await self.bot.wait_until_ready()
@@ -0,0 +1,53 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import structlog
+from discord.ext import commands, tasks
+
+from intelstream.services.maintenance import MaintenanceReport, MaintenanceService
+
+if TYPE_CHECKING:
+    from intelstream.bot import IntelStreamBot
+
+logger = structlog.get_logger()
+
+
+class DatabaseMaintenance(commands.Cog):
+    def __init__(self, bot: "IntelStreamBot") -> None:
+        self.bot = bot
+        self._service: MaintenanceService | None = None
+        self.last_report: MaintenanceReport | None = None
+
+    async def cog_load(self) -> None:
+        if not self.bot.settings.maintenance_enabled:
+            logger.info("Database maintenance disabled")
+            return
+
+        self._service = MaintenanceService(self.bot.repository, self.bot.settings)
+        interval = self.bot.settings.maintenance_interval_hours
+        self.maintenance_loop.change_interval(hours=interval)
+        self.maintenance_loop.start()
+
+        logger.info("Database maintenance cog loaded", interval_hours=interval)
+
+    async def cog_unload(self) -> None:
+        self.maintenance_loop.cancel()
+        logger.info("Database maintenance cog unloaded")
+
+    # Interval placeholder; actual value set via change_interval() in cog_load
+    @tasks.loop(hours=24)
+    async def maintenance_loop(self) -> None:
+        if self._service is None:
+            return
+
+        try:
+            self.last_report = await self._service.run()
+        except Exception as e:
+            logger.error("Database maintenance failed", error=str(e))
+
+    @maintenance_loop.before_loop
+    async def before_maintenance_loop(self) -> None:
+        await self.bot.wait_until_ready()
+        # The first run waits a full interval so that maintenance does not
+        # compete with the catch-up fetch and posting cycles at startup.
+        await asyncio.sleep(self.bot.settings.maintenance_interval_hours * 3600)
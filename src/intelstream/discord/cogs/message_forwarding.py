@@ -1,11 +1,14 @@
 import asyncio
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING
 
 import discord
 import structlog
 from discord import app_commands
 from discord.ext import commands
 
+from intelstream.services.forward_coalescer import ForwardCoalescer
+from intelstream.services.forwarding_index import ForwardingRuleIndex
 from intelstream.services.message_forwarder import MessageForwarder
 
 if TYPE_CHECKING:
@@ -22,35 +25,47 @@ class MessageForwarding(commands.Cog):
 
     def __init__(self, bot: "IntelStreamBot") -> None:
         self.bot = bot
-        self.forwarder = MessageForwarder(bot)
-        self._rules_cache: dict[str, list[Any]] = {}
+        self.forwarder = MessageForwarder(bot, webhooks=bot.webhooks)
+        self.coalescer = ForwardCoalescer(
+            self.forwarder,
+            on_delivered=bot.counters.increment_forwarding,
+            max_burst_messages=bot.settings.forward_coalesce_max_messages,
+        )
+        self.rules = ForwardingRuleIndex()
+        # Serializes writers only; on_message reads the index without it.
         self._cache_lock = asyncio.Lock()
 
+    async def cog_unload(self) -> None:
+        await self.coalescer.close()
+        await self.forwarder.close()
+
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         await self._refresh_cache()
 
     async def _refresh_cache(self) -> None:
         async with self._cache_lock:
-            new_cache: dict[str, list[Any]] = {}
-            total_rules = 0
+            start = time.perf_counter()
+            rules = []
             for guild in self.bot.guilds:
-                rules = await self.bot.repository.get_forwarding_rules_for_guild(str(guild.id))
-                for rule in rules:
-                    if rule.is_active:
-                        if rule.source_channel_id not in new_cache:
-                            new_cache[rule.source_channel_id] = []
-                        new_cache[rule.source_channel_id].append(rule)
-                        total_rules += 1
-
-            self._rules_cache = new_cache
+                rules.extend(
+                    await self.bot.repository.get_forwarding_rules_for_guild(str(guild.id))
+                )
+            self.rules.rebuild(rules)
 
             logger.info(
                 "Forwarding rules cache refreshed",
-                total_active_rules=total_rules,
-                source_channels=list(self._rules_cache.keys()),
+                total_active_rules=self.rules.rule_count,
+                source_channels=len(self.rules),
+                elapsed_ms=round((time.perf_counter() - start) * 1000, 2),
             )
 
+    async def _reload_source(self, source_channel_id: str) -> None:
+        """Re-read one source channel's rules after a command changed them."""
+        async with self._cache_lock:
+            rules = await self.bot.repository.get_forwarding_rules_for_source(source_channel_id)
+            self.rules.replace_channel(source_channel_id, rules)
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         if message.author == self.bot.user:
@@ -60,22 +75,28 @@ class MessageForwarding(commands.Cog):
             return
 
         channel_id = str(message.channel.id)
-        rules = self._rules_cache.get(channel_id, [])
+        rules = self.rules.rules_for(channel_id)
 
         if not rules:
             return
 
+        immediate = []
         for rule in rules:
-            destination_id = int(rule.destination_channel_id)
+            if rule.coalesce_window_seconds > 0:
+                self.coalescer.add(rule, message)
+            else:
+                immediate.append(rule)
+        if not immediate:
+            return
 
-            forwarded = await self.forwarder.forward_message(
-                message=message,
-                destination_id=destination_id,
-                destination_type=rule.destination_type,
-            )
+        destinations = [(rule.destination_id, rule.destination_type) for rule in immediate]
+        results = await self.forwarder.forward_to_destinations(message, destinations)
 
+        for rule, (destination_id, _), forwarded in zip(
+            immediate, destinations, results, strict=True
+        ):
             if forwarded:
-                await self.bot.repository.increment_forwarding_count(rule.id)
+                self.bot.counters.increment_forwarding(rule.id)
                 logger.debug(
                     "Forward succeeded, count incremented",
                     rule_id=rule.id,
@@ -148,7 +169,7 @@ class MessageForwarding(commands.Cog):
             destination_type=destination_type,
         )
 
-        await self._refresh_cache()
+        await self._reload_source(str(source.id))
 
         logger.info(
             "Forwarding rule added",
@@ -179,6 +200,7 @@ class MessageForwarding(commands.Cog):
             )
             return
 
+        await self.bot.counters.flush()
         rules = await self.bot.repository.get_forwarding_rules_for_guild(str(interaction.guild_id))
 
         if not rules:
@@ -207,6 +229,8 @@ class MessageForwarding(commands.Cog):
                 else f"Unknown ({rule.destination_channel_id})"
             )
             status = "active" if rule.is_active else "paused"
+            if rule.coalesce_window_seconds:
+                status += f", coalesced {rule.coalesce_window_seconds}s"
 
             lines.append(
                 f"{i}. {source_name} -> {dest_name} ({status}, {rule.messages_forwarded} forwarded)"
@@ -241,7 +265,7 @@ class MessageForwarding(commands.Cog):
         )
 
         if deleted:
-            await self._refresh_cache()
+            await self._reload_source(str(source.id))
             logger.info(
                 "Forwarding rule removed",
                 source_id=source.id,
@@ -286,7 +310,7 @@ class MessageForwarding(commands.Cog):
         )
 
         if updated:
-            await self._refresh_cache()
+            await self._reload_source(str(source.id))
             logger.info(
                 "Forwarding rule paused",
                 source_id=source.id,
@@ -331,7 +355,7 @@ class MessageForwarding(commands.Cog):
         )
 
         if updated:
-            await self._refresh_cache()
+            await self._reload_source(str(source.id))
             logger.info(
                 "Forwarding rule resumed",
                 source_id=source.id,
@@ -348,6 +372,60 @@ class MessageForwarding(commands.Cog):
                 ephemeral=True,
             )
 
+    @forward_group.command(
+        name="coalesce", description="Merge bursts of messages into fewer forwards"
+    )
+    @app_commands.describe(
+        source="Source channel or thread of the rule",
+        destination="Destination channel or thread of the rule",
+        seconds="Window in seconds to collect a burst before forwarding it (0 disables)",
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def forward_coalesce(
+        self,
+        interaction: discord.Interaction,
+        source: discord.TextChannel | discord.Thread,
+        destination: discord.TextChannel | discord.Thread,
+        seconds: app_commands.Range[int, 0, 60],
+    ) -> None:
+        await interaction.response.defer(ephemeral=True)
+
+        if interaction.guild is None:
+            await interaction.followup.send(
+                "This command can only be used in a server.", ephemeral=True
+            )
+            return
+
+        updated = await self.bot.repository.set_forwarding_rule_coalesce_window(
+            guild_id=str(interaction.guild_id),
+            source_channel_id=str(source.id),
+            destination_channel_id=str(destination.id),
+            window_seconds=seconds,
+        )
+
+        if updated:
+            await self._reload_source(str(source.id))
+            logger.info(
+                "Forwarding rule coalesce window set",
+                source_id=source.id,
+                destination_id=destination.id,
+                window_seconds=seconds,
+                user_id=interaction.user.id,
+            )
+            if seconds:
+                reply = (
+                    f"Messages from {source.mention} to {destination.mention} "
+                    f"will be merged over {seconds}s windows."
+                )
+            else:
+                reply = f"Coalescing disabled for {source.mention} -> {destination.mention}."
+            await interaction.followup.send(reply, ephemeral=True)
+        else:
+            await interaction.followup.send(
+                f"No forwarding rule found from {source.mention} to {destination.mention}.",
+                ephemeral=True,
+            )
+
 
 async def setup(bot: "IntelStreamBot") -> None:
     await bot.add_cog(MessageForwarding(bot))
@@ -43,7 +43,7 @@ class SuckBoobs(commands.Cog):
             )
             return
 
-        await self.bot.repository.record_suck_boobs_usage(
+        self.bot.counters.record_suck_boobs_usage(
             guild_id=str(interaction.guild_id),
             user_id=str(interaction.user.id),
             pinged_user_id=str(target.id),
@@ -84,6 +84,7 @@ class SuckBoobs(commands.Cog):
 
         await interaction.response.defer()
 
+        await self.bot.counters.flush()
         top_users, top_pinged = await self.bot.repository.get_suck_boobs_leaderboard(
             guild_id=str(interaction.guild_id)
         )
@@ -0,0 +1,64 @@
+import math
+import time
+from dataclasses import dataclass, field
+
+# Page size aims to clear the current backlog in roughly this many pages.
+BACKLOG_PAGE_DIVISOR = 10
+
+
+@dataclass
+class DrainBudget:
+    """Per-cycle limits for draining the summarization or posting backlog.
+
+    A cycle keeps pulling pages until the item budget is spent, the deadline
+    passes, or a page comes back short. Page size grows with backlog depth,
+    bounded by ``min_page_size`` and ``max_page_size``.
+    """
+
+    max_items: int
+    deadline_seconds: float
+    min_page_size: int = 10
+    max_page_size: int = 100
+    consumed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def remaining_items(self) -> int:
+        return max(self.max_items - self.consumed, 0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() - self.started_at >= self.deadline_seconds
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining_items == 0 or self.expired
+
+    def consume(self, count: int) -> None:
+        self.consumed += count
+
+    def page_size(self, backlog: int) -> int:
+        size = math.ceil(backlog / BACKLOG_PAGE_DIVISOR)
+        size = max(self.min_page_size, min(size, self.max_page_size))
+        return min(size, self.remaining_items)
+
+
+@dataclass
+class BacklogStatus:
+    pending_summary: int
+    pending_posting: int
+    summary_drain_minutes: int | None
+    posting_drain_minutes: int | None
+
+
+def estimate_drain_minutes(backlog: int, per_cycle: int, interval_minutes: int) -> int | None:
+    """Estimate minutes until the backlog is drained at the last cycle's throughput.
+
+    Returns 0 for an empty backlog and None when nothing was processed last
+    cycle, since no rate can be inferred.
+    """
+    if backlog <= 0:
+        return 0
+    if per_cycle <= 0:
+        return None
+    return math.ceil(backlog / per_cycle) * interval_minutes
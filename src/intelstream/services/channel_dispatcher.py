@@ -0,0 +1,144 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import discord
+import structlog
+
+logger = structlog.get_logger()
+
+SendCallable = Callable[[], Awaitable[discord.Message]]
+
+
+@dataclass
+class DispatchResult:
+    key: str
+    channel_id: int
+    message: discord.Message | None = None
+    error: Exception | None = None
+    wait_seconds: float = 0.0
+
+
+@dataclass
+class ChannelQueueStats:
+    channel_id: int
+    queue_depth: int = 0
+    sent: int = 0
+    failed: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        completed = self.sent + self.failed
+        return self.total_wait_seconds / completed if completed else 0.0
+
+
+@dataclass
+class _DispatchJob:
+    key: str
+    send: SendCallable
+    future: "asyncio.Future[DispatchResult]"
+    enqueued_at: float
+
+
+class ChannelDispatcher:
+    """Fan sends out to one queue and worker per destination channel.
+
+    discord.py sleeps inside ``channel.send`` when a route is rate limited, so
+    awaiting sends one after another lets a single throttled channel stall every
+    other channel. Each channel gets its own FIFO queue drained by a dedicated
+    worker, which keeps per-channel ordering while channels proceed independently.
+    Workers are started on demand and exit once their queue is empty.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[int, asyncio.Queue[_DispatchJob]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+        self._stats: dict[int, ChannelQueueStats] = {}
+
+    def submit(
+        self, channel_id: int, key: str, send: SendCallable
+    ) -> "asyncio.Future[DispatchResult]":
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[DispatchResult] = loop.create_future()
+
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = asyncio.Queue()
+            self._queues[channel_id] = queue
+            self._stats[channel_id] = ChannelQueueStats(channel_id=channel_id)
+
+        queue.put_nowait(
+            _DispatchJob(key=key, send=send, future=future, enqueued_at=time.monotonic())
+        )
+        self._stats[channel_id].queue_depth = queue.qsize()
+
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.create_task(self._run_worker(channel_id, queue))
+
+        return future
+
+    async def _run_worker(self, channel_id: int, queue: "asyncio.Queue[_DispatchJob]") -> None:
+        stats = self._stats[channel_id]
+        while True:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                self._workers.pop(channel_id, None)
+                return
+
+            stats.queue_depth = queue.qsize()
+            wait_seconds = time.monotonic() - job.enqueued_at
+            stats.total_wait_seconds += wait_seconds
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait_seconds)
+
+            result = DispatchResult(key=job.key, channel_id=channel_id, wait_seconds=wait_seconds)
+            try:
+                result.message = await job.send()
+                stats.sent += 1
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.cancel()
+                raise
+            except Exception as e:
+                result.error = e
+                stats.failed += 1
+                logger.debug(
+                    "Channel dispatch failed",
+                    channel_id=channel_id,
+                    key=job.key,
+                    error=str(e),
+                )
+            finally:
+                queue.task_done()
+
+            if not job.future.done():
+                job.future.set_result(result)
+
+    async def close(self) -> None:
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers.clear()
+
+        for queue in self._queues.values():
+            while not queue.empty():
+                job = queue.get_nowait()
+                if not job.future.done():
+                    job.future.cancel()
+        for stats in self._stats.values():
+            stats.queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    def get_stats(self) -> dict[int, ChannelQueueStats]:
+        return dict(self._stats)
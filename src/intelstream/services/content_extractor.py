@@ -9,6 +9,7 @@ import trafilatura
 from bs4 import BeautifulSoup, Tag
 
 from intelstream.config import get_settings
+from intelstream.utils.parse_pool import run_parse
 from intelstream.utils.url_validation import SSRFError, validate_url_for_ssrf
 
 logger = structlog.get_logger()
@@ -37,6 +38,9 @@ class ContentExtractor:
         if not html:
             return ExtractedContent(text="")
 
+        return await run_parse(extract_content, html)
+
+    def _extract_from_html(self, html: str) -> ExtractedContent:
         result = trafilatura.extract(
             html,
             include_comments=False,
@@ -206,3 +210,8 @@ class ContentExtractor:
             return body.get_text(separator="\n", strip=True)[:10000]
 
         return soup.get_text(separator="\n", strip=True)[:10000]
+
+
+def extract_content(html: str) -> ExtractedContent:
+    """Parse-pool job for ``ContentExtractor._extract_from_html``."""
+    return ContentExtractor()._extract_from_html(html)
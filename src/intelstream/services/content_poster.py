@@ -1,9 +1,15 @@
+import asyncio
+import functools
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import discord
 import structlog
 
-from intelstream.database.models import ContentItem, SourceType
+from intelstream.database.models import ContentItem, Source, SourceType
+from intelstream.services.backlog import DrainBudget
+from intelstream.services.channel_dispatcher import ChannelDispatcher, DispatchResult
+from intelstream.services.webhook_pool import WebhookPool
 
 if TYPE_CHECKING:
     from intelstream.bot import IntelStreamBot
@@ -73,9 +79,23 @@ def truncate_summary_at_bullet(summary: str, max_length: int) -> str:
 
 
 class ContentPoster:
-    def __init__(self, bot: "IntelStreamBot", max_message_length: int = 2000) -> None:
+    def __init__(
+        self,
+        bot: "IntelStreamBot",
+        max_message_length: int = 2000,
+        webhooks: WebhookPool | None = None,
+    ) -> None:
         self._bot = bot
         self._max_message_length = max_message_length
+        self._webhooks = webhooks
+        self._dispatcher = ChannelDispatcher()
+
+    @property
+    def dispatcher(self) -> ChannelDispatcher:
+        return self._dispatcher
+
+    async def close(self) -> None:
+        await self._dispatcher.close()
 
     def format_message(
         self,
@@ -145,7 +165,11 @@ class ContentPoster:
             content = content_item.original_url
         else:
             content = self.format_message(content_item, source_type, source_name)
-        message = await channel.send(content=content)
+        message = None
+        if self._webhooks is not None:
+            message = await self._webhooks.send(channel, content=content)
+        if message is None:
+            message = await channel.send(content=content)
 
         logger.info(
             "Posted content to Discord",
@@ -156,94 +180,190 @@ class ContentPoster:
 
         return message
 
-    async def post_unposted_items(self, guild_id: int) -> int:
-        items = await self._bot.repository.get_unposted_content_items()
-
-        if not items:
-            logger.debug("No unposted content items to post")
-            return 0
-
-        source_ids = {item.source_id for item in items}
-        sources_map = await self._bot.repository.get_sources_by_ids(source_ids)
-
-        posted_count = 0
+    async def post_unposted_items(
+        self,
+        guild_ids: Sequence[int],
+        budget: DrainBudget | None = None,
+        page_size: int = 10,
+    ) -> int:
+        """Post unposted items for the given guilds, grouped by destination channel.
+
+        Each page of items is loaded with its source and guild default channel in
+        one query, grouped by destination channel, and handed to the per-channel
+        dispatcher. Sources without a guild are legacy/global and fall back to
+        the default channel of the first listed guild that has an active config.
+
+        Without a budget a single page of ``page_size`` items is posted. With one,
+        pages grow with the backlog and keep coming until the budget is spent.
+        """
+        backlog = 0
+        if budget is not None:
+            backlog = await self._bot.repository.count_unposted_content_items()
+            page_size = budget.page_size(backlog)
+
+        allowed_guilds = {str(guild_id) for guild_id in guild_ids}
+        legacy_channel_id: str | None = None
+        legacy_channel_loaded = False
+        attempted: set[str] = set()
+        total_posted = 0
+
+        while page_size > 0:
+            rows = await self._bot.repository.get_unposted_items_with_destinations(
+                limit=page_size, exclude_ids=attempted
+            )
+            if not rows:
+                break
 
-        for item in items:
-            try:
-                source = sources_map.get(item.source_id)
-                if source is None:
-                    logger.warning("Source not found for content item", item_id=item.id)
-                    continue
+            by_channel: dict[str, list[tuple[ContentItem, Source]]] = {}
 
-                # Skip sources belonging to a different guild.
-                # Sources without guild_id are legacy/global and can post to any guild.
-                if source.guild_id and str(guild_id) != source.guild_id:
+            for item, source, guild_channel_id in rows:
+                if source.guild_id and source.guild_id not in allowed_guilds:
                     logger.debug(
-                        "Skipping item, guild mismatch",
+                        "Skipping item, bot is not in source guild",
                         item_id=item.id,
                         source_guild_id=source.guild_id,
-                        current_guild_id=guild_id,
                     )
                     continue
 
-                if not source.channel_id:
-                    config = await self._bot.repository.get_discord_config(str(guild_id))
-                    if config is None or not config.is_active:
+                if source.channel_id:
+                    channel_id = source.channel_id
+                elif source.guild_id:
+                    if guild_channel_id is None:
                         logger.debug(
                             "No channel for source and no guild config",
                             source_id=source.id,
-                            guild_id=guild_id,
+                            guild_id=source.guild_id,
                         )
                         continue
-                    channel_id = config.channel_id
+                    channel_id = guild_channel_id
                 else:
-                    channel_id = source.channel_id
+                    if not legacy_channel_loaded:
+                        try:
+                            legacy_channel_id = await self._resolve_legacy_channel_id(guild_ids)
+                        except Exception as e:
+                            logger.error("Error resolving legacy channel", error=str(e))
+                        legacy_channel_loaded = True
+                    if legacy_channel_id is None:
+                        logger.debug(
+                            "No channel for legacy source and no guild config",
+                            source_id=source.id,
+                        )
+                        continue
+                    channel_id = legacy_channel_id
 
-                channel = self._bot.get_channel(int(channel_id))
-                if channel is None or not isinstance(
-                    channel, (discord.TextChannel, discord.Thread)
-                ):
-                    logger.warning(
-                        "Could not find channel for source",
-                        source_id=source.id,
-                        channel_id=channel_id,
-                    )
-                    continue
+                by_channel.setdefault(channel_id, []).append((item, source))
 
-                message = await self.post_content(
-                    channel=channel,
-                    content_item=item,
-                    source_type=source.type,
-                    source_name=source.name,
-                    skip_summary=source.skip_summary,
-                )
+            posted = await self._dispatch_by_channel(by_channel)
+            if posted:
+                await self._bot.repository.mark_content_items_posted(posted)
+                total_posted += len(posted)
+            attempted.update(item.id for item, _, _ in rows)
+
+            if budget is None:
+                break
+            budget.consume(len(rows))
+            if len(rows) < page_size or budget.exhausted:
+                break
+            page_size = budget.page_size(backlog - budget.consumed)
 
-                await self._bot.repository.mark_content_item_posted(
-                    content_id=item.id,
-                    discord_message_id=str(message.id),
+        if total_posted > 0:
+            logger.info("Posted unposted items", count=total_posted, backlog=backlog)
+        elif not attempted:
+            logger.debug("No unposted content items to post")
+        else:
+            logger.debug("No items to post")
+        return total_posted
+
+    async def _dispatch_by_channel(
+        self, by_channel: dict[str, list[tuple[ContentItem, Source]]]
+    ) -> list[tuple[str, str]]:
+        pending: list[tuple[ContentItem, Source, asyncio.Future[DispatchResult]]] = []
+
+        for channel_id, channel_items in by_channel.items():
+            try:
+                channel = self._bot.get_channel(int(channel_id))
+            except Exception as e:
+                # One broken destination must not hold back the other guilds.
+                logger.error(
+                    "Error resolving channel for sources",
+                    channel_id=channel_id,
+                    source_ids=sorted({source.id for _, source in channel_items}),
+                    error=str(e),
+                )
+                continue
+            if channel is None or not isinstance(channel, (discord.TextChannel, discord.Thread)):
+                logger.warning(
+                    "Could not find channel for sources",
+                    channel_id=channel_id,
+                    source_ids=sorted({source.id for _, source in channel_items}),
+                )
+                continue
+
+            for item, source in channel_items:
+                future = self._dispatcher.submit(
+                    int(channel_id),
+                    item.id,
+                    functools.partial(
+                        self.post_content,
+                        channel=channel,
+                        content_item=item,
+                        source_type=source.type,
+                        source_name=source.name,
+                        skip_summary=source.skip_summary,
+                    ),
                 )
+                pending.append((item, source, future))
+
+        return await self._collect_dispatch_results(pending)
 
-                posted_count += 1
+    async def _resolve_legacy_channel_id(self, guild_ids: Sequence[int]) -> str | None:
+        configs = await self._bot.repository.get_discord_configs_for_guilds(
+            [str(guild_id) for guild_id in guild_ids]
+        )
+        for guild_id in guild_ids:
+            config = configs.get(str(guild_id))
+            if config is not None and config.is_active:
+                return config.channel_id
+        return None
+
+    async def _collect_dispatch_results(
+        self, pending: list[tuple[ContentItem, Source, "asyncio.Future[DispatchResult]"]]
+    ) -> list[tuple[str, str]]:
+        posted: list[tuple[str, str]] = []
+        if not pending:
+            return posted
+
+        results = await asyncio.gather(
+            *(future for _, _, future in pending), return_exceptions=True
+        )
 
-            except discord.HTTPException as e:
+        for (item, source, _), result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
+                # The channel's worker was cancelled before it reached this item.
+                logger.error(
+                    "Dispatch for content item did not complete",
+                    item_id=item.id,
+                    title=item.title,
+                    source_name=source.name,
+                    error=str(result) or type(result).__name__,
+                )
+            elif result.message is not None:
+                posted.append((item.id, str(result.message.id)))
+            elif isinstance(result.error, discord.HTTPException):
                 logger.error(
                     "Failed to post content item",
                     item_id=item.id,
                     title=item.title,
-                    source_name=source.name if source else "unknown",
-                    error=str(e),
+                    source_name=source.name,
+                    error=str(result.error),
                 )
-            except Exception as e:
+            else:
                 logger.error(
                     "Unexpected error posting content item",
                     item_id=item.id,
                     title=item.title,
-                    source_name=source.name if source else "unknown",
-                    error=str(e),
+                    source_name=source.name,
+                    error=str(result.error),
                 )
 
-        if posted_count > 0:
-            logger.info("Posted unposted items", count=posted_count, guild_id=guild_id)
-        else:
-            logger.debug("No items to post for guild", guild_id=guild_id)
-        return posted_count
+        return posted
@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import structlog
+
+from intelstream.database.repository import ForwardingCountDelta, Repository, UsageCountDelta
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class CounterFlushStats:
+    pending_forwarding_rules: int
+    pending_usage_rows: int
+    flush_lag_seconds: float
+    flushes: int
+    failed_flushes: int
+    last_flush_duration_seconds: float
+
+
+class CounterAggregator:
+    """Coalesce high-frequency counter increments and write them behind.
+
+    Forwarding counts and /suck_boobs usage are accumulated in memory and
+    written in one transaction every ``flush_interval_seconds`` and on close,
+    so busy guilds do not queue a write per message behind the content
+    pipeline. ``flush_lag_seconds`` is how long the oldest unflushed increment
+    has been waiting. A failed flush keeps its deltas for the next attempt.
+    """
+
+    def __init__(self, repository: Repository, flush_interval_seconds: float = 5.0) -> None:
+        self._repository = repository
+        self._flush_interval = flush_interval_seconds
+        self._forwarding: dict[str, ForwardingCountDelta] = {}
+        self._usage: dict[tuple[str, str], UsageCountDelta] = {}
+        self._oldest_pending_at: float | None = None
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._last_flush_duration = 0.0
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    def increment_forwarding(self, rule_id: str, count: int = 1) -> None:
+        now = datetime.now(UTC)
+        delta = self._forwarding.get(rule_id)
+        if delta is None:
+            self._forwarding[rule_id] = ForwardingCountDelta(count=count, last_forwarded_at=now)
+        else:
+            delta.count += count
+            delta.last_forwarded_at = now
+        self._mark_pending()
+
+    def record_suck_boobs_usage(self, guild_id: str, user_id: str, pinged_user_id: str) -> None:
+        self._usage.setdefault((guild_id, user_id), UsageCountDelta()).times_used += 1
+        self._usage.setdefault((guild_id, pinged_user_id), UsageCountDelta()).times_pinged += 1
+        self._mark_pending()
+
+    def _mark_pending(self) -> None:
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = time.monotonic()
+
+    @property
+    def flush_lag_seconds(self) -> float:
+        if self._oldest_pending_at is None:
+            return 0.0
+        return time.monotonic() - self._oldest_pending_at
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._forwarding and not self._usage:
+                return
+
+            forwarding, self._forwarding = self._forwarding, {}
+            usage, self._usage = self._usage, {}
+            oldest_pending_at, self._oldest_pending_at = self._oldest_pending_at, None
+
+            start = time.monotonic()
+            try:
+                await self._repository.apply_counter_deltas(forwarding=forwarding, usage=usage)
+            except Exception as e:
+                self._failed_flushes += 1
+                self._restore(forwarding, usage, oldest_pending_at)
+                logger.error("Counter flush failed, will retry", error=str(e))
+                return
+
+            self._flushes += 1
+            self._last_flush_duration = time.monotonic() - start
+            logger.debug(
+                "Counters flushed",
+                forwarding_rules=len(forwarding),
+                usage_rows=len(usage),
+                elapsed_seconds=round(self._last_flush_duration, 3),
+            )
+
+    def _restore(
+        self,
+        forwarding: dict[str, ForwardingCountDelta],
+        usage: dict[tuple[str, str], UsageCountDelta],
+        oldest_pending_at: float | None,
+    ) -> None:
+        for rule_id, delta in forwarding.items():
+            newer = self._forwarding.get(rule_id)
+            if newer is None:
+                self._forwarding[rule_id] = delta
+            else:
+                newer.count += delta.count
+        for key, usage_delta in usage.items():
+            merged = self._usage.setdefault(key, UsageCountDelta())
+            merged.times_used += usage_delta.times_used
+            merged.times_pinged += usage_delta.times_pinged
+        if oldest_pending_at is not None:
+            self._oldest_pending_at = oldest_pending_at
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+    def get_stats(self) -> CounterFlushStats:
+        return CounterFlushStats(
+            pending_forwarding_rules=len(self._forwarding),
+            pending_usage_rows=len(self._usage),
+            flush_lag_seconds=self.flush_lag_seconds,
+            flushes=self._flushes,
+            failed_flushes=self._failed_flushes,
+            last_flush_duration_seconds=self._last_flush_duration,
+        )
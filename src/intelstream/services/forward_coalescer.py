@@ -0,0 +1,138 @@
+import asyncio
+import contextlib
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+import discord
+import structlog
+
+from intelstream.services.forwarding_index import RuleRecord
+from intelstream.services.message_forwarder import MessageForwarder
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class CoalescerStats:
+    pending_bursts: int
+    pending_messages: int
+    bursts_delivered: int
+    messages_delivered: int
+
+
+@dataclass
+class _PendingBurst:
+    rule: RuleRecord
+    messages: list[discord.Message] = field(default_factory=list)
+    timer: asyncio.Task[None] | None = None
+
+
+class ForwardCoalescer:
+    """Buffer forwarded messages per rule and deliver each burst as one forward.
+
+    The first message of a burst opens a window of the rule's
+    ``coalesce_window_seconds``; when it closes, everything buffered is handed
+    to ``MessageForwarder.forward_batch``. A burst that reaches
+    ``max_burst_messages`` is delivered at once, so a flood cannot grow one
+    window without bound. Bursts of the same rule are delivered one at a time
+    in arrival order.
+    """
+
+    def __init__(
+        self,
+        forwarder: MessageForwarder,
+        on_delivered: Callable[[str, int], None],
+        max_burst_messages: int = 50,
+    ) -> None:
+        self._forwarder = forwarder
+        self._on_delivered = on_delivered
+        self._max_burst_messages = max_burst_messages
+        self._pending: dict[str, _PendingBurst] = {}
+        self._rule_locks: dict[str, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._bursts_delivered = 0
+        self._messages_delivered = 0
+
+    def add(self, rule: RuleRecord, message: discord.Message) -> None:
+        burst = self._pending.get(rule.id)
+        if burst is None:
+            burst = _PendingBurst(rule=rule)
+            self._pending[rule.id] = burst
+            burst.timer = self._spawn(self._deliver_after(burst, rule.coalesce_window_seconds))
+
+        burst.messages.append(message)
+        if len(burst.messages) >= self._max_burst_messages:
+            self._detach(burst)
+            if burst.timer is not None:
+                burst.timer.cancel()
+            self._spawn(self._deliver(burst))
+
+    async def close(self) -> None:
+        """Deliver every buffered burst and wait for in-flight deliveries."""
+        bursts = list(self._pending.values())
+        for burst in bursts:
+            self._detach(burst)
+            if burst.timer is not None:
+                burst.timer.cancel()
+            # Spawned rather than awaited so they queue behind earlier bursts.
+            self._spawn(self._deliver(burst))
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _detach(self, burst: _PendingBurst) -> None:
+        if self._pending.get(burst.rule.id) is burst:
+            del self._pending[burst.rule.id]
+
+    async def _deliver_after(self, burst: _PendingBurst, delay: float) -> None:
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.sleep(delay)
+            # close() may have detached the burst while this timer was waking.
+            if self._pending.get(burst.rule.id) is burst:
+                self._detach(burst)
+                await self._deliver(burst)
+
+    async def _deliver(self, burst: _PendingBurst) -> None:
+        rule = burst.rule
+        lock = self._rule_locks.setdefault(rule.id, asyncio.Lock())
+        async with lock:
+            try:
+                delivered = await self._forwarder.forward_batch(
+                    burst.messages,
+                    destination_id=rule.destination_id,
+                    destination_type=rule.destination_type,
+                )
+            except Exception as e:
+                logger.error(
+                    "Burst forward failed",
+                    rule_id=rule.id,
+                    messages=len(burst.messages),
+                    error=str(e),
+                )
+                return
+
+        self._bursts_delivered += 1
+        self._messages_delivered += delivered
+        if delivered:
+            self._on_delivered(rule.id, delivered)
+        if delivered < len(burst.messages):
+            logger.warning(
+                "Burst partially forwarded",
+                rule_id=rule.id,
+                messages=len(burst.messages),
+                delivered=delivered,
+            )
+
+    def get_stats(self) -> CoalescerStats:
+        return CoalescerStats(
+            pending_bursts=len(self._pending),
+            pending_messages=sum(len(burst.messages) for burst in self._pending.values()),
+            bursts_delivered=self._bursts_delivered,
+            messages_delivered=self._messages_delivered,
+        )
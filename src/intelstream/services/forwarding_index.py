@@ -0,0 +1,72 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from intelstream.database.models import ForwardingRule
+
+
+@dataclass(frozen=True, slots=True)
+class RuleRecord:
+    """The parts of an active ForwardingRule that ``on_message`` needs."""
+
+    id: str
+    source_channel_id: str
+    destination_id: int
+    destination_type: str
+    coalesce_window_seconds: int
+
+    @classmethod
+    def from_rule(cls, rule: ForwardingRule) -> "RuleRecord":
+        return cls(
+            id=rule.id,
+            source_channel_id=rule.source_channel_id,
+            destination_id=int(rule.destination_channel_id),
+            destination_type=rule.destination_type,
+            coalesce_window_seconds=rule.coalesce_window_seconds or 0,
+        )
+
+
+class ForwardingRuleIndex:
+    """Active forwarding rules keyed by source channel ID.
+
+    Readers use the current snapshot without locking. Every change builds a
+    new mapping that shares the untouched rule tuples, then publishes it with
+    a single assignment. A reader that is iterating while a command changes
+    the rules therefore keeps a consistent view of the old rules.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Mapping[str, tuple[RuleRecord, ...]] = MappingProxyType({})
+
+    @property
+    def snapshot(self) -> Mapping[str, tuple[RuleRecord, ...]]:
+        return self._snapshot
+
+    def rules_for(self, source_channel_id: str) -> tuple[RuleRecord, ...]:
+        return self._snapshot.get(source_channel_id, ())
+
+    def rebuild(self, rules: Iterable[ForwardingRule]) -> None:
+        grouped: dict[str, list[RuleRecord]] = {}
+        for rule in rules:
+            if rule.is_active:
+                grouped.setdefault(rule.source_channel_id, []).append(RuleRecord.from_rule(rule))
+        self._snapshot = MappingProxyType(
+            {channel_id: tuple(records) for channel_id, records in grouped.items()}
+        )
+
+    def replace_channel(self, source_channel_id: str, rules: Iterable[ForwardingRule]) -> None:
+        """Swap in the current rules of one source channel, leaving the rest shared."""
+        records = tuple(RuleRecord.from_rule(rule) for rule in rules if rule.is_active)
+        updated = dict(self._snapshot)
+        if records:
+            updated[source_channel_id] = records
+        else:
+            updated.pop(source_channel_id, None)
+        self._snapshot = MappingProxyType(updated)
+
+    @property
+    def rule_count(self) -> int:
+        return sum(len(records) for records in self._snapshot.values())
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
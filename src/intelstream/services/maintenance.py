@@ -0,0 +1,85 @@
+import time
+from dataclasses import dataclass
+
+import structlog
+
+from intelstream.config import Settings
+from intelstream.database.repository import Repository
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class MaintenanceReport:
+    extraction_cache_deleted: int
+    raw_content_pruned: int
+    size_bytes_before: int
+    size_bytes_after: int
+    full_vacuum: bool
+    duration_seconds: float
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return max(self.size_bytes_before - self.size_bytes_after, 0)
+
+
+class MaintenanceService:
+    """Keep the database small: retention deletes, free-page release and ANALYZE.
+
+    Runs on its own schedule rather than inside the fetch cycle. Databases
+    created before incremental auto_vacuum was enabled need one full VACUUM to
+    switch modes. That VACUUM rewrites the whole file under an exclusive lock,
+    so it only runs when ``maintenance_convert_auto_vacuum`` is set; otherwise
+    free pages stay in the file until the conversion is done.
+    """
+
+    def __init__(self, repository: Repository, settings: Settings) -> None:
+        self._repository = repository
+        self._settings = settings
+
+    async def run(self) -> MaintenanceReport:
+        start = time.monotonic()
+        before = await self._repository.get_database_file_stats()
+
+        cache_deleted = await self._repository.cleanup_extraction_cache(
+            max_age_days=self._settings.extraction_cache_max_age_days
+        )
+        raw_pruned = await self._repository.prune_raw_content(
+            max_age_days=self._settings.raw_content_retention_days
+        )
+
+        full_vacuum = False
+        if before.incremental_vacuum_enabled:
+            await self._repository.incremental_vacuum(self._settings.maintenance_vacuum_max_pages)
+        elif self._settings.maintenance_convert_auto_vacuum:
+            logger.info("Converting database to incremental auto_vacuum")
+            await self._repository.vacuum()
+            full_vacuum = True
+        else:
+            logger.info(
+                "Database does not use incremental auto_vacuum, free pages are not released",
+                free_pages=before.freelist_count,
+                hint="set MAINTENANCE_CONVERT_AUTO_VACUUM=true to convert it with a full VACUUM",
+            )
+
+        await self._repository.analyze()
+
+        after = await self._repository.get_database_file_stats()
+        report = MaintenanceReport(
+            extraction_cache_deleted=cache_deleted,
+            raw_content_pruned=raw_pruned,
+            size_bytes_before=before.size_bytes,
+            size_bytes_after=after.size_bytes,
+            full_vacuum=full_vacuum,
+            duration_seconds=round(time.monotonic() - start, 2),
+        )
+        logger.info(
+            "Database maintenance complete",
+            extraction_cache_deleted=report.extraction_cache_deleted,
+            raw_content_pruned=report.raw_content_pruned,
+            bytes_reclaimed=report.bytes_reclaimed,
+            size_bytes=report.size_bytes_after,
+            full_vacuum=report.full_vacuum,
+            elapsed_seconds=report.duration_seconds,
+        )
+        return report
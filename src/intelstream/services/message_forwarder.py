@@ -1,25 +1,285 @@
+import asyncio
 import contextlib
+import functools
+import io
+import tempfile
+import weakref
 from asyncio import Semaphore
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
 
 import discord
+import httpx
 import structlog
 
 from intelstream.config import get_settings
+from intelstream.services.webhook_pool import WebhookPool
+from intelstream.utils.ttl_cache import TTLCache
 
 logger = structlog.get_logger()
 
 MAX_TOTAL_ATTACHMENT_SIZE = 25 * 1024 * 1024  # 25MB total limit
+DESTINATION_CACHE_TTL_SECONDS = 300.0
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class DownloadedAttachment:
+    """An attachment fetched once and shared by every delivery of a message.
+
+    Bytes stay in memory up to ``spool_threshold`` and roll over to a temporary
+    file beyond it. Every delivery opens its own reader, so concurrent sends
+    never share a file position.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        spool_threshold: int,
+        spoiler: bool = False,
+        description: str | None = None,
+    ) -> None:
+        self.filename = filename
+        self.spoiler = spoiler
+        self.description = description
+        self.size = 0
+        self.peak_memory_bytes = 0
+        self.path: str | None = None
+        self._spool_threshold = spool_threshold
+        self._buffer: io.BytesIO | None = io.BytesIO()
+        self._data = b""
+        self._file: IO[bytes] | None = None
+
+    @property
+    def memory_bytes(self) -> int:
+        return 0 if self.path is not None else self.size
+
+    def write(self, chunk: bytes) -> None:
+        if self._file is None and self.size + len(chunk) > self._spool_threshold:
+            self._rollover()
+        if self._file is not None:
+            self._file.write(chunk)
+        elif self._buffer is not None:
+            self._buffer.write(chunk)
+            self.peak_memory_bytes = self.size + len(chunk)
+        self.size += len(chunk)
+
+    def _rollover(self) -> None:
+        self._file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+            prefix="intelstream-forward-", delete=False
+        )
+        self.path = self._file.name
+        if self._buffer is not None:
+            self._file.write(self._buffer.getvalue())
+            self._buffer = None
+
+    def finish(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        elif self._buffer is not None:
+            self._data = self._buffer.getvalue()
+            self._buffer = None
+
+    def to_file(self) -> discord.File:
+        fp: str | io.BytesIO = self.path if self.path is not None else io.BytesIO(self._data)
+        return discord.File(
+            fp,
+            filename=self.filename,
+            spoiler=self.spoiler,
+            description=self.description,
+        )
+
+    def close(self) -> None:
+        self._buffer = None
+        self._data = b""
+        if self._file is not None:
+            with contextlib.suppress(OSError):
+                self._file.close()
+            self._file = None
+        if self.path is not None:
+            with contextlib.suppress(OSError):
+                Path(self.path).unlink()
+            self.path = None
+
+
+class MemoryBudget:
+    """Cap on attachment bytes held in memory across all concurrent forwards.
+
+    Requests larger than the whole budget are clamped to it, so one oversized
+    forward waits for the others to drain instead of deadlocking.
+    """
+
+    def __init__(self, limit_bytes: int) -> None:
+        self.limit_bytes = limit_bytes
+        self.in_use_bytes = 0
+        self.peak_bytes = 0
+        self.waits = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, nbytes: int) -> int:
+        nbytes = min(nbytes, self.limit_bytes)
+        if nbytes <= 0:
+            return 0
+        async with self._condition:
+            if self.in_use_bytes + nbytes > self.limit_bytes:
+                self.waits += 1
+                await self._condition.wait_for(
+                    lambda: self.in_use_bytes + nbytes <= self.limit_bytes
+                )
+            self.in_use_bytes += nbytes
+            self.peak_bytes = max(self.peak_bytes, self.in_use_bytes)
+        return nbytes
+
+    async def release(self, nbytes: int) -> None:
+        if nbytes <= 0:
+            return
+        async with self._condition:
+            self.in_use_bytes -= nbytes
+            self._condition.notify_all()
+
+
+@dataclass
+class ForwardMemoryStats:
+    budget_bytes: int
+    in_use_bytes: int
+    peak_bytes: int
+    budget_waits: int
+    spilled_attachments: int
+    last_forward_peak_bytes: int
+    max_forward_peak_bytes: int
+
+
+@dataclass
+class BurstChunk:
+    """Messages from one burst that fit into a single send."""
+
+    messages: list[discord.Message] = field(default_factory=list)
+    lines: list[str] = field(default_factory=list)
+    embeds: list[discord.Embed] = field(default_factory=list)
+    attachments: list[discord.Attachment] = field(default_factory=list)
+    attachment_bytes: int = 0
+    last_author_id: int | None = None
+
+    @property
+    def content_length(self) -> int:
+        return sum(len(line) for line in self.lines) + max(len(self.lines) - 1, 0)
+
+
+def _attributed_line(message: discord.Message, chunk: BurstChunk) -> str | None:
+    text = message.content or ", ".join(a.filename for a in message.attachments[:10])
+    if not text:
+        return None
+    if message.author.id != chunk.last_author_id:
+        text = f"**{message.author.display_name}**: {text}"
+    return text
+
+
+def plan_burst(messages: Sequence[discord.Message], max_content_length: int) -> list[BurstChunk]:
+    """Split a burst into ordered chunks that each fit one Discord message.
+
+    A message whose attributed text does not fit one send starts a chunk of
+    its own and continues in as many following chunks as it needs, so no
+    content is cut; it is listed in each chunk it spans.
+    """
+    chunks = [BurstChunk()]
+    for message in messages:
+        attachments = list(message.attachments[:10])
+        embeds = [] if message.content or attachments else list(message.embeds[:10])
+        attachment_bytes = sum(attachment.size for attachment in attachments)
+
+        chunk = chunks[-1]
+        line = _attributed_line(message, chunk)
+        added_length = len(line) + (1 if chunk.lines else 0) if line else 0
+        if chunk.messages and (
+            chunk.content_length + added_length > max_content_length
+            or len(chunk.embeds) + len(embeds) > 10
+            or len(chunk.attachments) + len(attachments) > 10
+            or chunk.attachment_bytes + attachment_bytes > MAX_TOTAL_ATTACHMENT_SIZE
+        ):
+            chunk = BurstChunk()
+            chunks.append(chunk)
+            line = _attributed_line(message, chunk)
+
+        chunk.messages.append(message)
+        chunk.embeds.extend(embeds)
+        chunk.attachments.extend(attachments)
+        chunk.attachment_bytes += attachment_bytes
+        if line:
+            for start in range(0, len(line), max_content_length):
+                if start:
+                    chunk = BurstChunk(messages=[message])
+                    chunks.append(chunk)
+                chunk.lines.append(line[start : start + max_content_length])
+                chunk.last_author_id = message.author.id
+    return [chunk for chunk in chunks if chunk.messages]
 
 
 class MessageForwarder:
-    def __init__(self, bot: discord.Client, max_concurrent_forwards: int | None = None) -> None:
+    def __init__(
+        self,
+        bot: discord.Client,
+        max_concurrent_forwards: int | None = None,
+        spool_threshold_bytes: int | None = None,
+        memory_budget_bytes: int | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        webhooks: WebhookPool | None = None,
+    ) -> None:
         self.bot = bot
+        self._webhooks = webhooks
+        settings = get_settings()
         limit = (
             max_concurrent_forwards
             if max_concurrent_forwards is not None
-            else get_settings().max_concurrent_forwards
+            else settings.max_concurrent_forwards
         )
         self._semaphore = Semaphore(limit)
+        self._spool_threshold = (
+            spool_threshold_bytes
+            if spool_threshold_bytes is not None
+            else settings.forward_spool_threshold_kib * 1024
+        )
+        self._memory_budget = MemoryBudget(
+            memory_budget_bytes
+            if memory_budget_bytes is not None
+            else settings.forward_memory_budget_mib * 1024 * 1024
+        )
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._http_timeout = settings.http_timeout_seconds
+        self._max_content_length = settings.discord_max_message_length
+        self._destinations: TTLCache[tuple[int, str], discord.TextChannel | discord.Thread] = (
+            TTLCache(ttl_seconds=DESTINATION_CACHE_TTL_SECONDS)
+        )
+        # Held only while some task is unarchiving the thread, then dropped.
+        self._unarchive_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._spilled_attachments = 0
+        self._last_forward_peak = 0
+        self._max_forward_peak = 0
+
+    async def close(self) -> None:
+        if self._http_client is not None and self._owns_http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=self._http_timeout, follow_redirects=True)
+        return self._http_client
+
+    def get_memory_stats(self) -> ForwardMemoryStats:
+        return ForwardMemoryStats(
+            budget_bytes=self._memory_budget.limit_bytes,
+            in_use_bytes=self._memory_budget.in_use_bytes,
+            peak_bytes=self._memory_budget.peak_bytes,
+            budget_waits=self._memory_budget.waits,
+            spilled_attachments=self._spilled_attachments,
+            last_forward_peak_bytes=self._last_forward_peak,
+            max_forward_peak_bytes=self._max_forward_peak,
+        )
 
     async def forward_message(
         self,
@@ -27,65 +287,204 @@ class MessageForwarder:
         destination_id: int,
         destination_type: str,
     ) -> discord.Message | None:
-        async with self._semaphore:
-            try:
-                destination = await self._get_destination(destination_id, destination_type)
-                if destination is None:
-                    logger.warning(
-                        "Forwarding destination not found",
-                        destination_id=destination_id,
-                        destination_type=destination_type,
-                    )
-                    return None
+        results = await self.forward_to_destinations(message, [(destination_id, destination_type)])
+        return results[0]
 
-                if isinstance(destination, discord.Thread) and destination.archived:
-                    try:
-                        await destination.edit(archived=False)
-                    except discord.Forbidden:
-                        logger.warning("Cannot unarchive thread", thread_id=destination_id)
-                        return None
+    async def forward_to_destinations(
+        self,
+        message: discord.Message,
+        destinations: Sequence[tuple[int, str]],
+    ) -> list[discord.Message | None]:
+        """Forward one message to several destinations.
 
-                content = self._build_forwarded_content(message)
-                files = await self._download_attachments(message, destination)
+        Attachments are downloaded once and shared by every delivery; the
+        deliveries then run concurrently, each taking the forwarding semaphore
+        for its send. Results are returned in the order of ``destinations``.
+        """
+        resolved = [
+            await self._prepare_destination(destination_id, destination_type)
+            for destination_id, destination_type in destinations
+        ]
+        filesize_limit = max(
+            (destination.guild.filesize_limit for destination in resolved if destination),
+            default=0,
+        )
 
-                if not content and not files and not message.embeds:
-                    logger.warning(
-                        "Nothing to forward",
-                        source_channel=message.channel.id,
-                        message_id=message.id,
-                    )
-                    return None
+        attachments: list[DownloadedAttachment] = []
+        reserved = 0
+        try:
+            if filesize_limit and message.attachments:
+                attachments, reserved = await self._download_attachments(
+                    message.attachments, filesize_limit
+                )
 
-                try:
-                    if not content and not files and message.embeds:
-                        forwarded = await destination.send(
-                            embeds=message.embeds[:10],
-                        )
-                    else:
-                        forwarded = await destination.send(
-                            content=content,
-                            files=files,
-                        )
-                except Exception:
-                    self._close_files(files)
-                    raise
-
-                logger.info(
-                    "Message forwarded",
-                    source_channel=message.channel.id,
-                    destination=destination_id,
-                    message_id=message.id,
+            content = self._build_forwarded_content(message)
+            results = await asyncio.gather(
+                *(
+                    self._deliver(message, content, attachments, destination, destination_id)
+                    for destination, (destination_id, _) in zip(resolved, destinations, strict=True)
                 )
+            )
+            return list(results)
+        finally:
+            for attachment in attachments:
+                attachment.close()
+            await self._memory_budget.release(reserved)
 
-                return forwarded
+    async def _deliver(
+        self,
+        message: discord.Message,
+        content: str,
+        attachments: list[DownloadedAttachment],
+        destination: discord.TextChannel | discord.Thread | None,
+        destination_id: int,
+    ) -> discord.Message | None:
+        if destination is None:
+            return None
+
+        sendable = [
+            attachment
+            for attachment in attachments
+            if attachment.size <= destination.guild.filesize_limit
+        ]
+
+        if not content and not sendable and not message.embeds:
+            logger.warning(
+                "Nothing to forward",
+                source_channel=message.channel.id,
+                message_id=message.id,
+            )
+            return None
+
+        if not content and not sendable and message.embeds:
+            forwarded = await self._send(
+                destination, destination_id, author=message.author, embeds=message.embeds[:10]
+            )
+        else:
+            forwarded = await self._send(
+                destination,
+                destination_id,
+                attachments=sendable,
+                author=message.author,
+                content=content,
+            )
+
+        if forwarded is not None:
+            logger.info(
+                "Message forwarded",
+                source_channel=message.channel.id,
+                destination=destination_id,
+                message_id=message.id,
+            )
+        return forwarded
+
+    async def forward_batch(
+        self,
+        messages: Sequence[discord.Message],
+        destination_id: int,
+        destination_type: str,
+    ) -> int:
+        """Forward a burst of messages to one destination in as few sends as possible.
+
+        Messages are merged in order with author attribution, split wherever a
+        send would exceed Discord's content, embed or attachment limits. A
+        burst of one is forwarded unchanged. Returns how many of ``messages``
+        were delivered.
+        """
+        if len(messages) <= 1:
+            if not messages:
+                return 0
+            forwarded = await self.forward_message(messages[0], destination_id, destination_type)
+            return 1 if forwarded else 0
+
+        destination = await self._prepare_destination(destination_id, destination_type)
+        if destination is None:
+            return 0
+
+        # A message split across chunks counts as delivered only if every part was.
+        undelivered: set[int] = set()
+        for chunk in plan_burst(messages, self._max_content_length):
+            if not await self._deliver_chunk(chunk, destination, destination_id):
+                undelivered.update(id(message) for message in chunk.messages)
+        delivered = sum(1 for message in messages if id(message) not in undelivered)
+
+        logger.info(
+            "Burst forwarded",
+            source_channel=messages[0].channel.id,
+            destination=destination_id,
+            messages=len(messages),
+            delivered=delivered,
+        )
+        return delivered
+
+    async def _deliver_chunk(
+        self,
+        chunk: BurstChunk,
+        destination: discord.TextChannel | discord.Thread,
+        destination_id: int,
+    ) -> bool:
+        attachments: list[DownloadedAttachment] = []
+        reserved = 0
+        try:
+            if chunk.attachments:
+                attachments, reserved = await self._download_attachments(
+                    chunk.attachments, destination.guild.filesize_limit
+                )
+            content = "\n".join(chunk.lines)
+            if not content and not attachments and not chunk.embeds:
+                return False
+            kwargs: dict[str, Any] = {"content": content or None}
+            if chunk.embeds:
+                kwargs["embeds"] = chunk.embeds
+            authors = {message.author.id for message in chunk.messages}
+            author = chunk.messages[0].author if len(authors) == 1 else None
+            forwarded = await self._send(
+                destination, destination_id, attachments=attachments, author=author, **kwargs
+            )
+            return forwarded is not None
+        finally:
+            for attachment in attachments:
+                attachment.close()
+            await self._memory_budget.release(reserved)
 
+    async def _send(
+        self,
+        destination: discord.TextChannel | discord.Thread,
+        destination_id: int,
+        attachments: Sequence[DownloadedAttachment] | None = None,
+        author: discord.User | discord.Member | None = None,
+        **kwargs: Any,
+    ) -> discord.Message | None:
+        """Send through the destination's webhook when enabled, else as the bot.
+
+        Webhook sends carry the original author's name and avatar when the
+        message has a single author. A destination without a usable webhook
+        falls back to ``destination.send`` with freshly opened files.
+        """
+        async with self._semaphore:
+            try:
+                forwarded: discord.Message | None = None
+                if self._webhooks is not None:
+                    webhook_send = functools.partial(
+                        self._webhooks.send,
+                        destination,
+                        username=author.display_name if author else None,
+                        avatar_url=author.display_avatar.url if author else None,
+                    )
+                    forwarded = await self._attempt_send(webhook_send, attachments, kwargs)
+                if forwarded is None:
+                    forwarded = await self._attempt_send(destination.send, attachments, kwargs)
+                return forwarded
             except discord.Forbidden:
+                self._forget_destination(destination_id)
                 logger.error(
                     "Missing permissions to forward message",
                     destination_id=destination_id,
                 )
                 return None
             except discord.HTTPException as e:
+                if isinstance(e, discord.NotFound):
+                    self._forget_destination(destination_id)
                 logger.error(
                     "Failed to forward message",
                     error=str(e),
@@ -93,6 +492,67 @@ class MessageForwarder:
                 )
                 return None
 
+    async def _attempt_send(
+        self,
+        send: Callable[..., Awaitable[discord.Message | None]],
+        attachments: Sequence[DownloadedAttachment] | None,
+        kwargs: dict[str, Any],
+    ) -> discord.Message | None:
+        files = [attachment.to_file() for attachment in attachments or []]
+        if attachments is not None:
+            kwargs = {**kwargs, "files": files}
+        try:
+            forwarded = await send(**kwargs)
+        except Exception:
+            self._close_files(files)
+            raise
+        if forwarded is None:
+            # No webhook took the send, so nothing consumed (and closed) the files.
+            self._close_files(files)
+        return forwarded
+
+    async def _prepare_destination(
+        self, destination_id: int, destination_type: str
+    ) -> discord.TextChannel | discord.Thread | None:
+        """Resolve a destination through the cache and make sure it can receive messages."""
+        key = (destination_id, destination_type)
+        destination = self._destinations.get(key)
+        if destination is None:
+            destination = await self._get_destination(destination_id, destination_type)
+            if destination is None:
+                logger.warning(
+                    "Forwarding destination not found",
+                    destination_id=destination_id,
+                    destination_type=destination_type,
+                )
+                return None
+            self._destinations.set(key, destination)
+
+        if isinstance(destination, discord.Thread) and destination.archived:
+            lock = self._unarchive_locks.setdefault(destination_id, asyncio.Lock())
+            async with lock:
+                destination = self._destinations.get(key) or destination
+                if isinstance(destination, discord.Thread) and destination.archived:
+                    try:
+                        edited = await destination.edit(archived=False)
+                    except discord.Forbidden:
+                        logger.warning("Cannot unarchive thread", thread_id=destination_id)
+                        return None
+                    except discord.HTTPException as e:
+                        logger.error(
+                            "Failed to unarchive thread", thread_id=destination_id, error=str(e)
+                        )
+                        return None
+                    if isinstance(edited, discord.Thread):
+                        destination = edited
+                    self._destinations.set(key, destination)
+
+        return destination
+
+    def _forget_destination(self, destination_id: int) -> None:
+        for destination_type in ("channel", "thread"):
+            self._destinations.invalidate((destination_id, destination_type))
+
     async def _get_destination(
         self, destination_id: int, destination_type: str
     ) -> discord.TextChannel | discord.Thread | None:
@@ -139,44 +599,102 @@ class MessageForwarder:
         return None
 
     async def _download_attachments(
-        self, message: discord.Message, destination: discord.TextChannel | discord.Thread
-    ) -> list[discord.File]:
-        files: list[discord.File] = []
+        self, source_attachments: Sequence[discord.Attachment], filesize_limit: int
+    ) -> tuple[list[DownloadedAttachment], int]:
+        """Stream attachments into spooled files under the shared memory budget.
+
+        Returns the attachments and the number of budget bytes still reserved
+        for them, which the caller releases once every delivery has finished.
+        The budget is reserved before the forwarding semaphore is taken: budget
+        is only given back after a send, and sends need the semaphore.
+        """
+        candidates: list[discord.Attachment] = []
         total_size = 0
+        for attachment in source_attachments[:10]:
+            if attachment.size > filesize_limit:
+                logger.warning(
+                    "Attachment too large to forward",
+                    filename=attachment.filename,
+                    size=attachment.size,
+                    limit=filesize_limit,
+                )
+                continue
+            if total_size + attachment.size > MAX_TOTAL_ATTACHMENT_SIZE:
+                logger.warning(
+                    "Skipping remaining attachments due to total size limit",
+                    current_total=total_size,
+                    attachment_size=attachment.size,
+                    limit=MAX_TOTAL_ATTACHMENT_SIZE,
+                    skipped_count=len(source_attachments[:10]) - len(candidates),
+                )
+                break
+            candidates.append(attachment)
+            total_size += attachment.size
+
+        # Reserve the whole forward's in-memory share at once so forwards never
+        # hold part of the budget while waiting for more.
+        reserved = await self._memory_budget.acquire(
+            sum(min(attachment.size, self._spool_threshold) for attachment in candidates)
+        )
+        attachments: list[DownloadedAttachment] = []
+        peak = 0
         try:
-            for attachment in message.attachments[:10]:
-                if attachment.size > destination.guild.filesize_limit:
-                    logger.warning(
-                        "Attachment too large to forward",
-                        filename=attachment.filename,
-                        size=attachment.size,
-                        limit=destination.guild.filesize_limit,
-                    )
-                    continue
-                if total_size + attachment.size > MAX_TOTAL_ATTACHMENT_SIZE:
-                    logger.warning(
-                        "Skipping remaining attachments due to total size limit",
-                        current_total=total_size,
-                        attachment_size=attachment.size,
-                        limit=MAX_TOTAL_ATTACHMENT_SIZE,
-                        skipped_count=len(message.attachments[:10]) - len(files),
-                    )
-                    break
-                try:
-                    file = await attachment.to_file()
-                    files.append(file)
-                    total_size += attachment.size
-                except discord.HTTPException as e:
-                    logger.warning(
-                        "Failed to download attachment",
+            held = 0
+            async with self._semaphore:
+                for attachment in candidates:
+                    downloaded = DownloadedAttachment(
                         filename=attachment.filename,
-                        attachment_id=attachment.id,
-                        error=str(e),
+                        spool_threshold=self._spool_threshold,
+                        spoiler=attachment.is_spoiler(),
+                        description=attachment.description,
                     )
-        except Exception:
-            self._close_files(files)
+                    try:
+                        await self._stream_attachment(attachment, downloaded)
+                    except httpx.HTTPError as e:
+                        downloaded.close()
+                        logger.warning(
+                            "Failed to download attachment",
+                            filename=attachment.filename,
+                            attachment_id=attachment.id,
+                            error=str(e),
+                        )
+                        continue
+                    except BaseException:
+                        downloaded.close()
+                        raise
+                    peak = max(peak, held + downloaded.peak_memory_bytes)
+                    held += downloaded.memory_bytes
+                    attachments.append(downloaded)
+                    if downloaded.path is not None:
+                        self._spilled_attachments += 1
+        except BaseException:
+            for downloaded in attachments:
+                downloaded.close()
+            await self._memory_budget.release(reserved)
             raise
-        return files
+
+        self._last_forward_peak = peak
+        self._max_forward_peak = max(self._max_forward_peak, peak)
+
+        in_memory = min(sum(a.memory_bytes for a in attachments), reserved)
+        await self._memory_budget.release(reserved - in_memory)
+        logger.debug(
+            "Attachments downloaded",
+            count=len(attachments),
+            total_bytes=sum(a.size for a in attachments),
+            peak_memory_bytes=peak,
+        )
+        return attachments, in_memory
+
+    async def _stream_attachment(
+        self, attachment: discord.Attachment, downloaded: DownloadedAttachment
+    ) -> None:
+        client = self._get_http_client()
+        async with client.stream("GET", attachment.url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                downloaded.write(chunk)
+        downloaded.finish()
 
     def _close_files(self, files: list[discord.File]) -> None:
         for file in files:
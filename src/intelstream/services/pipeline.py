@@ -6,6 +6,7 @@ from datetime import UTC, datetime, timedelta
 import anthropic
 import httpx
 import structlog
+from tenacity import RetryError
 
 from intelstream.adapters.arxiv import ArxivAdapter
 from intelstream.adapters.base import BaseAdapter, ContentData
@@ -18,6 +19,7 @@ from intelstream.config import Settings
 from intelstream.database.exceptions import DuplicateContentError
 from intelstream.database.models import ContentItem, Source, SourceType
 from intelstream.database.repository import Repository
+from intelstream.services.backlog import DrainBudget
 from intelstream.services.summarizer import SummarizationError, SummarizationService
 
 logger = structlog.get_logger()
@@ -35,6 +37,8 @@ class ContentPipeline:
         self._summarizer = summarizer
         self._http_client: httpx.AsyncClient | None = None
         self._adapters: dict[SourceType, BaseAdapter] = {}
+        # Source ID -> (raw extraction profile JSON, adapter built from it).
+        self._page_adapters: dict[str, tuple[str, BaseAdapter]] = {}
 
     async def initialize(self) -> None:
         self._http_client = httpx.AsyncClient(timeout=self._settings.http_timeout_seconds)
@@ -78,6 +82,7 @@ class ContentPipeline:
     async def fetch_all_sources(self) -> int:
         sources = await self._repository.get_all_sources(active_only=True)
         logger.info("Fetching content from sources", count=len(sources))
+        self._prune_page_adapters(sources)
 
         fetch_start = time.monotonic()
         total_new_items = 0
@@ -85,6 +90,7 @@ class ContentPipeline:
         sources_skipped = 0
         sources_failed = 0
         fetch_delay = self._settings.fetch_delay_seconds
+        succeeded_source_ids: list[str] = []
 
         for i, source in enumerate(sources):
             if source.last_polled_at is not None:
@@ -176,12 +182,12 @@ class ContentPipeline:
                 sources_failed += 1
 
             if fetch_succeeded:
-                await self._repository.reset_failure_count(source.id)
+                succeeded_source_ids.append(source.id)
 
             if fetch_delay > 0 and i < len(sources) - 1:
                 await asyncio.sleep(fetch_delay)
 
-        await self._repository.cleanup_extraction_cache()
+        recovered = await self._repository.reset_failure_counts(succeeded_source_ids)
 
         elapsed = round(time.monotonic() - fetch_start, 2)
         logger.info(
@@ -190,6 +196,7 @@ class ContentPipeline:
             sources_polled=sources_polled,
             sources_skipped=sources_skipped,
             sources_failed=sources_failed,
+            sources_recovered=recovered,
             elapsed_seconds=elapsed,
         )
         return total_new_items
@@ -198,23 +205,9 @@ class ContentPipeline:
         adapter: BaseAdapter | None = None
 
         if source.type == SourceType.PAGE:
-            if not source.extraction_profile:
-                logger.warning("Page source missing extraction profile", source_name=source.name)
+            adapter = self._get_page_adapter(source)
+            if adapter is None:
                 return 0
-            from intelstream.adapters.page import PageAdapter
-            from intelstream.services.page_analyzer import ExtractionProfile
-
-            try:
-                profile_data = json.loads(source.extraction_profile)
-                profile = ExtractionProfile.from_dict(profile_data)
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.error(
-                    "Invalid extraction profile",
-                    source_name=source.name,
-                    error=str(e),
-                )
-                return 0
-            adapter = PageAdapter(extraction_profile=profile, http_client=self._http_client)
         else:
             adapter = self._adapters.get(source.type)
 
@@ -268,6 +261,42 @@ class ContentPipeline:
 
         return new_count
 
+    def _prune_page_adapters(self, sources: list[Source]) -> None:
+        """Drop cached page adapters of sources that were removed or paused."""
+        active = {source.id for source in sources if source.type == SourceType.PAGE}
+        for source_id in self._page_adapters.keys() - active:
+            del self._page_adapters[source_id]
+
+    def _get_page_adapter(self, source: Source) -> BaseAdapter | None:
+        """Return the page source's adapter, rebuilt only when its profile JSON changes."""
+        if not source.extraction_profile:
+            logger.warning("Page source missing extraction profile", source_name=source.name)
+            self._page_adapters.pop(source.id, None)
+            return None
+
+        cached = self._page_adapters.get(source.id)
+        if cached is not None and cached[0] == source.extraction_profile:
+            return cached[1]
+
+        from intelstream.adapters.page import PageAdapter
+        from intelstream.services.page_analyzer import ExtractionProfile
+
+        try:
+            profile_data = json.loads(source.extraction_profile)
+            profile = ExtractionProfile.from_dict(profile_data)
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.error(
+                "Invalid extraction profile",
+                source_name=source.name,
+                error=str(e),
+            )
+            self._page_adapters.pop(source.id, None)
+            return None
+
+        adapter = PageAdapter(extraction_profile=profile, http_client=self._http_client)
+        self._page_adapters[source.id] = (source.extraction_profile, adapter)
+        return adapter
+
     async def _store_content_item(self, source: Source, item: ContentData) -> None:
         await self._repository.add_content_item(
             source_id=source.id,
@@ -280,45 +309,119 @@ class ContentPipeline:
             thumbnail_url=item.thumbnail_url,
         )
 
+    def _create_drain_budget(self, min_page_size: int, max_items: int) -> DrainBudget | None:
+        if not self._settings.backlog_drain_enabled:
+            return None
+        return DrainBudget(
+            max_items=max_items,
+            deadline_seconds=self._settings.backlog_cycle_deadline_seconds,
+            min_page_size=min_page_size,
+            max_page_size=max(self._settings.backlog_max_page_size, min_page_size),
+        )
+
     async def summarize_pending(self, max_items: int = 10) -> int:
+        """Summarize pending items, draining the backlog while budgets allow.
+
+        With drain mode off this processes a single page of ``max_items``. With
+        it on, ``max_items`` is the smallest page size and pages grow with the
+        backlog until the per-cycle item budget or deadline runs out, a page
+        comes back short, or the Anthropic API starts rate limiting.
+        """
         if self._summarizer is None:
             logger.warning("Summarizer not configured, skipping summarization")
             return 0
 
-        items = await self._repository.get_unsummarized_content_items(limit=max_items)
+        budget = self._create_drain_budget(
+            max_items, self._settings.summarization_max_items_per_cycle
+        )
+        backlog = 0
+        page_size = max_items
+        if budget is not None:
+            backlog = await self._repository.count_unsummarized_content_items()
+            page_size = budget.page_size(backlog)
 
-        await self._handle_first_posting_backfill(items)
+        summarize_start = time.monotonic()
+        summarized_count = 0
+        attempted: set[str] = set()
 
-        items = await self._repository.get_unsummarized_content_items(limit=max_items)
+        while page_size > 0:
+            page = await self._repository.get_unsummarized_content_items(
+                limit=page_size, exclude_ids=attempted
+            )
+            if not page:
+                break
 
-        if not items:
+            backfilled = await self._handle_first_posting_backfill(page)
+            attempted.update(item.id for item in page)
+            items = [item for item in page if item.id not in backfilled]
+
+            logger.info("Summarizing pending items", count=len(items), backlog=backlog)
+            page_summarized, stop_draining = await self._summarize_items(
+                self._summarizer, items, budget
+            )
+            summarized_count += page_summarized
+
+            if budget is None:
+                break
+            budget.consume(len(items))
+            if stop_draining or len(page) < page_size or budget.exhausted:
+                break
+            page_size = budget.page_size(backlog - budget.consumed)
+
+        if not attempted:
             logger.debug("No items pending summarization")
             return 0
 
-        logger.info("Summarizing pending items", count=len(items))
-        summarize_start = time.monotonic()
-        summarized_count = 0
+        elapsed = round(time.monotonic() - summarize_start, 2)
+        logger.info(
+            "Summarization complete",
+            summarized_count=summarized_count,
+            backlog=backlog,
+            elapsed_seconds=elapsed,
+        )
+        return summarized_count
+
+    async def _summarize_items(
+        self,
+        summarizer: SummarizationService,
+        items: list[ContentItem],
+        budget: DrainBudget | None,
+    ) -> tuple[int, bool]:
+        """Summarize one page of items.
+
+        Returns the number summarized and whether draining should stop, which
+        happens when the cycle deadline passes or the API rate limits us.
+        """
+        # raw_content decompresses the stored blob on every access, so read it once.
+        contents = [(item, item.raw_content) for item in items]
+        empty_items = [item for item, content in contents if not content]
+        if empty_items:
+            await self._repository.update_content_item_summaries(
+                [(item.id, "") for item in empty_items]
+            )
+        summarized_count = len(empty_items)
+        for item in empty_items:
+            logger.debug(
+                "Item has no content, marked ready for posting",
+                item_id=item.id,
+                title=item.title,
+            )
+
+        for item, content in contents:
+            if not content:
+                continue
+            if budget is not None and budget.expired:
+                logger.info("Summarization deadline reached, deferring remaining items")
+                return summarized_count, True
 
-        for item in items:
             source = await self._repository.get_source_by_id(item.source_id)
             source_name = source.name if source else "unknown"
             source_type = source.type.value if source else "unknown"
 
-            if not item.raw_content:
-                await self._repository.update_content_item_summary(item.id, "")
-                summarized_count += 1
-                logger.debug(
-                    "Item has no content, marked ready for posting",
-                    item_id=item.id,
-                    title=item.title,
-                    source_name=source_name,
-                )
-                continue
-
             try:
                 item_start = time.monotonic()
-                summary = await self._summarizer.summarize(
-                    content=item.raw_content,
+                summary = await summarizer.summarize(
+                    content=content,
                     title=item.title,
                     source_type=source_type,
                     author=item.author,
@@ -344,6 +447,15 @@ class ContentPipeline:
                     source_name=source_name,
                     error=str(e),
                 )
+            except (anthropic.RateLimitError, RetryError) as e:
+                logger.warning(
+                    "Summarization rate limited, deferring remaining items",
+                    item_id=item.id,
+                    title=item.title,
+                    source_name=source_name,
+                    error=str(e),
+                )
+                return summarized_count, True
             except Exception as e:
                 logger.error(
                     "Unexpected error during summarization",
@@ -355,43 +467,31 @@ class ContentPipeline:
 
             await asyncio.sleep(self._settings.summarization_delay_seconds)
 
-        elapsed = round(time.monotonic() - summarize_start, 2)
-        logger.info(
-            "Summarization complete",
-            summarized_count=summarized_count,
-            elapsed_seconds=elapsed,
-        )
-        return summarized_count
-
-    async def _handle_first_posting_backfill(self, items: list[ContentItem]) -> None:
-        processed_sources: set[str] = set()
-
-        for item in items:
-            if item.source_id in processed_sources:
-                continue
-
-            has_posted = await self._repository.has_source_posted_content(item.source_id)
+        return summarized_count, False
 
-            if not has_posted:
-                most_recent = await self._repository.get_most_recent_item_for_source(item.source_id)
+    async def _handle_first_posting_backfill(self, items: list[ContentItem]) -> set[str]:
+        """Backfill older pending items of never-posted sources in this page.
 
-                if most_recent:
-                    backfilled_count = await self._repository.mark_items_as_backfilled(
-                        source_id=item.source_id,
-                        exclude_item_id=most_recent.id,
-                    )
+        Returns the IDs of items that were backfilled and so need no summary.
+        """
+        backfilled = await self._repository.backfill_first_posting_items(
+            {item.source_id for item in items}
+        )
+        if not backfilled:
+            return set()
+
+        counts: dict[str, int] = {}
+        for _, source_id in backfilled:
+            counts[source_id] = counts.get(source_id, 0) + 1
+        for source_id, backfilled_count in counts.items():
+            source = await self._repository.get_source_by_id(source_id)
+            logger.info(
+                "First posting for source - backfilled old items",
+                source_name=source.name if source else "unknown",
+                backfilled_count=backfilled_count,
+            )
 
-                    if backfilled_count > 0:
-                        source = await self._repository.get_source_by_id(item.source_id)
-                        source_name = source.name if source else "unknown"
-                        logger.info(
-                            "First posting for source - backfilled old items",
-                            source_name=source_name,
-                            backfilled_count=backfilled_count,
-                            most_recent_title=most_recent.title,
-                        )
-
-            processed_sources.add(item.source_id)
+        return {item_id for item_id, _ in backfilled}
 
     async def run_cycle(self) -> tuple[int, int]:
         new_items = await self.fetch_all_sources()
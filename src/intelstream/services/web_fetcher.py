@@ -5,6 +5,7 @@ import httpx
 import structlog
 from bs4 import BeautifulSoup, Tag
 
+from intelstream.utils.parse_pool import run_parse
 from intelstream.utils.url_validation import SSRFError, validate_url_for_ssrf
 
 logger = structlog.get_logger()
@@ -59,7 +60,7 @@ class WebFetcher:
             if len(html) > MAX_CONTENT_LENGTH:
                 html = html[:MAX_CONTENT_LENGTH]
 
-            return self._parse_html(url, html)
+            return await run_parse(parse_web_page, url, html)
 
         except httpx.HTTPStatusError as e:
             logger.warning("HTTP error fetching URL", url=url, status=e.response.status_code)
@@ -177,3 +178,8 @@ class WebFetcher:
                 pass
 
         return None
+
+
+def parse_web_page(url: str, html: str) -> WebContent:
+    """Parse-pool job for ``WebFetcher._parse_html``."""
+    return WebFetcher()._parse_html(url, html)
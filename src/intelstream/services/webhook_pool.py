@@ -0,0 +1,122 @@
+import asyncio
+import re
+from typing import Any
+
+import discord
+import structlog
+
+logger = structlog.get_logger()
+
+WEBHOOK_NAME = "IntelStream"
+MAX_WEBHOOK_USERNAME_LENGTH = 80
+
+# Discord rejects webhook usernames containing these words.
+_RESERVED_USERNAME_WORDS = re.compile(r"(disc)(ord)|(cly)(de)", re.IGNORECASE)
+
+# Webhooks may always ping @everyone and roles, so forwarded text must not.
+WEBHOOK_ALLOWED_MENTIONS = discord.AllowedMentions(everyone=False, roles=False, users=True)
+
+
+def webhook_username(name: str) -> str:
+    name = _RESERVED_USERNAME_WORDS.sub(
+        lambda m: "\u200b".join(part for part in m.groups() if part), name
+    )
+    return name[:MAX_WEBHOOK_USERNAME_LENGTH] or WEBHOOK_NAME
+
+
+class WebhookPool:
+    """One bot-owned webhook per channel, created on first use and cached.
+
+    Webhook sends use their own rate-limit buckets instead of the bot account's.
+    Threads are posted to through their parent channel's webhook. Channels where
+    the bot cannot manage webhooks are remembered, and ``send`` returns None
+    for them so callers fall back to ``channel.send``.
+    """
+
+    def __init__(self, bot: discord.Client) -> None:
+        self._bot = bot
+        self._webhooks: dict[int, discord.Webhook] = {}
+        self._unavailable: set[int] = set()
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    async def get_webhook(
+        self, channel: discord.TextChannel | discord.ForumChannel
+    ) -> discord.Webhook | None:
+        webhook = self._webhooks.get(channel.id)
+        if webhook is not None or channel.id in self._unavailable:
+            return webhook
+
+        async with self._locks.setdefault(channel.id, asyncio.Lock()):
+            webhook = self._webhooks.get(channel.id)
+            if webhook is not None or channel.id in self._unavailable:
+                return webhook
+
+            try:
+                webhook = await self._find_or_create(channel)
+            except discord.Forbidden:
+                self._unavailable.add(channel.id)
+                logger.warning("Missing permission to manage webhooks", channel_id=channel.id)
+                return None
+            except discord.HTTPException as e:
+                logger.warning("Failed to set up webhook", channel_id=channel.id, error=str(e))
+                return None
+
+            self._webhooks[channel.id] = webhook
+            return webhook
+
+    async def _find_or_create(
+        self, channel: discord.TextChannel | discord.ForumChannel
+    ) -> discord.Webhook:
+        bot_user = self._bot.user
+        for webhook in await channel.webhooks():
+            if (
+                webhook.token
+                and webhook.user is not None
+                and bot_user is not None
+                and webhook.user.id == bot_user.id
+            ):
+                return webhook
+
+        webhook = await channel.create_webhook(
+            name=WEBHOOK_NAME, reason="IntelStream message delivery"
+        )
+        logger.info("Created delivery webhook", channel_id=channel.id, webhook_id=webhook.id)
+        return webhook
+
+    async def send(
+        self,
+        destination: discord.TextChannel | discord.Thread,
+        username: str | None = None,
+        avatar_url: str | None = None,
+        **kwargs: Any,
+    ) -> discord.Message | None:
+        """Send through the destination's webhook, or return None if it has none.
+
+        Discord errors other than a deleted webhook propagate like they would
+        from ``channel.send``.
+        """
+        parent = destination.parent if isinstance(destination, discord.Thread) else destination
+        if not isinstance(parent, (discord.TextChannel, discord.ForumChannel)):
+            return None
+
+        webhook = await self.get_webhook(parent)
+        if webhook is None:
+            return None
+
+        if isinstance(destination, discord.Thread):
+            kwargs["thread"] = destination
+        if username is not None:
+            kwargs["username"] = webhook_username(username)
+        if avatar_url is not None:
+            kwargs["avatar_url"] = avatar_url
+        kwargs.setdefault("allowed_mentions", WEBHOOK_ALLOWED_MENTIONS)
+
+        try:
+            return await webhook.send(wait=True, **kwargs)
+        except discord.NotFound as e:
+            # 10015 is Unknown Webhook: it was deleted from the channel settings.
+            if e.code != 10015:
+                raise
+            self._webhooks.pop(parent.id, None)
+            logger.warning("Delivery webhook was deleted", channel_id=parent.id)
+            return None
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from typing import Any
@@ -5,6 +6,32 @@ from typing import Any
 import feedparser
 
 
+@dataclass
+class ParsedFeed:
+    """The parts of a feedparser result the adapters use, safe to pickle.
+
+    ``bozo_exception`` is kept as its message because the parser's exception
+    objects hold open file handles.
+    """
+
+    feed: feedparser.FeedParserDict
+    entries: list[feedparser.FeedParserDict]
+    bozo: bool = False
+    bozo_exception: str | None = None
+
+
+def parse_feed(content: str | bytes) -> ParsedFeed:
+    """Parse a feed document; runs in the parse pool."""
+    parsed = feedparser.parse(content)
+    bozo_exception = parsed.get("bozo_exception")
+    return ParsedFeed(
+        feed=parsed.feed,
+        entries=list(parsed.entries),
+        bozo=bool(parsed.bozo),
+        bozo_exception=str(bozo_exception) if bozo_exception is not None else None,
+    )
+
+
 def _parse_time_tuple(parsed: tuple[Any, ...]) -> datetime | None:
     """Safely parse a time tuple into a datetime.
 
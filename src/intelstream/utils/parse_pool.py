@@ -0,0 +1,152 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, cast
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class _JobResult[T]:
+    value: T | None
+    error: Exception | None
+    # Wall clock, because the submitting process has to compare the start time.
+    started_at: float
+    parse_seconds: float
+
+
+def _timed_call[T](func: Callable[..., T], args: tuple[Any, ...]) -> _JobResult[T]:
+    started_at = time.time()
+    start = time.perf_counter()
+    try:
+        return _JobResult(func(*args), None, started_at, time.perf_counter() - start)
+    except Exception as e:
+        # Returned rather than raised, so anything the executor raises means
+        # the job could not be run or its outcome could not be sent back.
+        return _JobResult(None, e, started_at, time.perf_counter() - start)
+
+
+class ParsePool:
+    """Run CPU-heavy HTML and feed parsing in worker processes.
+
+    Jobs are module-level functions that take the fetched document and return
+    picklable dataclasses, so the event loop only pays for pickling.
+    ``max_workers=0`` parses inline, which is also the fallback when a job,
+    its arguments or its outcome cannot be pickled or a worker dies; a dead
+    pool is replaced for the next job. Queue wait is the time from submission
+    until a worker starts the job; each job logs it with its parse time at
+    debug level, and closing the pool logs the totals.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self._executor: ProcessPoolExecutor | None = self._create_executor()
+        self._jobs = 0
+        self._inline_jobs = 0
+        self._fallbacks = 0
+        self._total_queue_wait = 0.0
+        self._max_queue_wait = 0.0
+        self._total_parse = 0.0
+        self._max_parse = 0.0
+
+    def _create_executor(self) -> ProcessPoolExecutor | None:
+        if self._workers <= 0:
+            return None
+        # Forking a process that runs the gateway and database threads is unsafe.
+        return ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def start(self) -> None:
+        """Spawn the workers now instead of on the first job."""
+        if self._executor is not None:
+            self._executor.submit(os.getpid)
+
+    async def run[T](self, func: Callable[..., T], *args: Any) -> T:
+        executor = self._executor
+        if executor is None:
+            return self._run_inline(func, args)
+
+        submitted_at = time.time()
+        try:
+            job = await asyncio.wrap_future(executor.submit(_timed_call, func, args))
+        except Exception as e:
+            self._fallbacks += 1
+            logger.warning(
+                "Parse job failed in worker pool, parsing inline",
+                job=getattr(func, "__qualname__", repr(func)),
+                error=str(e) or type(e).__name__,
+            )
+            if isinstance(e, BrokenProcessPool) and self._executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+            return self._run_inline(func, args)
+
+        self._record(func, max(job.started_at - submitted_at, 0.0), job.parse_seconds)
+        if job.error is not None:
+            raise job.error
+        return cast("T", job.value)
+
+    def _run_inline[T](self, func: Callable[..., T], args: tuple[Any, ...]) -> T:
+        self._inline_jobs += 1
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._record(func, 0.0, time.perf_counter() - start)
+
+    def _record(self, func: Callable[..., Any], queue_wait: float, parse_seconds: float) -> None:
+        logger.debug(
+            "Parse job finished",
+            job=getattr(func, "__qualname__", repr(func)),
+            queue_wait_seconds=round(queue_wait, 4),
+            parse_seconds=round(parse_seconds, 4),
+        )
+        self._jobs += 1
+        self._total_queue_wait += queue_wait
+        self._max_queue_wait = max(self._max_queue_wait, queue_wait)
+        self._total_parse += parse_seconds
+        self._max_parse = max(self._max_parse, parse_seconds)
+
+    async def close(self) -> None:
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+        jobs = self._jobs or 1
+        logger.info(
+            "Parse pool closed",
+            workers=self._workers,
+            jobs=self._jobs,
+            inline_jobs=self._inline_jobs,
+            fallbacks=self._fallbacks,
+            avg_queue_wait_seconds=round(self._total_queue_wait / jobs, 4),
+            max_queue_wait_seconds=round(self._max_queue_wait, 4),
+            avg_parse_seconds=round(self._total_parse / jobs, 4),
+            max_parse_seconds=round(self._max_parse, 4),
+        )
+
+
+# Parses inline until the bot installs a worker pool at startup.
+_parse_pool = ParsePool(max_workers=0)
+
+
+def get_parse_pool() -> ParsePool:
+    return _parse_pool
+
+
+def set_parse_pool(pool: ParsePool) -> None:
+    global _parse_pool
+    _parse_pool = pool
+
+
+async def run_parse[T](func: Callable[..., T], *args: Any) -> T:
+    """Run a parse job on the shared pool."""
+    return await _parse_pool.run(func, *args)
@@ -18,6 +18,15 @@ def mock_settings_env(monkeypatch):
     get_settings.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_feed_probe_cache():
+    from intelstream.adapters.strategies.rss_discovery import shared_probe_cache
+
+    shared_probe_cache.clear()
+    yield
+    shared_probe_cache.clear()
+
+
 @pytest.fixture
 async def db_session():
     engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
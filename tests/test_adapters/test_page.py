@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
-from intelstream.adapters.page import PageAdapter
+from intelstream.adapters.page import PageAdapter, compile_profile
 from intelstream.services.page_analyzer import ExtractionProfile
 
 
@@ -233,6 +233,109 @@ class TestPageAdapter:
         assert (datetime.now(UTC) - result).total_seconds() < 5
 
 
+class TestCompiledSelectors:
+    def test_compiled_path_matches_beautifulsoup(
+        self, sample_profile: ExtractionProfile, sample_html: str
+    ) -> None:
+        adapter = PageAdapter(extraction_profile=sample_profile)
+
+        compiled = adapter._extract_posts(sample_html, "https://example.com/blog")
+        with patch("intelstream.adapters.page.compile_profile", return_value=None):
+            souped = adapter._extract_posts(sample_html, "https://example.com/blog")
+
+        def comparable(items: list) -> list:
+            # Dateless posts are stamped with the current time by both paths.
+            return [(i.title, i.original_url, i.author, i.external_id) for i in items]
+
+        assert comparable(compiled) == comparable(souped)
+        assert [i.published_at for i in compiled[:2]] == [i.published_at for i in souped[:2]]
+
+    def test_nested_text_matches_beautifulsoup(self, sample_profile: ExtractionProfile) -> None:
+        html = """
+        <html><body>
+            <article class="post">
+                <h2 class="title"> Hello <em> nested </em> world </h2>
+                <a class="link" href="/p">x</a>
+                <span class="author"><b>Ann</b> Lee</span>
+            </article>
+        </body></html>
+        """
+        adapter = PageAdapter(extraction_profile=sample_profile)
+
+        compiled = adapter._extract_posts(html, "https://example.com")
+        with patch("intelstream.adapters.page.compile_profile", return_value=None):
+            souped = adapter._extract_posts(html, "https://example.com")
+
+        assert compiled[0].title == souped[0].title
+        assert compiled[0].author == souped[0].author
+
+    def test_text_skips_scripts_styles_and_comments_like_beautifulsoup(
+        self, sample_profile: ExtractionProfile
+    ) -> None:
+        html = """
+        <html><body>
+            <article class="post">
+                <h2 class="title">Hello<script>var x=1;</script> <!-- draft -->World
+                    <style>.a{color:red}</style><template><b>hidden</b></template>!</h2>
+                <a class="link" href="/p">x</a>
+                <span class="author">Ann<noscript>Enable JS</noscript></span>
+            </article>
+        </body></html>
+        """
+        adapter = PageAdapter(extraction_profile=sample_profile)
+
+        compiled = adapter._extract_posts(html, "https://example.com")
+        with patch("intelstream.adapters.page.compile_profile", return_value=None):
+            souped = adapter._extract_posts(html, "https://example.com")
+
+        assert compiled[0].title == souped[0].title == "HelloWorld!"
+        assert compiled[0].author == souped[0].author
+
+    def test_selector_does_not_match_post_itself(self) -> None:
+        profile = ExtractionProfile(
+            site_name="Test Blog",
+            post_selector="div.post",
+            title_selector="div",
+            url_selector="a",
+            url_attribute="href",
+        )
+        html = '<div class="post"><a href="/p">link</a><div>Inner Title</div></div>'
+
+        items = PageAdapter(extraction_profile=profile)._extract_posts(html, "https://example.com")
+
+        assert [i.title for i in items] == ["Inner Title"]
+
+    def test_unsupported_selector_falls_back_to_beautifulsoup(self) -> None:
+        profile = ExtractionProfile(
+            site_name="Test Blog",
+            post_selector="article",
+            title_selector='h2:-soup-contains("Title")',
+            url_selector="a",
+            url_attribute="href",
+        )
+        html = (
+            '<article><h2>Has Title</h2><a href="/a">x</a></article>'
+            '<article><h2>Other</h2><a href="/b">x</a></article>'
+        )
+
+        assert compile_profile(profile) is None
+        items = PageAdapter(extraction_profile=profile)._extract_posts(html, "https://example.com")
+
+        assert [i.title for i in items] == ["Has Title"]
+
+    def test_empty_document_falls_back_to_beautifulsoup(
+        self, sample_profile: ExtractionProfile
+    ) -> None:
+        adapter = PageAdapter(extraction_profile=sample_profile)
+
+        assert adapter._extract_posts("", "https://example.com") == []
+
+    def test_compiled_profile_is_cached(self, sample_profile: ExtractionProfile) -> None:
+        same = ExtractionProfile.from_dict(sample_profile.to_dict())
+
+        assert compile_profile(sample_profile) is compile_profile(same)
+
+
 class TestExtractionProfile:
     def test_to_dict(self, sample_profile: ExtractionProfile) -> None:
         data = sample_profile.to_dict()
@@ -1,10 +1,13 @@
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 import respx
+from structlog.testing import capture_logs
 
+from intelstream.adapters import smart_blog
 from intelstream.adapters.smart_blog import SmartBlogAdapter
 from intelstream.adapters.strategies.base import DiscoveredPost, DiscoveryResult
 from intelstream.database.models import Source, SourceType
@@ -15,13 +18,14 @@ from intelstream.database.repository import Repository
 def mock_repository():
     repo = AsyncMock(spec=Repository)
     repo.get_source_by_identifier = AsyncMock(return_value=None)
-    repo.get_known_urls_for_source = AsyncMock(return_value=set())
     repo.content_item_exists = AsyncMock(return_value=False)
     repo.get_extraction_cache = AsyncMock(return_value=None)
     repo.set_extraction_cache = AsyncMock()
     repo.update_source_discovery_strategy = AsyncMock()
     repo.increment_failure_count = AsyncMock(return_value=1)
-    repo.reset_failure_count = AsyncMock()
+    repo.reset_failure_count = AsyncMock(return_value=False)
+    repo.update_source_sitemap_watermark = AsyncMock()
+    repo.get_sitemap_location = AsyncMock(return_value=None)
     return repo
 
 
@@ -51,6 +55,7 @@ def sample_source():
     source.feed_url = "https://example.com/feed.xml"
     source.url_pattern = None
     source.consecutive_failures = 0
+    source.sitemap_lastmod_watermark = None
     return source
 
 
@@ -143,6 +148,104 @@ class TestSmartBlogAdapterAnalysis:
             assert "Unable to find blog posts" in result.error
 
 
+def found(url: str) -> DiscoveryResult:
+    return DiscoveryResult(posts=[DiscoveredPost(url=url, title="Post")])
+
+
+class TestAnalysisRace:
+    async def test_preferred_strategy_wins_even_if_slower(self, adapter: SmartBlogAdapter):
+        async def slow_rss(_url: str) -> DiscoveryResult:
+            await asyncio.sleep(0.05)
+            return found("https://example.com/from-rss")
+
+        with (
+            patch.object(adapter._strategies[0], "discover", side_effect=slow_rss),
+            patch.object(adapter._strategies[1], "discover", new_callable=AsyncMock) as sitemap,
+            patch.object(adapter._strategies[2], "discover", new_callable=AsyncMock) as llm,
+        ):
+            sitemap.return_value = found("https://example.com/from-sitemap")
+
+            result = await adapter.analyze_site("https://example.com/")
+
+        assert result.strategy == "rss"
+        llm.assert_not_called()
+
+    async def test_winner_cancels_slower_strategies(self, adapter: SmartBlogAdapter):
+        cancelled = asyncio.Event()
+
+        async def hanging_sitemap(_url: str) -> DiscoveryResult | None:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return None
+
+        with (
+            patch.object(adapter._strategies[0], "discover", new_callable=AsyncMock) as rss,
+            patch.object(adapter._strategies[1], "discover", side_effect=hanging_sitemap),
+        ):
+            rss.return_value = found("https://example.com/from-rss")
+
+            result = await asyncio.wait_for(adapter.analyze_site("https://example.com/"), 5)
+
+        assert result.strategy == "rss"
+        assert cancelled.is_set()
+
+    async def test_llm_starts_as_soon_as_cheap_strategies_fail(self, adapter: SmartBlogAdapter):
+        with (
+            patch.object(smart_blog, "SPECULATIVE_START_DELAY_SECONDS", 60),
+            patch.object(adapter._strategies[0], "discover", new_callable=AsyncMock) as rss,
+            patch.object(adapter._strategies[1], "discover", side_effect=RuntimeError("boom")),
+            patch.object(adapter._strategies[2], "discover", new_callable=AsyncMock) as llm,
+        ):
+            rss.return_value = None
+            llm.return_value = found("https://example.com/from-llm")
+
+            result = await asyncio.wait_for(adapter.analyze_site("https://example.com/"), 5)
+
+        assert result.success is True
+        assert result.strategy == "llm"
+
+    async def test_llm_starts_speculatively_after_delay(self, adapter: SmartBlogAdapter):
+        release = asyncio.Event()
+        llm_started = asyncio.Event()
+
+        async def slow_failure(_url: str) -> None:
+            await release.wait()
+
+        async def llm_discover(_url: str) -> DiscoveryResult:
+            llm_started.set()
+            release.set()
+            return found("https://example.com/from-llm")
+
+        with (
+            patch.object(smart_blog, "SPECULATIVE_START_DELAY_SECONDS", 0.01),
+            patch.object(adapter._strategies[0], "discover", side_effect=slow_failure),
+            patch.object(adapter._strategies[1], "discover", side_effect=slow_failure),
+            patch.object(adapter._strategies[2], "discover", side_effect=llm_discover),
+        ):
+            result = await asyncio.wait_for(adapter.analyze_site("https://example.com/"), 5)
+
+        assert llm_started.is_set()
+        assert result.strategy == "llm"
+
+    async def test_llm_not_started_when_cheap_strategy_succeeds(self, adapter: SmartBlogAdapter):
+        with (
+            patch.object(smart_blog, "SPECULATIVE_START_DELAY_SECONDS", 60),
+            patch.object(adapter._strategies[0], "discover", new_callable=AsyncMock) as rss,
+            patch.object(adapter._strategies[1], "discover", new_callable=AsyncMock) as sitemap,
+            patch.object(adapter._strategies[2], "discover", new_callable=AsyncMock) as llm,
+        ):
+            rss.return_value = None
+            sitemap.return_value = found("https://example.com/blog/post")
+
+            result = await adapter.analyze_site("https://example.com/")
+
+        assert result.strategy == "sitemap"
+        llm.assert_not_called()
+
+
 class TestSmartBlogAdapterFetchLatest:
     async def test_fetch_latest_source_not_found(self, adapter: SmartBlogAdapter, mock_repository):
         mock_repository.get_source_by_identifier.return_value = None
@@ -187,7 +290,6 @@ class TestSmartBlogAdapterFetchLatest:
         sample_source.discovery_strategy = "sitemap"
         sample_source.feed_url = None
         mock_repository.get_source_by_identifier.return_value = sample_source
-        mock_repository.get_known_urls_for_source.return_value = set()
 
         discovery_result = DiscoveryResult(
             posts=[DiscoveredPost(url="https://example.com/new", title="New Post")],
@@ -255,6 +357,136 @@ class TestSmartBlogAdapterFetchLatest:
             assert result[0].original_url == "https://example.com/new"
 
 
+class TestSitemapWatermark:
+    @pytest.fixture
+    def sitemap_source(self, sample_source, mock_repository):
+        sample_source.discovery_strategy = "sitemap"
+        sample_source.feed_url = None
+        sample_source.url_pattern = "/posts/"
+        mock_repository.get_source_by_identifier.return_value = sample_source
+        return sample_source
+
+    async def test_nothing_newer_than_watermark_is_not_a_failure(
+        self, adapter: SmartBlogAdapter, mock_repository, sitemap_source
+    ):
+        sitemap_source.sitemap_lastmod_watermark = datetime(2024, 1, 15)
+        result = DiscoveryResult(posts=[], watermark=datetime(2024, 1, 15, tzinfo=UTC))
+
+        with patch.object(adapter, "_discover_with_fallback", new_callable=AsyncMock) as mock:
+            mock.return_value = result
+            items = await adapter.fetch_latest(sitemap_source.identifier)
+
+        assert items == []
+        mock_repository.increment_failure_count.assert_not_called()
+        mock_repository.reset_failure_count.assert_called_once_with(sitemap_source.id)
+        mock_repository.update_source_sitemap_watermark.assert_not_called()
+
+    async def test_recovery_after_failures_is_logged(
+        self, adapter: SmartBlogAdapter, mock_repository, sitemap_source
+    ):
+        mock_repository.reset_failure_count.return_value = True
+        result = DiscoveryResult(posts=[], watermark=datetime(2024, 1, 15, tzinfo=UTC))
+
+        with (
+            patch.object(adapter, "_discover_with_fallback", new_callable=AsyncMock) as mock,
+            capture_logs() as logs,
+        ):
+            mock.return_value = result
+            await adapter.fetch_latest(sitemap_source.identifier)
+
+        assert any(log["event"] == "Blog source recovered" for log in logs)
+
+    async def test_watermark_advances_to_newest_lastmod(
+        self, adapter: SmartBlogAdapter, mock_repository, sitemap_source
+    ):
+        newest = datetime(2024, 2, 1, tzinfo=UTC)
+        result = DiscoveryResult(
+            posts=[
+                DiscoveredPost(url="https://example.com/posts/a", title="", published_at=newest)
+            ],
+            watermark=newest,
+        )
+
+        with (
+            patch.object(adapter, "_discover_with_fallback", new_callable=AsyncMock) as mock,
+            patch.object(adapter._content_extractor, "extract", new_callable=AsyncMock) as extract,
+        ):
+            mock.return_value = result
+            extract.return_value = MagicMock(
+                text="Content", title="A", author="Author", published_at=None
+            )
+            items = await adapter.fetch_latest(sitemap_source.identifier)
+
+        assert len(items) == 1
+        mock_repository.update_source_sitemap_watermark.assert_called_once_with(
+            sitemap_source.id, newest
+        )
+
+    async def test_watermark_stops_at_failed_post(
+        self, adapter: SmartBlogAdapter, mock_repository, sitemap_source
+    ):
+        failed_at = datetime(2024, 1, 20, tzinfo=UTC)
+        newest = datetime(2024, 2, 1, tzinfo=UTC)
+        result = DiscoveryResult(
+            posts=[
+                DiscoveredPost(url="https://example.com/posts/new", title="", published_at=newest),
+                DiscoveredPost(
+                    url="https://example.com/posts/broken", title="", published_at=failed_at
+                ),
+            ],
+            watermark=newest,
+        )
+
+        async def extract(url: str) -> MagicMock:
+            if url.endswith("broken"):
+                raise httpx.ConnectError("down")
+            return MagicMock(text="Content", title="New", author="Author", published_at=None)
+
+        with (
+            patch.object(adapter, "_discover_with_fallback", new_callable=AsyncMock) as mock,
+            patch.object(adapter._content_extractor, "extract", side_effect=extract),
+        ):
+            mock.return_value = result
+            items = await adapter.fetch_latest(sitemap_source.identifier)
+
+        assert len(items) == 1
+        mock_repository.update_source_sitemap_watermark.assert_called_once_with(
+            sitemap_source.id, failed_at
+        )
+
+    async def test_future_lastmod_does_not_move_watermark_past_now(
+        self, adapter: SmartBlogAdapter, mock_repository, sitemap_source
+    ):
+        mock_repository.content_item_exists.return_value = True
+        result = DiscoveryResult(
+            posts=[DiscoveredPost(url="https://example.com/posts/a", title="")],
+            watermark=datetime(2999, 1, 1, tzinfo=UTC),
+        )
+
+        with patch.object(adapter, "_discover_with_fallback", new_callable=AsyncMock) as mock:
+            mock.return_value = result
+            await adapter.fetch_latest(sitemap_source.identifier)
+
+        stored = mock_repository.update_source_sitemap_watermark.call_args.args[1]
+        assert stored <= datetime.now(UTC)
+
+    async def test_watermark_passed_to_strategy(self, adapter: SmartBlogAdapter, sitemap_source):
+        sitemap_source.sitemap_lastmod_watermark = datetime(2024, 1, 15)
+
+        with patch.object(adapter._strategies[1], "discover", new_callable=AsyncMock) as mock:
+            mock.return_value = DiscoveryResult(posts=[], watermark=datetime(2024, 1, 15))
+            await adapter._discover_with_fallback(
+                url=sitemap_source.identifier,
+                cached_strategy="sitemap",
+                url_pattern="/posts/",
+                source=sitemap_source,
+            )
+
+        mock.assert_called_once_with(
+            sitemap_source.identifier, url_pattern="/posts/", since=datetime(2024, 1, 15)
+        )
+
+
 class TestSmartBlogAdapterFallback:
     async def test_discover_with_fallback_tries_cached_strategy_first(
         self, adapter: SmartBlogAdapter, sample_source
@@ -5,7 +5,11 @@ import httpx
 import pytest
 import respx
 
-from intelstream.adapters.strategies.llm_extraction import LLMExtractionStrategy
+from intelstream.adapters.strategies.llm_extraction import (
+    LLMExtractionStrategy,
+    content_fingerprint,
+    legacy_content_hash,
+)
 from intelstream.database.models import ExtractionCache
 from intelstream.database.repository import Repository
 
@@ -94,6 +98,27 @@ class TestLLMExtractionStrategy:
         assert result.posts[0].url == "https://example.com/cached"
         mock_anthropic_client.messages.create.assert_not_called()
 
+    @respx.mock
+    async def test_discover_carries_over_legacy_cache(
+        self, llm_strategy: LLMExtractionStrategy, mock_repository, mock_anthropic_client
+    ):
+        html = "<html><body><main><a href='/post/1'>Post 1</a></main></body></html>"
+        posts_json = json.dumps([{"url": "https://example.com/post/1", "title": "Post 1"}])
+        cached = MagicMock(spec=ExtractionCache)
+        cached.content_hash = legacy_content_hash(html)
+        cached.posts_json = posts_json
+        mock_repository.get_extraction_cache.return_value = cached
+        respx.get("https://example.com/").mock(return_value=httpx.Response(200, text=html))
+
+        result = await llm_strategy.discover("https://example.com/")
+
+        assert result is not None
+        assert [p.url for p in result.posts] == ["https://example.com/post/1"]
+        mock_anthropic_client.messages.create.assert_not_called()
+        mock_repository.set_extraction_cache.assert_called_once_with(
+            "https://example.com/", content_fingerprint(html), posts_json
+        )
+
     @respx.mock
     async def test_discover_caches_result(
         self, llm_strategy: LLMExtractionStrategy, mock_repository, mock_anthropic_client
@@ -298,3 +323,34 @@ class TestLLMExtractionStrategy:
         assert len(result.posts) == 1
         assert result.posts[0].url == "https://example.com/valid"
         mock_anthropic_client.messages.create.assert_not_called()
+
+
+class TestContentFingerprint:
+    PAGE = (
+        "<html><head><script>var token = '{token}';</script></head><body>"
+        '<nav><a href="/{nav}">Nav</a></nav><main><h1>Blog</h1><p>Updated {updated}</p>'
+        '{posts}</main><footer><a href="/legal">Legal</a></footer></body></html>'
+    )
+
+    def render(self, posts=(1, 2), token="a", nav="about", updated="1m ago") -> str:
+        cards = "".join(f'<article><h2><a href="/p/{i}">Post {i}</a></h2></article>' for i in posts)
+        return self.PAGE.format(token=token, nav=nav, updated=updated, posts=cards)
+
+    def test_ignores_scripts_navigation_and_text_churn(self):
+        baseline = content_fingerprint(self.render())
+
+        assert content_fingerprint(self.render(token="b")) == baseline
+        assert content_fingerprint(self.render(nav="team")) == baseline
+        assert content_fingerprint(self.render(updated="2m ago")) == baseline
+
+    def test_changes_when_post_list_changes(self):
+        baseline = content_fingerprint(self.render())
+
+        assert content_fingerprint(self.render(posts=(3, 1, 2))) != baseline
+        assert content_fingerprint(self.render(posts=(1,))) != baseline
+
+    def test_falls_back_to_text_without_links_or_headings(self):
+        first = content_fingerprint("<html><body><p>First</p></body></html>")
+        second = content_fingerprint("<html><body><p>Second</p></body></html>")
+
+        assert first != second
@@ -2,7 +2,12 @@ import httpx
 import pytest
 import respx
 
-from intelstream.adapters.strategies.rss_discovery import RSSDiscoveryStrategy
+from intelstream.adapters.strategies.rss_discovery import (
+    RSS_PATHS,
+    FeedProbeCache,
+    RSSDiscoveryStrategy,
+    shared_probe_cache,
+)
 
 
 @pytest.fixture
@@ -198,3 +203,111 @@ class TestRSSDiscoveryStrategy:
         result = await rss_strategy.discover("https://example.com/")
 
         assert result is None
+
+
+class TestFeedProbeCache:
+    HTML = "<html><body>No RSS link</body></html>"
+    RSS = """<?xml version="1.0"?>
+    <rss version="2.0"><channel>
+        <item><title>Post</title><link>https://example.com/post</link></item>
+    </channel></rss>
+    """
+
+    @respx.mock
+    async def test_dead_paths_are_not_probed_again(self, rss_strategy: RSSDiscoveryStrategy):
+        respx.get("https://example.com/").mock(return_value=httpx.Response(200, text=self.HTML))
+        probes = [
+            respx.head(f"https://example.com{path}").mock(return_value=httpx.Response(404))
+            for path in RSS_PATHS
+        ]
+
+        assert await rss_strategy.discover("https://example.com/") is None
+        assert await rss_strategy.discover("https://example.com/") is None
+
+        assert all(probe.call_count == 1 for probe in probes)
+
+    @respx.mock
+    async def test_found_feed_is_reused(self, rss_strategy: RSSDiscoveryStrategy):
+        respx.get("https://example.com/").mock(return_value=httpx.Response(200, text=self.HTML))
+        head = respx.head("https://example.com/feed").mock(
+            return_value=httpx.Response(200, headers={"content-type": "application/rss+xml"})
+        )
+        respx.get("https://example.com/feed").mock(
+            return_value=httpx.Response(
+                200, text=self.RSS, headers={"content-type": "application/rss+xml"}
+            )
+        )
+
+        first = await rss_strategy.discover("https://example.com/")
+        second = await rss_strategy.discover("https://example.com/")
+
+        assert first is not None and second is not None
+        assert second.feed_url == "https://example.com/feed"
+        assert head.call_count == 1
+
+    @respx.mock
+    async def test_found_feed_dropped_when_it_stops_parsing(
+        self, rss_strategy: RSSDiscoveryStrategy
+    ):
+        respx.get("https://example.com/").mock(return_value=httpx.Response(200, text=self.HTML))
+        shared_probe_cache.found.set("https://example.com", "https://example.com/feed")
+        respx.get("https://example.com/feed").mock(return_value=httpx.Response(404))
+
+        assert await rss_strategy.discover("https://example.com/") is None
+        assert shared_probe_cache.found.get("https://example.com") is None
+
+    @respx.mock
+    async def test_transient_errors_are_not_cached(self):
+        cache = FeedProbeCache()
+        strategy = RSSDiscoveryStrategy(probe_cache=cache)
+        respx.get("https://example.com/").mock(return_value=httpx.Response(200, text=self.HTML))
+        respx.head("https://example.com/feed").mock(side_effect=httpx.ConnectError("down"))
+        respx.head("https://example.com/feed.xml").mock(return_value=httpx.Response(503))
+        for path in RSS_PATHS[2:]:
+            respx.head(f"https://example.com{path}").mock(return_value=httpx.Response(404))
+
+        assert await strategy.discover("https://example.com/") is None
+
+        assert cache.dead.get(("https://example.com", "/feed")) is None
+        assert cache.dead.get(("https://example.com", "/feed.xml")) is None
+        assert cache.dead.get(("https://example.com", "/rss")) is True
+        assert len(shared_probe_cache.dead) == 0
+
+    @respx.mock
+    async def test_non_feed_200_is_cached_as_dead(self, rss_strategy: RSSDiscoveryStrategy):
+        respx.get("https://example.com/").mock(return_value=httpx.Response(200, text=self.HTML))
+        respx.head("https://example.com/feed").mock(
+            return_value=httpx.Response(200, headers={"content-type": "text/html"})
+        )
+        respx.get("https://example.com/feed").mock(
+            return_value=httpx.Response(200, text=self.HTML, headers={"content-type": "text/html"})
+        )
+        for path in RSS_PATHS[1:]:
+            respx.head(f"https://example.com{path}").mock(return_value=httpx.Response(404))
+
+        assert await rss_strategy.discover("https://example.com/") is None
+
+        assert shared_probe_cache.dead.get(("https://example.com", "/feed")) is True
+
+    @respx.mock
+    @pytest.mark.parametrize(
+        "get_response",
+        [httpx.ConnectError("reset"), httpx.Response(503)],
+    )
+    async def test_failed_validation_fetch_is_not_cached_as_dead(self, get_response):
+        cache = FeedProbeCache()
+        strategy = RSSDiscoveryStrategy(probe_cache=cache)
+        respx.get("https://example.com/").mock(return_value=httpx.Response(200, text=self.HTML))
+        respx.head("https://example.com/feed").mock(
+            return_value=httpx.Response(200, headers={"content-type": "text/html"})
+        )
+        if isinstance(get_response, Exception):
+            respx.get("https://example.com/feed").mock(side_effect=get_response)
+        else:
+            respx.get("https://example.com/feed").mock(return_value=get_response)
+        for path in RSS_PATHS[1:]:
+            respx.head(f"https://example.com{path}").mock(return_value=httpx.Response(404))
+
+        assert await strategy.discover("https://example.com/") is None
+
+        assert cache.dead.get(("https://example.com", "/feed")) is None
@@ -1,12 +1,20 @@
+import asyncio
 import gzip
-from unittest.mock import patch
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 import respx
 
 from intelstream.adapters.strategies import sitemap_discovery
-from intelstream.adapters.strategies.sitemap_discovery import SitemapDiscoveryStrategy
+from intelstream.adapters.strategies.sitemap_discovery import (
+    SitemapDiscoveryStrategy,
+    _SitemapTarget,
+)
+from intelstream.database.models import SitemapLocation
+from intelstream.database.repository import Repository
 
 
 @pytest.fixture
@@ -307,3 +315,572 @@ class TestSitemapDiscoveryStrategy:
         assert result is not None
         assert len(result.posts) == 1
         assert result.posts[0].url == "https://example.com/blog/post"
+
+
+class TestSitemapWatermark:
+    SITEMAP = """<?xml version="1.0"?>
+    <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <url><loc>https://example.com/blog/new</loc><lastmod>2024-02-01</lastmod></url>
+        <url><loc>https://example.com/blog/same-day</loc><lastmod>2024-01-15</lastmod></url>
+        <url><loc>https://example.com/blog/old</loc><lastmod>2023-06-01</lastmod></url>
+        <url><loc>https://example.com/blog/undated</loc></url>
+        <url><loc>https://example.com/about</loc><lastmod>2024-03-01</lastmod></url>
+    </urlset>
+    """
+
+    @respx.mock
+    async def test_skips_entries_older_than_watermark(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/sitemap.xml").mock(
+            return_value=httpx.Response(200, text=self.SITEMAP)
+        )
+
+        result = await sitemap_strategy.discover(
+            "https://example.com/blog",
+            url_pattern="/blog/",
+            since=datetime(2024, 1, 15, tzinfo=UTC),
+        )
+
+        assert result is not None
+        assert [p.url for p in result.posts] == [
+            "https://example.com/blog/new",
+            "https://example.com/blog/same-day",
+            "https://example.com/blog/undated",
+        ]
+        assert result.watermark == datetime(2024, 2, 1, tzinfo=UTC)
+
+    @respx.mock
+    async def test_naive_watermark_is_treated_as_utc(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/sitemap.xml").mock(
+            return_value=httpx.Response(200, text=self.SITEMAP)
+        )
+
+        result = await sitemap_strategy.discover(
+            "https://example.com/blog", url_pattern="/blog/", since=datetime(2024, 1, 16)
+        )
+
+        assert result is not None
+        assert [p.url for p in result.posts] == [
+            "https://example.com/blog/new",
+            "https://example.com/blog/undated",
+        ]
+
+    @respx.mock
+    async def test_nothing_newer_returns_empty_result_with_watermark(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        sitemap = """<?xml version="1.0"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <url><loc>https://example.com/blog/old</loc><lastmod>2023-06-01</lastmod></url>
+        </urlset>
+        """
+        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/sitemap.xml").mock(
+            return_value=httpx.Response(200, text=sitemap)
+        )
+
+        result = await sitemap_strategy.discover(
+            "https://example.com/blog",
+            url_pattern="/blog/",
+            since=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+
+        assert result is not None
+        assert result.posts == []
+        assert result.found
+        assert result.watermark == datetime(2023, 6, 1, tzinfo=UTC)
+
+    @respx.mock
+    async def test_watermark_ignored_while_inferring_pattern(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/sitemap.xml").mock(
+            return_value=httpx.Response(200, text=self.SITEMAP)
+        )
+
+        result = await sitemap_strategy.discover(
+            "https://example.com/blog", since=datetime(2024, 1, 15, tzinfo=UTC)
+        )
+
+        assert result is not None
+        assert result.url_pattern == "/blog/"
+        assert len(result.posts) == 4
+
+    @respx.mock
+    async def test_inflates_gzipped_sitemap_in_bounded_steps(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        entries = "".join(
+            f"<url><loc>https://example.com/blog/post-{i}</loc></url>" for i in range(2000)
+        )
+        sitemap = (
+            '<?xml version="1.0"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'
+        )
+        gzipped = gzip.compress(sitemap.encode())
+
+        respx.get("https://example.com/sitemap.xml.gz").mock(
+            return_value=httpx.Response(200, content=gzipped)
+        )
+
+        with patch.object(sitemap_discovery, "INFLATE_CHUNK_SIZE", 1024):
+            sitemap_result = await sitemap_strategy._parse_sitemap(
+                "https://example.com/sitemap.xml.gz", url_pattern="/blog/"
+            )
+
+        assert len(sitemap_result.entries) == 2000
+        assert sitemap_result.entries[-1].url == "https://example.com/blog/post-1999"
+
+    @respx.mock
+    async def test_rejects_entity_expansion(self, sitemap_strategy: SitemapDiscoveryStrategy):
+        sitemap = """<?xml version="1.0"?>
+        <!DOCTYPE urlset [<!ENTITY a "https://example.com/blog/post">]>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <url><loc>&a;</loc></url>
+        </urlset>
+        """
+        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/sitemap.xml").mock(
+            return_value=httpx.Response(200, text=sitemap)
+        )
+
+        result = await sitemap_strategy.discover("https://example.com/blog", url_pattern="/blog/")
+
+        assert result is None
+
+
+def make_location(
+    sitemap_url: str | None,
+    sub_sitemaps: dict[str, str | None] | None = None,
+    checked_at: datetime | None = None,
+) -> MagicMock:
+    location = MagicMock(spec=SitemapLocation)
+    location.sitemap_url = sitemap_url
+    location.sub_sitemaps_json = json.dumps(sub_sitemaps or {}, sort_keys=True)
+    location.checked_at = checked_at or datetime.now(UTC)
+    return location
+
+
+class TestSitemapLocation:
+    URLSET = """<?xml version="1.0"?>
+    <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <url><loc>https://example.com/blog/post-1</loc></url>
+    </urlset>
+    """
+
+    @pytest.fixture
+    def repository(self):
+        repo = AsyncMock(spec=Repository)
+        repo.get_sitemap_location = AsyncMock(return_value=None)
+        return repo
+
+    @pytest.fixture
+    def strategy(self, repository):
+        return SitemapDiscoveryStrategy(repository=repository)
+
+    @respx.mock
+    async def test_fresh_location_skips_robots_and_probes(self, strategy, repository):
+        repository.get_sitemap_location.return_value = make_location(
+            "https://example.com/posts-sitemap.xml"
+        )
+        robots = respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/posts-sitemap.xml").mock(
+            return_value=httpx.Response(200, text=self.URLSET)
+        )
+
+        result = await strategy.discover("https://example.com/blog", url_pattern="/blog/")
+
+        assert result is not None
+        assert len(result.posts) == 1
+        assert not robots.called
+        repository.set_sitemap_location.assert_not_called()
+
+    @respx.mock
+    async def test_stale_location_is_looked_up_again(self, strategy, repository):
+        repository.get_sitemap_location.return_value = make_location(
+            "https://example.com/old-sitemap.xml",
+            checked_at=datetime.now(UTC) - timedelta(days=30),
+        )
+        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/sitemap.xml").mock(
+            return_value=httpx.Response(200, text=self.URLSET)
+        )
+
+        result = await strategy.discover("https://example.com/blog", url_pattern="/blog/")
+
+        assert result is not None
+        repository.set_sitemap_location.assert_called_once()
+        call = repository.set_sitemap_location.call_args
+        assert call.args[:2] == ("https://example.com/blog", "https://example.com/sitemap.xml")
+        assert call.kwargs["checked_at"] is not None
+
+    @respx.mock
+    async def test_broken_location_is_looked_up_again(self, strategy, repository):
+        repository.get_sitemap_location.return_value = make_location("https://example.com/gone.xml")
+        respx.get("https://example.com/gone.xml").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+        respx.get("https://example.com/sitemap.xml").mock(
+            return_value=httpx.Response(200, text=self.URLSET)
+        )
+
+        result = await strategy.discover("https://example.com/blog", url_pattern="/blog/")
+
+        assert result is not None
+        assert repository.set_sitemap_location.call_args.args[1] == (
+            "https://example.com/sitemap.xml"
+        )
+
+    @respx.mock
+    async def test_all_sub_sitemaps_unchanged_is_still_a_result(self, strategy, repository):
+        index = """<?xml version="1.0"?>
+        <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <sitemap><loc>https://example.com/s1.xml</loc><lastmod>2024-01-01</lastmod></sitemap>
+        </sitemapindex>
+        """
+        repository.get_sitemap_location.return_value = make_location(
+            "https://example.com/sitemap_index.xml",
+            {"https://example.com/s1.xml": "2024-01-01T00:00:00+00:00"},
+        )
+        respx.get("https://example.com/sitemap_index.xml").mock(
+            return_value=httpx.Response(200, text=index)
+        )
+        since = datetime(2024, 2, 1, tzinfo=UTC)
+
+        with patch.object(sitemap_discovery, "validate_url_for_ssrf"):
+            result = await strategy.discover(
+                "https://example.com/blog", url_pattern="/blog/", since=since
+            )
+
+        assert result is not None
+        assert result.posts == []
+        assert result.watermark == since
+        repository.set_sitemap_location.assert_not_called()
+
+    @respx.mock
+    async def test_self_reference_is_not_persisted(self, strategy, repository):
+        index = """<?xml version="1.0"?>
+        <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <sitemap><loc>https://example.com/sitemap_index.xml</loc></sitemap>
+            <sitemap><loc>https://example.com/posts.xml</loc></sitemap>
+        </sitemapindex>
+        """
+        repository.get_sitemap_location.return_value = make_location(
+            "https://example.com/sitemap_index.xml",
+            {
+                "https://example.com/sitemap_index.xml": None,
+                "https://example.com/posts.xml": None,
+            },
+        )
+        route = respx.get("https://example.com/sitemap_index.xml").mock(
+            return_value=httpx.Response(200, text=index)
+        )
+        respx.get("https://example.com/posts.xml").mock(
+            return_value=httpx.Response(200, text=self.URLSET)
+        )
+
+        with patch.object(sitemap_discovery, "validate_url_for_ssrf"):
+            result = await strategy.discover(
+                "https://example.com/blog",
+                url_pattern="/blog/",
+                since=datetime(2024, 1, 1, tzinfo=UTC),
+            )
+
+        assert result is not None
+        assert route.call_count == 1
+        stored = json.loads(repository.set_sitemap_location.call_args.args[2])
+        assert stored == {"https://example.com/posts.xml": None}
+
+    @respx.mock
+    async def test_failed_sub_sitemap_is_fetched_on_next_poll(self, strategy, repository):
+        index = """<?xml version="1.0"?>
+        <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <sitemap><loc>https://example.com/s1.xml</loc><lastmod>2024-01-01</lastmod></sitemap>
+            <sitemap><loc>https://example.com/s2.xml</loc><lastmod>2024-01-01</lastmod></sitemap>
+        </sitemapindex>
+        """
+        repository.get_sitemap_location.return_value = make_location(
+            "https://example.com/sitemap_index.xml"
+        )
+
+        async def save(_page_url, sitemap_url, sub_sitemaps_json, **_kwargs):
+            repository.get_sitemap_location.return_value = make_location(
+                sitemap_url, json.loads(sub_sitemaps_json)
+            )
+
+        repository.set_sitemap_location.side_effect = save
+        respx.get("https://example.com/sitemap_index.xml").mock(
+            return_value=httpx.Response(200, text=index)
+        )
+        respx.get("https://example.com/s1.xml").mock(
+            side_effect=[httpx.Response(500), httpx.Response(200, text=self.URLSET)]
+        )
+        respx.get("https://example.com/s2.xml").mock(
+            return_value=httpx.Response(
+                200,
+                text=self.URLSET.replace("/blog/post-1", "/blog/post-2"),
+            )
+        )
+        since = datetime(2024, 2, 1, tzinfo=UTC)
+
+        with patch.object(sitemap_discovery, "validate_url_for_ssrf"):
+            first = await strategy.discover(
+                "https://example.com/blog", url_pattern="/blog/", since=since
+            )
+            second = await strategy.discover(
+                "https://example.com/blog", url_pattern="/blog/", since=since
+            )
+
+        assert first is not None and second is not None
+        assert [p.url for p in first.posts] == ["https://example.com/blog/post-2"]
+        assert "https://example.com/blog/post-1" in [p.url for p in second.posts]
+        assert second.watermark == since
+
+    @respx.mock
+    async def test_fresh_missing_sitemap_is_not_probed(self, strategy, repository):
+        repository.get_sitemap_location.return_value = make_location(None)
+        robots = respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
+
+        result = await strategy.discover("https://example.com/blog", url_pattern="/blog/")
+
+        assert result is None
+        assert not robots.called
+
+
+class TestSubSitemaps:
+    INDEX = """<?xml version="1.0"?>
+    <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <sitemap><loc>https://example.com/sitemap-2019.xml</loc><lastmod>2019-12-31</lastmod></sitemap>
+        <sitemap><loc>https://example.com/sitemap-2024.xml</loc><lastmod>2024-02-01</lastmod></sitemap>
+    </sitemapindex>
+    """
+
+    @staticmethod
+    def urlset(*paths: str) -> str:
+        urls = "".join(f"<url><loc>https://example.com{p}</loc></url>" for p in paths)
+        return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+
+    @respx.mock
+    async def test_unchanged_old_sub_sitemap_is_skipped(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        respx.get("https://example.com/sitemap_index.xml").mock(
+            return_value=httpx.Response(200, text=self.INDEX)
+        )
+        old = respx.get("https://example.com/sitemap-2019.xml").mock(
+            return_value=httpx.Response(200, text=self.urlset("/blog/2019"))
+        )
+        respx.get("https://example.com/sitemap-2024.xml").mock(
+            return_value=httpx.Response(200, text=self.urlset("/blog/2024"))
+        )
+        known = {
+            "https://example.com/sitemap-2019.xml": datetime(2019, 12, 31, tzinfo=UTC),
+            "https://example.com/sitemap-2024.xml": datetime(2024, 1, 20, tzinfo=UTC),
+        }
+
+        with patch.object(sitemap_discovery, "validate_url_for_ssrf"):
+            result = await sitemap_strategy._parse_sitemap(
+                "https://example.com/sitemap_index.xml",
+                url_pattern="/blog/",
+                since=datetime(2024, 1, 20, tzinfo=UTC),
+                known=known,
+            )
+
+        assert not old.called
+        assert [e.url for e in result.entries] == ["https://example.com/blog/2024"]
+        assert result.skipped_unchanged == 1
+        assert set(result.listed) == set(known)
+
+    @respx.mock
+    async def test_sub_sitemaps_fetched_without_watermark(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        respx.get("https://example.com/sitemap_index.xml").mock(
+            return_value=httpx.Response(200, text=self.INDEX)
+        )
+        respx.get("https://example.com/sitemap-2019.xml").mock(
+            return_value=httpx.Response(200, text=self.urlset("/blog/2019"))
+        )
+        respx.get("https://example.com/sitemap-2024.xml").mock(
+            return_value=httpx.Response(200, text=self.urlset("/blog/2024"))
+        )
+        known = {"https://example.com/sitemap-2019.xml": datetime(2019, 12, 31, tzinfo=UTC)}
+
+        with patch.object(sitemap_discovery, "validate_url_for_ssrf"):
+            result = await sitemap_strategy._parse_sitemap(
+                "https://example.com/sitemap_index.xml", url_pattern="/blog/", known=known
+            )
+
+        assert [e.url for e in result.entries] == [
+            "https://example.com/blog/2019",
+            "https://example.com/blog/2024",
+        ]
+
+    async def test_sub_sitemap_fetches_limited_per_host(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def fake_feed(url: str, target: _SitemapTarget) -> None:
+            if url.endswith("index.xml"):
+                target.is_index = True
+                target.sub_sitemaps = [
+                    sitemap_discovery.SitemapEntry(url=f"https://{h}/sitemap-{i}.xml", lastmod=None)
+                    for i in range(6)
+                    for h in ("a.example.com", "b.example.com")
+                ]
+                return
+            host = url.split("/")[2]
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+
+        with (
+            patch.object(sitemap_discovery, "MAX_SUB_SITEMAPS", 20),
+            patch.object(sitemap_discovery, "MAX_CONCURRENT_FETCHES_PER_HOST", 2),
+            patch.object(sitemap_discovery, "validate_url_for_ssrf"),
+            patch.object(sitemap_strategy, "_feed_sitemap", side_effect=fake_feed),
+        ):
+            await sitemap_strategy._parse_sitemap("https://a.example.com/index.xml")
+
+        assert peak == {"a.example.com": 2, "b.example.com": 2}
+
+    @staticmethod
+    def index(*urls: str) -> str:
+        sitemaps = "".join(f"<sitemap><loc>{u}</loc></sitemap>" for u in urls)
+        return (
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            f"{sitemaps}</sitemapindex>"
+        )
+
+    @respx.mock
+    async def test_self_referencing_index_is_fetched_once(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        index = respx.get("https://example.com/sitemap_index.xml").mock(
+            return_value=httpx.Response(
+                200,
+                text=self.index(
+                    "https://example.com/sitemap_index.xml", "https://example.com/posts.xml"
+                ),
+            )
+        )
+        posts = respx.get("https://example.com/posts.xml").mock(
+            return_value=httpx.Response(200, text=self.urlset("/blog/post"))
+        )
+
+        with patch.object(sitemap_discovery, "validate_url_for_ssrf"):
+            result = await sitemap_strategy._parse_sitemap("https://example.com/sitemap_index.xml")
+
+        assert index.call_count == 1
+        assert posts.call_count == 1
+        assert [e.url for e in result.entries] == ["https://example.com/blog/post"]
+
+    @respx.mock
+    async def test_mutually_referencing_indexes_are_fetched_once(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        first = respx.get("https://example.com/a.xml").mock(
+            return_value=httpx.Response(200, text=self.index("https://example.com/b.xml"))
+        )
+        second = respx.get("https://example.com/b.xml").mock(
+            return_value=httpx.Response(200, text=self.index("https://example.com/a.xml"))
+        )
+
+        with patch.object(sitemap_discovery, "validate_url_for_ssrf"):
+            result = await sitemap_strategy._parse_sitemap("https://example.com/a.xml")
+
+        assert first.call_count == 1
+        assert second.call_count == 1
+        assert result.entries == []
+
+    @respx.mock
+    async def test_nested_indexes_stop_at_max_depth(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        routes = [
+            respx.get(f"https://example.com/level-{i}.xml").mock(
+                return_value=httpx.Response(
+                    200, text=self.index(f"https://example.com/level-{i + 1}.xml")
+                )
+            )
+            for i in range(6)
+        ]
+
+        with (
+            patch.object(sitemap_discovery, "MAX_SITEMAP_DEPTH", 3),
+            patch.object(sitemap_discovery, "validate_url_for_ssrf"),
+        ):
+            await sitemap_strategy._parse_sitemap("https://example.com/level-0.xml")
+
+        assert [route.call_count for route in routes] == [1, 1, 1, 1, 0, 0]
+
+    async def test_sub_sitemaps_of_one_index_limited(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        active = 0
+        peak = 0
+
+        async def fake_feed(url: str, target: _SitemapTarget) -> None:
+            nonlocal active, peak
+            if url.endswith("index.xml"):
+                target.is_index = True
+                target.sub_sitemaps = [
+                    sitemap_discovery.SitemapEntry(
+                        url=f"https://h{i}.example.com/s.xml", lastmod=None
+                    )
+                    for i in range(8)
+                ]
+                return
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        with (
+            patch.object(sitemap_discovery, "MAX_CONCURRENT_SUB_SITEMAPS", 3),
+            patch.object(sitemap_discovery, "validate_url_for_ssrf"),
+            patch.object(sitemap_strategy, "_feed_sitemap", side_effect=fake_feed),
+        ):
+            await sitemap_strategy._parse_sitemap("https://example.com/index.xml")
+
+        assert peak == 3
+
+    @respx.mock
+    async def test_failed_sub_sitemap_keeps_watermark(
+        self, sitemap_strategy: SitemapDiscoveryStrategy
+    ):
+        respx.get("https://example.com/robots.txt").mock(
+            return_value=httpx.Response(200, text="Sitemap: https://example.com/sitemap_index.xml")
+        )
+        respx.get("https://example.com/sitemap_index.xml").mock(
+            return_value=httpx.Response(200, text=self.INDEX)
+        )
+        respx.get("https://example.com/sitemap-2019.xml").mock(return_value=httpx.Response(500))
+        respx.get("https://example.com/sitemap-2024.xml").mock(
+            return_value=httpx.Response(
+                200,
+                text=(
+                    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                    "<url><loc>https://example.com/blog/2024</loc>"
+                    "<lastmod>2024-02-01</lastmod></url></urlset>"
+                ),
+            )
+        )
+        since = datetime(2019, 1, 1, tzinfo=UTC)
+
+        with patch.object(sitemap_discovery, "validate_url_for_ssrf"):
+            result = await sitemap_strategy.discover(
+                "https://example.com/blog", url_pattern="/blog/", since=since
+            )
+
+        assert result is not None
+        assert [p.url for p in result.posts] == ["https://example.com/blog/2024"]
+        assert result.watermark == since
@@ -2,8 +2,9 @@ import asyncio
 from datetime import UTC, datetime, timedelta
 
 import pytest
-from sqlalchemy import select, text
+from sqlalchemy import event, inspect, select, text
 from sqlalchemy.ext.asyncio import create_async_engine
+from structlog.testing import capture_logs
 
 from intelstream.database.exceptions import (
     DuplicateContentError,
@@ -11,7 +12,12 @@ from intelstream.database.exceptions import (
     SourceNotFoundError,
 )
 from intelstream.database.models import SourceType
-from intelstream.database.repository import Repository
+from intelstream.database.repository import (
+    ForwardingCountDelta,
+    Repository,
+    SQLitePragmas,
+    UsageCountDelta,
+)
 
 
 @pytest.fixture
@@ -36,6 +42,65 @@ class TestRepositoryInitialization:
         assert repo is not None
         await repo.close()
 
+    async def test_applies_performance_pragmas_on_connect(self, tmp_path) -> None:
+        repo = Repository(f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}")
+        await repo.initialize()
+
+        async with repo.session() as session:
+            pragmas = {
+                name: (await session.execute(text(f"PRAGMA {name}"))).scalar_one()
+                for name in (
+                    "journal_mode",
+                    "synchronous",
+                    "cache_size",
+                    "busy_timeout",
+                    "temp_store",
+                )
+            }
+
+        assert pragmas["journal_mode"] == "wal"
+        assert pragmas["synchronous"] == 1  # NORMAL
+        assert pragmas["cache_size"] == -64 * 1024
+        assert pragmas["busy_timeout"] == 5000
+        assert pragmas["temp_store"] == 2  # MEMORY
+        await repo.close()
+
+    async def test_custom_pragmas(self, tmp_path) -> None:
+        repo = Repository(
+            f"sqlite+aiosqlite:///{tmp_path / 'custom.db'}",
+            pragmas=SQLitePragmas(
+                journal_mode="DELETE", synchronous="FULL", busy_timeout_ms=250, temp_store="FILE"
+            ),
+        )
+        await repo.initialize()
+
+        async with repo.session() as session:
+            journal_mode = (await session.execute(text("PRAGMA journal_mode"))).scalar_one()
+            synchronous = (await session.execute(text("PRAGMA synchronous"))).scalar_one()
+            busy_timeout = (await session.execute(text("PRAGMA busy_timeout"))).scalar_one()
+            temp_store = (await session.execute(text("PRAGMA temp_store"))).scalar_one()
+
+        assert journal_mode == "delete"
+        assert synchronous == 2  # FULL
+        assert busy_timeout == 250
+        assert temp_store == 1  # FILE
+        await repo.close()
+
+    async def test_wal_allows_reads_while_writer_holds_lock(self, tmp_path) -> None:
+        repo = Repository(f"sqlite+aiosqlite:///{tmp_path / 'concurrent.db'}")
+        await repo.initialize()
+        await repo.add_source(source_type=SourceType.RSS, name="Existing", identifier="existing")
+
+        async with repo._engine.connect() as writer:
+            await writer.exec_driver_sql("BEGIN EXCLUSIVE")
+            await writer.exec_driver_sql("UPDATE sources SET name = 'Renamed'")
+            source = await asyncio.wait_for(repo.get_source_by_identifier("existing"), timeout=2.0)
+            await writer.exec_driver_sql("COMMIT")
+
+        assert source is not None
+        assert source.name == "Existing"
+        await repo.close()
+
 
 class TestSourceOperations:
     async def test_add_source(self, repository: Repository) -> None:
@@ -209,10 +274,51 @@ class TestSourceOperations:
         source = await repository.get_source_by_identifier("to-delete")
         assert source is None
 
+    async def test_delete_source_removes_content_blobs(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.SUBSTACK,
+            name="To Delete",
+            identifier="to-delete",
+        )
+        await repository.add_content_item(
+            source_id=source.id,
+            external_id="article-1",
+            title="Article",
+            original_url="https://example.com/1",
+            author="Author",
+            published_at=datetime(2024, 1, 15, 12, 0, 0),
+            raw_content="Body",
+        )
+
+        await repository.delete_source("to-delete")
+
+        async with repository._engine.begin() as conn:
+            result = await conn.execute(text("SELECT COUNT(*) FROM content_blobs"))
+            assert result.scalar_one() == 0
+
     async def test_delete_source_not_found(self, repository: Repository) -> None:
         with pytest.raises(SourceNotFoundError):
             await repository.delete_source("nonexistent")
 
+    async def test_sitemap_watermark_reset_by_strategy_update(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.BLOG,
+            name="Blog",
+            identifier="https://blog.example.com",
+        )
+
+        await repository.update_source_sitemap_watermark(source.id, datetime(2024, 1, 15, 12, 0, 0))
+        stored = await repository.get_source_by_id(source.id)
+        assert stored is not None
+        assert stored.sitemap_lastmod_watermark == datetime(2024, 1, 15, 12, 0, 0)
+
+        await repository.update_source_discovery_strategy(
+            source.id, discovery_strategy="sitemap", url_pattern="/posts/"
+        )
+        reset = await repository.get_source_by_id(source.id)
+        assert reset is not None
+        assert reset.sitemap_lastmod_watermark is None
+
 
 class TestContentItemOperations:
     async def test_add_content_item(self, repository: Repository) -> None:
@@ -236,6 +342,85 @@ class TestContentItemOperations:
         assert content.title == "Test Article"
         assert content.posted_to_discord is False
 
+    async def test_raw_content_stored_compressed_in_blob(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.ARXIV,
+            name="Papers",
+            identifier="papers",
+        )
+        body = "Scaling laws for neural language models. " * 500
+
+        content = await repository.add_content_item(
+            source_id=source.id,
+            external_id="paper-1",
+            title="Paper",
+            original_url="https://arxiv.org/abs/1",
+            author="Author",
+            published_at=datetime(2024, 1, 15, 12, 0, 0),
+            raw_content=body,
+        )
+
+        async with repository._engine.begin() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT codec, length(data), original_size FROM content_blobs "
+                    "WHERE content_item_id = :id"
+                ),
+                {"id": content.id},
+            )
+            codec, stored_size, original_size = result.one()
+
+        assert codec == "zlib"
+        assert original_size == len(body)
+        assert stored_size < original_size // 10
+
+        items = await repository.get_unsummarized_content_items()
+        assert items[0].raw_content == body
+
+    async def test_queue_queries_do_not_load_raw_content(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.SUBSTACK,
+            name="Test Source",
+            identifier="test-source",
+        )
+        content = await repository.add_content_item(
+            source_id=source.id,
+            external_id="article-1",
+            title="Article",
+            original_url="https://example.com/1",
+            author="Author",
+            published_at=datetime(2024, 1, 15, 12, 0, 0),
+            raw_content="Body",
+        )
+        await repository.update_content_item_summary(content.id, "Summary")
+
+        rows = await repository.get_unposted_items_with_destinations()
+
+        assert len(rows) == 1
+        assert "blob" in inspect(rows[0][0]).unloaded
+
+    async def test_item_without_raw_content_has_no_blob(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.YOUTUBE,
+            name="Test Channel",
+            identifier="test-channel",
+        )
+        await repository.add_content_item(
+            source_id=source.id,
+            external_id="video-1",
+            title="Video",
+            original_url="https://youtube.com/watch?v=1",
+            author="Author",
+            published_at=datetime(2024, 1, 15, 12, 0, 0),
+        )
+
+        items = await repository.get_unsummarized_content_items()
+        assert items[0].raw_content is None
+
+        async with repository._engine.begin() as conn:
+            result = await conn.execute(text("SELECT COUNT(*) FROM content_blobs"))
+            assert result.scalar_one() == 0
+
     async def test_content_item_exists(self, repository: Repository) -> None:
         source = await repository.add_source(
             source_type=SourceType.YOUTUBE,
@@ -302,7 +487,7 @@ class TestContentItemOperations:
 
         await repository.update_content_item_summary(content.id, "This is the summary.")
 
-        await repository.mark_content_item_posted(content.id, "discord-msg-123")
+        await repository.mark_content_items_posted([(content.id, "discord-msg-123")])
 
         updated = await repository.get_content_item_by_external_id("blog-post-1")
         assert updated is not None
@@ -310,7 +495,7 @@ class TestContentItemOperations:
         assert updated.posted_to_discord is True
         assert updated.discord_message_id == "discord-msg-123"
 
-    async def test_get_unposted_content_items(self, repository: Repository) -> None:
+    async def test_posted_items_leave_unposted_query(self, repository: Repository) -> None:
         source = await repository.add_source(
             source_type=SourceType.SUBSTACK,
             name="Test",
@@ -338,59 +523,355 @@ class TestContentItemOperations:
         await repository.update_content_item_summary(content1.id, "Summary 1")
         await repository.update_content_item_summary(content2.id, "Summary 2")
 
-        unposted = await repository.get_unposted_content_items()
+        unposted = await repository.get_unposted_items_with_destinations()
         assert len(unposted) == 2
 
-        await repository.mark_content_item_posted(content1.id, "msg-1")
-
-        unposted = await repository.get_unposted_content_items()
-        assert len(unposted) == 1
-        assert unposted[0].external_id == "post-2"
+        await repository.mark_content_items_posted([(content1.id, "msg-1")])
 
+        unposted = await repository.get_unposted_items_with_destinations()
+        assert [item.external_id for item, _, _ in unposted] == ["post-2"]
 
-class TestFirstPostingOperations:
-    async def test_has_source_posted_content_false_when_none_posted(
-        self, repository: Repository
-    ) -> None:
+    async def test_mark_content_items_posted_batch(self, repository: Repository) -> None:
         source = await repository.add_source(
             source_type=SourceType.SUBSTACK,
             name="Test",
             identifier="test",
         )
 
-        await repository.add_content_item(
-            source_id=source.id,
-            external_id="post-1",
-            title="Post 1",
-            original_url="https://example.com/1",
-            author="Author",
-            published_at=datetime(2024, 1, 1),
+        items = []
+        for i in range(3):
+            item = await repository.add_content_item(
+                source_id=source.id,
+                external_id=f"batch-{i}",
+                title=f"Post {i}",
+                original_url=f"https://example.com/{i}",
+                author="Author",
+                published_at=datetime(2024, 1, i + 1),
+            )
+            await repository.update_content_item_summary(item.id, f"Summary {i}")
+            items.append(item)
+
+        marked = await repository.mark_content_items_posted(
+            [(items[0].id, "msg-0"), (items[2].id, "msg-2")]
         )
 
-        has_posted = await repository.has_source_posted_content(source.id)
-        assert has_posted is False
+        assert marked == 2
+        unposted = await repository.get_unposted_items_with_destinations()
+        assert [item.external_id for item, _, _ in unposted] == ["batch-1"]
+        posted = await repository.get_content_item_by_external_id("batch-2")
+        assert posted is not None
+        assert posted.discord_message_id == "msg-2"
 
-    async def test_has_source_posted_content_true_when_posted(self, repository: Repository) -> None:
+    async def test_mark_content_items_posted_empty(self, repository: Repository) -> None:
+        assert await repository.mark_content_items_posted([]) == 0
+
+    async def test_backlog_counts_and_exclusions(self, repository: Repository) -> None:
         source = await repository.add_source(
             source_type=SourceType.SUBSTACK,
             name="Test",
             identifier="test",
         )
 
-        content = await repository.add_content_item(
-            source_id=source.id,
-            external_id="post-1",
-            title="Post 1",
-            original_url="https://example.com/1",
+        items = []
+        for i in range(3):
+            items.append(
+                await repository.add_content_item(
+                    source_id=source.id,
+                    external_id=f"backlog-{i}",
+                    title=f"Post {i}",
+                    original_url=f"https://example.com/{i}",
+                    author="Author",
+                    published_at=datetime(2024, 1, i + 1),
+                )
+            )
+        await repository.update_content_item_summary(items[0].id, "Summary")
+
+        assert await repository.count_unsummarized_content_items() == 2
+        assert await repository.count_unposted_content_items() == 1
+
+        remaining = await repository.get_unsummarized_content_items(exclude_ids={items[1].id})
+        assert [i.external_id for i in remaining] == ["backlog-2"]
+
+        rows = await repository.get_unposted_items_with_destinations(exclude_ids={items[0].id})
+        assert rows == []
+
+
+class TestSeenIndex:
+    async def _add_item(self, repository: Repository, source_id: str, external_id: str) -> None:
+        await repository.add_content_item(
+            source_id=source_id,
+            external_id=external_id,
+            title="Title",
+            original_url=f"https://example.com/{external_id}",
             author="Author",
-            published_at=datetime(2024, 1, 1),
+            published_at=datetime(2024, 1, 15, 12, 0, 0),
         )
 
-        await repository.mark_content_item_posted(content.id, "msg-123")
+    async def test_loads_existing_ids(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.RSS, name="Feed", identifier="feed"
+        )
+        await self._add_item(repository, source.id, "existing")
+
+        index = await repository.load_seen_index(capacity=1000, recent_size=100)
+
+        assert index.get_stats().ids_loaded == 1
+        assert await repository.content_item_exists("existing") is True
+        assert await repository.content_item_exists("missing") is False
+
+    async def test_warns_once_when_index_exceeds_capacity(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.RSS, name="Feed", identifier="feed"
+        )
+        await repository.load_seen_index(capacity=1, recent_size=100)
+
+        with capture_logs() as logs:
+            for external_id in ("item-1", "item-2", "item-3"):
+                await self._add_item(repository, source.id, external_id)
+
+        warnings = [log for log in logs if log["log_level"] == "warning"]
+        assert len(warnings) == 1
+        assert warnings[0]["capacity"] == 1
+
+    async def test_seen_ids_resolve_without_database(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.RSS, name="Feed", identifier="feed"
+        )
+        await repository.load_seen_index(capacity=1000, recent_size=100)
+        await self._add_item(repository, source.id, "item-1")
 
-        has_posted = await repository.has_source_posted_content(source.id)
-        assert has_posted is True
+        statements: list[str] = []
 
+        def capture(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        event.listen(repository._engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            assert await repository.content_item_exists("item-1") is True
+            assert await repository.content_item_exists("item-2") is False
+        finally:
+            event.remove(repository._engine.sync_engine, "before_cursor_execute", capture)
+
+        assert statements == []
+
+    async def test_deleted_source_items_are_not_reported_seen(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.RSS, name="Feed", identifier="feed"
+        )
+        await repository.load_seen_index(capacity=1000, recent_size=100)
+        await self._add_item(repository, source.id, "item-1")
+
+        await repository.delete_source("feed")
+
+        assert await repository.content_item_exists("item-1") is False
+
+
+class TestReadThroughCache:
+    async def test_source_lookups_are_cached(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.RSS, name="Feed", identifier="feed"
+        )
+
+        first = await repository.get_source_by_id(source.id)
+        second = await repository.get_source_by_id(source.id)
+        by_identifier = await repository.get_source_by_identifier("feed")
+
+        assert first is second
+        assert by_identifier is first
+        stats = repository.get_cache_stats()
+        assert stats["sources_by_id"].hits == 1
+        assert stats["sources_by_id"].misses == 1
+        assert stats["sources_by_identifier"].hits == 1
+
+    async def test_mutators_invalidate_cached_source(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.BLOG, name="Blog", identifier="blog"
+        )
+        await repository.get_source_by_identifier("blog")
+
+        await repository.update_source_discovery_strategy(
+            source.id, discovery_strategy="rss", feed_url="https://blog.example.com/feed"
+        )
+        updated = await repository.get_source_by_identifier("blog")
+        assert updated is not None
+        assert updated.discovery_strategy == "rss"
+
+        await repository.set_source_active("blog", False)
+        paused = await repository.get_source_by_id(source.id)
+        assert paused is not None
+        assert paused.is_active is False
+
+        await repository.increment_failure_count(source.id)
+        failed = await repository.get_source_by_id(source.id)
+        assert failed is not None
+        assert failed.consecutive_failures == 1
+
+        await repository.delete_source("blog")
+        assert await repository.get_source_by_id(source.id) is None
+        assert await repository.get_source_by_identifier("blog") is None
+
+    async def test_last_polled_update_keeps_source_cached(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.RSS, name="Feed", identifier="feed"
+        )
+        cached = await repository.get_source_by_id(source.id)
+        assert cached is not None
+        assert cached.last_polled_at is None
+
+        await repository.update_source_last_polled(source.id)
+
+        polled = await repository.get_source_by_id(source.id)
+        assert polled is cached
+        assert polled.last_polled_at is not None
+        assert await repository.get_source_by_identifier("feed") is cached
+        assert repository.get_cache_stats()["sources_by_id"].hits == 1
+
+    async def test_discord_config_cached_and_invalidated(self, repository: Repository) -> None:
+        await repository.get_or_create_discord_config("guild-1", "channel-1")
+
+        first = await repository.get_discord_config("guild-1")
+        configs = await repository.get_discord_configs_for_guilds(["guild-1"])
+        assert configs["guild-1"] is first
+        assert repository.get_cache_stats()["discord_configs"].hits == 1
+
+        await repository.get_or_create_discord_config("guild-1", "channel-2")
+
+        updated = await repository.get_discord_config("guild-1")
+        assert updated is not None
+        assert updated.channel_id == "channel-2"
+
+    async def test_zero_ttl_disables_cache(self) -> None:
+        repo = Repository("sqlite+aiosqlite:///:memory:", cache_ttl_seconds=0)
+        await repo.initialize()
+        source = await repo.add_source(source_type=SourceType.RSS, name="Feed", identifier="feed")
+
+        first = await repo.get_source_by_id(source.id)
+        second = await repo.get_source_by_id(source.id)
+
+        assert first is not second
+        assert repo.get_cache_stats()["sources_by_id"].hits == 0
+        await repo.close()
+
+
+class TestAtomicUpdates:
+    async def test_concurrent_failure_increments_are_not_lost(self, tmp_path) -> None:
+        repo = Repository(f"sqlite+aiosqlite:///{tmp_path / 'atomic.db'}")
+        await repo.initialize()
+        source = await repo.add_source(source_type=SourceType.RSS, name="Feed", identifier="feed")
+
+        counts = await asyncio.gather(*(repo.increment_failure_count(source.id) for _ in range(20)))
+
+        assert sorted(counts) == list(range(1, 21))
+        refreshed = await repo.get_source_by_id(source.id)
+        assert refreshed is not None
+        assert refreshed.consecutive_failures == 20
+        await repo.close()
+
+    async def test_increment_failure_count_missing_source(self, repository: Repository) -> None:
+        assert await repository.increment_failure_count("missing") == 0
+
+    async def test_reset_failure_counts_only_touches_failed_sources(
+        self, repository: Repository
+    ) -> None:
+        failing = await repository.add_source(
+            source_type=SourceType.RSS, name="Failing", identifier="failing"
+        )
+        healthy = await repository.add_source(
+            source_type=SourceType.RSS, name="Healthy", identifier="healthy"
+        )
+        await repository.increment_failure_count(failing.id)
+
+        reset = await repository.reset_failure_counts([failing.id, healthy.id])
+
+        assert reset == 1
+        refreshed = await repository.get_source_by_id(failing.id)
+        assert refreshed is not None
+        assert refreshed.consecutive_failures == 0
+        assert await repository.reset_failure_count(failing.id) is False
+
+    async def test_update_content_item_summaries_batch(self, repository: Repository) -> None:
+        source = await repository.add_source(
+            source_type=SourceType.RSS, name="Feed", identifier="feed"
+        )
+        ids = []
+        for i in range(3):
+            item = await repository.add_content_item(
+                source_id=source.id,
+                external_id=f"item-{i}",
+                title=f"Item {i}",
+                original_url=f"https://example.com/{i}",
+                author="Author",
+                published_at=datetime(2024, 1, 1),
+            )
+            ids.append(item.id)
+
+        updated = await repository.update_content_item_summaries(
+            [(ids[0], ""), (ids[1], "Summary")]
+        )
+
+        assert updated == 2
+        pending = await repository.get_unsummarized_content_items()
+        assert [item.id for item in pending] == [ids[2]]
+
+    async def test_update_missing_content_item_returns_false(self, repository: Repository) -> None:
+        assert await repository.update_content_item_summary("missing", "Summary") is False
+
+    async def test_apply_forwarding_count_deltas(self, repository: Repository) -> None:
+        first = await repository.add_forwarding_rule(
+            guild_id="guild-123",
+            source_channel_id="source-1",
+            source_type="channel",
+            destination_channel_id="dest-1",
+            destination_type="channel",
+        )
+        second = await repository.add_forwarding_rule(
+            guild_id="guild-123",
+            source_channel_id="source-1",
+            source_type="channel",
+            destination_channel_id="dest-2",
+            destination_type="channel",
+        )
+
+        now = datetime.now(UTC)
+        updated = await repository.apply_counter_deltas(
+            forwarding={
+                rule_id: ForwardingCountDelta(count=count, last_forwarded_at=now)
+                for rule_id, count in {first.id: 3, second.id: 1, "missing": 2}.items()
+            }
+        )
+
+        assert updated == 2
+        rules = {
+            rule.id: rule for rule in await repository.get_forwarding_rules_for_source("source-1")
+        }
+        assert rules[first.id].messages_forwarded == 3
+        assert rules[second.id].messages_forwarded == 1
+        assert rules[first.id].last_forwarded_at is not None
+
+    async def test_apply_usage_deltas_upserts(self, repository: Repository) -> None:
+        await repository.apply_counter_deltas(
+            usage={
+                ("guild-1", "user-1"): UsageCountDelta(times_used=1),
+                ("guild-1", "user-2"): UsageCountDelta(times_pinged=1),
+            }
+        )
+        await repository.apply_counter_deltas(
+            usage={("guild-1", "user-1"): UsageCountDelta(times_used=1, times_pinged=1)}
+        )
+
+        async with repository._engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT user_id, times_used, times_pinged FROM suck_boobs_stats "
+                    "ORDER BY user_id"
+                )
+            )
+            rows = [tuple(row) for row in result.all()]
+
+        assert rows == [("user-1", 2, 1), ("user-2", 0, 1)]
+
+
+class TestFirstPostingOperations:
     async def test_get_most_recent_item_for_source(self, repository: Repository) -> None:
         source = await repository.add_source(
             source_type=SourceType.RSS,
@@ -539,7 +1020,7 @@ class TestFirstPostingOperations:
             published_at=datetime(2024, 1, 1),
         )
 
-        await repository.mark_content_item_posted(content1.id, "real-msg-123")
+        await repository.mark_content_items_posted([(content1.id, "real-msg-123")])
 
         await repository.add_content_item(
             source_id=source.id,
@@ -558,6 +1039,63 @@ class TestFirstPostingOperations:
         assert item1 is not None
         assert item1.discord_message_id == "real-msg-123"
 
+    async def test_backfill_first_posting_items_is_set_based(self, repository: Repository) -> None:
+        fresh = await repository.add_source(
+            source_type=SourceType.RSS, name="Fresh", identifier="fresh"
+        )
+        posted = await repository.add_source(
+            source_type=SourceType.RSS, name="Posted", identifier="posted"
+        )
+        fresh_ids = []
+        for day in (1, 2, 3):
+            item = await repository.add_content_item(
+                source_id=fresh.id,
+                external_id=f"fresh-{day}",
+                title=f"Fresh {day}",
+                original_url=f"https://example.com/fresh/{day}",
+                author="Author",
+                published_at=datetime(2024, 1, day),
+            )
+            fresh_ids.append(item.id)
+        already = await repository.add_content_item(
+            source_id=posted.id,
+            external_id="posted-1",
+            title="Posted 1",
+            original_url="https://example.com/posted/1",
+            author="Author",
+            published_at=datetime(2024, 1, 1),
+        )
+        await repository.mark_content_items_posted([(already.id, "msg-1")])
+        pending = await repository.add_content_item(
+            source_id=posted.id,
+            external_id="posted-2",
+            title="Posted 2",
+            original_url="https://example.com/posted/2",
+            author="Author",
+            published_at=datetime(2024, 1, 2),
+        )
+
+        statements: list[str] = []
+
+        def capture(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        event.listen(repository._engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            backfilled = await repository.backfill_first_posting_items({fresh.id, posted.id})
+        finally:
+            event.remove(repository._engine.sync_engine, "before_cursor_execute", capture)
+
+        assert sorted(backfilled) == sorted((item_id, fresh.id) for item_id in fresh_ids[:2])
+        assert len(statements) == 1
+
+        unsummarized = await repository.get_unsummarized_content_items(limit=10)
+        assert {item.id for item in unsummarized} == {fresh_ids[2], pending.id}
+        assert await repository.count_unsummarized_content_items() == 2
+
+    async def test_backfill_first_posting_items_empty(self, repository: Repository) -> None:
+        assert await repository.backfill_first_posting_items(set()) == []
+
 
 class TestDiscordConfigOperations:
     async def test_get_or_create_discord_config(self, repository: Repository) -> None:
@@ -590,6 +1128,50 @@ class TestDiscordConfigOperations:
         missing = await repository.get_discord_config("nonexistent")
         assert missing is None
 
+    async def test_get_discord_configs_for_guilds(self, repository: Repository) -> None:
+        await repository.get_or_create_discord_config("guild-1", "channel-1")
+        await repository.get_or_create_discord_config("guild-2", "channel-2")
+
+        configs = await repository.get_discord_configs_for_guilds(["guild-1", "guild-3"])
+
+        assert set(configs) == {"guild-1"}
+        assert configs["guild-1"].channel_id == "channel-1"
+        assert await repository.get_discord_configs_for_guilds([]) == {}
+
+    async def test_get_unposted_items_with_destinations(self, repository: Repository) -> None:
+        await repository.get_or_create_discord_config("guild-1", "default-channel")
+        scoped = await repository.add_source(
+            source_type=SourceType.RSS,
+            name="Scoped",
+            identifier="scoped",
+            guild_id="guild-1",
+        )
+        unconfigured = await repository.add_source(
+            source_type=SourceType.RSS,
+            name="Unconfigured",
+            identifier="unconfigured",
+            guild_id="guild-2",
+            channel_id="channel-2",
+        )
+
+        for i, source in enumerate([scoped, unconfigured]):
+            item = await repository.add_content_item(
+                source_id=source.id,
+                external_id=f"dest-{i}",
+                title=f"Post {i}",
+                original_url=f"https://example.com/{i}",
+                author="Author",
+                published_at=datetime(2024, 1, i + 1),
+            )
+            await repository.update_content_item_summary(item.id, "Summary")
+
+        rows = await repository.get_unposted_items_with_destinations()
+
+        assert [(item.external_id, source.name, channel) for item, source, channel in rows] == [
+            ("dest-0", "Scoped", "default-channel"),
+            ("dest-1", "Unconfigured", None),
+        ]
+
     async def test_get_or_create_discord_config_concurrent_access(self, tmp_path) -> None:
         db_path = tmp_path / "test_concurrent.db"
         repository = Repository(f"sqlite+aiosqlite:///{db_path}")
@@ -651,6 +1233,44 @@ class TestMigrations:
         assert "consecutive_failures" in columns
         assert "guild_id" in columns
         assert "channel_id" in columns
+        assert "sitemap_lastmod_watermark" in columns
+
+        await repo.close()
+
+    async def test_migrate_adds_coalesce_window_to_forwarding_rules(self, tmp_path) -> None:
+        db_url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+
+        engine = create_async_engine(db_url, echo=False)
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("""
+                CREATE TABLE forwarding_rules (
+                    id VARCHAR(36) PRIMARY KEY,
+                    guild_id VARCHAR(36) NOT NULL,
+                    source_channel_id VARCHAR(36) NOT NULL,
+                    source_type VARCHAR(20) NOT NULL,
+                    destination_channel_id VARCHAR(36) NOT NULL,
+                    destination_type VARCHAR(20) NOT NULL,
+                    is_active BOOLEAN,
+                    messages_forwarded INTEGER,
+                    last_forwarded_at DATETIME,
+                    created_at DATETIME
+                )
+            """)
+            )
+            await conn.execute(
+                text("""
+                INSERT INTO forwarding_rules
+                VALUES ('rule-1', 'g', 's', 'channel', 'd', 'channel', 1, 3, NULL, NULL)
+            """)
+            )
+        await engine.dispose()
+
+        repo = Repository(db_url)
+        await repo.initialize()
+
+        rules = await repo.get_forwarding_rules_for_guild("g")
+        assert rules[0].coalesce_window_seconds == 0
 
         await repo.close()
 
@@ -701,6 +1321,55 @@ class TestMigrations:
 
         assert migrated_count == 0
 
+    async def test_migrate_moves_inline_raw_content_to_blobs(self, tmp_path) -> None:
+        db_path = tmp_path / "test.db"
+        db_url = f"sqlite+aiosqlite:///{db_path}"
+
+        engine = create_async_engine(db_url, echo=False)
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("""
+                CREATE TABLE content_items (
+                    id VARCHAR(36) PRIMARY KEY,
+                    source_id VARCHAR(36) NOT NULL,
+                    external_id VARCHAR(512) NOT NULL UNIQUE,
+                    title VARCHAR(512) NOT NULL,
+                    original_url VARCHAR(1024) NOT NULL,
+                    author VARCHAR(255) NOT NULL,
+                    published_at DATETIME NOT NULL,
+                    raw_content TEXT,
+                    summary TEXT,
+                    thumbnail_url VARCHAR(1024),
+                    posted_to_discord BOOLEAN,
+                    discord_message_id VARCHAR(36),
+                    created_at DATETIME
+                )
+            """)
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO content_items (id, source_id, external_id, title, "
+                    "original_url, author, published_at, raw_content, posted_to_discord, "
+                    "created_at) VALUES ('item-1', 'source-1', 'ext-1', 'Title', "
+                    "'https://example.com', 'Author', '2024-01-01 00:00:00', "
+                    "'Legacy body', 0, '2024-01-01 00:00:00')"
+                )
+            )
+        await engine.dispose()
+
+        repo = Repository(db_url)
+        await repo.initialize()
+
+        async with repo._engine.begin() as conn:
+            result = await conn.execute(text("SELECT raw_content FROM content_items"))
+            assert result.scalar_one() is None
+
+        items = await repo.get_unsummarized_content_items()
+        assert len(items) == 1
+        assert items[0].raw_content == "Legacy body"
+
+        await repo.close()
+
 
 class TestForwardingRuleOperations:
     async def test_add_forwarding_rule(self, repository: Repository) -> None:
@@ -784,7 +1453,7 @@ class TestForwardingRuleOperations:
         other_rules = await repository.get_forwarding_rules_for_guild("guild-other")
         assert len(other_rules) == 1
 
-    async def test_increment_forwarding_count(self, repository: Repository) -> None:
+    async def test_forwarding_count_accumulates(self, repository: Repository) -> None:
         rule = await repository.add_forwarding_rule(
             guild_id="guild-123",
             source_channel_id="source-456",
@@ -796,8 +1465,12 @@ class TestForwardingRuleOperations:
         assert rule.messages_forwarded == 0
         assert rule.last_forwarded_at is None
 
-        await repository.increment_forwarding_count(rule.id)
-        await repository.increment_forwarding_count(rule.id)
+        for _ in range(2):
+            await repository.apply_counter_deltas(
+                forwarding={
+                    rule.id: ForwardingCountDelta(count=1, last_forwarded_at=datetime.now(UTC))
+                }
+            )
 
         rules = await repository.get_forwarding_rules_for_source("source-456")
         assert len(rules) == 1
@@ -853,6 +1526,31 @@ class TestForwardingRuleOperations:
         )
         assert not_found is False
 
+    async def test_set_forwarding_rule_coalesce_window(self, repository: Repository) -> None:
+        await repository.add_forwarding_rule(
+            guild_id="guild-123",
+            source_channel_id="source-456",
+            source_type="channel",
+            destination_channel_id="dest-789",
+            destination_type="channel",
+        )
+
+        rules = await repository.get_forwarding_rules_for_guild("guild-123")
+        assert rules[0].coalesce_window_seconds == 0
+
+        updated = await repository.set_forwarding_rule_coalesce_window(
+            "guild-123", "source-456", "dest-789", 10
+        )
+        assert updated is True
+
+        rules = await repository.get_forwarding_rules_for_guild("guild-123")
+        assert rules[0].coalesce_window_seconds == 10
+
+        not_found = await repository.set_forwarding_rule_coalesce_window(
+            "guild-123", "nonexistent", "dest-789", 10
+        )
+        assert not_found is False
+
 
 class TestGitHubRepoOperations:
     async def test_add_github_repo(self, repository: Repository) -> None:
@@ -1033,6 +1731,38 @@ class TestGitHubRepoOperations:
         assert found.is_active is True
 
 
+class TestSitemapLocations:
+    async def test_set_and_update_location(self, repository: Repository) -> None:
+        checked = datetime(2024, 1, 1, 12, 0, 0)
+        await repository.set_sitemap_location(
+            "https://example.com/blog", "https://example.com/sitemap.xml", "{}", checked_at=checked
+        )
+        await repository.set_sitemap_location(
+            "https://example.com/blog",
+            "https://example.com/sitemap.xml",
+            '{"https://example.com/sitemap-1.xml": null}',
+        )
+
+        location = await repository.get_sitemap_location("https://example.com/blog")
+        assert location is not None
+        assert location.sitemap_url == "https://example.com/sitemap.xml"
+        assert location.sub_sitemaps_json == '{"https://example.com/sitemap-1.xml": null}'
+        assert location.checked_at == checked
+
+    async def test_missing_location_returns_none(self, repository: Repository) -> None:
+        assert await repository.get_sitemap_location("https://example.com/none") is None
+
+    async def test_deleting_source_removes_location(self, repository: Repository) -> None:
+        await repository.add_source(
+            source_type=SourceType.BLOG, name="Blog", identifier="example.com/blog"
+        )
+        await repository.set_sitemap_location("example.com/blog", None, "{}")
+
+        await repository.delete_source("example.com/blog")
+
+        assert await repository.get_sitemap_location("example.com/blog") is None
+
+
 class TestExtractionCacheCleanup:
     async def test_cleanup_removes_old_entries(self, repository: Repository) -> None:
         await repository.set_extraction_cache(
@@ -1082,3 +1812,152 @@ class TestExtractionCacheCleanup:
 
         entry = await repository.get_extraction_cache("https://example.com/fresh")
         assert entry is not None
+
+
+class TestExtractionCacheMemoryTier:
+    async def test_reads_are_served_from_memory(self, repository: Repository) -> None:
+        await repository.set_extraction_cache("https://example.com/blog", "hash1", "[]")
+
+        first = await repository.get_extraction_cache("https://example.com/blog")
+        second = await repository.get_extraction_cache("https://example.com/blog")
+
+        assert first is second
+        assert first is not None
+        assert first.content_hash == "hash1"
+        assert repository.get_cache_stats()["extraction_cache"].hits == 2
+
+    async def test_unchanged_result_is_not_rewritten(self, repository: Repository) -> None:
+        stored = await repository.set_extraction_cache("https://example.com/blog", "hash1", "[]")
+
+        again = await repository.set_extraction_cache("https://example.com/blog", "hash1", "[]")
+        assert again is stored
+        assert again.cached_at == stored.cached_at
+
+        changed = await repository.set_extraction_cache("https://example.com/blog", "hash2", "[]")
+        assert changed.content_hash == "hash2"
+        entry = await repository.get_extraction_cache("https://example.com/blog")
+        assert entry is not None
+        assert entry.content_hash == "hash2"
+
+    async def test_memory_tier_is_size_bounded(self) -> None:
+        repo = Repository("sqlite+aiosqlite:///:memory:", extraction_cache_entries=2)
+        await repo.initialize()
+        for i in range(3):
+            await repo.set_extraction_cache(f"https://example.com/{i}", f"hash{i}", "[]")
+
+        stats = repo.get_cache_stats()["extraction_cache"]
+        assert stats.size == 2
+        assert stats.evictions == 1
+
+        evicted = await repo.get_extraction_cache("https://example.com/0")
+        assert evicted is not None
+        assert evicted.content_hash == "hash0"
+        assert repo.get_cache_stats()["extraction_cache"].misses == stats.misses + 1
+        await repo.close()
+
+
+class TestQueryPlans:
+    """Guard the hot loop queries against regressing to full table scans."""
+
+    @staticmethod
+    async def _plans_for(repository: Repository, call, kind: str = "SELECT") -> list[str]:
+        captured: list[tuple[str, object]] = []
+
+        def capture(_conn, _cursor, statement, parameters, _context, _executemany) -> None:
+            if statement.lstrip().upper().startswith(kind):
+                captured.append((statement, parameters))
+
+        sync_engine = repository._engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", capture)
+        try:
+            await call()
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", capture)
+
+        assert captured, f"no {kind} statements were executed"
+        details: list[str] = []
+        async with repository._engine.connect() as conn:
+            for statement, parameters in captured:
+                result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                details.extend(row[-1] for row in result.all())
+        return details
+
+    @staticmethod
+    def _assert_no_full_scan(details: list[str], *tables: str) -> None:
+        for detail in details:
+            for table in tables:
+                if detail.startswith(f"SCAN {table}"):
+                    assert "USING" in detail, f"full scan of {table}: {details}"
+
+    async def test_indexes_created_on_initialize(self, repository: Repository) -> None:
+        async with repository.session() as session:
+            result = await session.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+            names = {row[0] for row in result.all()}
+
+        assert {
+            "ix_content_items_source_published",
+            "ix_content_items_source_posted",
+            "ix_content_items_unsummarized",
+            "ix_content_items_unposted",
+            "ix_sources_active_last_polled",
+        } <= names
+
+    async def test_indexes_added_to_existing_database(self, tmp_path) -> None:
+        db_url = f"sqlite+aiosqlite:///{tmp_path / 'existing.db'}"
+        repo = Repository(db_url)
+        await repo.initialize()
+        async with repo.session() as session:
+            await session.execute(text("DROP INDEX ix_content_items_unposted"))
+            await session.commit()
+        await repo.close()
+
+        repo = Repository(db_url)
+        await repo.initialize()
+        async with repo.session() as session:
+            result = await session.execute(
+                text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'index' AND name = 'ix_content_items_unposted'"
+                )
+            )
+            assert result.scalar_one_or_none() == "ix_content_items_unposted"
+        await repo.close()
+
+    async def test_unsummarized_query_uses_index(self, repository: Repository) -> None:
+        details = await self._plans_for(
+            repository, lambda: repository.get_unsummarized_content_items(limit=10)
+        )
+        assert any("ix_content_items_unsummarized" in d for d in details), details
+        self._assert_no_full_scan(details, "content_items")
+
+    async def test_unposted_query_uses_index(self, repository: Repository) -> None:
+        details = await self._plans_for(
+            repository, lambda: repository.get_unposted_items_with_destinations(limit=10)
+        )
+        assert any("ix_content_items_unposted" in d for d in details), details
+        self._assert_no_full_scan(details, "content_items", "sources", "discord_config")
+
+    async def test_most_recent_item_for_source_uses_index(self, repository: Repository) -> None:
+        details = await self._plans_for(
+            repository, lambda: repository.get_most_recent_item_for_source("source-id")
+        )
+        assert any("ix_content_items_source_published" in d for d in details), details
+        self._assert_no_full_scan(details, "content_items")
+
+    async def test_first_posting_backfill_uses_index(self, repository: Repository) -> None:
+        details = await self._plans_for(
+            repository,
+            lambda: repository.backfill_first_posting_items({"source-id"}),
+            kind="UPDATE",
+        )
+        assert any("ix_content_items_source_posted" in d for d in details), details
+        self._assert_no_full_scan(details, "content_items")
+
+    async def test_active_sources_query_uses_index(self, repository: Repository) -> None:
+        details = await self._plans_for(
+            repository, lambda: repository.get_all_sources(active_only=True)
+        )
+        assert any("ix_sources_active_last_polled" in d for d in details), details
+        self._assert_no_full_scan(details, "sources")
@@ -4,8 +4,9 @@ import discord
 import pytest
 from discord import app_commands
 
-from intelstream.bot import IntelStreamBot, RestrictedCommandTree, create_bot
+from intelstream.bot import CoreCommands, IntelStreamBot, RestrictedCommandTree, create_bot
 from intelstream.config import Settings
+from intelstream.utils.ttl_cache import CacheStats
 
 
 @pytest.fixture
@@ -156,3 +157,18 @@ class TestRestrictedCommandTreeErrorHandler:
             "Test error message", ephemeral=True
         )
         mock_interaction.followup.send.assert_not_called()
+
+
+class TestCoreCommandsFormatting:
+    def test_format_cache_hit_rates(self) -> None:
+        bot = MagicMock()
+        bot.repository.get_cache_stats.return_value = {
+            "sources_by_id": CacheStats(hits=9, misses=1, size=4),
+            "sources_by_identifier": CacheStats(hits=0, misses=0, size=4),
+            "discord_configs": CacheStats(hits=1, misses=1, size=1),
+            "extraction_cache": CacheStats(hits=0, misses=0, size=0),
+        }
+
+        result = CoreCommands(bot)._format_cache_hit_rates()
+
+        assert result == "sources 90%, configs 50%, extraction 0%"
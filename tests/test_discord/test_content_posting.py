@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import discord
 import pytest
@@ -10,6 +10,7 @@ from intelstream.discord.cogs.content_posting import ContentPosting
 def mock_bot():
     bot = MagicMock()
     bot.repository = MagicMock()
+    bot.webhooks = None
     bot.settings = MagicMock()
     bot.settings.anthropic_api_key = "test-api-key"
     bot.settings.content_poll_interval_minutes = 5
@@ -52,7 +53,7 @@ class TestContentPostingCogLoad:
         )
         mock_pipeline_cls.assert_called_once()
         mock_pipeline.initialize.assert_called_once()
-        mock_poster_cls.assert_called_once_with(mock_bot, max_message_length=2000)
+        mock_poster_cls.assert_called_once_with(mock_bot, max_message_length=2000, webhooks=None)
         assert cog._initialized is True
 
     @patch("intelstream.discord.cogs.content_posting.SummarizationService")
@@ -92,6 +93,29 @@ class TestContentPostingCogUnload:
         mock_pipeline.close.assert_called_once()
         assert cog._initialized is False
 
+    @patch("intelstream.discord.cogs.content_posting.SummarizationService")
+    @patch("intelstream.discord.cogs.content_posting.ContentPipeline")
+    @patch("intelstream.discord.cogs.content_posting.ContentPoster")
+    async def test_cog_unload_closes_poster(
+        self, mock_poster_cls, mock_pipeline_cls, _mock_summarizer_cls, mock_bot
+    ):
+        mock_pipeline = MagicMock()
+        mock_pipeline.initialize = AsyncMock()
+        mock_pipeline.close = AsyncMock()
+        mock_pipeline_cls.return_value = mock_pipeline
+
+        mock_poster = MagicMock()
+        mock_poster.close = AsyncMock()
+        mock_poster_cls.return_value = mock_poster
+
+        cog = ContentPosting(mock_bot)
+        await cog.cog_load()
+
+        await cog.cog_unload()
+
+        mock_poster.close.assert_called_once()
+        mock_pipeline.close.assert_called_once()
+
 
 class TestContentLoop:
     @patch("intelstream.discord.cogs.content_posting.SummarizationService")
@@ -130,7 +154,7 @@ class TestContentLoop:
     @patch("intelstream.discord.cogs.content_posting.SummarizationService")
     @patch("intelstream.discord.cogs.content_posting.ContentPipeline")
     @patch("intelstream.discord.cogs.content_posting.ContentPoster")
-    async def test_content_loop_posts_to_all_guilds(
+    async def test_content_loop_posts_for_all_guilds_in_one_pass(
         self, mock_poster_cls, mock_pipeline_cls, _mock_summarizer_cls, mock_bot
     ):
         mock_pipeline = MagicMock()
@@ -157,9 +181,7 @@ class TestContentLoop:
 
         await cog.content_loop()
 
-        assert mock_poster.post_unposted_items.call_count == 2
-        mock_poster.post_unposted_items.assert_any_call(111)
-        mock_poster.post_unposted_items.assert_any_call(222)
+        mock_poster.post_unposted_items.assert_called_once_with([111, 222], budget=ANY)
 
     @patch("intelstream.discord.cogs.content_posting.SummarizationService")
     @patch("intelstream.discord.cogs.content_posting.ContentPipeline")
@@ -184,7 +206,7 @@ class TestContentLoop:
     @patch("intelstream.discord.cogs.content_posting.SummarizationService")
     @patch("intelstream.discord.cogs.content_posting.ContentPipeline")
     @patch("intelstream.discord.cogs.content_posting.ContentPoster")
-    async def test_content_loop_continues_on_guild_error(
+    async def test_content_loop_survives_posting_error(
         self, mock_poster_cls, mock_pipeline_cls, _mock_summarizer_cls, mock_bot
     ):
         mock_pipeline = MagicMock()
@@ -193,25 +215,23 @@ class TestContentLoop:
         mock_pipeline_cls.return_value = mock_pipeline
 
         mock_poster = MagicMock()
-        mock_poster.post_unposted_items = AsyncMock(side_effect=[Exception("Guild 1 error"), 2])
+        mock_poster.post_unposted_items = AsyncMock(side_effect=Exception("Posting error"))
         mock_poster_cls.return_value = mock_poster
 
         guild1 = MagicMock(spec=discord.Guild)
         guild1.id = 111
         guild1.name = "Guild 1"
 
-        guild2 = MagicMock(spec=discord.Guild)
-        guild2.id = 222
-        guild2.name = "Guild 2"
-
-        mock_bot.guilds = [guild1, guild2]
+        mock_bot.guilds = [guild1]
 
         cog = ContentPosting(mock_bot)
         await cog.cog_load()
 
         await cog.content_loop()
 
-        assert mock_poster.post_unposted_items.call_count == 2
+        mock_poster.post_unposted_items.assert_called_once_with([111], budget=ANY)
+        assert cog._consecutive_failures == 0
+        mock_bot.notify_owner.assert_not_called()
 
 
 class TestContentLoopErrorHandler:
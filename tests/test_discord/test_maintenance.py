@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from intelstream.discord.cogs.maintenance import DatabaseMaintenance
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.repository = MagicMock()
+    bot.settings = MagicMock()
+    bot.settings.maintenance_enabled = True
+    bot.settings.maintenance_interval_hours = 12
+    bot.wait_until_ready = AsyncMock()
+    return bot
+
+
+class TestDatabaseMaintenanceCog:
+    async def test_cog_load_disabled_does_not_start_loop(self, mock_bot):
+        mock_bot.settings.maintenance_enabled = False
+        cog = DatabaseMaintenance(mock_bot)
+
+        with patch.object(cog.maintenance_loop, "start") as start:
+            await cog.cog_load()
+
+        start.assert_not_called()
+        assert cog._service is None
+
+    async def test_cog_load_uses_configured_interval(self, mock_bot):
+        cog = DatabaseMaintenance(mock_bot)
+
+        with patch.object(cog.maintenance_loop, "start") as start:
+            await cog.cog_load()
+
+        start.assert_called_once()
+        assert cog.maintenance_loop.hours == 12
+
+    async def test_loop_stores_last_report(self, mock_bot):
+        cog = DatabaseMaintenance(mock_bot)
+        report = MagicMock()
+        cog._service = MagicMock()
+        cog._service.run = AsyncMock(return_value=report)
+
+        await cog.maintenance_loop()
+
+        assert cog.last_report is report
+
+    async def test_loop_swallows_errors(self, mock_bot):
+        cog = DatabaseMaintenance(mock_bot)
+        cog._service = MagicMock()
+        cog._service.run = AsyncMock(side_effect=Exception("database is locked"))
+
+        await cog.maintenance_loop()
+
+        assert cog.last_report is None
+
+    async def test_first_run_waits_one_interval(self, mock_bot):
+        cog = DatabaseMaintenance(mock_bot)
+
+        with patch("intelstream.discord.cogs.maintenance.asyncio.sleep", new=AsyncMock()) as sleep:
+            await cog.before_maintenance_loop()
+
+        mock_bot.wait_until_ready.assert_awaited_once()
+        sleep.assert_awaited_once_with(12 * 3600)
+
+    async def test_fresh_start_does_not_run_maintenance(self, mock_bot):
+        cog = DatabaseMaintenance(mock_bot)
+        await cog.cog_load()
+        cog._service = MagicMock()
+        cog._service.run = AsyncMock()
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        cog._service.run.assert_not_called()
+        await cog.cog_unload()
@@ -4,12 +4,18 @@ import discord
 import pytest
 
 from intelstream.discord.cogs.message_forwarding import MessageForwarding
+from intelstream.services.forwarding_index import RuleRecord
 
 
 @pytest.fixture
 def mock_bot():
     bot = MagicMock()
     bot.repository = MagicMock()
+    bot.repository.get_forwarding_rules_for_source = AsyncMock(return_value=[])
+    bot.webhooks = None
+    bot.counters = MagicMock()
+    bot.settings.forward_coalesce_max_messages = 50
+    bot.counters.flush = AsyncMock()
     bot.guilds = []
     bot.user = MagicMock()
     bot.user.id = 999
@@ -17,6 +23,17 @@ def mock_bot():
     return bot
 
 
+def make_rule(rule_id: str, destination: str, window: int = 0, source: str = "111"):
+    rule = MagicMock()
+    rule.id = rule_id
+    rule.source_channel_id = source
+    rule.destination_channel_id = destination
+    rule.destination_type = "channel"
+    rule.is_active = True
+    rule.coalesce_window_seconds = window
+    return rule
+
+
 @pytest.fixture
 def cog(mock_bot):
     return MessageForwarding(mock_bot)
@@ -398,6 +415,42 @@ class TestForwardPauseResume:
         assert "No forwarding rule found" in call_args[0][0]
 
 
+class TestForwardCoalesce:
+    async def test_forward_coalesce_sets_window(self, cog, mock_bot):
+        interaction = MagicMock(spec=discord.Interaction)
+        interaction.response = MagicMock()
+        interaction.response.defer = AsyncMock()
+        interaction.followup = MagicMock()
+        interaction.followup.send = AsyncMock()
+        interaction.user = MagicMock()
+        interaction.user.id = 123
+        interaction.guild_id = 456
+        interaction.guild = MagicMock(spec=discord.Guild)
+
+        mock_source = MagicMock(spec=discord.TextChannel)
+        mock_source.id = 111
+        mock_source.mention = "#source"
+
+        mock_dest = MagicMock(spec=discord.TextChannel)
+        mock_dest.id = 222
+        mock_dest.mention = "#dest"
+
+        mock_bot.repository.set_forwarding_rule_coalesce_window = AsyncMock(return_value=True)
+        mock_bot.repository.get_forwarding_rules_for_guild = AsyncMock(return_value=[])
+
+        await cog.forward_coalesce.callback(
+            cog, interaction, source=mock_source, destination=mock_dest, seconds=10
+        )
+
+        mock_bot.repository.set_forwarding_rule_coalesce_window.assert_called_once_with(
+            guild_id="456",
+            source_channel_id="111",
+            destination_channel_id="222",
+            window_seconds=10,
+        )
+        assert "10s" in interaction.followup.send.call_args[0][0]
+
+
 class TestOnMessage:
     async def test_on_message_forwards_to_matching_rule(self, cog, mock_bot):
         mock_rule = MagicMock()
@@ -405,12 +458,12 @@ class TestOnMessage:
         mock_rule.destination_channel_id = "222"
         mock_rule.destination_type = "channel"
         mock_rule.is_active = True
+        mock_rule.coalesce_window_seconds = 0
 
-        cog._rules_cache = {"111": [mock_rule]}
+        cog.rules.replace_channel("111", [mock_rule])
 
         mock_forwarded = MagicMock(spec=discord.Message)
-        cog.forwarder.forward_message = AsyncMock(return_value=mock_forwarded)
-        mock_bot.repository.increment_forwarding_count = AsyncMock()
+        cog.forwarder.forward_to_destinations = AsyncMock(return_value=[mock_forwarded])
 
         mock_other_user = MagicMock()
         mock_other_user.id = 123
@@ -423,16 +476,12 @@ class TestOnMessage:
 
         await cog.on_message(message)
 
-        cog.forwarder.forward_message.assert_called_once_with(
-            message=message,
-            destination_id=222,
-            destination_type="channel",
-        )
-        mock_bot.repository.increment_forwarding_count.assert_called_once_with("rule-123")
+        cog.forwarder.forward_to_destinations.assert_called_once_with(message, [(222, "channel")])
+        mock_bot.counters.increment_forwarding.assert_called_once_with("rule-123")
 
     async def test_on_message_ignores_bot_messages(self, cog, mock_bot):
-        cog._rules_cache = {"111": [MagicMock()]}
-        cog.forwarder.forward_message = AsyncMock()
+        cog.rules.replace_channel("111", [make_rule("rule-1", "222")])
+        cog.forwarder.forward_to_destinations = AsyncMock()
 
         message = MagicMock(spec=discord.Message)
         message.author = mock_bot.user
@@ -442,11 +491,11 @@ class TestOnMessage:
 
         await cog.on_message(message)
 
-        cog.forwarder.forward_message.assert_not_called()
+        cog.forwarder.forward_to_destinations.assert_not_called()
 
     async def test_on_message_ignores_dms(self, cog):
-        cog._rules_cache = {"111": [MagicMock()]}
-        cog.forwarder.forward_message = AsyncMock()
+        cog.rules.replace_channel("111", [make_rule("rule-1", "222")])
+        cog.forwarder.forward_to_destinations = AsyncMock()
 
         message = MagicMock(spec=discord.Message)
         message.author = MagicMock()
@@ -456,11 +505,10 @@ class TestOnMessage:
 
         await cog.on_message(message)
 
-        cog.forwarder.forward_message.assert_not_called()
+        cog.forwarder.forward_to_destinations.assert_not_called()
 
     async def test_on_message_no_matching_rules(self, cog):
-        cog._rules_cache = {}
-        cog.forwarder.forward_message = AsyncMock()
+        cog.forwarder.forward_to_destinations = AsyncMock()
 
         message = MagicMock(spec=discord.Message)
         message.author = MagicMock()
@@ -470,17 +518,55 @@ class TestOnMessage:
 
         await cog.on_message(message)
 
-        cog.forwarder.forward_message.assert_not_called()
+        cog.forwarder.forward_to_destinations.assert_not_called()
 
     async def test_on_message_does_not_increment_on_failure(self, cog, mock_bot):
         mock_rule = MagicMock()
         mock_rule.id = "rule-123"
         mock_rule.destination_channel_id = "222"
         mock_rule.destination_type = "channel"
+        mock_rule.is_active = True
+        mock_rule.coalesce_window_seconds = 0
+
+        cog.rules.replace_channel("111", [mock_rule])
+        cog.forwarder.forward_to_destinations = AsyncMock(return_value=[None])
+
+        message = MagicMock(spec=discord.Message)
+        message.author = MagicMock()
+        message.guild = MagicMock()
+        message.channel = MagicMock()
+        message.channel.id = 111
+
+        await cog.on_message(message)
+
+        mock_bot.counters.increment_forwarding.assert_not_called()
+
+    async def test_on_message_fans_out_to_all_rules_in_one_call(self, cog, mock_bot):
+        cog.rules.replace_channel("111", [make_rule("rule-1", "222"), make_rule("rule-2", "333")])
+        cog.forwarder.forward_to_destinations = AsyncMock(
+            return_value=[MagicMock(spec=discord.Message), None]
+        )
+
+        message = MagicMock(spec=discord.Message)
+        message.author = MagicMock()
+        message.guild = MagicMock()
+        message.channel = MagicMock()
+        message.channel.id = 111
+
+        await cog.on_message(message)
 
-        cog._rules_cache = {"111": [mock_rule]}
-        cog.forwarder.forward_message = AsyncMock(return_value=None)
-        mock_bot.repository.increment_forwarding_count = AsyncMock()
+        cog.forwarder.forward_to_destinations.assert_called_once_with(
+            message, [(222, "channel"), (333, "channel")]
+        )
+        mock_bot.counters.increment_forwarding.assert_called_once_with("rule-1")
+
+    async def test_on_message_buffers_coalesced_rules(self, cog):
+        coalesced = make_rule("rule-1", "222", window=5)
+        immediate = make_rule("rule-2", "333")
+
+        cog.rules.replace_channel("111", [coalesced, immediate])
+        cog.coalescer.add = MagicMock()
+        cog.forwarder.forward_to_destinations = AsyncMock(return_value=[MagicMock()])
 
         message = MagicMock(spec=discord.Message)
         message.author = MagicMock()
@@ -490,7 +576,8 @@ class TestOnMessage:
 
         await cog.on_message(message)
 
-        mock_bot.repository.increment_forwarding_count.assert_not_called()
+        cog.coalescer.add.assert_called_once_with(RuleRecord.from_rule(coalesced), message)
+        cog.forwarder.forward_to_destinations.assert_called_once_with(message, [(333, "channel")])
 
 
 class TestCacheRefresh:
@@ -507,8 +594,7 @@ class TestCacheRefresh:
 
         await cog._refresh_cache()
 
-        assert "111" in cog._rules_cache
-        assert len(cog._rules_cache["111"]) == 1
+        assert len(cog.rules.rules_for("111")) == 1
 
     async def test_refresh_cache_excludes_inactive_rules(self, cog, mock_bot):
         mock_rule = MagicMock()
@@ -523,4 +609,17 @@ class TestCacheRefresh:
 
         await cog._refresh_cache()
 
-        assert "111" not in cog._rules_cache
+        assert cog.rules.rules_for("111") == ()
+
+    async def test_command_reloads_only_its_source_channel(self, cog, mock_bot):
+        cog.rules.rebuild([make_rule("rule-1", "222"), make_rule("rule-2", "333", source="444")])
+        untouched = cog.rules.rules_for("444")
+        mock_bot.repository.get_forwarding_rules_for_source = AsyncMock(
+            return_value=[make_rule("rule-3", "555")]
+        )
+
+        await cog._reload_source("111")
+
+        mock_bot.repository.get_forwarding_rules_for_source.assert_awaited_once_with("111")
+        assert [rule.id for rule in cog.rules.rules_for("111")] == ["rule-3"]
+        assert cog.rules.rules_for("444") is untouched
@@ -0,0 +1,105 @@
+import pytest
+
+from intelstream.database.seen_index import BloomFilter, SeenIdIndex
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self) -> None:
+        bloom = BloomFilter(capacity=1000)
+        values = [f"https://example.com/post/{i}" for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+
+        assert all(value in bloom for value in values)
+
+    def test_false_positive_rate_near_target(self) -> None:
+        bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+        for i in range(10_000):
+            bloom.add(f"seen-{i}")
+
+        false_positives = sum(f"unseen-{i}" in bloom for i in range(10_000))
+
+        assert false_positives < 200
+
+    def test_memory_is_compact(self) -> None:
+        bloom = BloomFilter(capacity=1_000_000, error_rate=0.01)
+
+        assert bloom.memory_bytes < 1_300_000
+
+    def test_rejects_invalid_parameters(self) -> None:
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=10, error_rate=1.5)
+
+
+class TestSeenIdIndex:
+    def test_unknown_id_is_definitely_new(self) -> None:
+        index = SeenIdIndex(capacity=100)
+
+        assert index.lookup("new-id") is False
+        assert index.bloom_negatives == 1
+
+    def test_added_id_is_known(self) -> None:
+        index = SeenIdIndex(capacity=100)
+        index.add("item-1")
+
+        assert index.lookup("item-1") is True
+        assert index.recent_hits == 1
+
+    def test_loaded_id_needs_database_check(self) -> None:
+        index = SeenIdIndex(capacity=100)
+        index.load("item-1")
+
+        assert index.lookup("item-1") is None
+        assert index.db_checks == 1
+
+        index.remember("item-1")
+        assert index.lookup("item-1") is True
+
+    def test_recent_set_is_bounded(self) -> None:
+        index = SeenIdIndex(capacity=100, recent_size=2)
+        for external_id in ("a", "b", "c"):
+            index.add(external_id)
+
+        stats = index.get_stats()
+        assert stats.recent_ids == 2
+        assert index.lookup("a") is None
+        assert index.lookup("c") is True
+
+    def test_forget_falls_back_to_database(self) -> None:
+        index = SeenIdIndex(capacity=100)
+        index.add("item-1")
+        index.forget("item-1")
+
+        assert index.lookup("item-1") is None
+        assert index.get_stats().recent_memory_bytes == 0
+
+    def test_forget_unknown_id_keeps_memory_accounting(self) -> None:
+        index = SeenIdIndex(capacity=100)
+        index.add("item-1")
+        before = index.get_stats().recent_memory_bytes
+
+        index.forget("item-2")
+
+        assert index.get_stats().recent_memory_bytes == before
+        assert index.lookup("item-1") is True
+
+    def test_over_capacity(self) -> None:
+        index = SeenIdIndex(capacity=2)
+        index.add("a")
+        index.add("b")
+        assert not index.over_capacity
+
+        index.add("c")
+        assert index.over_capacity
+
+    def test_stats_report_memory(self) -> None:
+        index = SeenIdIndex(capacity=1000)
+        index.add("item-1")
+
+        stats = index.get_stats()
+        assert stats.ids_loaded == 1
+        assert stats.bloom_memory_bytes > 0
+        assert stats.recent_memory_bytes > 0
+        assert stats.memory_bytes == stats.bloom_memory_bytes + stats.recent_memory_bytes
@@ -0,0 +1,56 @@
+import time
+
+from intelstream.services.backlog import DrainBudget, estimate_drain_minutes
+
+
+class TestDrainBudget:
+    def test_page_size_uses_minimum_for_small_backlog(self):
+        budget = DrainBudget(max_items=100, deadline_seconds=60, min_page_size=10)
+
+        assert budget.page_size(0) == 10
+        assert budget.page_size(50) == 10
+
+    def test_page_size_grows_with_backlog(self):
+        budget = DrainBudget(max_items=1000, deadline_seconds=60, min_page_size=10)
+
+        assert budget.page_size(300) == 30
+        assert budget.page_size(800) == 80
+
+    def test_page_size_capped_at_maximum(self):
+        budget = DrainBudget(
+            max_items=1000, deadline_seconds=60, min_page_size=10, max_page_size=50
+        )
+
+        assert budget.page_size(10_000) == 50
+
+    def test_page_size_limited_by_remaining_items(self):
+        budget = DrainBudget(max_items=25, deadline_seconds=60, min_page_size=10)
+        budget.consume(20)
+
+        assert budget.remaining_items == 5
+        assert budget.page_size(1000) == 5
+
+    def test_exhausted_when_items_spent(self):
+        budget = DrainBudget(max_items=10, deadline_seconds=60)
+
+        assert not budget.exhausted
+        budget.consume(10)
+        assert budget.exhausted
+        assert budget.page_size(100) == 0
+
+    def test_exhausted_when_deadline_passed(self):
+        budget = DrainBudget(max_items=100, deadline_seconds=30, started_at=time.monotonic() - 31)
+
+        assert budget.expired
+        assert budget.exhausted
+
+
+class TestEstimateDrainMinutes:
+    def test_empty_backlog(self):
+        assert estimate_drain_minutes(0, 0, 5) == 0
+
+    def test_unknown_without_throughput(self):
+        assert estimate_drain_minutes(10, 0, 5) is None
+
+    def test_rounds_up_to_whole_cycles(self):
+        assert estimate_drain_minutes(250, 100, 5) == 15
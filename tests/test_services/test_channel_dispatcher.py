@@ -0,0 +1,132 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from intelstream.services.channel_dispatcher import ChannelDispatcher
+
+
+def make_message(message_id: int) -> MagicMock:
+    message = MagicMock(spec=discord.Message)
+    message.id = message_id
+    return message
+
+
+@pytest.fixture
+def dispatcher():
+    return ChannelDispatcher()
+
+
+class TestChannelDispatcher:
+    async def test_preserves_order_within_channel(self, dispatcher):
+        sent: list[str] = []
+
+        def make_send(key: str, delay: float):
+            async def send():
+                await asyncio.sleep(delay)
+                sent.append(key)
+                return make_message(len(sent))
+
+            return send
+
+        futures = [
+            dispatcher.submit(1, "a", make_send("a", 0.03)),
+            dispatcher.submit(1, "b", make_send("b", 0.0)),
+            dispatcher.submit(1, "c", make_send("c", 0.01)),
+        ]
+        results = await asyncio.gather(*futures)
+
+        assert sent == ["a", "b", "c"]
+        assert [r.key for r in results] == ["a", "b", "c"]
+
+    async def test_blocked_channel_does_not_block_others(self, dispatcher):
+        release = asyncio.Event()
+
+        async def blocked_send():
+            await release.wait()
+            return make_message(1)
+
+        async def fast_send():
+            return make_message(2)
+
+        blocked = dispatcher.submit(1, "slow", blocked_send)
+        fast = dispatcher.submit(2, "fast", fast_send)
+
+        result = await asyncio.wait_for(fast, timeout=1.0)
+        assert result.message.id == 2
+        assert not blocked.done()
+
+        release.set()
+        blocked_result = await blocked
+        assert blocked_result.message.id == 1
+
+    async def test_send_error_is_captured_in_result(self, dispatcher):
+        async def failing_send():
+            raise RuntimeError("boom")
+
+        async def ok_send():
+            return make_message(5)
+
+        failed = dispatcher.submit(1, "bad", failing_send)
+        ok = dispatcher.submit(1, "good", ok_send)
+
+        failed_result, ok_result = await asyncio.gather(failed, ok)
+
+        assert failed_result.message is None
+        assert isinstance(failed_result.error, RuntimeError)
+        assert ok_result.message.id == 5
+
+    async def test_stats_track_sends_failures_and_wait(self, dispatcher):
+        async def slow_send():
+            await asyncio.sleep(0.02)
+            return make_message(1)
+
+        async def failing_send():
+            raise RuntimeError("boom")
+
+        futures = [
+            dispatcher.submit(7, "a", slow_send),
+            dispatcher.submit(7, "b", slow_send),
+            dispatcher.submit(7, "c", failing_send),
+        ]
+        assert dispatcher.queue_depth == 3
+
+        await asyncio.gather(*futures)
+
+        stats = dispatcher.get_stats()[7]
+        assert stats.sent == 2
+        assert stats.failed == 1
+        assert stats.queue_depth == 0
+        assert stats.max_wait_seconds >= 0.02
+        assert stats.avg_wait_seconds > 0
+        assert dispatcher.queue_depth == 0
+
+    async def test_worker_exits_when_queue_drained(self, dispatcher):
+        async def send():
+            return make_message(1)
+
+        await dispatcher.submit(1, "a", send)
+        await asyncio.sleep(0)
+
+        assert dispatcher._workers == {}
+
+        result = await dispatcher.submit(1, "b", send)
+        assert result.message is not None
+
+    async def test_close_cancels_pending_jobs(self, dispatcher):
+        release = asyncio.Event()
+
+        async def blocked_send():
+            await release.wait()
+            return make_message(1)
+
+        first = dispatcher.submit(1, "a", blocked_send)
+        second = dispatcher.submit(1, "b", blocked_send)
+        await asyncio.sleep(0)
+
+        await dispatcher.close()
+
+        assert first.cancelled()
+        assert second.cancelled()
+        assert dispatcher.queue_depth == 0
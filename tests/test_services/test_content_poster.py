@@ -1,3 +1,4 @@
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
@@ -5,6 +6,7 @@ import discord
 import pytest
 
 from intelstream.database.models import ContentItem, SourceType
+from intelstream.services.backlog import DrainBudget
 from intelstream.services.content_poster import (
     SOURCE_TYPE_LABELS,
     TRUNCATION_NOTICE,
@@ -171,6 +173,44 @@ class TestContentPosterPostContent:
         assert isinstance(call_kwargs["content"], str)
         assert result == mock_message
 
+    async def test_post_content_uses_webhook_when_enabled(self, mock_bot, sample_content_item):
+        webhooks = MagicMock()
+        webhook_message = MagicMock(spec=discord.Message)
+        webhook_message.id = 999
+        webhooks.send = AsyncMock(return_value=webhook_message)
+        poster = ContentPoster(mock_bot, webhooks=webhooks)
+        mock_channel = MagicMock(spec=discord.TextChannel)
+        mock_channel.send = AsyncMock()
+
+        result = await poster.post_content(
+            channel=mock_channel,
+            content_item=sample_content_item,
+            source_type=SourceType.SUBSTACK,
+            source_name="Test",
+        )
+
+        assert result == webhook_message
+        webhooks.send.assert_awaited_once()
+        mock_channel.send.assert_not_called()
+
+    async def test_post_content_falls_back_without_webhook(self, mock_bot, sample_content_item):
+        webhooks = MagicMock()
+        webhooks.send = AsyncMock(return_value=None)
+        poster = ContentPoster(mock_bot, webhooks=webhooks)
+        mock_channel = MagicMock(spec=discord.TextChannel)
+        mock_message = MagicMock(spec=discord.Message)
+        mock_message.id = 12345
+        mock_channel.send = AsyncMock(return_value=mock_message)
+
+        result = await poster.post_content(
+            channel=mock_channel,
+            content_item=sample_content_item,
+            source_type=SourceType.SUBSTACK,
+            source_name="Test",
+        )
+
+        assert result == mock_message
+
     async def test_post_content_message_contains_item_info(
         self, content_poster, sample_content_item
     ):
@@ -248,143 +288,128 @@ class TestContentPosterPostContent:
         assert sample_content_item.summary in call_kwargs["content"]
 
 
+def make_source(
+    name: str = "Test Source",
+    guild_id: str | None = "123",
+    channel_id: str | None = "456",
+    source_type: SourceType = SourceType.SUBSTACK,
+) -> MagicMock:
+    source = MagicMock()
+    source.id = f"{name}-id"
+    source.type = source_type
+    source.name = name
+    source.skip_summary = False
+    source.guild_id = guild_id
+    source.channel_id = channel_id
+    return source
+
+
+def make_channel(message_id: int = 789) -> MagicMock:
+    channel = MagicMock(spec=discord.TextChannel)
+    message = MagicMock(spec=discord.Message)
+    message.id = message_id
+    channel.send = AsyncMock(return_value=message)
+    return channel
+
+
 class TestContentPosterPostUnpostedItems:
     async def test_returns_zero_when_no_items(self, content_poster, mock_bot):
-        mock_bot.repository.get_unposted_content_items = AsyncMock(return_value=[])
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(return_value=[])
 
-        result = await content_poster.post_unposted_items(guild_id=123)
+        result = await content_poster.post_unposted_items([123])
 
         assert result == 0
 
     async def test_posts_to_source_channel(self, content_poster, mock_bot, sample_content_item):
-        mock_channel = MagicMock(spec=discord.TextChannel)
-        mock_message = MagicMock(spec=discord.Message)
-        mock_message.id = 789
-        mock_channel.send = AsyncMock(return_value=mock_message)
-        mock_bot.get_channel = MagicMock(return_value=mock_channel)
-
-        mock_bot.repository.get_unposted_content_items = AsyncMock(
-            return_value=[sample_content_item]
-        )
-
-        mock_source = MagicMock()
-        mock_source.type = SourceType.SUBSTACK
-        mock_source.name = "Test Source"
-        mock_source.skip_summary = False
-        mock_source.guild_id = "123"
-        mock_source.channel_id = "456"
-        mock_bot.repository.get_sources_by_ids = AsyncMock(
-            return_value={sample_content_item.source_id: mock_source}
+        mock_bot.get_channel = MagicMock(return_value=make_channel(789))
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, make_source(), None)]
         )
-        mock_bot.repository.mark_content_item_posted = AsyncMock()
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
 
-        result = await content_poster.post_unposted_items(guild_id=123)
+        result = await content_poster.post_unposted_items([123])
 
         assert result == 1
         mock_bot.get_channel.assert_called_with(456)
-        mock_bot.repository.mark_content_item_posted.assert_called_once_with(
-            content_id=sample_content_item.id,
-            discord_message_id="789",
+        mock_bot.repository.mark_content_items_posted.assert_called_once_with(
+            [(sample_content_item.id, "789")]
         )
 
     async def test_falls_back_to_guild_config_when_no_source_channel(
         self, content_poster, mock_bot, sample_content_item
     ):
-        mock_config = MagicMock()
-        mock_config.is_active = True
-        mock_config.channel_id = "999"
-        mock_bot.repository.get_discord_config = AsyncMock(return_value=mock_config)
-
-        mock_channel = MagicMock(spec=discord.TextChannel)
-        mock_message = MagicMock(spec=discord.Message)
-        mock_message.id = 789
-        mock_channel.send = AsyncMock(return_value=mock_message)
-        mock_bot.get_channel = MagicMock(return_value=mock_channel)
-
-        mock_bot.repository.get_unposted_content_items = AsyncMock(
-            return_value=[sample_content_item]
-        )
-
-        mock_source = MagicMock()
-        mock_source.type = SourceType.SUBSTACK
-        mock_source.name = "Test Source"
-        mock_source.skip_summary = False
-        mock_source.guild_id = None
-        mock_source.channel_id = None
-        mock_bot.repository.get_sources_by_ids = AsyncMock(
-            return_value={sample_content_item.source_id: mock_source}
+        mock_bot.repository.get_discord_configs_for_guilds = AsyncMock()
+        mock_bot.get_channel = MagicMock(return_value=make_channel())
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, make_source(channel_id=None), "999")]
         )
-        mock_bot.repository.mark_content_item_posted = AsyncMock()
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
 
-        result = await content_poster.post_unposted_items(guild_id=123)
+        result = await content_poster.post_unposted_items([123])
 
         assert result == 1
         mock_bot.get_channel.assert_called_with(999)
+        mock_bot.repository.get_discord_configs_for_guilds.assert_not_called()
 
-    async def test_skips_item_from_different_guild(
+    async def test_legacy_source_uses_first_guild_with_active_config(
         self, content_poster, mock_bot, sample_content_item
     ):
-        mock_bot.repository.get_unposted_content_items = AsyncMock(
-            return_value=[sample_content_item]
+        inactive = MagicMock()
+        inactive.is_active = False
+        inactive.channel_id = "111"
+        active = MagicMock()
+        active.is_active = True
+        active.channel_id = "222"
+        mock_bot.repository.get_discord_configs_for_guilds = AsyncMock(
+            return_value={"1": inactive, "2": active}
         )
+        mock_bot.get_channel = MagicMock(return_value=make_channel())
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, make_source(guild_id=None, channel_id=None), None)]
+        )
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
+
+        result = await content_poster.post_unposted_items([1, 2])
 
-        mock_source = MagicMock()
-        mock_source.type = SourceType.SUBSTACK
-        mock_source.name = "Test Source"
-        mock_source.skip_summary = False
-        mock_source.guild_id = "999"
-        mock_source.channel_id = "456"
-        mock_bot.repository.get_sources_by_ids = AsyncMock(
-            return_value={sample_content_item.source_id: mock_source}
+        assert result == 1
+        mock_bot.get_channel.assert_called_with(222)
+        mock_bot.repository.get_discord_configs_for_guilds.assert_called_once_with(["1", "2"])
+
+    async def test_skips_item_from_guild_bot_is_not_in(
+        self, content_poster, mock_bot, sample_content_item
+    ):
+        mock_bot.get_channel = MagicMock()
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, make_source(guild_id="999"), None)]
         )
 
-        result = await content_poster.post_unposted_items(guild_id=123)
+        result = await content_poster.post_unposted_items([123])
 
         assert result == 0
+        mock_bot.get_channel.assert_not_called()
 
     async def test_skips_when_no_channel_and_no_config(
         self, content_poster, mock_bot, sample_content_item
     ):
-        mock_bot.repository.get_discord_config = AsyncMock(return_value=None)
-
-        mock_bot.repository.get_unposted_content_items = AsyncMock(
-            return_value=[sample_content_item]
-        )
-
-        mock_source = MagicMock()
-        mock_source.type = SourceType.SUBSTACK
-        mock_source.name = "Test Source"
-        mock_source.skip_summary = False
-        mock_source.guild_id = None
-        mock_source.channel_id = None
-        mock_bot.repository.get_sources_by_ids = AsyncMock(
-            return_value={sample_content_item.source_id: mock_source}
+        mock_bot.get_channel = MagicMock()
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, make_source(channel_id=None), None)]
         )
 
-        result = await content_poster.post_unposted_items(guild_id=123)
+        result = await content_poster.post_unposted_items([123])
 
         assert result == 0
+        mock_bot.get_channel.assert_not_called()
 
     async def test_skips_when_channel_not_found(
         self, content_poster, mock_bot, sample_content_item
     ):
         mock_bot.get_channel = MagicMock(return_value=None)
-
-        mock_bot.repository.get_unposted_content_items = AsyncMock(
-            return_value=[sample_content_item]
-        )
-
-        mock_source = MagicMock()
-        mock_source.type = SourceType.SUBSTACK
-        mock_source.name = "Test Source"
-        mock_source.skip_summary = False
-        mock_source.guild_id = "123"
-        mock_source.channel_id = "456"
-        mock_bot.repository.get_sources_by_ids = AsyncMock(
-            return_value={sample_content_item.source_id: mock_source}
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, make_source(), None)]
         )
 
-        result = await content_poster.post_unposted_items(guild_id=123)
+        result = await content_poster.post_unposted_items([123])
 
         assert result == 0
 
@@ -396,36 +421,206 @@ class TestContentPosterPostUnpostedItems:
             side_effect=discord.HTTPException(mock_response, "Server Error")
         )
         mock_bot.get_channel = MagicMock(return_value=mock_channel)
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, make_source(), None)]
+        )
+
+        result = await content_poster.post_unposted_items([123])
 
-        mock_bot.repository.get_unposted_content_items = AsyncMock(
-            return_value=[sample_content_item]
+        assert result == 0
+
+    async def test_failing_guild_does_not_stop_other_guilds(
+        self, content_poster, mock_bot, sample_content_item
+    ):
+        second_item = MagicMock(spec=ContentItem)
+        second_item.id = "second-item-id"
+        second_item.title = "Second Article"
+        second_item.summary = "Second summary."
+        second_item.original_url = "https://example.com/second"
+        second_item.author = "Other Author"
+
+        forbidden_response = MagicMock()
+        forbidden_response.status = 403
+        forbidden_channel = MagicMock(spec=discord.TextChannel)
+        forbidden_channel.send = AsyncMock(
+            side_effect=discord.Forbidden(forbidden_response, "Missing Access")
+        )
+        working_channel = make_channel(790)
+
+        def get_channel(channel_id):
+            if channel_id == 455:
+                raise RuntimeError("channel cache unavailable")
+            return {456: forbidden_channel, 457: working_channel}[channel_id]
+
+        third_item = MagicMock(spec=ContentItem)
+        third_item.id = "third-item-id"
+        third_item.title = "Third Article"
+
+        mock_bot.get_channel = MagicMock(side_effect=get_channel)
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[
+                (third_item, make_source("Broken", guild_id="1", channel_id="455"), None),
+                (
+                    sample_content_item,
+                    make_source("Forbidden", guild_id="2", channel_id="456"),
+                    None,
+                ),
+                (second_item, make_source("Working", guild_id="3", channel_id="457"), None),
+            ]
         )
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
+
+        result = await content_poster.post_unposted_items([1, 2, 3])
 
-        mock_source = MagicMock()
-        mock_source.type = SourceType.SUBSTACK
-        mock_source.name = "Test Source"
-        mock_source.skip_summary = False
-        mock_source.guild_id = "123"
-        mock_source.channel_id = "456"
-        mock_bot.repository.get_sources_by_ids = AsyncMock(
-            return_value={sample_content_item.source_id: mock_source}
+        assert result == 1
+        working_channel.send.assert_called_once()
+        mock_bot.repository.mark_content_items_posted.assert_called_once_with(
+            [(second_item.id, "790")]
         )
 
-        result = await content_poster.post_unposted_items(guild_id=123)
+    async def test_legacy_channel_lookup_failure_does_not_stop_posting(
+        self, content_poster, mock_bot, sample_content_item
+    ):
+        legacy_item = MagicMock(spec=ContentItem)
+        legacy_item.id = "legacy-item-id"
+        legacy_item.title = "Legacy Article"
 
-        assert result == 0
+        mock_bot.repository.get_discord_configs_for_guilds = AsyncMock(
+            side_effect=RuntimeError("database is locked")
+        )
+        mock_bot.get_channel = MagicMock(return_value=make_channel())
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[
+                (legacy_item, make_source("Legacy", guild_id=None, channel_id=None), None),
+                (sample_content_item, make_source(), None),
+            ]
+        )
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
+
+        result = await content_poster.post_unposted_items([123])
+
+        assert result == 1
+        mock_bot.repository.mark_content_items_posted.assert_called_once_with(
+            [(sample_content_item.id, "789")]
+        )
+
+    async def test_resolves_each_channel_once(self, content_poster, mock_bot, sample_content_item):
+        second_item = MagicMock(spec=ContentItem)
+        second_item.id = "second-item-id"
+        second_item.title = "Second Article"
+        second_item.summary = "Second summary."
+        second_item.original_url = "https://example.com/second"
+        second_item.author = "Other Author"
+
+        channel = make_channel()
+        mock_bot.get_channel = MagicMock(return_value=channel)
+        source = make_source()
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, source, None), (second_item, source, None)]
+        )
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
+
+        result = await content_poster.post_unposted_items([123])
+
+        assert result == 2
+        mock_bot.get_channel.assert_called_once_with(456)
+        assert channel.send.call_count == 2
 
-    async def test_skips_item_when_source_not_found(
+    async def test_posts_channels_concurrently_and_marks_in_batch(
         self, content_poster, mock_bot, sample_content_item
     ):
-        mock_bot.repository.get_unposted_content_items = AsyncMock(
-            return_value=[sample_content_item]
+        second_item = MagicMock(spec=ContentItem)
+        second_item.id = "second-item-id"
+        second_item.title = "Second Article"
+        second_item.summary = "Second summary."
+        second_item.original_url = "https://example.com/second"
+        second_item.author = "Other Author"
+
+        release = asyncio.Event()
+        slow_message = MagicMock(spec=discord.Message)
+        slow_message.id = 1
+        fast_message = MagicMock(spec=discord.Message)
+        fast_message.id = 2
+
+        async def slow_send(**_kwargs):
+            await release.wait()
+            return slow_message
+
+        async def fast_send(**_kwargs):
+            release.set()
+            return fast_message
+
+        slow_channel = MagicMock(spec=discord.TextChannel)
+        slow_channel.send = AsyncMock(side_effect=slow_send)
+        fast_channel = MagicMock(spec=discord.TextChannel)
+        fast_channel.send = AsyncMock(side_effect=fast_send)
+        mock_bot.get_channel = MagicMock(
+            side_effect=lambda cid: {456: slow_channel, 457: fast_channel}[cid]
         )
-        mock_bot.repository.get_sources_by_ids = AsyncMock(return_value={})
 
-        result = await content_poster.post_unposted_items(guild_id=123)
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[
+                (sample_content_item, make_source("Slow Source", channel_id="456"), None),
+                (
+                    second_item,
+                    make_source("Fast Source", channel_id="457", source_type=SourceType.RSS),
+                    None,
+                ),
+            ]
+        )
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
 
-        assert result == 0
+        result = await asyncio.wait_for(content_poster.post_unposted_items([123]), timeout=1.0)
+
+        assert result == 2
+        mock_bot.repository.mark_content_items_posted.assert_called_once_with(
+            [(sample_content_item.id, "1"), (second_item.id, "2")]
+        )
+        stats = content_poster.dispatcher.get_stats()
+        assert stats[456].sent == 1
+        assert stats[457].sent == 1
+
+    async def test_drains_multiple_pages_with_budget(
+        self, content_poster, mock_bot, sample_content_item
+    ):
+        second_item = MagicMock(spec=ContentItem)
+        second_item.id = "second-item-id"
+        second_item.title = "Second Article"
+        second_item.summary = "Second summary."
+        second_item.original_url = "https://example.com/second"
+        second_item.author = "Other Author"
+
+        mock_bot.get_channel = MagicMock(return_value=make_channel())
+        source = make_source()
+        mock_bot.repository.count_unposted_content_items = AsyncMock(return_value=2)
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            side_effect=[[(sample_content_item, source, None)], [(second_item, source, None)], []]
+        )
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
+
+        budget = DrainBudget(max_items=10, deadline_seconds=60, min_page_size=1)
+        result = await content_poster.post_unposted_items([123], budget=budget)
+
+        assert result == 2
+        assert budget.consumed == 2
+        assert mock_bot.repository.mark_content_items_posted.call_count == 2
+
+    async def test_stops_draining_when_budget_spent(
+        self, content_poster, mock_bot, sample_content_item
+    ):
+        mock_bot.get_channel = MagicMock(return_value=make_channel())
+        mock_bot.repository.count_unposted_content_items = AsyncMock(return_value=500)
+        mock_bot.repository.get_unposted_items_with_destinations = AsyncMock(
+            return_value=[(sample_content_item, make_source(), None)]
+        )
+        mock_bot.repository.mark_content_items_posted = AsyncMock()
+
+        budget = DrainBudget(max_items=1, deadline_seconds=60, min_page_size=1)
+        result = await content_poster.post_unposted_items([123], budget=budget)
+
+        assert result == 1
+        mock_bot.repository.get_unposted_items_with_destinations.assert_called_once()
+        assert budget.exhausted
 
 
 class TestTruncateSummaryAtBullet:
@@ -0,0 +1,115 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from intelstream.database.repository import Repository
+from intelstream.services.counter_aggregator import CounterAggregator
+
+
+@pytest.fixture
+async def repository():
+    repo = Repository("sqlite+aiosqlite:///:memory:")
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+
+async def add_rule(repository: Repository):
+    return await repository.add_forwarding_rule(
+        guild_id="guild-1",
+        source_channel_id="source-1",
+        source_type="channel",
+        destination_channel_id="dest-1",
+        destination_type="channel",
+    )
+
+
+class TestCounterAggregator:
+    async def test_increments_are_coalesced_until_flush(self, repository: Repository) -> None:
+        rule = await add_rule(repository)
+        counters = CounterAggregator(repository)
+
+        for _ in range(5):
+            counters.increment_forwarding(rule.id)
+
+        rules = await repository.get_forwarding_rules_for_guild("guild-1")
+        assert rules[0].messages_forwarded == 0
+        assert counters.get_stats().pending_forwarding_rules == 1
+
+        await counters.flush()
+
+        rules = await repository.get_forwarding_rules_for_guild("guild-1")
+        assert rules[0].messages_forwarded == 5
+        assert rules[0].last_forwarded_at is not None
+        stats = counters.get_stats()
+        assert stats.pending_forwarding_rules == 0
+        assert stats.flushes == 1
+        assert stats.flush_lag_seconds == 0.0
+
+    async def test_usage_counts_are_upserted(self, repository: Repository) -> None:
+        counters = CounterAggregator(repository)
+
+        counters.record_suck_boobs_usage("guild-1", "alice", "bob")
+        counters.record_suck_boobs_usage("guild-1", "alice", "carol")
+        counters.record_suck_boobs_usage("guild-1", "bob", "alice")
+        await counters.flush()
+
+        top_users, top_pinged = await repository.get_suck_boobs_leaderboard("guild-1")
+        used = {row.user_id: row.times_used for row in top_users}
+        pinged = {row.user_id: row.times_pinged for row in top_pinged}
+        assert used == {"alice": 2, "bob": 1}
+        assert pinged == {"bob": 1, "carol": 1, "alice": 1}
+
+    async def test_flush_is_single_repository_call(self) -> None:
+        repository = AsyncMock(spec=Repository)
+        counters = CounterAggregator(repository)
+
+        counters.increment_forwarding("rule-1")
+        counters.increment_forwarding("rule-2")
+        counters.record_suck_boobs_usage("guild-1", "alice", "bob")
+        await counters.flush()
+
+        repository.apply_counter_deltas.assert_awaited_once()
+        kwargs = repository.apply_counter_deltas.await_args.kwargs
+        assert set(kwargs["forwarding"]) == {"rule-1", "rule-2"}
+        assert set(kwargs["usage"]) == {("guild-1", "alice"), ("guild-1", "bob")}
+
+    async def test_flush_without_pending_is_noop(self) -> None:
+        repository = AsyncMock(spec=Repository)
+        counters = CounterAggregator(repository)
+
+        await counters.flush()
+
+        repository.apply_counter_deltas.assert_not_awaited()
+
+    async def test_failed_flush_keeps_deltas(self) -> None:
+        repository = AsyncMock(spec=Repository)
+        repository.apply_counter_deltas.side_effect = [RuntimeError("database is locked"), 1]
+        counters = CounterAggregator(repository)
+
+        counters.increment_forwarding("rule-1")
+        counters.increment_forwarding("rule-1")
+        await counters.flush()
+
+        counters.increment_forwarding("rule-1")
+        stats = counters.get_stats()
+        assert stats.failed_flushes == 1
+        assert stats.pending_forwarding_rules == 1
+        assert stats.flush_lag_seconds > 0
+
+        await counters.flush()
+
+        retried = repository.apply_counter_deltas.await_args.kwargs["forwarding"]
+        assert retried["rule-1"].count == 3
+        assert counters.get_stats().flushes == 1
+
+    async def test_close_flushes_pending(self, repository: Repository) -> None:
+        rule = await add_rule(repository)
+        counters = CounterAggregator(repository, flush_interval_seconds=60)
+        counters.start()
+
+        counters.increment_forwarding(rule.id)
+        await counters.close()
+
+        rules = await repository.get_forwarding_rules_for_guild("guild-1")
+        assert rules[0].messages_forwarded == 1
@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from intelstream.services.forward_coalescer import ForwardCoalescer
+from intelstream.services.forwarding_index import RuleRecord
+
+
+def make_rule(rule_id: str = "rule-1", window: float = 1) -> RuleRecord:
+    return RuleRecord(
+        id=rule_id,
+        source_channel_id="111",
+        destination_id=222,
+        destination_type="channel",
+        coalesce_window_seconds=window,
+    )
+
+
+def make_message(message_id: int):
+    message = MagicMock(spec=discord.Message)
+    message.id = message_id
+    return message
+
+
+def make_forwarder():
+    forwarder = MagicMock()
+    forwarder.forward_batch = AsyncMock(side_effect=lambda messages, **_: len(messages))
+    return forwarder
+
+
+class TestForwardCoalescer:
+    async def test_burst_within_window_is_one_batch(self):
+        forwarder = make_forwarder()
+        on_delivered = MagicMock()
+        coalescer = ForwardCoalescer(forwarder, on_delivered=on_delivered)
+        rule = make_rule(window=0.05)
+        messages = [make_message(i) for i in range(5)]
+
+        for message in messages:
+            coalescer.add(rule, message)
+        assert coalescer.get_stats().pending_messages == 5
+        forwarder.forward_batch.assert_not_called()
+
+        await asyncio.sleep(0.1)
+
+        forwarder.forward_batch.assert_awaited_once_with(
+            messages, destination_id=222, destination_type="channel"
+        )
+        on_delivered.assert_called_once_with("rule-1", 5)
+        stats = coalescer.get_stats()
+        assert stats.pending_bursts == 0
+        assert stats.bursts_delivered == 1
+        assert stats.messages_delivered == 5
+
+    async def test_full_burst_is_delivered_before_window_ends(self):
+        forwarder = make_forwarder()
+        coalescer = ForwardCoalescer(forwarder, on_delivered=MagicMock(), max_burst_messages=3)
+        rule = make_rule(window=60)
+
+        for i in range(4):
+            coalescer.add(rule, make_message(i))
+        await asyncio.sleep(0)
+
+        forwarder.forward_batch.assert_awaited_once()
+        assert [m.id for m in forwarder.forward_batch.await_args.args[0]] == [0, 1, 2]
+        assert coalescer.get_stats().pending_messages == 1
+
+        await coalescer.close()
+
+    async def test_close_delivers_pending_bursts(self):
+        forwarder = make_forwarder()
+        on_delivered = MagicMock()
+        coalescer = ForwardCoalescer(forwarder, on_delivered=on_delivered)
+
+        coalescer.add(make_rule("rule-1", window=60), make_message(1))
+        coalescer.add(make_rule("rule-2", window=60), make_message(2))
+        await coalescer.close()
+
+        assert forwarder.forward_batch.await_count == 2
+        assert coalescer.get_stats().pending_bursts == 0
+        on_delivered.assert_any_call("rule-1", 1)
+        on_delivered.assert_any_call("rule-2", 1)
+
+    async def test_bursts_of_one_rule_are_delivered_in_order(self):
+        delivered: list[list[int]] = []
+
+        async def forward_batch(messages, **_):
+            await asyncio.sleep(0.01 if not delivered else 0)
+            delivered.append([m.id for m in messages])
+            return len(messages)
+
+        forwarder = MagicMock()
+        forwarder.forward_batch = forward_batch
+        coalescer = ForwardCoalescer(forwarder, on_delivered=MagicMock(), max_burst_messages=2)
+        rule = make_rule(window=60)
+
+        for i in range(4):
+            coalescer.add(rule, make_message(i))
+        await coalescer.close()
+
+        assert delivered == [[0, 1], [2, 3]]
+
+    async def test_failed_burst_is_not_counted(self):
+        forwarder = MagicMock()
+        forwarder.forward_batch = AsyncMock(side_effect=RuntimeError("boom"))
+        on_delivered = MagicMock()
+        coalescer = ForwardCoalescer(forwarder, on_delivered=on_delivered)
+
+        coalescer.add(make_rule(window=60), make_message(1))
+        await coalescer.close()
+
+        on_delivered.assert_not_called()
@@ -0,0 +1,74 @@
+from intelstream.database.models import ForwardingRule
+from intelstream.services.forwarding_index import ForwardingRuleIndex, RuleRecord
+
+
+def make_rule(
+    rule_id: str, source: str = "111", destination: str = "222", active: bool = True
+) -> ForwardingRule:
+    return ForwardingRule(
+        id=rule_id,
+        guild_id="1",
+        source_channel_id=source,
+        source_type="channel",
+        destination_channel_id=destination,
+        destination_type="thread",
+        is_active=active,
+        coalesce_window_seconds=5,
+    )
+
+
+class TestForwardingRuleIndex:
+    def test_rebuild_groups_active_rules_by_source(self) -> None:
+        index = ForwardingRuleIndex()
+
+        index.rebuild(
+            [
+                make_rule("rule-1"),
+                make_rule("rule-2", destination="333"),
+                make_rule("rule-3", source="444"),
+                make_rule("rule-4", source="555", active=False),
+            ]
+        )
+
+        assert [record.id for record in index.rules_for("111")] == ["rule-1", "rule-2"]
+        assert [record.id for record in index.rules_for("444")] == ["rule-3"]
+        assert index.rules_for("555") == ()
+        assert len(index) == 2
+        assert index.rule_count == 3
+
+    def test_record_holds_parsed_destination(self) -> None:
+        record = RuleRecord.from_rule(make_rule("rule-1", destination="333"))
+
+        assert record.destination_id == 333
+        assert record.destination_type == "thread"
+        assert record.coalesce_window_seconds == 5
+
+    def test_replace_channel_shares_other_channels(self) -> None:
+        index = ForwardingRuleIndex()
+        index.rebuild([make_rule("rule-1"), make_rule("rule-2", source="444")])
+        untouched = index.rules_for("444")
+
+        index.replace_channel("111", [make_rule("rule-1"), make_rule("rule-3", destination="333")])
+
+        assert [record.id for record in index.rules_for("111")] == ["rule-1", "rule-3"]
+        assert index.rules_for("444") is untouched
+
+    def test_replace_channel_drops_channel_without_active_rules(self) -> None:
+        index = ForwardingRuleIndex()
+        index.rebuild([make_rule("rule-1")])
+
+        index.replace_channel("111", [make_rule("rule-1", active=False)])
+
+        assert index.rules_for("111") == ()
+        assert len(index) == 0
+
+    def test_readers_keep_their_snapshot(self) -> None:
+        index = ForwardingRuleIndex()
+        index.rebuild([make_rule("rule-1")])
+        snapshot = index.snapshot
+
+        index.replace_channel("111", [])
+        index.replace_channel("444", [make_rule("rule-2", source="444")])
+
+        assert [record.id for record in snapshot["111"]] == ["rule-1"]
+        assert "444" not in snapshot
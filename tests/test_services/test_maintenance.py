@@ -0,0 +1,140 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import text, update
+
+from intelstream.database.models import ContentItem, ExtractionCache, SourceType
+from intelstream.database.repository import Repository, SQLitePragmas
+from intelstream.services.maintenance import MaintenanceService
+
+
+@pytest.fixture
+def mock_settings():
+    settings = MagicMock()
+    settings.extraction_cache_max_age_days = 7
+    settings.raw_content_retention_days = 30
+    settings.maintenance_vacuum_max_pages = 0
+    settings.maintenance_convert_auto_vacuum = False
+    return settings
+
+
+@pytest.fixture
+async def repository(tmp_path):
+    repo = Repository(f"sqlite+aiosqlite:///{tmp_path / 'maintenance.db'}")
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+
+async def add_old_summarized_items(repository: Repository, count: int) -> None:
+    source = await repository.add_source(
+        source_type=SourceType.ARXIV, name="Papers", identifier="papers"
+    )
+    for i in range(count):
+        item = await repository.add_content_item(
+            source_id=source.id,
+            external_id=f"paper-{i}",
+            title=f"Paper {i}",
+            original_url=f"https://arxiv.org/abs/{i}",
+            author="Author",
+            published_at=datetime(2024, 1, 1),
+            raw_content=bytes(range(256)).hex() * 200,
+        )
+        await repository.update_content_item_summary(item.id, "Summary")
+
+    async with repository.session() as session:
+        await session.execute(
+            update(ContentItem).values(created_at=datetime.now(UTC) - timedelta(days=60))
+        )
+        await session.commit()
+
+
+class TestMaintenanceService:
+    async def test_prunes_expired_rows_and_reclaims_space(self, repository, mock_settings):
+        await add_old_summarized_items(repository, 20)
+        await repository.set_extraction_cache(
+            url="https://example.com/old", content_hash="hash", posts_json="[]"
+        )
+        async with repository.session() as session:
+            await session.execute(
+                update(ExtractionCache).values(cached_at=datetime.now(UTC) - timedelta(days=10))
+            )
+            await session.commit()
+
+        report = await MaintenanceService(repository, mock_settings).run()
+
+        assert report.extraction_cache_deleted == 1
+        assert report.raw_content_pruned == 20
+        assert report.full_vacuum is False
+        assert report.bytes_reclaimed > 0
+        assert report.size_bytes_after < report.size_bytes_before
+        assert report.duration_seconds >= 0
+
+        assert await repository.count_unposted_content_items() == 20
+
+    async def test_keeps_recent_and_unsummarized_bodies(self, repository, mock_settings):
+        source = await repository.add_source(
+            source_type=SourceType.RSS, name="Feed", identifier="feed"
+        )
+        await repository.add_content_item(
+            source_id=source.id,
+            external_id="pending",
+            title="Pending",
+            original_url="https://example.com/pending",
+            author="Author",
+            published_at=datetime(2024, 1, 1),
+            raw_content="Pending body",
+        )
+
+        report = await MaintenanceService(repository, mock_settings).run()
+
+        assert report.raw_content_pruned == 0
+        items = await repository.get_unsummarized_content_items()
+        assert items[0].raw_content == "Pending body"
+
+    async def test_converts_legacy_database_with_full_vacuum(self, tmp_path, mock_settings):
+        mock_settings.maintenance_convert_auto_vacuum = True
+        repo = Repository(
+            f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}",
+            pragmas=SQLitePragmas(auto_vacuum="NONE"),
+        )
+        await repo.initialize()
+        await repo.close()
+
+        repo = Repository(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+        await repo.initialize()
+        assert not (await repo.get_database_file_stats()).incremental_vacuum_enabled
+
+        report = await MaintenanceService(repo, mock_settings).run()
+
+        assert report.full_vacuum is True
+        assert (await repo.get_database_file_stats()).incremental_vacuum_enabled
+
+        second = await MaintenanceService(repo, mock_settings).run()
+        assert second.full_vacuum is False
+        await repo.close()
+
+    async def test_legacy_database_is_not_vacuumed_without_opt_in(self, tmp_path, mock_settings):
+        repo = Repository(
+            f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}",
+            pragmas=SQLitePragmas(auto_vacuum="NONE"),
+        )
+        await repo.initialize()
+
+        with patch.object(repo, "vacuum", AsyncMock()) as vacuum:
+            report = await MaintenanceService(repo, mock_settings).run()
+
+        vacuum.assert_not_called()
+        assert report.full_vacuum is False
+        assert not (await repo.get_database_file_stats()).incremental_vacuum_enabled
+        await repo.close()
+
+    async def test_runs_analyze(self, repository, mock_settings):
+        await add_old_summarized_items(repository, 1)
+
+        await MaintenanceService(repository, mock_settings).run()
+
+        async with repository.session() as session:
+            result = await session.execute(text("SELECT COUNT(*) FROM sqlite_stat1"))
+            assert result.scalar_one() > 0
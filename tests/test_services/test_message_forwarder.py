@@ -1,9 +1,17 @@
+import asyncio
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import discord
+import httpx
 import pytest
 
-from intelstream.services.message_forwarder import MessageForwarder
+from intelstream.services.message_forwarder import (
+    DownloadedAttachment,
+    MemoryBudget,
+    MessageForwarder,
+    plan_burst,
+)
 
 
 @pytest.fixture
@@ -14,9 +22,28 @@ def mock_bot():
     return bot
 
 
+class FakeCdn:
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+        self.requests: list[str] = []
+
+    def serve(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        self.requests.append(url)
+        if url not in self.files:
+            return httpx.Response(404)
+        return httpx.Response(200, content=self.files[url])
+
+
+@pytest.fixture
+def cdn():
+    return FakeCdn()
+
+
 @pytest.fixture
-def forwarder(mock_bot):
-    return MessageForwarder(mock_bot)
+def forwarder(mock_bot, cdn):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(cdn.serve))
+    return MessageForwarder(mock_bot, http_client=client)
 
 
 class TestBuildForwardedContent:
@@ -104,84 +131,310 @@ class TestGetDestination:
         mock_guild.fetch_channel.assert_called_once_with(12345)
 
 
+def make_attachment(
+    cdn: FakeCdn,
+    data: bytes = b"payload",
+    filename: str = "clip.mp4",
+    size: int | None = None,
+):
+    attachment = MagicMock()
+    attachment.id = 123
+    attachment.size = len(data) if size is None else size
+    attachment.filename = filename
+    attachment.description = None
+    attachment.url = f"https://cdn.discordapp.com/attachments/1/{filename}"
+    attachment.is_spoiler = MagicMock(return_value=False)
+    cdn.files[attachment.url] = data
+    return attachment
+
+
+def make_destination(spec=discord.TextChannel, filesize_limit: int = 8_000_000):
+    destination = MagicMock(spec=spec)
+    destination.guild = MagicMock()
+    destination.guild.filesize_limit = filesize_limit
+    destination.send = AsyncMock(return_value=MagicMock(spec=discord.Message))
+    return destination
+
+
+def make_message(content: str = "Test", attachments: list | None = None):
+    message = MagicMock(spec=discord.Message)
+    message.channel = MagicMock()
+    message.channel.id = 111
+    message.id = 222
+    message.content = content
+    message.embeds = []
+    message.attachments = attachments or []
+    return message
+
+
 class TestDownloadAttachments:
-    async def test_download_attachments_success(self, forwarder):
-        mock_file = MagicMock(spec=discord.File)
-        mock_attachment = MagicMock()
-        mock_attachment.size = 1000
-        mock_attachment.to_file = AsyncMock(return_value=mock_file)
+    async def test_download_attachments_success(self, forwarder, cdn):
+        message = make_message(attachments=[make_attachment(cdn, data=b"video bytes")])
 
-        message = MagicMock(spec=discord.Message)
-        message.attachments = [mock_attachment]
+        attachments, reserved = await forwarder._download_attachments(
+            message.attachments, 8_000_000
+        )
 
-        destination = MagicMock(spec=discord.TextChannel)
-        destination.guild = MagicMock()
-        destination.guild.filesize_limit = 8_000_000
+        assert len(attachments) == 1
+        assert attachments[0].to_file().fp.read() == b"video bytes"
+        assert attachments[0].filename == "clip.mp4"
+        assert reserved == len(b"video bytes")
 
-        files = await forwarder._download_attachments(message, destination)
+    async def test_download_attachments_too_large(self, forwarder, cdn):
+        message = make_message(attachments=[make_attachment(cdn, size=10_000_000)])
 
-        assert len(files) == 1
-        assert files[0] == mock_file
+        attachments, reserved = await forwarder._download_attachments(
+            message.attachments, 8_000_000
+        )
 
-    async def test_download_attachments_too_large(self, forwarder):
-        mock_attachment = MagicMock()
-        mock_attachment.size = 10_000_000
-        mock_attachment.id = 123
+        assert len(attachments) == 0
+        assert reserved == 0
+        assert cdn.requests == []
 
-        message = MagicMock(spec=discord.Message)
-        message.attachments = [mock_attachment]
+    async def test_download_attachments_http_error(self, forwarder, cdn):
+        attachment = make_attachment(cdn)
+        del cdn.files[attachment.url]
+        message = make_message(attachments=[attachment])
 
-        destination = MagicMock(spec=discord.TextChannel)
-        destination.guild = MagicMock()
-        destination.guild.filesize_limit = 8_000_000
+        attachments, reserved = await forwarder._download_attachments(
+            message.attachments, 8_000_000
+        )
 
-        files = await forwarder._download_attachments(message, destination)
+        assert len(attachments) == 0
+        assert reserved == 0
+        assert forwarder.get_memory_stats().in_use_bytes == 0
 
-        assert len(files) == 0
-        mock_attachment.to_file.assert_not_called()
+    async def test_large_attachment_spools_to_disk(self, mock_bot, cdn):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(cdn.serve))
+        forwarder = MessageForwarder(mock_bot, spool_threshold_bytes=1024, http_client=client)
+        data = b"x" * 200_000
+        message = make_message(attachments=[make_attachment(cdn, data=data)])
 
-    async def test_download_attachments_http_error(self, forwarder):
-        mock_attachment = MagicMock()
-        mock_attachment.size = 1000
-        mock_attachment.id = 456
-        mock_attachment.to_file = AsyncMock(side_effect=discord.HTTPException(MagicMock(), "error"))
+        attachments, reserved = await forwarder._download_attachments(
+            message.attachments, 8_000_000
+        )
 
-        message = MagicMock(spec=discord.Message)
-        message.attachments = [mock_attachment]
+        path = attachments[0].path
+        assert path is not None
+        assert reserved == 0
+        file = attachments[0].to_file()
+        assert file.fp.read() == data
+        file.close()
+
+        attachments[0].close()
+        assert not await asyncio.to_thread(Path(path).exists)
+        stats = forwarder.get_memory_stats()
+        assert stats.spilled_attachments == 1
+        assert stats.last_forward_peak_bytes <= 1024
+
+    def test_downloaded_attachment_opens_independent_files(self):
+        attachment = DownloadedAttachment(filename="a.png", spool_threshold=1024, spoiler=True)
+        attachment.write(b"abc")
+        attachment.finish()
+
+        first = attachment.to_file()
+        second = attachment.to_file()
+
+        assert first.fp is not second.fp
+        assert first.fp.read() == b"abc"
+        assert second.fp.read() == b"abc"
+        assert first.filename == "SPOILER_a.png"
+
+
+class TestMemoryBudget:
+    async def test_acquire_waits_for_release(self):
+        budget = MemoryBudget(limit_bytes=100)
+        await budget.acquire(80)
+
+        waiter = asyncio.create_task(budget.acquire(50))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await budget.release(80)
+        assert await waiter == 50
+        assert budget.waits == 1
+        assert budget.peak_bytes == 80
+
+    async def test_oversized_request_is_clamped(self):
+        budget = MemoryBudget(limit_bytes=100)
+
+        assert await budget.acquire(500) == 100
+        assert budget.in_use_bytes == 100
+
+    async def test_forwards_share_the_budget(self, mock_bot, cdn):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(cdn.serve))
+        forwarder = MessageForwarder(
+            mock_bot, memory_budget_bytes=1000, spool_threshold_bytes=1000, http_client=client
+        )
+        destination = make_destination()
+        mock_bot.get_channel = MagicMock(return_value=destination)
+        first = make_message(attachments=[make_attachment(cdn, data=b"a" * 800, filename="a")])
+        second = make_message(attachments=[make_attachment(cdn, data=b"b" * 800, filename="b")])
+
+        results = await asyncio.gather(
+            forwarder.forward_message(first, 1, "channel"),
+            forwarder.forward_message(second, 1, "channel"),
+        )
 
-        destination = MagicMock(spec=discord.TextChannel)
-        destination.guild = MagicMock()
-        destination.guild.filesize_limit = 8_000_000
+        assert all(results)
+        stats = forwarder.get_memory_stats()
+        assert stats.peak_bytes <= 1000
+        assert stats.budget_waits == 1
+        assert stats.in_use_bytes == 0
+        assert stats.max_forward_peak_bytes == 800
+
+    async def test_oversubscribed_budget_does_not_deadlock(self, mock_bot, cdn):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(cdn.serve))
+        forwarder = MessageForwarder(
+            mock_bot,
+            max_concurrent_forwards=1,
+            memory_budget_bytes=1000,
+            spool_threshold_bytes=1000,
+            http_client=client,
+        )
+        mock_bot.get_channel = MagicMock(return_value=make_destination())
+        messages = [
+            make_message(attachments=[make_attachment(cdn, data=b"x" * 800, filename=name)])
+            for name in ("a", "b", "c")
+        ]
+        burst = [
+            make_burst_message(
+                i, f"user{i}", "hi", attachments=[make_attachment(cdn, b"y" * 800, f"burst{i}")]
+            )
+            for i in range(2)
+        ]
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(forwarder.forward_message(message, 1, "channel") for message in messages),
+                forwarder.forward_batch(burst, 1, "channel"),
+            ),
+            timeout=2.0,
+        )
 
-        files = await forwarder._download_attachments(message, destination)
+        assert all(results[:3])
+        assert results[3] == 2
+        stats = forwarder.get_memory_stats()
+        assert stats.peak_bytes <= 1000
+        assert stats.in_use_bytes == 0
 
-        assert len(files) == 0
 
-    async def test_download_attachments_closes_files_on_unexpected_error(self, forwarder):
-        mock_file1 = MagicMock(spec=discord.File)
-        mock_file2 = MagicMock(spec=discord.File)
-        mock_attachment1 = MagicMock()
-        mock_attachment1.size = 1000
-        mock_attachment1.to_file = AsyncMock(return_value=mock_file1)
-        mock_attachment2 = MagicMock()
-        mock_attachment2.size = 1000
-        mock_attachment2.to_file = AsyncMock(return_value=mock_file2)
-        mock_attachment3 = MagicMock()
-        mock_attachment3.size = 1000
-        mock_attachment3.to_file = AsyncMock(side_effect=RuntimeError("Unexpected"))
+class TestForwardToDestinations:
+    async def test_attachments_downloaded_once_for_all_destinations(self, forwarder, mock_bot, cdn):
+        destinations = {1: make_destination(), 2: make_destination(), 3: make_destination()}
+        mock_bot.get_channel = MagicMock(side_effect=destinations.get)
+        message = make_message(attachments=[make_attachment(cdn)])
 
-        message = MagicMock(spec=discord.Message)
-        message.attachments = [mock_attachment1, mock_attachment2, mock_attachment3]
+        results = await forwarder.forward_to_destinations(
+            message, [(1, "channel"), (2, "channel"), (3, "channel")]
+        )
+
+        assert results == [d.send.return_value for d in destinations.values()]
+        assert len(cdn.requests) == 1
+        for destination in destinations.values():
+            files = destination.send.call_args.kwargs["files"]
+            assert len(files) == 1
+            assert files[0].fp.read() == b"payload"
+
+    async def test_deliveries_run_concurrently(self, forwarder, mock_bot):
+        in_flight = 0
+        peak = 0
+
+        async def send(**_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(spec=discord.Message)
+
+        destinations = {1: make_destination(), 2: make_destination(), 3: make_destination()}
+        for destination in destinations.values():
+            destination.send = AsyncMock(side_effect=send)
+        mock_bot.get_channel = MagicMock(side_effect=destinations.get)
+
+        await forwarder.forward_to_destinations(
+            make_message(), [(1, "channel"), (2, "channel"), (3, "channel")]
+        )
 
-        destination = MagicMock(spec=discord.TextChannel)
-        destination.guild = MagicMock()
-        destination.guild.filesize_limit = 8_000_000
+        assert peak == 3
 
-        with pytest.raises(RuntimeError):
-            await forwarder._download_attachments(message, destination)
+    async def test_per_destination_filesize_limit(self, forwarder, mock_bot, cdn):
+        small = make_destination(filesize_limit=1_000)
+        large = make_destination(filesize_limit=50_000_000)
+        mock_bot.get_channel = MagicMock(side_effect={1: small, 2: large}.get)
+        message = make_message(attachments=[make_attachment(cdn, data=b"x" * 10_000)])
 
-        mock_file1.close.assert_called_once()
-        mock_file2.close.assert_called_once()
+        await forwarder.forward_to_destinations(message, [(1, "channel"), (2, "channel")])
+
+        assert small.send.call_args.kwargs["files"] == []
+        assert len(large.send.call_args.kwargs["files"]) == 1
+
+    async def test_one_failed_destination_does_not_block_others(self, forwarder, mock_bot):
+        failing = make_destination()
+        failing.send = AsyncMock(side_effect=discord.Forbidden(MagicMock(), "No permission"))
+        working = make_destination()
+        mock_bot.get_channel = MagicMock(side_effect={1: failing, 2: working}.get)
+
+        results = await forwarder.forward_to_destinations(
+            make_message(), [(1, "channel"), (2, "channel")]
+        )
+
+        assert results == [None, working.send.return_value]
+
+    async def test_destination_lookup_is_cached(self, forwarder, mock_bot):
+        destination = make_destination()
+        mock_bot.get_channel = MagicMock(return_value=destination)
+
+        await forwarder.forward_message(make_message(), 1, "channel")
+        await forwarder.forward_message(make_message(), 1, "channel")
+
+        mock_bot.get_channel.assert_called_once_with(1)
+
+    async def test_forbidden_destination_is_looked_up_again(self, forwarder, mock_bot):
+        destination = make_destination()
+        destination.send = AsyncMock(side_effect=discord.Forbidden(MagicMock(), "No permission"))
+        mock_bot.get_channel = MagicMock(return_value=destination)
+
+        await forwarder.forward_message(make_message(), 1, "channel")
+        await forwarder.forward_message(make_message(), 1, "channel")
+
+        assert mock_bot.get_channel.call_count == 2
+
+    async def test_archived_thread_unarchived_once(self, forwarder, mock_bot):
+        thread = make_destination(spec=discord.Thread)
+        thread.archived = True
+        unarchived = make_destination(spec=discord.Thread)
+        unarchived.archived = False
+        thread.edit = AsyncMock(return_value=unarchived)
+        mock_bot.get_channel = MagicMock(return_value=thread)
+
+        await forwarder.forward_message(make_message(), 5, "thread")
+        await forwarder.forward_message(make_message(), 5, "thread")
+
+        thread.edit.assert_called_once_with(archived=False)
+        assert unarchived.send.call_count == 2
+
+    async def test_concurrent_unarchive_shares_lock_then_drops_it(self, forwarder, mock_bot):
+        thread = make_destination(spec=discord.Thread)
+        thread.archived = True
+        unarchived = make_destination(spec=discord.Thread)
+        unarchived.archived = False
+
+        async def edit(**_kwargs):
+            await asyncio.sleep(0.01)
+            return unarchived
+
+        thread.edit = AsyncMock(side_effect=edit)
+        mock_bot.get_channel = MagicMock(return_value=thread)
+
+        await asyncio.gather(
+            forwarder.forward_message(make_message(), 5, "thread"),
+            forwarder.forward_message(make_message(), 5, "thread"),
+        )
+
+        thread.edit.assert_called_once_with(archived=False)
+        assert len(forwarder._unarchive_locks) == 0
 
 
 class TestForwardMessage:
@@ -351,34 +604,228 @@ class TestForwardMessage:
         assert result is None
         mock_destination.send.assert_not_called()
 
-    async def test_forward_message_closes_files_on_send_failure(self, forwarder, mock_bot):
-        mock_file = MagicMock(spec=discord.File)
-        mock_attachment = MagicMock()
-        mock_attachment.size = 1000
-        mock_attachment.to_file = AsyncMock(return_value=mock_file)
-
-        mock_destination = MagicMock(spec=discord.TextChannel)
-        mock_destination.guild = MagicMock()
-        mock_destination.guild.filesize_limit = 8_000_000
+    async def test_forward_message_closes_files_on_send_failure(self, forwarder, mock_bot, cdn):
+        mock_destination = make_destination()
         mock_destination.send = AsyncMock(
             side_effect=discord.HTTPException(MagicMock(), "Failed to send")
         )
-
         mock_bot.get_channel = MagicMock(return_value=mock_destination)
+        forwarder._close_files = MagicMock()
 
-        message = MagicMock(spec=discord.Message)
-        message.channel = MagicMock()
-        message.channel.name = "source"
-        message.author = MagicMock()
-        message.author.bot = False
-        message.content = "Test"
-        message.embeds = []
-        message.attachments = [mock_attachment]
+        message = make_message(attachments=[make_attachment(cdn)])
 
         result = await forwarder.forward_message(message, 333, "channel")
 
         assert result is None
-        mock_file.close.assert_called_once()
+        forwarder._close_files.assert_called_once()
+        assert len(forwarder._close_files.call_args.args[0]) == 1
+
+
+def make_burst_message(author_id: int, name: str, content: str = "", attachments=None, embeds=None):
+    message = make_message(content=content, attachments=attachments)
+    message.author = MagicMock()
+    message.author.id = author_id
+    message.author.display_name = name
+    message.embeds = embeds or []
+    return message
+
+
+class TestPlanBurst:
+    def test_merges_in_order_with_attribution(self):
+        messages = [
+            make_burst_message(1, "alice", "first"),
+            make_burst_message(1, "alice", "second"),
+            make_burst_message(2, "bob", "third"),
+        ]
+
+        chunks = plan_burst(messages, max_content_length=2000)
+
+        assert len(chunks) == 1
+        assert chunks[0].lines == ["**alice**: first", "second", "**bob**: third"]
+        assert chunks[0].messages == messages
+
+    def test_splits_at_content_limit_and_reattributes(self):
+        messages = [make_burst_message(1, "alice", "x" * 60) for _ in range(3)]
+
+        chunks = plan_burst(messages, max_content_length=150)
+
+        assert [len(chunk.messages) for chunk in chunks] == [2, 1]
+        assert all(chunk.content_length <= 150 for chunk in chunks)
+        assert chunks[1].lines[0].startswith("**alice**: ")
+
+    def test_full_length_message_is_split_not_truncated(self):
+        long_message = make_burst_message(2, "bob", "y" * 2000)
+        messages = [
+            make_burst_message(1, "alice", "hi"),
+            long_message,
+            make_burst_message(2, "bob", "after"),
+        ]
+
+        chunks = plan_burst(messages, max_content_length=2000)
+
+        assert all(chunk.content_length <= 2000 for chunk in chunks)
+        assert chunks[0].lines == ["**alice**: hi"]
+        assert "".join(line for chunk in chunks[1:] for line in chunk.lines) == (
+            "**bob**: " + "y" * 2000 + "after"
+        )
+        assert [chunk.messages for chunk in chunks[1:]] == [
+            [long_message],
+            [long_message, messages[2]],
+        ]
+
+    def test_embed_only_messages_share_a_send_up_to_ten(self):
+        messages = [
+            make_burst_message(9, "feed", embeds=[MagicMock(spec=discord.Embed)] * 4)
+            for _ in range(3)
+        ]
+
+        chunks = plan_burst(messages, max_content_length=2000)
+
+        assert [len(chunk.embeds) for chunk in chunks] == [8, 4]
+        assert chunks[0].lines == []
+
+    def test_splits_at_attachment_count(self, cdn):
+        messages = [
+            make_burst_message(
+                1,
+                "alice",
+                attachments=[make_attachment(cdn, filename=f"{i}-{j}.png") for j in range(4)],
+            )
+            for i in range(3)
+        ]
+
+        chunks = plan_burst(messages, max_content_length=2000)
+
+        assert [len(chunk.attachments) for chunk in chunks] == [8, 4]
+        assert chunks[0].lines[0] == "**alice**: 0-0.png, 0-1.png, 0-2.png, 0-3.png"
+
+
+class TestForwardBatch:
+    async def test_burst_becomes_one_send(self, forwarder, mock_bot, cdn):
+        destination = make_destination()
+        mock_bot.get_channel = MagicMock(return_value=destination)
+        messages = [
+            make_burst_message(1, "alice", "one"),
+            make_burst_message(2, "bob", "two", attachments=[make_attachment(cdn)]),
+        ]
+
+        delivered = await forwarder.forward_batch(messages, 1, "channel")
+
+        assert delivered == 2
+        destination.send.assert_called_once()
+        kwargs = destination.send.call_args.kwargs
+        assert kwargs["content"] == "**alice**: one\n**bob**: two"
+        assert len(kwargs["files"]) == 1
+        assert forwarder.get_memory_stats().in_use_bytes == 0
+
+    async def test_single_message_burst_is_forwarded_unchanged(self, forwarder, mock_bot):
+        destination = make_destination()
+        mock_bot.get_channel = MagicMock(return_value=destination)
+
+        delivered = await forwarder.forward_batch(
+            [make_burst_message(1, "alice", "solo")], 1, "channel"
+        )
+
+        assert delivered == 1
+        assert destination.send.call_args.kwargs["content"] == "solo"
+
+    async def test_failed_chunk_is_not_counted(self, forwarder, mock_bot):
+        destination = make_destination()
+        destination.send = AsyncMock(
+            side_effect=[discord.HTTPException(MagicMock(), "rate limited"), MagicMock()]
+        )
+        mock_bot.get_channel = MagicMock(return_value=destination)
+        forwarder._max_content_length = 45
+        messages = [make_burst_message(1, "alice", "x" * 15) for _ in range(3)]
+
+        delivered = await forwarder.forward_batch(messages, 1, "channel")
+
+        assert destination.send.call_count == 2
+        assert delivered == 1
+
+    async def test_split_message_counts_once_when_every_part_is_sent(self, forwarder, mock_bot):
+        destination = make_destination()
+        mock_bot.get_channel = MagicMock(return_value=destination)
+        forwarder._max_content_length = 20
+        messages = [make_burst_message(1, "alice", "x" * 30), make_burst_message(2, "bob", "y")]
+
+        delivered = await forwarder.forward_batch(messages, 1, "channel")
+
+        assert delivered == 2
+        sent = [call.kwargs["content"] for call in destination.send.call_args_list]
+        assert "".join(sent).replace("\n", "") == "**alice**: " + "x" * 30 + "**bob**: y"
+
+
+class TestWebhookDelivery:
+    async def test_forward_uses_webhook_with_author(self, mock_bot, cdn):
+        webhooks = MagicMock()
+        webhooks.send = AsyncMock(return_value=MagicMock(spec=discord.Message))
+        client = httpx.AsyncClient(transport=httpx.MockTransport(cdn.serve))
+        forwarder = MessageForwarder(mock_bot, http_client=client, webhooks=webhooks)
+        destination = make_destination()
+        mock_bot.get_channel = MagicMock(return_value=destination)
+        message = make_burst_message(
+            1, "alice", "hello", attachments=[make_attachment(cdn, data=b"img")]
+        )
+        message.author.display_avatar.url = "https://cdn/alice.png"
+
+        result = await forwarder.forward_message(message, 1, "channel")
+
+        assert result is webhooks.send.return_value
+        destination.send.assert_not_called()
+        args, kwargs = webhooks.send.call_args
+        assert args == (destination,)
+        assert kwargs["username"] == "alice"
+        assert kwargs["avatar_url"] == "https://cdn/alice.png"
+        assert kwargs["content"] == "hello"
+        assert len(kwargs["files"]) == 1
+
+    async def test_falls_back_to_channel_send_with_fresh_files(self, mock_bot, cdn):
+        webhooks = MagicMock()
+        webhooks.send = AsyncMock(return_value=None)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(cdn.serve))
+        forwarder = MessageForwarder(mock_bot, http_client=client, webhooks=webhooks)
+        destination = make_destination()
+        mock_bot.get_channel = MagicMock(return_value=destination)
+        message = make_message(attachments=[make_attachment(cdn, data=b"img")])
+
+        result = await forwarder.forward_message(message, 1, "channel")
+
+        assert result is destination.send.return_value
+        webhook_files = webhooks.send.call_args.kwargs["files"]
+        channel_files = destination.send.call_args.kwargs["files"]
+        assert webhook_files[0] is not channel_files[0]
+        assert channel_files[0].fp.read() == b"img"
+
+    async def test_unused_webhook_files_are_closed(self, mock_bot, cdn):
+        webhooks = MagicMock()
+        webhooks.send = AsyncMock(return_value=None)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(cdn.serve))
+        forwarder = MessageForwarder(
+            mock_bot, spool_threshold_bytes=16, http_client=client, webhooks=webhooks
+        )
+        destination = make_destination()
+        mock_bot.get_channel = MagicMock(return_value=destination)
+        message = make_message(attachments=[make_attachment(cdn, data=b"x" * 1024)])
+
+        result = await forwarder.forward_message(message, 1, "channel")
+
+        assert result is destination.send.return_value
+        webhook_file = webhooks.send.call_args.kwargs["files"][0]
+        assert webhook_file.fp.closed
+
+    async def test_mixed_author_burst_uses_default_webhook_identity(self, mock_bot):
+        webhooks = MagicMock()
+        webhooks.send = AsyncMock(return_value=MagicMock(spec=discord.Message))
+        forwarder = MessageForwarder(mock_bot, webhooks=webhooks)
+        mock_bot.get_channel = MagicMock(return_value=make_destination())
+        messages = [make_burst_message(1, "alice", "a"), make_burst_message(2, "bob", "b")]
+
+        await forwarder.forward_batch(messages, 1, "channel")
+
+        kwargs = webhooks.send.call_args.kwargs
+        assert kwargs["username"] is None
+        assert kwargs["content"] == "**alice**: a\n**bob**: b"
 
 
 class TestCloseFiles:
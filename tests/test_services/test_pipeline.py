@@ -1,11 +1,13 @@
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anthropic
 import pytest
 
 from intelstream.adapters.base import ContentData
 from intelstream.config import Settings
-from intelstream.database.models import ContentItem, Source, SourceType
+from intelstream.database.models import ContentBlob, ContentItem, Source, SourceType
 from intelstream.database.repository import Repository
 from intelstream.services.pipeline import ContentPipeline
 from intelstream.services.summarizer import SummarizationError, SummarizationService
@@ -20,13 +22,20 @@ def mock_settings():
     settings.http_timeout_seconds = 30.0
     settings.summarization_delay_seconds = 0.5
     settings.fetch_delay_seconds = 0.0
+    settings.backlog_drain_enabled = True
+    settings.backlog_max_page_size = 100
+    settings.backlog_cycle_deadline_seconds = 120.0
+    settings.summarization_max_items_per_cycle = 100
     settings.get_poll_interval.return_value = 5
     return settings
 
 
 @pytest.fixture
 def mock_repository():
-    return AsyncMock(spec=Repository)
+    repository = AsyncMock(spec=Repository)
+    repository.count_unsummarized_content_items.return_value = 0
+    repository.backfill_first_posting_items.return_value = []
+    return repository
 
 
 @pytest.fixture
@@ -582,7 +591,7 @@ class TestFetchAllSources:
             result = await pipeline.fetch_all_sources()
 
         assert result == 1
-        mock_repository.reset_failure_count.assert_called_once_with(sample_source.id)
+        mock_repository.reset_failure_counts.assert_called_once_with([sample_source.id])
 
         await pipeline.close()
 
@@ -704,6 +713,77 @@ class TestFetchAllSources:
         await pipeline.close()
 
 
+class TestPageAdapterCache:
+    @pytest.fixture
+    def page_source(self):
+        source = MagicMock(spec=Source)
+        source.id = "page-1"
+        source.name = "Page Source"
+        source.type = SourceType.PAGE
+        source.extraction_profile = json.dumps(
+            {
+                "site_name": "Blog",
+                "post_selector": "article",
+                "title_selector": "h2",
+                "url_selector": "a",
+                "url_attribute": "href",
+            }
+        )
+        return source
+
+    def test_reuses_adapter_while_profile_unchanged(
+        self, pipeline: ContentPipeline, page_source
+    ) -> None:
+        first = pipeline._get_page_adapter(page_source)
+
+        assert first is not None
+        assert pipeline._get_page_adapter(page_source) is first
+
+    def test_rebuilds_adapter_when_profile_changes(
+        self, pipeline: ContentPipeline, page_source
+    ) -> None:
+        first = pipeline._get_page_adapter(page_source)
+        profile = json.loads(page_source.extraction_profile)
+        profile["title_selector"] = "h3"
+        page_source.extraction_profile = json.dumps(profile)
+
+        second = pipeline._get_page_adapter(page_source)
+
+        assert second is not None
+        assert second is not first
+        assert second._profile.title_selector == "h3"
+        assert len(pipeline._page_adapters) == 1
+
+    async def test_removed_source_adapter_is_dropped(
+        self, pipeline: ContentPipeline, mock_repository: AsyncMock, page_source
+    ) -> None:
+        pipeline._get_page_adapter(page_source)
+        mock_repository.get_all_sources.return_value = []
+
+        await pipeline.fetch_all_sources()
+
+        assert pipeline._page_adapters == {}
+
+    def test_invalid_profile_drops_cached_adapter(
+        self, pipeline: ContentPipeline, page_source
+    ) -> None:
+        pipeline._get_page_adapter(page_source)
+        page_source.extraction_profile = "{not json"
+
+        assert pipeline._get_page_adapter(page_source) is None
+        assert pipeline._page_adapters == {}
+
+    def test_invalid_profile_returns_none(self, pipeline: ContentPipeline, page_source) -> None:
+        page_source.extraction_profile = "{not json"
+
+        assert pipeline._get_page_adapter(page_source) is None
+
+    def test_missing_profile_returns_none(self, pipeline: ContentPipeline, page_source) -> None:
+        page_source.extraction_profile = None
+
+        assert pipeline._get_page_adapter(page_source) is None
+
+
 class TestSummarizePending:
     async def test_summarize_pending_success(
         self,
@@ -717,7 +797,6 @@ class TestSummarizePending:
 
         mock_repository.get_unsummarized_content_items.return_value = [sample_content_item]
         mock_repository.get_source_by_id.return_value = sample_source
-        mock_repository.has_source_posted_content.return_value = True
         mock_summarizer.summarize.return_value = "This is the summary."
 
         result = await pipeline.summarize_pending(max_items=5)
@@ -735,6 +814,30 @@ class TestSummarizePending:
 
         await pipeline.close()
 
+    async def test_summarize_pending_decompresses_content_once(
+        self,
+        pipeline: ContentPipeline,
+        mock_repository: AsyncMock,
+        mock_summarizer: AsyncMock,
+        sample_source,
+    ):
+        await pipeline.initialize()
+
+        item = ContentItem(id="item-1", source_id=sample_source.id, title="Post", author="A")
+        item.raw_content = "Body"
+        mock_repository.get_unsummarized_content_items.return_value = [item]
+        mock_repository.get_source_by_id.return_value = sample_source
+        mock_summarizer.summarize.return_value = "Summary"
+
+        with patch.object(ContentBlob, "decode", autospec=True, return_value="Body") as decode:
+            result = await pipeline.summarize_pending(max_items=5)
+
+        assert result == 1
+        assert decode.call_count == 1
+        assert mock_summarizer.summarize.call_args.kwargs["content"] == "Body"
+
+        await pipeline.close()
+
     async def test_summarize_pending_no_summarizer(self, mock_settings, mock_repository: AsyncMock):
         pipeline = ContentPipeline(
             settings=mock_settings, repository=mock_repository, summarizer=None
@@ -759,13 +862,12 @@ class TestSummarizePending:
         item_without_content.raw_content = None
 
         mock_repository.get_unsummarized_content_items.return_value = [item_without_content]
-        mock_repository.has_source_posted_content.return_value = True
 
         result = await pipeline.summarize_pending()
 
         assert result == 1
         mock_summarizer.summarize.assert_not_called()
-        mock_repository.update_content_item_summary.assert_called_once_with("item-456", "")
+        mock_repository.update_content_item_summaries.assert_called_once_with([("item-456", "")])
 
         await pipeline.close()
 
@@ -781,7 +883,6 @@ class TestSummarizePending:
 
         mock_repository.get_unsummarized_content_items.return_value = [sample_content_item]
         mock_repository.get_source_by_id.return_value = sample_source
-        mock_repository.has_source_posted_content.return_value = True
         mock_summarizer.summarize.side_effect = SummarizationError("API error")
 
         result = await pipeline.summarize_pending()
@@ -803,7 +904,6 @@ class TestSummarizePending:
 
         mock_repository.get_unsummarized_content_items.return_value = [sample_content_item]
         mock_repository.get_source_by_id.return_value = sample_source
-        mock_repository.has_source_posted_content.return_value = True
         mock_summarizer.summarize.side_effect = RuntimeError("Unexpected")
 
         result = await pipeline.summarize_pending()
@@ -823,7 +923,6 @@ class TestSummarizePending:
 
         mock_repository.get_unsummarized_content_items.return_value = [sample_content_item]
         mock_repository.get_source_by_id.return_value = None
-        mock_repository.has_source_posted_content.return_value = True
         mock_summarizer.summarize.return_value = "Summary"
 
         result = await pipeline.summarize_pending()
@@ -859,24 +958,122 @@ class TestSummarizePending:
         new_item.author = "Author"
         new_item.published_at = datetime(2024, 1, 15, tzinfo=UTC)
 
-        mock_repository.get_unsummarized_content_items.side_effect = [
-            [old_item, new_item],
-            [new_item],
+        mock_repository.get_unsummarized_content_items.return_value = [old_item, new_item]
+        mock_repository.backfill_first_posting_items.return_value = [
+            (old_item.id, sample_source.id)
         ]
-        mock_repository.has_source_posted_content.return_value = False
-        mock_repository.get_most_recent_item_for_source.return_value = new_item
-        mock_repository.mark_items_as_backfilled.return_value = 1
         mock_repository.get_source_by_id.return_value = sample_source
         mock_summarizer.summarize.return_value = "Summary"
 
         result = await pipeline.summarize_pending()
 
-        mock_repository.mark_items_as_backfilled.assert_called_once_with(
-            source_id=sample_source.id,
-            exclude_item_id=new_item.id,
-        )
+        mock_repository.backfill_first_posting_items.assert_called_once_with({sample_source.id})
+        assert mock_repository.get_unsummarized_content_items.call_count == 1
+        mock_summarizer.summarize.assert_called_once()
+        assert mock_summarizer.summarize.call_args.kwargs["content"] == "New content"
+        assert result == 1
+
+        await pipeline.close()
+
+    async def test_summarize_pending_drains_multiple_pages(
+        self,
+        pipeline: ContentPipeline,
+        mock_repository: AsyncMock,
+        mock_summarizer: AsyncMock,
+        mock_settings,
+        sample_source,
+    ):
+        await pipeline.initialize()
+        mock_settings.summarization_delay_seconds = 0
+
+        def make_item(i: int) -> MagicMock:
+            item = MagicMock(spec=ContentItem)
+            item.id = f"item-{i}"
+            item.source_id = sample_source.id
+            item.title = f"Article {i}"
+            item.author = "Author"
+            item.raw_content = "Content"
+            return item
+
+        first_page = [make_item(i) for i in range(2)]
+        second_page = [make_item(i) for i in range(2, 3)]
+        mock_repository.count_unsummarized_content_items.return_value = 3
+        mock_repository.get_unsummarized_content_items.side_effect = [
+            first_page,
+            second_page,
+        ]
+        mock_repository.get_source_by_id.return_value = sample_source
+        mock_summarizer.summarize.return_value = "Summary"
+
+        result = await pipeline.summarize_pending(max_items=2)
+
+        assert result == 3
+        assert mock_repository.get_unsummarized_content_items.call_count == 2
+        assert mock_summarizer.summarize.call_count == 3
+
+        await pipeline.close()
+
+    async def test_summarize_pending_single_page_when_drain_disabled(
+        self,
+        pipeline: ContentPipeline,
+        mock_repository: AsyncMock,
+        mock_summarizer: AsyncMock,
+        mock_settings,
+        sample_content_item,
+        sample_source,
+    ):
+        await pipeline.initialize()
+        mock_settings.backlog_drain_enabled = False
+        mock_settings.summarization_delay_seconds = 0
+
+        mock_repository.get_unsummarized_content_items.return_value = [sample_content_item]
+        mock_repository.get_source_by_id.return_value = sample_source
+        mock_summarizer.summarize.return_value = "Summary"
+
+        result = await pipeline.summarize_pending(max_items=1)
+
+        assert result == 1
+        assert mock_repository.get_unsummarized_content_items.call_count == 1
+        mock_repository.count_unsummarized_content_items.assert_not_called()
+
+        await pipeline.close()
+
+    async def test_summarize_pending_stops_draining_when_rate_limited(
+        self,
+        pipeline: ContentPipeline,
+        mock_repository: AsyncMock,
+        mock_summarizer: AsyncMock,
+        mock_settings,
+        sample_source,
+    ):
+        await pipeline.initialize()
+        mock_settings.summarization_delay_seconds = 0
+
+        items = []
+        for i in range(3):
+            item = MagicMock(spec=ContentItem)
+            item.id = f"item-{i}"
+            item.source_id = sample_source.id
+            item.title = f"Article {i}"
+            item.author = "Author"
+            item.raw_content = "Content"
+            items.append(item)
+
+        mock_repository.count_unsummarized_content_items.return_value = 100
+        mock_repository.get_unsummarized_content_items.return_value = items
+        mock_repository.get_source_by_id.return_value = sample_source
+        mock_summarizer.summarize.side_effect = [
+            "Summary",
+            anthropic.RateLimitError(
+                "rate limited", response=MagicMock(status_code=429), body=None
+            ),
+        ]
+
+        result = await pipeline.summarize_pending(max_items=3)
 
         assert result == 1
+        assert mock_summarizer.summarize.call_count == 2
+        assert mock_repository.get_unsummarized_content_items.call_count == 1
 
         await pipeline.close()
 
@@ -891,7 +1088,6 @@ class TestRunCycle:
 
         mock_repository.get_all_sources.return_value = []
         mock_repository.get_unsummarized_content_items.return_value = []
-        mock_repository.has_source_posted_content.return_value = True
 
         result = await pipeline.run_cycle()
 
@@ -0,0 +1,124 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from intelstream.services.webhook_pool import (
+    WEBHOOK_ALLOWED_MENTIONS,
+    WEBHOOK_NAME,
+    WebhookPool,
+    webhook_username,
+)
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.user = MagicMock()
+    bot.user.id = 999
+    return bot
+
+
+def make_webhook(owner_id: int = 999, token: str | None = "token"):
+    webhook = MagicMock(spec=discord.Webhook)
+    webhook.id = 1
+    webhook.token = token
+    webhook.user = MagicMock()
+    webhook.user.id = owner_id
+    webhook.send = AsyncMock(return_value=MagicMock(spec=discord.WebhookMessage))
+    return webhook
+
+
+def make_channel(webhooks=None):
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = 100
+    channel.webhooks = AsyncMock(return_value=webhooks or [])
+    channel.create_webhook = AsyncMock(return_value=make_webhook())
+    return channel
+
+
+class TestWebhookUsername:
+    def test_reserved_words_are_broken_up(self):
+        name = webhook_username("Discord Clyde fan")
+
+        assert "discord" not in name.lower()
+        assert "clyde" not in name.lower()
+
+    def test_long_names_are_truncated(self):
+        assert len(webhook_username("x" * 200)) == 80
+
+    def test_empty_name_falls_back(self):
+        assert webhook_username("") == WEBHOOK_NAME
+
+
+class TestWebhookPool:
+    async def test_creates_webhook_once_per_channel(self, mock_bot):
+        pool = WebhookPool(mock_bot)
+        channel = make_channel()
+
+        await pool.send(channel, content="one")
+        await pool.send(channel, content="two")
+
+        channel.create_webhook.assert_awaited_once()
+        channel.webhooks.assert_awaited_once()
+        assert channel.create_webhook.return_value.send.await_count == 2
+
+    async def test_reuses_existing_bot_webhook(self, mock_bot):
+        foreign = make_webhook(owner_id=1)
+        own = make_webhook()
+        pool = WebhookPool(mock_bot)
+        channel = make_channel(webhooks=[foreign, own])
+
+        await pool.send(channel, content="hello")
+
+        channel.create_webhook.assert_not_called()
+        own.send.assert_awaited_once()
+        foreign.send.assert_not_called()
+
+    async def test_sends_with_author_and_safe_mentions(self, mock_bot):
+        pool = WebhookPool(mock_bot)
+        channel = make_channel()
+
+        await pool.send(channel, username="alice", avatar_url="https://cdn/a.png", content="hi")
+
+        kwargs = channel.create_webhook.return_value.send.call_args.kwargs
+        assert kwargs["username"] == "alice"
+        assert kwargs["avatar_url"] == "https://cdn/a.png"
+        assert kwargs["allowed_mentions"] is WEBHOOK_ALLOWED_MENTIONS
+        assert kwargs["wait"] is True
+
+    async def test_thread_uses_parent_webhook(self, mock_bot):
+        pool = WebhookPool(mock_bot)
+        channel = make_channel()
+        thread = MagicMock(spec=discord.Thread)
+        thread.parent = channel
+
+        await pool.send(thread, content="hi")
+
+        kwargs = channel.create_webhook.return_value.send.call_args.kwargs
+        assert kwargs["thread"] is thread
+
+    async def test_forbidden_channel_is_remembered(self, mock_bot):
+        pool = WebhookPool(mock_bot)
+        channel = make_channel()
+        channel.webhooks = AsyncMock(side_effect=discord.Forbidden(MagicMock(), "no"))
+
+        assert await pool.send(channel, content="one") is None
+        assert await pool.send(channel, content="two") is None
+
+        channel.webhooks.assert_awaited_once()
+
+    async def test_deleted_webhook_is_recreated_next_time(self, mock_bot):
+        pool = WebhookPool(mock_bot)
+        channel = make_channel()
+        deleted = make_webhook()
+        response = MagicMock()
+        response.status = 404
+        deleted.send = AsyncMock(
+            side_effect=discord.NotFound(response, {"code": 10015, "message": "Unknown Webhook"})
+        )
+        replacement = make_webhook()
+        channel.create_webhook = AsyncMock(side_effect=[deleted, replacement])
+
+        assert await pool.send(channel, content="one") is None
+        assert await pool.send(channel, content="two") is replacement.send.return_value
@@ -1,7 +1,8 @@
+import pickle
 from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
-from intelstream.utils.feed_utils import parse_feed_date
+from intelstream.utils.feed_utils import parse_feed, parse_feed_date
 
 
 class TestParseFeedDate:
@@ -137,3 +138,22 @@ class TestParseFeedDate:
         result = parse_feed_date(entry)
 
         assert result == datetime(2024, 2, 20, 14, 0, 0, tzinfo=UTC)
+
+
+class TestParseFeed:
+    def test_returns_entries_and_feed(self) -> None:
+        feed = parse_feed(
+            "<rss><channel><title>Blog</title>"
+            "<item><title>Post</title><link>https://example.com/1</link></item>"
+            "</channel></rss>"
+        )
+
+        assert feed.bozo is False
+        assert feed.feed.title == "Blog"
+        assert [entry.link for entry in feed.entries] == ["https://example.com/1"]
+
+    def test_malformed_feed_is_picklable(self) -> None:
+        feed = pickle.loads(pickle.dumps(parse_feed(b"<rss><channel><item>")))
+
+        assert feed.bozo is True
+        assert feed.bozo_exception
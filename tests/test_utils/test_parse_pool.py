@@ -0,0 +1,61 @@
+import operator
+
+import pytest
+from structlog.testing import capture_logs
+
+from intelstream.utils.parse_pool import ParsePool
+
+
+def finished_jobs(logs: list[dict]) -> list[dict]:
+    return [log for log in logs if log["event"] == "Parse job finished"]
+
+
+class TestParsePool:
+    async def test_inline_pool_runs_in_process(self) -> None:
+        pool = ParsePool(max_workers=0)
+
+        with capture_logs() as logs:
+            assert await pool.run(operator.add, 2, 3) == 5
+            await pool.close()
+
+        jobs = finished_jobs(logs)
+        assert len(jobs) == 1
+        assert jobs[0]["queue_wait_seconds"] == 0.0
+        summary = next(log for log in logs if log["event"] == "Parse pool closed")
+        assert summary["workers"] == 0
+        assert summary["jobs"] == 1
+        assert summary["inline_jobs"] == 1
+
+    async def test_worker_pool_records_metrics(self) -> None:
+        pool = ParsePool(max_workers=1)
+        with capture_logs() as logs:
+            try:
+                assert await pool.run(operator.mul, 6, 7) == 42
+            finally:
+                await pool.close()
+
+        jobs = finished_jobs(logs)
+        assert len(jobs) == 1
+        assert jobs[0]["parse_seconds"] >= 0.0
+        summary = next(log for log in logs if log["event"] == "Parse pool closed")
+        assert summary["jobs"] == 1
+        assert summary["inline_jobs"] == 0
+        assert summary["max_parse_seconds"] >= 0.0
+
+    async def test_unpicklable_job_falls_back_inline(self) -> None:
+        pool = ParsePool(max_workers=1)
+        with capture_logs() as logs:
+            try:
+                assert await pool.run(lambda value: value * 2, 21) == 42
+            finally:
+                await pool.close()
+
+        summary = next(log for log in logs if log["event"] == "Parse pool closed")
+        assert summary["fallbacks"] == 1
+        assert summary["inline_jobs"] == 1
+
+    async def test_job_errors_propagate(self) -> None:
+        pool = ParsePool(max_workers=0)
+
+        with pytest.raises(ZeroDivisionError):
+            await pool.run(operator.truediv, 1, 0)
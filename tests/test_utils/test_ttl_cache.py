@@ -0,0 +1,85 @@
+from intelstream.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_hit_and_miss_counts(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=60)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.get_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+        assert stats.hit_rate == 0.5
+
+    def test_entries_expire(self) -> None:
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats().evictions == 1
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_where(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate_where(lambda value: value == 2)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_peek_does_not_count_or_refresh(self) -> None:
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=10, max_entries=2, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.peek("a") == 1
+        assert cache.peek("missing") is None
+        cache.set("c", 3)
+
+        assert cache.peek("a") is None
+        assert cache.get_stats().hits == 0
+        assert cache.get_stats().misses == 0
+        clock.now = 11
+        assert cache.peek("b") is None
+
+    def test_hit_rate_without_lookups(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=60)
+
+        assert cache.get_stats().hit_rate == 0.0